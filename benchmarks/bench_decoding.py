@@ -0,0 +1,52 @@
+# benchmarks/bench_decoding.py
+"""
+Compare response parse throughput: full pydantic validation vs. trusted decoding.
+
+    python benchmarks/bench_decoding.py --rows 5000 --repeat 5
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import brand_row, page, product_row  # noqa: E402
+from smartscout.decoding import decode_paged  # noqa: E402
+from smartscout.models.base import PagedResponse  # noqa: E402
+from smartscout.models.responses import Brand, Product  # noqa: E402
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(rows: int = 5000, repeat: int = 3):
+    results = []
+    for model, make_row in ((Product, product_row), (Brand, brand_row)):
+        payload = page([make_row(i) for i in range(rows)])
+        validated = _best_of(lambda: PagedResponse[model](**payload), repeat)
+        trusted = _best_of(lambda: decode_paged(payload, model), repeat)
+        results.append({
+            "model": model.__name__,
+            "rows": rows,
+            "validate_rows_per_sec": rows / validated,
+            "trusted_rows_per_sec": rows / trusted,
+            "speedup": validated / trusted,
+        })
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print(json.dumps(run(args.rows, args.repeat), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# benchmarks/bench_import.py
+"""
+Measure cold import time of the package, each scenario in a fresh interpreter.
+
+    python benchmarks/bench_import.py --repeat 9
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# What a short-lived process typically imports before its first call.
+SCENARIOS = {
+    "package": "import smartscout",
+    "client": "from smartscout import SmartScoutAPIClient",
+    "one_endpoint": "from smartscout import SmartScoutAPIClient, SearchBrandsRequest",
+    "all_models": "from smartscout.models import *",
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(m for m in sys.modules if m.startswith("smartscout"))}}))
+"""
+
+def _probe(statement):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(statement=statement)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+def run(repeat: int = 5):
+    results = []
+    for name, statement in SCENARIOS.items():
+        _probe(statement)  # warm the OS file cache (and bytecode cache, where it is written)
+        probes = [_probe(statement) for _ in range(repeat)]
+        median = statistics.median(probe["seconds"] for probe in probes)
+        results.append({
+            "scenario": name,
+            "ms": median * 1000,
+            "imports_per_sec": 1 / median,
+            "smartscout_modules": len(probes[0]["modules"]),
+        })
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run(args.repeat), indent=2))
+
+if __name__ == "__main__":
+    main()
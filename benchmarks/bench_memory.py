@@ -0,0 +1,74 @@
+# benchmarks/bench_memory.py
+"""
+Measure memory held per 10k decoded rows for each output mode.
+
+    python benchmarks/bench_memory.py --rows 10000
+
+Each mode parses the JSON body itself, so strings the decoded rows keep from the payload are
+counted too. `saved_fraction` is the share of `trusted`'s retained memory a mode saves.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import page, product_row  # noqa: E402
+from smartscout.columnar import convert_page  # noqa: E402
+from smartscout.decoding import Flyweights, decode_paged  # noqa: E402
+from smartscout.models.base import CategoryInfo, Money, PagedResponse  # noqa: E402
+from smartscout.models.responses import Product  # noqa: E402
+
+DECODERS = {
+    "validated": lambda payload: PagedResponse[Product](**payload),
+    "trusted": lambda payload: decode_paged(payload, Product),
+    "flyweights": lambda payload: decode_paged(payload, Product, flyweights=Flyweights()),
+    "flyweights_money": lambda payload: decode_paged(payload, Product, flyweights=Flyweights(shared=(CategoryInfo, Money))),
+    "records": lambda payload: convert_page(payload, Product, "records"),
+}
+
+def _measure(decode, body):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = decode(json.loads(body))
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained - baseline, peak - baseline
+
+def run(rows: int = 10_000):
+    body = json.dumps(page([product_row(i) for i in range(rows)]))
+    # Warm up caches (generic model classes, compiled decoders) outside the measurement.
+    for decode in DECODERS.values():
+        decode(page([product_row(0)]))
+    results = []
+    for name, decode in DECODERS.items():
+        retained, peak = _measure(decode, body)
+        results.append({
+            "mode": name,
+            "rows": rows,
+            "retained_bytes": retained,
+            "peak_bytes": peak,
+            "retained_bytes_per_10k_rows": retained * 10_000 // rows,
+        })
+    trusted = next(result["retained_bytes"] for result in results if result["mode"] == "trusted")
+    for result in results:
+        result["saved_fraction"] = round(1 - result["retained_bytes"] / trusted, 3)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.rows), indent=2))
+
+if __name__ == "__main__":
+    main()
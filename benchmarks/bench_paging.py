@@ -0,0 +1,110 @@
+# benchmarks/bench_paging.py
+"""
+Measure end-to-end paging throughput of the sync client against a local stub server.
+
+The stub answers every request with the same pre-encoded page, so the numbers reflect client
+cost (HTTP, JSON parsing, model construction) rather than server cost.
+
+    python benchmarks/bench_paging.py --pages 200 --page-size 100
+    python benchmarks/bench_paging.py --work-ms 5   # simulate per-page consumer work
+
+The `prefetch` rows fetch pages ahead on a background thread; with consumer work comparable to
+the fetch time they show how much of it is overlapped.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import brand_row  # noqa: E402
+from smartscout.client import SmartScoutAPIClient  # noqa: E402
+from smartscout.models.requests import SearchBrandsRequest  # noqa: E402
+from smartscout.ratelimit import RetryPolicy  # noqa: E402
+
+class StubServer:
+    """Serves `pages` pages of `page_size` identical brand rows, following `page[id]` cursors."""
+
+    def __init__(self, pages: int, page_size: int):
+        rows = json.dumps([brand_row(i) for i in range(page_size)], separators=(",", ":"))
+        self.pages = pages
+
+        def body(cursor: int) -> bytes:
+            has_more = cursor + 1 < pages
+            paging = {"nextPageId": str(cursor + 1) if has_more else None, "hasMoreRecords": has_more}
+            return f'{{"dataCount":{pages * page_size},"paging":{json.dumps(paging)},"data":{rows}}}'.encode("utf-8")
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                page = request.get("page") or {}
+                encoded = body(int(page.get("page[id]") or page.get("id") or 0))
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return "http://%s:%d" % self._httpd.server_address[:2]
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+def run(pages: int = 200, page_size: int = 100, work_ms: float = 0.0):
+    results = []
+    with StubServer(pages, page_size) as server:
+        for output, validate, prefetch in (("models", True, 0), ("models", False, 0), ("records", True, 0), ("models", False, 2)):
+            client = SmartScoutAPIClient(api_key="bench", base_url=server.url, retry_policy=RetryPolicy(max_retries=0), validate_responses=validate)
+            request = SearchBrandsRequest(marketplace="US")
+            start = time.perf_counter()
+            fetched = rows = 0
+            for response in client.iter_pages(client.search_brands, request, page_size=page_size, output=output, prefetch=prefetch):
+                fetched += 1
+                rows += len(response.data)
+                if work_ms:
+                    time.sleep(work_ms / 1000)
+            elapsed = time.perf_counter() - start
+            assert fetched == pages
+            results.append({
+                "output": output,
+                "validate_responses": validate,
+                "prefetch": prefetch,
+                "work_ms": work_ms,
+                "pages": pages,
+                "page_size": page_size,
+                "pages_per_sec": pages / elapsed,
+                "rows_per_sec": rows / elapsed,
+            })
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--work-ms", type=float, default=0.0, help="Simulated consumer work per page")
+    args = parser.parse_args()
+    print(json.dumps(run(args.pages, args.page_size, args.work_ms), indent=2))
+
+if __name__ == "__main__":
+    main()
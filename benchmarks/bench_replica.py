@@ -0,0 +1,85 @@
+# benchmarks/bench_replica.py
+"""
+Measure local query latency of a `Replica` against a linear scan of the same rows.
+
+    python benchmarks/bench_replica.py --rows 50000
+
+`first_ms` includes building the indexes the query uses; later queries reuse them.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import page, product_row  # noqa: E402
+from smartscout.decoding import decode_paged  # noqa: E402
+from smartscout.models.base import ListFilter, RangeInt, SortOptions, TextFilter  # noqa: E402
+from smartscout.models.requests import SearchProductsRequest  # noqa: E402
+from smartscout.models.responses import Product  # noqa: E402
+from smartscout.replica import Replica  # noqa: E402
+
+def _queries(rows):
+    asins = [f"B{i:09d}" for i in range(0, rows, max(rows // 100, 1))]
+    return {
+        "rank_sorted": (
+            SearchProductsRequest(marketplace="US", rank=RangeInt(max=20_000), sort=SortOptions(**{"sort[by]": "rank"})),
+            lambda product: product.sales_rank is not None and product.sales_rank <= 20_000,
+        ),
+        "rank_and_title": (
+            SearchProductsRequest(marketplace="US", rank=RangeInt(min=100_000, max=300_000), title=TextFilter(type="contains", filter="product 12")),
+            lambda product: product.sales_rank is not None and 100_000 <= product.sales_rank <= 300_000 and "product 12" in product.title.casefold(),
+        ),
+        "asin_list": (
+            SearchProductsRequest(marketplace="US", asins=ListFilter(filter=asins)),
+            lambda product, wanted=set(asins): product.asin in wanted,
+        ),
+        "brand_prefix": (
+            SearchProductsRequest(marketplace="US", brandName=TextFilter(type="startsWith", filter="ac")),
+            lambda product: product.brand is not None and product.brand.casefold().startswith("ac"),
+        ),
+    }
+
+def _median_seconds(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+def run(rows: int = 50_000, repeat: int = 20):
+    products = decode_paged(page([product_row(i) for i in range(rows)]), Product).data
+    replica = Replica()
+    replica.add("search_products", SearchProductsRequest(marketplace="US"), products)
+    results = []
+    for name, (request, keep) in _queries(rows).items():
+        start = time.perf_counter()
+        matches = len(replica.search("search_products", request))
+        first = time.perf_counter() - start
+        indexed = _median_seconds(lambda: replica.search("search_products", request), repeat)
+        scan = _median_seconds(lambda: [product for product in products if keep(product)], repeat)
+        results.append({
+            "query": name,
+            "rows": rows,
+            "matches": matches,
+            "first_ms": first * 1000,
+            "ms": indexed * 1000,
+            "queries_per_sec": 1 / indexed,
+            "scan_queries_per_sec": 1 / scan,
+        })
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(run(args.rows, args.repeat), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# benchmarks/bench_serialization.py
+"""
+Measure request serialization throughput for the widest request models.
+
+    python benchmarks/bench_serialization.py --repeat 5
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import wide_request  # noqa: E402
+from smartscout.models.requests import SearchBrandsRequest, SearchProductsRequest, SearchSellersRequest  # noqa: E402
+from smartscout.serialization import dumps, to_wire  # noqa: E402
+
+MODELS = (SearchSellersRequest, SearchProductsRequest, SearchBrandsRequest)
+
+def _best_of(fn, number, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(number: int = 2000, repeat: int = 3):
+    results = []
+    for model in MODELS:
+        request = wide_request(model)
+        to_dict = _best_of(lambda: request.dict(exclude_none=True), number, repeat)
+        dict_and_json = _best_of(lambda: json.dumps(request.dict(exclude_none=True), default=str), number, repeat)
+        compiled = _best_of(lambda: to_wire(request), number, repeat)
+        # What the client does per request: build the body, then encode it for the wire.
+        body = _best_of(lambda: dumps(to_wire(request)), number, repeat)
+        results.append({
+            "model": model.__name__,
+            "fields": len(model.__fields__),
+            "dict_per_sec": number / to_dict,
+            "dict_and_json_per_sec": number / dict_and_json,
+            "to_wire_per_sec": number / compiled,
+            "body_per_sec": number / body,
+            "us_per_request": body / number * 1e6,
+        })
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print(json.dumps(run(args.number, args.repeat), indent=2))
+
+if __name__ == "__main__":
+    main()
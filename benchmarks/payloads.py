@@ -0,0 +1,118 @@
+# benchmarks/payloads.py
+"""Synthetic SmartScout payloads shaped like the models in smartscout.models.responses."""
+
+import random
+from typing import Any, Dict, List, Optional
+
+CATEGORIES = [
+    {"id": "172282", "name": "Electronics", "path": ["Electronics"]},
+    {"id": "1055398", "name": "Home & Kitchen", "path": ["Home & Kitchen"]},
+    {"id": "3375251", "name": "Sports & Outdoors", "path": ["Sports & Outdoors"]},
+]
+SUBCATEGORIES = [
+    {"id": "281407", "name": "Headphones", "path": ["Electronics", "Headphones"]},
+    {"id": "289913", "name": "Cookware", "path": ["Home & Kitchen", "Kitchen & Dining", "Cookware"]},
+    {"id": "3407731", "name": "Yoga Mats", "path": ["Sports & Outdoors", "Exercise & Fitness", "Yoga Mats"]},
+]
+BRANDS = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Vandelay"]
+
+def product_row(i: int, rng: Optional[random.Random] = None) -> Dict[str, Any]:
+    rng = rng or random.Random(i)
+    slot = i % len(CATEGORIES)
+    price = round(rng.uniform(5, 500), 2)
+    return {
+        "asin": f"B{i:09d}",
+        "title": f"Product {i} " + "lorem ipsum " * 4,
+        "brand": BRANDS[i % len(BRANDS)],
+        "category": dict(CATEGORIES[slot]),
+        "subcategory": dict(SUBCATEGORIES[slot]),
+        "price": {"amount": price, "currency": "USD"},
+        "listPrice": {"amount": round(price * 1.2, 2), "currency": "USD"},
+        "currency": "USD",
+        "condition": "New",
+        "availability": "In Stock",
+        "fulfillmentChannel": rng.choice(["FBA", "FBM"]),
+        "isPrime": rng.random() < 0.7,
+        "isAmazonFulfilled": rng.random() < 0.6,
+        "isFBA": rng.random() < 0.6,
+        "salesRank": rng.randint(1, 1_000_000),
+        "reviews": {"averageRating": round(rng.uniform(1, 5), 1), "totalReviews": rng.randint(0, 50_000)},
+        "rating": round(rng.uniform(1, 5), 1),
+        "totalRatings": rng.randint(0, 50_000),
+        "dimensions": {"length": 10.0, "width": 5.0, "height": 2.0, "unit": "in"},
+        "weight": {"value": round(rng.uniform(0.1, 20), 2), "unit": "lb"},
+        "images": {"small": f"https://img.example/{i}_s.jpg", "medium": f"https://img.example/{i}_m.jpg", "large": f"https://img.example/{i}_l.jpg"},
+        "features": ["Durable", "Lightweight", "Easy to clean"],
+        "description": "A fine product. " * 10,
+        "isVariation": False,
+        "parentAsin": None,
+        "variationAttributes": None,
+        "estimatedMonthlySales": rng.randint(0, 10_000),
+        "estimatedMonthlyRevenue": {"amount": round(price * 100, 2), "currency": "USD"},
+        "buyBoxPrice": {"amount": price, "currency": "USD"},
+        "buyBoxOwner": rng.choice(["Amazon", "FBA", "FBM"]),
+        "numberOfSellers": rng.randint(1, 30),
+        "numberOfFBASellers": rng.randint(0, 10),
+    }
+
+def brand_row(i: int, rng: Optional[random.Random] = None) -> Dict[str, Any]:
+    rng = rng or random.Random(i)
+    return {
+        "brandName": f"{BRANDS[i % len(BRANDS)]} {i}",
+        "amazonIsr": rng.random(),
+        "avgFbaSellers": rng.uniform(0, 10),
+        "avgSellers": rng.uniform(0, 20),
+        "avgPrice": rng.uniform(5, 500),
+        "avgVolume": rng.uniform(0, 1000),
+        "reviewRating": rng.uniform(1, 5),
+        "totalProducts": rng.randint(1, 5000),
+        "totalReviews": rng.randint(0, 100_000),
+        "monthlyRevenue": rng.uniform(0, 5_000_000),
+        "monthlyUnitsSold": rng.randint(0, 100_000),
+        "brandScore": rng.uniform(0, 10),
+        "hasStorefront": rng.random() < 0.5,
+        "hasSingleSeller": rng.random() < 0.3,
+        "categoryName": CATEGORIES[i % len(CATEGORIES)]["name"],
+        "subcategoryName": SUBCATEGORIES[i % len(SUBCATEGORIES)]["name"],
+        "monthGrowth": rng.uniform(-1, 1),
+        "monthGrowth12": rng.uniform(-1, 1),
+        "trailing12Months": rng.uniform(0, 50_000_000),
+    }
+
+def page(rows: List[Dict[str, Any]], next_page_id: Optional[str] = None) -> Dict[str, Any]:
+    return {
+        "dataCount": len(rows),
+        "paging": {"nextPageId": next_page_id, "hasMoreRecords": next_page_id is not None},
+        "data": rows,
+    }
+
+def wide_request(model: Any, marketplace: str = "US") -> Any:
+    """Build a request model with every optional filter populated."""
+    values = {field.alias: _sample(field.outer_type_) for name, field in model.__fields__.items() if name != "marketplace"}
+    return model(marketplace=marketplace, **values)
+
+def _sample(type_: Any) -> Any:
+    from datetime import datetime
+    from enum import Enum
+    from pydantic import BaseModel
+    from typing import get_args, get_origin
+
+    if get_origin(type_) is not None:
+        args = [arg for arg in get_args(type_) if arg is not type(None)]
+        if get_origin(type_) is list:
+            return [_sample(args[0]), _sample(args[0])]
+        return _sample(args[0])
+    if isinstance(type_, type):
+        if issubclass(type_, BaseModel):
+            return {field.alias: _sample(field.outer_type_) for field in type_.__fields__.values()}
+        if issubclass(type_, Enum):
+            return next(iter(type_))
+        if issubclass(type_, bool):
+            return True
+        if issubclass(type_, int):
+            return 10
+        if issubclass(type_, float):
+            return 1.5
+        if issubclass(type_, datetime):
+            return datetime(2024, 1, 1)
+    return "sample"
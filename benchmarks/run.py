@@ -0,0 +1,116 @@
+# benchmarks/run.py
+"""
+Run the benchmark suite offline and write the results as JSON.
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --compare baseline.json --tolerance 0.2
+
+Throughput metrics (`*_per_sec`) that drop, and memory metrics (`*_bytes*`) that grow, by more
+than `--tolerance` relative to the baseline are reported as regressions and make the run exit 1.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bench_decoding  # noqa: E402
+import bench_import  # noqa: E402
+import bench_memory  # noqa: E402
+import bench_paging  # noqa: E402
+import bench_replica  # noqa: E402
+import bench_serialization  # noqa: E402
+
+SUITES = {
+    "serialization": lambda quick: bench_serialization.run(number=200 if quick else 2000),
+    "decoding": lambda quick: bench_decoding.run(rows=500 if quick else 5000),
+    "memory": lambda quick: bench_memory.run(rows=1000 if quick else 10_000),
+    "paging": lambda quick: bench_paging.run(pages=20 if quick else 200),
+    "import": lambda quick: bench_import.run(repeat=3 if quick else 9),
+    "replica": lambda quick: bench_replica.run(rows=2000 if quick else 50_000),
+}
+
+def _versions():
+    versions = {"python": platform.python_version()}
+    for module in ("pydantic", "requests", "smartscout"):
+        try:
+            versions[module] = getattr(__import__(module), "__version__", None) or _distribution_version(module)
+        except ImportError:
+            versions[module] = None
+    return versions
+
+def _distribution_version(module):
+    from importlib import metadata
+
+    try:
+        return metadata.version("smartscout-api" if module == "smartscout" else module)
+    except metadata.PackageNotFoundError:
+        return None
+
+def run(suites=None, quick=False):
+    return {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "platform": platform.platform(),
+            "versions": _versions(),
+            "quick": quick,
+        },
+        "results": {name: SUITES[name](quick) for name in (suites or SUITES)},
+    }
+
+def _metrics(report):
+    # Flatten to {"suite/<identifying fields>/metric": value}.
+    flat = {}
+    for suite, rows in report["results"].items():
+        for row in rows:
+            label = ",".join(f"{k}={v}" for k, v in row.items() if not isinstance(v, float) and "bytes" not in k)
+            for key, value in row.items():
+                if key.endswith("_per_sec") or "bytes" in key:
+                    flat[f"{suite}/{label}/{key}"] = value
+    return flat
+
+def compare(report, baseline, tolerance):
+    """Return human-readable regressions of `report` relative to `baseline`."""
+    current, previous = _metrics(report), _metrics(baseline)
+    regressions = []
+    for key, old in previous.items():
+        new = current.get(key)
+        if new is None or not old:
+            continue
+        change = (new - old) / old
+        worse = -change if key.endswith("_per_sec") else change
+        if worse > tolerance:
+            regressions.append(f"{key}: {old:.6g} -> {new:.6g} ({change:+.1%})")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--suite", action="append", choices=sorted(SUITES), help="Suite to run; repeat for several (default: all)")
+    parser.add_argument("--quick", action="store_true", help="Smaller inputs, for smoke runs")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--compare", help="Baseline JSON report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    report = run(args.suite, args.quick)
+    encoded = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(encoded + "\n")
+    else:
+        print(encoded)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
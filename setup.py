@@ -9,6 +9,16 @@ setup(
         "requests>=2.25.0",
         "pydantic>=1.8.0",
     ],
+    extras_require={
+        "async": ["httpx>=0.23.0"],
+        "http2": ["httpx[http2]>=0.23.0"],
+        "arrow": ["pyarrow>=7.0.0"],
+        "pandas": ["pandas>=1.3.0"],
+        "stream": ["ijson>=3.1"],
+        "prometheus": ["prometheus_client>=0.12"],
+        "otel": ["opentelemetry-api>=1.12"],
+        "brotli": ["brotli>=1.0"],
+    },
     author="Brian Weisberg",
     author_email="profs-brownie.0g@icloud.com",
     description="A Python client for the SmartScout API",
@@ -1,28 +1,73 @@
-from .client import SmartScoutAPIClient
-from .models.enums import MarketplaceId, SortOrder
-from .models.requests import (
-    SearchBrandsRequest,
-    SearchProductsRequest,
-    SearchSearchTermsRequest,
-    SearchSellersRequest,
-)
-from .models.responses import (
-    Brand,
-    Product,
-    SearchTerm,
-    Seller,
-)
+# src/smartscout/__init__.py
 
-__all__ = [
-    "SmartScoutAPIClient",
-    "MarketplaceId",
-    "SortOrder",
-    "SearchBrandsRequest",
-    "SearchProductsRequest",
-    "SearchSearchTermsRequest",
-    "SearchSellersRequest",
-    "Brand",
-    "Product",
-    "SearchTerm",
-    "Seller",
-]
+# Public names are imported on first access (PEP 562), so `import smartscout` stays cheap and
+# e.g. `from smartscout import SmartScoutAPIClient` never loads the async client or the models
+# of endpoints that are not used.
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .client import SmartScoutAPIClient
+    from .async_client import AsyncSmartScoutAPIClient
+    from .ratelimit import TokenBucket, RetryPolicy
+    from .bulk import BatchResult
+    from .cache import ResponseCache, SQLiteCache, MemoryCache
+    from .export import export, ExportResult
+    from .history import HistoryStore, HistorySync
+    from .replica import Replica
+    from .models.enums import MarketplaceId, SortOrder
+    from .models.requests import (
+        SearchBrandsRequest,
+        SearchProductsRequest,
+        SearchSearchTermsRequest,
+        SearchSellersRequest,
+    )
+    from .models.responses import (
+        Brand,
+        Product,
+        SearchTerm,
+        Seller,
+    )
+
+_EXPORTS: Dict[str, str] = {
+    "SmartScoutAPIClient": ".client",
+    "AsyncSmartScoutAPIClient": ".async_client",
+    "TokenBucket": ".ratelimit",
+    "RetryPolicy": ".ratelimit",
+    "BatchResult": ".bulk",
+    "LookupResult": ".bulk",
+    "ResponseCache": ".cache",
+    "SQLiteCache": ".cache",
+    "MemoryCache": ".cache",
+    "export": ".export",
+    "ExportResult": ".export",
+    "HistoryStore": ".history",
+    "HistorySync": ".history",
+    "Replica": ".replica",
+    "Flyweights": ".decoding",
+    "MarketplaceId": ".models.enums",
+    "SortOrder": ".models.enums",
+    "SearchBrandsRequest": ".models.requests",
+    "SearchProductsRequest": ".models.requests",
+    "SearchSearchTermsRequest": ".models.requests",
+    "SearchSellersRequest": ".models.requests",
+    "Brand": ".models.responses",
+    "Product": ".models.responses",
+    "SearchTerm": ".models.responses",
+    "Seller": ".models.responses",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache it so later lookups are plain module attribute reads.
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
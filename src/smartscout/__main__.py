@@ -0,0 +1,121 @@
+# src/smartscout/__main__.py
+
+import argparse
+import json
+import os
+import sys
+import typing
+from typing import List, Optional
+
+from .client import SmartScoutAPIClient, _marketplace_codes
+from .export import EXPORT_FORMATS, export
+from .models.enums import MarketplaceId
+
+def _marketplaces(args: argparse.Namespace) -> List[str]:
+    if args.all_marketplaces:
+        return _marketplace_codes()
+    return args.marketplace or [MarketplaceId.US.value]
+
+def _request_model(method: typing.Callable) -> type:
+    # Client annotations name models that are imported lazily, so resolve them explicitly.
+    from .models import base, generated, requests, responses
+
+    namespace = {**vars(base), **vars(requests), **vars(responses), **vars(generated)}
+    return typing.get_type_hints(method, localns=namespace)["request"]
+
+def _export(args: argparse.Namespace) -> int:
+    api_key = args.api_key or os.environ.get("SMARTSCOUT_API_KEY")
+    if not api_key:
+        print("error: pass --api-key or set SMARTSCOUT_API_KEY", file=sys.stderr)
+        return 2
+    client = SmartScoutAPIClient(api_key=api_key)
+    method = getattr(client, args.method, None)
+    if method is None or not callable(method):
+        print(f"error: unknown client method {args.method!r}", file=sys.stderr)
+        return 2
+    request_model = _request_model(method)
+    fields = json.loads(args.request) if args.request else {}
+
+    marketplaces = _marketplaces(args)
+    if len(marketplaces) > 1 and "{marketplace}" not in args.output:
+        print("error: output must contain '{marketplace}' when exporting several marketplaces", file=sys.stderr)
+        return 2
+    for marketplace in marketplaces:
+        request = request_model(**{**fields, "marketplace": marketplace})
+        path = args.output.format(marketplace=marketplace, method=args.method)
+        result = export(
+            client,
+            method,
+            request,
+            path,
+            format=args.format,
+            page_size=args.page_size,
+            max_pages=args.max_pages,
+            flush_rows=args.flush_rows,
+            resume=not args.no_resume,
+        )
+        state = "done" if result.completed else "stopped"
+        print(f"{marketplace}: {result.rows} rows in {result.pages} pages -> {result.path} ({state})")
+    return 0
+
+def _mock_server(args: argparse.Namespace) -> int:
+    from .mock import MockServer
+
+    latency = tuple(args.latency) if len(args.latency) == 2 else args.latency[0]
+    server = MockServer(
+        args.spec,
+        host=args.host,
+        port=args.port,
+        latency=latency,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        total_records=args.total_records,
+        page_size=args.page_size,
+        seed=args.seed,
+    )
+    print(f"Serving {len(server.routes)} operations from {args.spec} on {server.url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m smartscout", description="SmartScout API command line tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("export", help="Export every row of a paged endpoint to JSONL, CSV or Parquet")
+    p.add_argument("method", help="Paged client method, e.g. search_products")
+    p.add_argument("output", help="Output path; may contain {marketplace} and {method} placeholders")
+    p.add_argument("--format", choices=EXPORT_FORMATS, help="Output format (default: from the file extension)")
+    p.add_argument("--marketplace", action="append", help="Marketplace to export; repeat for several (default: US)")
+    p.add_argument("--all-marketplaces", action="store_true", help="Export every MarketplaceId")
+    p.add_argument("--request", help="Request fields as JSON using API field names, e.g. '{\"totalReviews\": {\"min\": 100}}'")
+    p.add_argument("--page-size", type=int)
+    p.add_argument("--max-pages", type=int)
+    p.add_argument("--flush-rows", type=int, default=50_000, help="Rows per flush/checkpoint and Parquet row group")
+    p.add_argument("--no-resume", action="store_true", help="Ignore an existing checkpoint and start over")
+    p.add_argument("--api-key", help="API key (default: $SMARTSCOUT_API_KEY)")
+    p.set_defaults(handler=_export)
+
+    p = commands.add_parser("mock-server", help="Serve a local stand-in for the API generated from swagger.json")
+    p.add_argument("--spec", default="swagger.json", help="OpenAPI spec to serve (default: ./swagger.json)")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8080)
+    p.add_argument("--latency", type=float, nargs="+", default=[0.0], help="Seconds per response, or MIN MAX")
+    p.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    p.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    p.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with injected 429s")
+    p.add_argument("--total-records", type=int, default=1000, help="Rows available from each paged endpoint")
+    p.add_argument("--page-size", type=int, default=100, help="Default page size")
+    p.add_argument("--seed", type=int, default=0)
+    p.set_defaults(handler=_mock_server)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
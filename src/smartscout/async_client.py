@@ -0,0 +1,448 @@
+# src/smartscout/async_client.py
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar, Union
+from urllib.parse import urlsplit
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from .models.base import BaseRequest, BaseResponse, PagedResponse, PageOptions
+from . import models
+
+# Request and response models are only needed for annotations here; the client looks them up
+# through the lazy `smartscout.models` package when a method is first called.
+if TYPE_CHECKING:
+    from .models.requests import (
+        SearchBrandsRequest,
+        SearchProductsRequest,
+        SearchSearchTermsRequest,
+        SearchSellersRequest,
+        GetOrganicRanksRequest,
+        GetProductHistoryScopeRequest,
+        GetRelevantProductsRequest,
+        GetSubcategoryBrandsRequest,
+        GetBrandSalesHistoryRequest,
+        GetBrandSalesHistoryBySubcategoriesRequest,
+        GetBrandScopeRequest,
+        GetBrandScopeTopProductsRequest,
+        GetRelevantSearchTermsRequest,
+        GetSearchTermHistoryRequest,
+    )
+    from .models.responses import (
+        Brand,
+        Product,
+        Seller,
+        SearchTerm,
+        BrandSalesHistory,
+        ProductSalesHistory,
+    )
+from .exceptions import SmartScoutAPIError, RateLimitError, AuthenticationError, InvalidRequestError
+from .ratelimit import TokenBucket, RetryPolicy, parse_retry_after
+from .decoding import Flyweights, decode_paged, get_decoder, paged_model
+from .columnar import ColumnarPage, convert_page
+from .instrumentation import redacted_curl
+from .endpoints import AsyncEndpointsMixin
+from .operations import Operation, request_url
+from .serialization import dumps, to_wire
+from .prefetch import AsyncPrefetchingPager
+
+T = TypeVar('T', bound=BaseResponse)
+
+# Default `data` of `_paged_request`: send the request model itself as the JSON body.
+_REQUEST_BODY: Any = object()
+
+class AsyncSmartScoutAPIClient(AsyncEndpointsMixin):
+    """
+    An asyncio client for interacting with the SmartScout API.
+
+    Mirrors every method of `SmartScoutAPIClient`, including the generated spec operations, as a
+    coroutine and shares its request/response models. Requests go through a pooled `httpx.AsyncClient`, so connections are kept alive and
+    reused across calls; with `http2=True` concurrent calls are multiplexed over a single connection.
+
+    Use it as an async context manager, or call `aclose()` when done:
+
+        async with AsyncSmartScoutAPIClient(api_key="...", http2=True) as client:
+            terms = await asyncio.gather(*(client.get_relevant_search_terms(r) for r in requests))
+    """
+
+    BASE_URL = "https://api.smartscout.com/v1"
+
+    def __init__(
+        self,
+        api_key: str,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        max_connections_per_host: Optional[int] = None,
+        keepalive_expiry: float = 5.0,
+        http2: bool = False,
+        timeout: Union[float, Tuple[float, float]] = (5.0, 60.0),
+        rate_limiter: Optional[TokenBucket] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        validate_responses: bool = True,
+        flyweights: Union[bool, Flyweights] = False,
+        base_url: Optional[str] = None,
+        transport: Any = None,
+    ):
+        """
+        Args:
+            api_key: SmartScout API key.
+            max_connections: Upper bound on open connections in the pool.
+            max_keepalive_connections: Idle connections kept alive for reuse.
+            max_connections_per_host: Upper bound on concurrent requests to any single host.
+                Defaults to no limit beyond `max_connections`.
+            keepalive_expiry: Seconds an idle connection is kept before being closed.
+            http2: Negotiate HTTP/2 and multiplex requests over shared connections.
+                Requires the `h2` package (`pip install smartscout-api[http2]`).
+            timeout: `(connect, read)` timeout in seconds for each request, or one number for both.
+            rate_limiter: Optional `TokenBucket` shared with other clients, threads or tasks.
+            retry_policy: How 429/5xx responses and connection errors are retried. Defaults to
+                `RetryPolicy()`.
+            validate_responses: Fully validate every response row with pydantic (default). Set to
+                False to build models straight from the trusted payload via `smartscout.decoding`,
+                which is several times faster on large pages.
+            flyweights: Share repeated strings, `CategoryInfo` instances and field sets between
+                decoded rows to cut the memory held by large result sets (see `Flyweights`). True
+                uses a new table per response; pass a `Flyweights` instance to share one table
+                across every response of this client. Requires `validate_responses=False`; the
+                decoded models are read-only.
+            base_url: API root to send requests to instead of `BASE_URL`, e.g. a `MockServer` URL.
+            transport: Optional `httpx.AsyncBaseTransport` to send requests through instead of
+                httpx's pooled default, e.g. `httpx.MockTransport` in tests. The connection limits
+                and `http2` apply only to the default transport.
+        """
+        if httpx is None:
+            raise ImportError("AsyncSmartScoutAPIClient requires httpx; install it with `pip install smartscout-api[async]`")
+        self.api_key = api_key
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        if (flyweights is True or isinstance(flyweights, Flyweights)) and validate_responses:
+            raise ValueError("flyweights require validate_responses=False")
+        self.validate_responses = validate_responses
+        self.flyweights = flyweights
+        self.max_connections_per_host = max_connections_per_host
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.session = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+                "Accept": "application/json"
+            },
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            timeout=httpx.Timeout(timeout[1], connect=timeout[0]) if isinstance(timeout, tuple) else timeout,
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncSmartScoutAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying connection pool.
+        """
+        await self.session.aclose()
+
+    def _host_semaphore(self, url: str) -> Optional[asyncio.Semaphore]:
+        if self.max_connections_per_host is None:
+            return None
+        host = urlsplit(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.max_connections_per_host)
+        return semaphore
+
+    def _flyweight_table(self) -> Optional[Flyweights]:
+        """The table to decode one response through, or None when values are not shared."""
+        if self.flyweights is True:
+            return Flyweights()
+        return self.flyweights if isinstance(self.flyweights, Flyweights) else None
+
+    async def _make_request(self, method: str, endpoint: str, data: Dict[str, Any] = None, params: Dict[str, Any] = None, verbose: bool = False) -> Dict[str, Any]:
+        """
+        Make a request to the SmartScout API.
+        """
+        url = request_url(self.base_url, endpoint)
+        body = dumps(data) if data is not None else None
+
+        if verbose:
+            print(f"CURL command:\n{redacted_curl(method, url, self.session.headers, data, params)}")
+
+        semaphore = self._host_semaphore(url)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            try:
+                if semaphore is None:
+                    response = await self.session.request(method, url, content=body, params=params)
+                else:
+                    async with semaphore:
+                        response = await self.session.request(method, url, content=body, params=params)
+            except httpx.TransportError as e:
+                if not self.retry_policy.should_retry_error(attempt):
+                    raise SmartScoutAPIError(f"An error occurred: {e}")
+                await asyncio.sleep(self.retry_policy.backoff(attempt))
+                attempt += 1
+                continue
+            except httpx.HTTPError as e:
+                raise SmartScoutAPIError(f"An error occurred: {e}")
+            if not self.retry_policy.should_retry_status(response.status_code, attempt):
+                break
+            delay = self.retry_policy.backoff(attempt, parse_retry_after(response.headers.get("Retry-After")))
+            if response.status_code == 429 and self.rate_limiter is not None:
+                self.rate_limiter.penalize(delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        try:
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429:
+                raise RateLimitError("Rate limit exceeded", retry_after=parse_retry_after(e.response.headers.get("Retry-After")))
+            elif e.response.status_code == 401:
+                raise AuthenticationError("Invalid API key")
+            else:
+                raise SmartScoutAPIError(f"HTTP error occurred: {e}")
+        except httpx.HTTPError as e:
+            raise SmartScoutAPIError(f"An error occurred: {e}")
+
+    async def _paged_request(
+        self,
+        endpoint: str,
+        request: BaseRequest,
+        response_model: Type[T],
+        verbose: bool = False,
+        output: str = "models",
+        method: str = "POST",
+        data: Optional[Dict[str, Any]] = _REQUEST_BODY,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> PagedResponse[T]:
+        """
+        Make a paged request to the SmartScout API.
+
+        See `SmartScoutAPIClient._paged_request` for the `output` formats. `"stream"` is only
+        supported by the sync client.
+        """
+        if output == "stream":
+            raise InvalidRequestError("output='stream' is not supported by the async client")
+        if data is _REQUEST_BODY:
+            data = to_wire(request) if method == "POST" else None
+        response_data = await self._make_request(method, endpoint, data=data, params=params, verbose=verbose)
+        if output != "models":
+            return convert_page(response_data, response_model, output)
+        if not self.validate_responses:
+            return decode_paged(response_data, response_model, self._flyweight_table())
+        return paged_model(response_model)(**response_data)
+
+    async def _operation_request(self, operation: Operation, request: BaseRequest, verbose: bool = False, output: str = "models") -> Any:
+        """
+        Send one generated operation of the API spec; see `SmartScoutAPIClient._operation_request`.
+        """
+        path, params, data = operation.serialize(request)
+        if operation.paged:
+            return await self._paged_request(path, request, operation.response_model, verbose=verbose, output=output, method=operation.method, data=data, params=params)
+        response_data = await self._make_request(operation.method, path, data=data, params=params, verbose=verbose)
+        if not self.validate_responses:
+            return get_decoder(operation.response_model, self._flyweight_table()).decode(response_data)
+        return operation.response_model.parse_obj(response_data)
+
+    async def search_brands(self, request: SearchBrandsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Brand]:
+        """
+        Search for brands based on the given criteria.
+        """
+        return await self._paged_request("/brands/search", request, models.Brand, verbose=verbose, output=output)
+
+    async def search_products(self, request: SearchProductsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Product]:
+        """
+        Search for products based on specified criteria.
+
+        See `SmartScoutAPIClient.search_products` for details.
+        """
+        return await self._paged_request("/products/search", request, models.Product, verbose=verbose, output=output)
+
+    async def search_search_terms(self, request: SearchSearchTermsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SearchTerm]:
+        """
+        Search for search terms based on the given criteria.
+        """
+        return await self._paged_request("/search-terms/search", request, models.SearchTerm, verbose=verbose, output=output)
+
+    async def search_sellers(self, request: SearchSellersRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Seller]:
+        """
+        Search for sellers based on the given criteria.
+        """
+        return await self._paged_request("/sellers/search", request, models.Seller, verbose=verbose, output=output)
+
+    async def get_organic_ranks(self, request: GetOrganicRanksRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Product]:
+        """
+        Get organic ranks for products based on the given criteria.
+        """
+        return await self._paged_request("/products/organic-ranks", request, models.Product, verbose=verbose, output=output)
+
+    async def get_product_history_scope(self, request: GetProductHistoryScopeRequest, verbose: bool = False, output: str = "models") -> PagedResponse[ProductSalesHistory]:
+        """
+        Get product history scope based on the given criteria.
+        """
+        return await self._paged_request("/products/history/scope", request, models.ProductSalesHistory, verbose=verbose, output=output)
+
+    async def get_relevant_products(self, request: GetRelevantProductsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Product]:
+        """
+        Get relevant products based on the given criteria.
+        """
+        return await self._paged_request("/products/relevant", request, models.Product, verbose=verbose, output=output)
+
+    async def get_subcategory_brands(self, request: GetSubcategoryBrandsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Brand]:
+        """
+        Get brands in a subcategory based on the given criteria.
+        """
+        return await self._paged_request("/subcategories/brands", request, models.Brand, verbose=verbose, output=output)
+
+    async def get_brand_sales_history(self, request: GetBrandSalesHistoryRequest, verbose: bool = False, output: str = "models") -> PagedResponse[BrandSalesHistory]:
+        """
+        Get brand sales history based on the given criteria.
+        """
+        return await self._paged_request("/brands/history/sales", request, models.BrandSalesHistory, verbose=verbose, output=output)
+
+    async def get_brand_sales_history_by_subcategories(self, request: GetBrandSalesHistoryBySubcategoriesRequest, verbose: bool = False, output: str = "models") -> PagedResponse[BrandSalesHistory]:
+        """
+        Get brand sales history by subcategories based on the given criteria.
+        """
+        return await self._paged_request("/brands/history/sales-by-subcategories", request, models.BrandSalesHistory, verbose=verbose, output=output)
+
+    async def get_brand_scope(self, request: GetBrandScopeRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Brand]:
+        """
+        Get brand scope based on the given criteria.
+        """
+        return await self._paged_request("/brands/scope", request, models.Brand, verbose=verbose, output=output)
+
+    async def get_brand_scope_top_products(self, request: GetBrandScopeTopProductsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Product]:
+        """
+        Get top products in a brand scope based on the given criteria.
+        """
+        return await self._paged_request("/brands/scope/top-products", request, models.Product, verbose=verbose, output=output)
+
+    async def get_relevant_search_terms(self, request: GetRelevantSearchTermsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SearchTerm]:
+        """
+        Get relevant search terms based on the given criteria.
+        """
+        return await self._paged_request("/search-terms/relevant", request, models.SearchTerm, verbose=verbose, output=output)
+
+    async def get_search_term_history(self, request: GetSearchTermHistoryRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SearchTerm]:
+        """
+        Get search term history based on the given criteria.
+        """
+        return await self._paged_request("/search-terms/history", request, models.SearchTerm, verbose=verbose, output=output)
+
+    async def iter_pages(
+        self,
+        method: Callable[..., Awaitable[PagedResponse[T]]],
+        request: BaseRequest,
+        page_size: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        verbose: bool = False,
+        output: str = "models",
+        prefetch: int = 0,
+    ) -> AsyncIterator[PagedResponse[T]]:
+        """
+        Yield successive pages of a paged endpoint, following `Paging.next_page_id`.
+
+        See `SmartScoutAPIClient.iter_pages`; with `prefetch=n` the next pages are fetched by a
+        background task (see `AsyncPrefetchingPager`).
+        """
+        pages = self._iter_pages(method, request, page_size, max_pages, verbose, output)
+        if not prefetch:
+            async for page in pages:
+                yield page
+            return
+        async with AsyncPrefetchingPager(pages, depth=prefetch) as pager:
+            async for page in pager:
+                yield page
+
+    async def _iter_pages(
+        self,
+        method: Callable[..., Awaitable[PagedResponse[T]]],
+        request: BaseRequest,
+        page_size: Optional[int],
+        max_pages: Optional[int],
+        verbose: bool,
+        output: str,
+    ) -> AsyncIterator[PagedResponse[T]]:
+        request = request.copy(deep=True)
+        if request.page is None:
+            request.page = PageOptions()
+        if page_size is not None:
+            request.page.size = page_size
+
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            response = await method(request, verbose=verbose, output=output)
+            pages += 1
+            next_page_id = response.paging.next_page_id
+            has_more = response.paging.has_more_records
+            yield response
+            del response
+            if not has_more or not next_page_id:
+                return
+            request.page.id = next_page_id
+
+    async def iter_items(
+        self,
+        method: Callable[..., Awaitable[PagedResponse[T]]],
+        request: BaseRequest,
+        page_size: Optional[int] = None,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        verbose: bool = False,
+        prefetch: int = 0,
+    ) -> AsyncIterator[T]:
+        """
+        Yield the items of a paged endpoint one at a time across all pages.
+
+        See `SmartScoutAPIClient.iter_items`.
+        """
+        if max_items is not None and max_items <= 0:
+            return
+        count = 0
+        async for page in self.iter_pages(method, request, page_size=page_size, max_pages=max_pages, verbose=verbose, prefetch=prefetch):
+            for item in page.data or []:
+                yield item
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+
+    def iter_brands(self, request: SearchBrandsRequest, page_size: Optional[int] = None, max_items: Optional[int] = None, max_pages: Optional[int] = None, verbose: bool = False) -> AsyncIterator[Brand]:
+        """
+        Iterate over every brand matching the given criteria, across all pages.
+        """
+        return self.iter_items(self.search_brands, request, page_size=page_size, max_items=max_items, max_pages=max_pages, verbose=verbose)
+
+    def iter_products(self, request: SearchProductsRequest, page_size: Optional[int] = None, max_items: Optional[int] = None, max_pages: Optional[int] = None, verbose: bool = False) -> AsyncIterator[Product]:
+        """
+        Iterate over every product matching the given criteria, across all pages.
+        """
+        return self.iter_items(self.search_products, request, page_size=page_size, max_items=max_items, max_pages=max_pages, verbose=verbose)
+
+    def iter_search_terms(self, request: SearchSearchTermsRequest, page_size: Optional[int] = None, max_items: Optional[int] = None, max_pages: Optional[int] = None, verbose: bool = False) -> AsyncIterator[SearchTerm]:
+        """
+        Iterate over every search term matching the given criteria, across all pages.
+        """
+        return self.iter_items(self.search_search_terms, request, page_size=page_size, max_items=max_items, max_pages=max_pages, verbose=verbose)
+
+    def iter_sellers(self, request: SearchSellersRequest, page_size: Optional[int] = None, max_items: Optional[int] = None, max_pages: Optional[int] = None, verbose: bool = False) -> AsyncIterator[Seller]:
+        """
+        Iterate over every seller matching the given criteria, across all pages.
+        """
+        return self.iter_items(self.search_sellers, request, page_size=page_size, max_items=max_items, max_pages=max_pages, verbose=verbose)
@@ -0,0 +1,146 @@
+# src/smartscout/bulk.py
+
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, NamedTuple, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+class BatchResult(NamedTuple):
+    """
+    Outcome of one item of a bulk run.
+
+    Exactly one of `response` and `error` is set; failures are returned as values so that one bad
+    item does not abort the rest of the batch.
+    """
+    index: int
+    request: Any
+    response: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+class LookupResult(Dict[str, Optional[T]]):
+    """
+    Outcome of a bulk lookup: a dict from each requested key to its row, or None when the API did
+    not return it.
+
+    Keys whose batch failed are left out of the dict and listed in `errors` with the exception
+    that batch raised, so one failed request does not discard the rows of the others. Retry them
+    with another lookup of `list(result.errors)`.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.errors: Dict[str, BaseException] = {}
+
+def run_batch(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = 8,
+    ordered: bool = True,
+) -> Iterator[BatchResult]:
+    """
+    Run `fn` over `items` on a bounded thread pool, yielding a `BatchResult` per item.
+
+    `items` is consumed lazily and at most `2 * max_workers` items are in flight or buffered at any
+    time, so arbitrarily large (or generated) inputs run in constant memory. With `ordered=True`
+    results come back in input order; otherwise they are yielded as soon as they complete.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    window = max_workers * 2
+    source = enumerate(items)
+    pending: Dict[Future, Tuple[int, Any]] = {}
+    buffered: Dict[int, BatchResult] = {}
+    next_index = 0
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        def fill() -> None:
+            while len(pending) + len(buffered) < window:
+                try:
+                    index, item = next(source)
+                except StopIteration:
+                    return
+                pending[executor.submit(fn, item)] = (index, item)
+
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, item = pending.pop(future)
+                error = future.exception()
+                result = BatchResult(index, item, None if error is not None else future.result(), error)
+                if ordered:
+                    buffered[index] = result
+                else:
+                    yield result
+            if ordered:
+                while next_index in buffered:
+                    yield buffered.pop(next_index)
+                    next_index += 1
+            fill()
+    finally:
+        # Abandon queued work if the caller stops iterating early.
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+_EXHAUSTED = object()
+
+def merge_iterators(
+    sources: Mapping[Any, Iterable[Any]],
+    max_workers: Optional[int] = None,
+    buffer: int = 256,
+) -> Iterator[Tuple[Any, Any]]:
+    """
+    Drain several iterables concurrently and yield `(key, item)` pairs as items arrive.
+
+    Each source is consumed on its own worker thread (at most `max_workers` at once), so a slow
+    source does not hold up the others. Items of one source keep their relative order; across
+    sources they are interleaved in arrival order. At most `buffer` items are held in memory. If a
+    source raises, the exception is re-raised to the caller and the remaining sources are stopped.
+    """
+    if not sources:
+        return
+    ready: "queue.Queue" = queue.Queue(maxsize=buffer)
+    stop = threading.Event()
+
+    def put(entry: Tuple[Any, Any, Optional[BaseException]]) -> bool:
+        while not stop.is_set():
+            try:
+                ready.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def drain(key: Any, source: Iterable[Any]) -> None:
+        try:
+            for item in source:
+                if not put((key, item, None)):
+                    return
+            put((key, _EXHAUSTED, None))
+        except BaseException as e:
+            put((key, None, e))
+
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(sources))
+    try:
+        for key, source in sources.items():
+            executor.submit(drain, key, source)
+        remaining = len(sources)
+        while remaining:
+            key, item, error = ready.get()
+            if error is not None:
+                raise error
+            if item is _EXHAUSTED:
+                remaining -= 1
+                continue
+            yield key, item
+    finally:
+        stop.set()
+        executor.shutdown(wait=True)
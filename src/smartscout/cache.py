@@ -0,0 +1,236 @@
+# src/smartscout/cache.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional, TypeVar
+
+from .serialization import dumps
+
+R = TypeVar('R')
+
+def cache_key(method: str, endpoint: str, data: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None, body: Optional[bytes] = None) -> str:
+    """
+    Build a stable cache key for a request.
+
+    The key covers the HTTP method, endpoint and the canonical JSON encoding (sorted keys, no
+    whitespace; see `smartscout.serialization.dumps`) of the body and query parameters, so
+    logically identical requests map to the same key regardless of field order. Pass the
+    already encoded `body` instead of `data` to skip encoding it again.
+    """
+    if body is None:
+        body = dumps(data or {})
+    digest = hashlib.sha256(f"{method.upper()} {endpoint}\n".encode("utf-8"))
+    digest.update(body)
+    digest.update(b"\n")
+    digest.update(dumps(params or {}))
+    return digest.hexdigest()
+
+class ResponseCache:
+    """
+    Base class for response caches used by `SmartScoutAPIClient`.
+
+    Subclasses implement `get`, `set` and `clear`. Expiry is decided here: `default_ttl` applies
+    to every endpoint unless `ttls` has an entry for it. A TTL of `None` never expires and a TTL
+    of `0` disables caching for that endpoint.
+    """
+
+    def __init__(self, default_ttl: Optional[float] = 24 * 60 * 60, ttls: Optional[Mapping[str, Optional[float]]] = None):
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+class SQLiteCache(ResponseCache):
+    """
+    Persistent response cache stored in a single SQLite file.
+
+    Entries are zlib-compressed JSON. When the stored size exceeds `max_bytes`, the least recently
+    used entries are evicted. The file can be shared by several processes, and one instance can be
+    shared by threads.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        default_ttl: Optional[float] = 24 * 60 * 60,
+        ttls: Optional[Mapping[str, Optional[float]]] = None,
+    ):
+        super().__init__(default_ttl=default_ttl, ttls=ttls)
+        self.path = path
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " expires_at REAL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+        # Upper bound on the stored size; only recomputed exactly when it crosses max_bytes.
+        self._approx_size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        return json.loads(zlib.decompress(value))
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        now = time.time()
+        blob = zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+        if len(blob) > self.max_bytes:
+            return
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, expires_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), expires_at, now),
+            )
+            self._approx_size += len(blob)
+            if self._approx_size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        self._conn.execute("DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall()
+        total = sum(size for _, size in rows)
+        doomed = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self._approx_size = total
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._approx_size = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+class MemoryCache(ResponseCache):
+    """
+    In-process, size-bounded LRU response cache with per-entry expiry.
+
+    Holds at most `max_entries` responses; the least recently used entry is dropped first.
+    Cached dicts are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: Optional[float] = 5 * 60,
+        ttls: Optional[Mapping[str, Optional[float]]] = None,
+    ):
+        super().__init__(default_ttl=default_ttl, ttls=ttls)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    Collapse concurrent identical calls into one.
+
+    The first caller for a key runs the function. Callers arriving with the same key while it is
+    still in flight wait for it and receive the same result, or the same exception.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], R]) -> R:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,187 @@
+# src/smartscout/cassette.py
+
+import io
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3 import HTTPResponse
+
+from .cache import cache_key
+from .transport import PooledAdapter
+
+CASSETTE_MODES = ("record", "replay", "once")
+
+_HEAD = b'{"version": 1, "interactions": [\n'
+_TAIL = b"\n]}\n"
+
+class CassetteMiss(requests.exceptions.RequestException):
+    """Raised in replay mode when a request has no recorded response."""
+
+class CassetteAdapter(BaseAdapter):
+    """
+    A `requests` transport adapter that records responses to a cassette file and replays them.
+
+    Requests are matched on method, path, query string and canonical JSON body; the host is
+    ignored, so a cassette recorded against the real API replays against any `base_url`.
+    Request headers (including the API key) are never written to the cassette. A request that
+    was recorded several times (e.g. pages re-fetched after a retry) replays its responses in
+    recorded order, repeating the last one.
+
+    New interactions are appended to the cassette as they are recorded, so the file stays valid
+    JSON without being rewritten for every request. Streamed responses (`stream=True`) are
+    recorded once the caller has read them to the end; a stream closed early is not recorded.
+
+    Modes:
+        - `"replay"`: serve only from the cassette; unknown requests raise `CassetteMiss`.
+        - `"record"`: send every request over the network and (re)record the responses.
+        - `"once"`: replay recorded requests and record the ones the cassette does not have yet.
+
+    Example:
+        ```python
+        client = SmartScoutAPIClient(api_key, adapter=CassetteAdapter("tests/cassettes/brands.json", mode="once"))
+        ```
+    """
+
+    def __init__(self, path: str, mode: str = "replay", adapter: Optional[BaseAdapter] = None):
+        super().__init__()
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"mode must be one of {', '.join(CASSETTE_MODES)}, not {mode!r}")
+        self.path = path
+        self.mode = mode
+        self.adapter = adapter or PooledAdapter()
+        self._builder = self.adapter if isinstance(self.adapter, HTTPAdapter) else HTTPAdapter()
+        self._lock = threading.Lock()
+        self._interactions: Dict[str, List[Dict[str, Any]]] = {}
+        self._played: Dict[str, int] = {}
+        self._recorded: set = set()
+        self._written = False
+        if mode != "record" and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for interaction in json.load(f).get("interactions", []):
+                    self._interactions.setdefault(interaction["key"], []).append(interaction)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        key = _request_key(request)
+        with self._lock:
+            recorded = self._interactions.get(key)
+            replay = self.mode != "record" and recorded and key not in self._recorded
+            if replay:
+                index = self._played.get(key, 0)
+                self._played[key] = index + 1
+                interaction = recorded[min(index, len(recorded) - 1)]
+        if replay:
+            return self._build_response(request, interaction["response"])
+        if self.mode == "replay":
+            raise CassetteMiss(f"No recorded response for {request.method} {request.path_url} in {self.path}", request=request)
+
+        response = self.adapter.send(request, **kwargs)
+        if kwargs.get("stream"):
+            # Leave the body on the socket for the caller and record what it reads.
+            response.raw = _RecordingStream(response.raw, lambda content: self._record(key, request, response, content))
+        else:
+            self._record(key, request, response, response.content)
+        return response
+
+    def _record(self, key: str, request: requests.PreparedRequest, response: requests.Response, content: bytes) -> None:
+        interaction = {
+            "key": key,
+            "request": {"method": request.method, "url": request.path_url, "body": _json_body(request.body)},
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": {k: v for k, v in response.headers.items() if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")},
+                "body": content.decode("utf-8", errors="replace"),
+            },
+        }
+        with self._lock:
+            if key not in self._recorded:
+                # First recording of this request in this session replaces older recordings.
+                self._interactions[key] = []
+                self._recorded.add(key)
+            self._interactions[key].append(interaction)
+            self._append(interaction)
+
+    def _build_response(self, request: requests.PreparedRequest, recorded: Dict[str, Any]) -> requests.Response:
+        body = recorded["body"].encode("utf-8")
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers={**recorded["headers"], "Content-Length": str(len(body))},
+            status=recorded["status"],
+            reason=recorded.get("reason"),
+            preload_content=False,
+            decode_content=False,
+        )
+        return self._builder.build_response(request, raw)
+
+    def _append(self, interaction: Dict[str, Any]) -> None:
+        if self._written:
+            with open(self.path, "r+b") as f:
+                f.seek(-len(_TAIL), os.SEEK_END)
+                f.write(b",\n" + json.dumps(interaction).encode("utf-8") + _TAIL)
+            return
+        # The first recording of a session writes the whole cassette; later ones only append.
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        interactions = [interaction for recorded in self._interactions.values() for interaction in recorded]
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(_HEAD + b",\n".join(json.dumps(interaction).encode("utf-8") for interaction in interactions) + _TAIL)
+        os.replace(tmp, self.path)
+        self._written = True
+
+    def close(self) -> None:
+        self.adapter.close()
+
+class _RecordingStream:
+    """Wraps a streamed `urllib3` response, passing decoded bytes to `on_complete` once read to the end."""
+
+    def __init__(self, raw: HTTPResponse, on_complete: Callable[[bytes], None]):
+        self._raw = raw
+        self._on_complete: Optional[Callable[[bytes], None]] = on_complete
+        self._chunks: List[bytes] = []
+
+    def read(self, amt: Optional[int] = None, decode_content: Optional[bool] = None, **kwargs: Any) -> bytes:
+        # Always decode, so the cassette holds the body its recorded headers describe.
+        data = self._raw.read(amt, decode_content=True, **kwargs)
+        if self._on_complete is not None:
+            self._chunks.append(data)
+            if amt is None or (amt and not data):
+                on_complete, self._on_complete = self._on_complete, None
+                on_complete(b"".join(self._chunks))
+                self._chunks = []
+        return data
+
+    def readinto(self, buffer: bytearray) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def stream(self, amt: int = 2 ** 16, decode_content: Optional[bool] = None) -> Iterator[bytes]:
+        while True:
+            data = self.read(amt)
+            if not data:
+                return
+            yield data
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._raw, name)
+
+def _json_body(body: Any) -> Any:
+    if body is None:
+        return None
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    try:
+        return json.loads(body)
+    except ValueError:
+        return body
+
+def _request_key(request: requests.PreparedRequest) -> str:
+    url = urlsplit(request.url)
+    body = _json_body(request.body)
+    return cache_key(request.method, url.path, data=body if isinstance(body, dict) else {"body": body}, params={"query": url.query})
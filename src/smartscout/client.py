@@ -1,86 +1,331 @@
 # src/smartscout/client.py
 
+from __future__ import annotations
+
+import threading
+import time
+import warnings
+from contextlib import contextmanager
 import requests
-from typing import Dict, Any, Type, TypeVar, Generic
-from .models.base import BaseRequest, BaseResponse, PagedResponse
+from typing import TYPE_CHECKING, Dict, Any, Type, TypeVar, Generic, Callable, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from .models.base import BaseRequest, BaseResponse, PagedResponse, PageOptions, ListFilter
 
 from .models.enums import MarketplaceId
-from .models.requests import (
-    SearchBrandsRequest,
-    SearchProductsRequest,
-    SearchSearchTermsRequest,
-    SearchSellersRequest,
-    GetOrganicRanksRequest,
-    GetProductHistoryScopeRequest,
-    GetRelevantProductsRequest,
-    GetSubcategoryBrandsRequest,
-    GetBrandSalesHistoryRequest,
-    GetBrandSalesHistoryBySubcategoriesRequest,
-    GetBrandScopeRequest,
-    GetBrandScopeTopProductsRequest,
-    GetRelevantSearchTermsRequest,
-    GetSearchTermHistoryRequest
-)
-from .models.responses import (
-    Brand,
-    Product,
-    Seller,
-    SearchTerm,
-    BrandSalesHistory,
-    ProductSalesHistory,
-    SellerPerformance,
-    CategoryTrend,
-    CompetitorAnalysis,
-    BrandPagedResponse,
-    ProductPagedResponse,
-    SellerPagedResponse,
-    SearchTermPagedResponse,
-    # Remove OrganicRank if it's not defined in responses.py
-    # OrganicRank,
-)
-from .exceptions import SmartScoutAPIError, RateLimitError, AuthenticationError
+from . import models
+
+# Request and response models are only needed for annotations here; the client looks them up
+# through the lazy `smartscout.models` package when a method is first called.
+if TYPE_CHECKING:
+    from .models.requests import (
+        SearchBrandsRequest,
+        SearchProductsRequest,
+        SearchSearchTermsRequest,
+        SearchSellersRequest,
+        GetOrganicRanksRequest,
+        GetProductHistoryScopeRequest,
+        GetRelevantProductsRequest,
+        GetSubcategoryBrandsRequest,
+        GetBrandSalesHistoryRequest,
+        GetBrandSalesHistoryBySubcategoriesRequest,
+        GetBrandScopeRequest,
+        GetBrandScopeTopProductsRequest,
+        GetRelevantSearchTermsRequest,
+        GetSearchTermHistoryRequest,
+    )
+    from .models.responses import (
+        Brand,
+        Product,
+        Seller,
+        SearchTerm,
+        BrandSalesHistory,
+        ProductSalesHistory,
+        SellerPerformance,
+        CategoryTrend,
+        CompetitorAnalysis,
+        BrandPagedResponse,
+        ProductPagedResponse,
+        SellerPagedResponse,
+        SearchTermPagedResponse,
+        # Remove OrganicRank if it's not defined in responses.py
+        # OrganicRank,
+    )
+from .exceptions import SmartScoutAPIError, RateLimitError, AuthenticationError, InvalidRequestError
+from .ratelimit import TokenBucket, RetryPolicy, parse_retry_after
+from .decoding import Flyweights, decode_paged, get_decoder, paged_model
+from .columnar import ColumnarPage, convert_page
+from .streaming import StreamedPage
+from .prefetch import PrefetchingPager
+from .bulk import BatchResult, LookupResult, run_batch, merge_iterators
+from .sharding import Number, ShardedScan
+from .cache import ResponseCache, SingleFlight, cache_key
+from .serialization import dumps, to_wire
+from .instrumentation import RequestHook, Trace, redacted_curl
+from .transport import PooledAdapter, Timeout
+from .endpoints import EndpointsMixin
+from .operations import Operation, request_url
 
 T = TypeVar('T', bound=BaseResponse)
 
-class SmartScoutAPIClient:
+# Default `data` of `_paged_request`: send the request model itself as the JSON body.
+_REQUEST_BODY: Any = object()
+
+class SmartScoutAPIClient(EndpointsMixin):
     """
     A client for interacting with the SmartScout API.
+
+    Besides the hand-written methods below, every operation of the API spec is available as a
+    generated method (see `smartscout.endpoints`), e.g. `client.brands_search_v2(...)`.
     """
 
     BASE_URL = "https://api.smartscout.com/v1"
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        rate_limiter: Optional[TokenBucket] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
+        validate_responses: bool = True,
+        flyweights: Union[bool, Flyweights] = False,
+        base_url: Optional[str] = None,
+        adapter: Optional[requests.adapters.BaseAdapter] = None,
+        hooks: Optional[Iterable[RequestHook]] = None,
+        timeout: Optional[Timeout] = (5.0, 60.0),
+    ):
+        """
+        Args:
+            api_key: SmartScout API key.
+            rate_limiter: Optional `TokenBucket` every request must draw from. Pass the same
+                instance to several clients (sync or async) to share one quota.
+            retry_policy: How 429/5xx responses and connection errors are retried. Defaults to
+                `RetryPolicy()`; pass `RetryPolicy(max_retries=0)` to disable retries.
+            cache: Optional `ResponseCache` (e.g. `SQLiteCache`). Cache hits are served without a
+                network round trip and without drawing from the rate limiter. Use `MemoryCache`
+                for a per-process LRU or `SQLiteCache` to persist across runs.
+            coalesce_requests: When True, identical requests already in flight on another thread
+                wait for that call and share its result instead of issuing their own.
+            validate_responses: Fully validate every response row with pydantic (default). Set to
+                False to build models straight from the trusted payload via `smartscout.decoding`,
+                which is several times faster on large pages.
+            flyweights: Share repeated strings, `CategoryInfo` instances and field sets between
+                decoded rows to cut the memory held by large result sets (see `Flyweights`). True
+                uses a new table per response; pass a `Flyweights` instance to share one table
+                across every response of this client. Requires `validate_responses=False`; the
+                decoded models are read-only.
+            base_url: API root to send requests to instead of `BASE_URL`, e.g. a `MockServer` URL.
+            adapter: Transport adapter shared by every thread's session. Defaults to a
+                `PooledAdapter` (pooled keep-alive connections); pass e.g. `PooledAdapter(pool_maxsize=64)`
+                to tune the pool, an `HttpxTransport`, a `StubTransport` in tests, or a
+                `CassetteAdapter` to record and replay responses.
+            hooks: Callables invoked with a `RequestEvent` after every API call (timings, bytes,
+                rows, retries, cache outcome), e.g. `PrometheusHook()` or `RequestStats()`.
+            timeout: `(connect, read)` timeout in seconds for every request, or one number for
+                both. The read timeout bounds each wait for data; timeouts are retried like other
+                connection errors. `None` waits forever.
+        """
         self.api_key = api_key
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.adapter = adapter if adapter is not None else PooledAdapter()
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        if (flyweights is True or isinstance(flyweights, Flyweights)) and validate_responses:
+            raise ValueError("flyweights require validate_responses=False")
+        self.validate_responses = validate_responses
+        self.flyweights = flyweights
+        self.cache = cache
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self._local = threading.local()
+        self.hooks: List[RequestHook] = list(hooks or [])
+
+    def add_hook(self, hook: RequestHook) -> RequestHook:
+        """
+        Register a callable to receive a `RequestEvent` after every API call. Returns the hook.
+        """
+        self.hooks.append(hook)
+        return hook
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The `requests.Session` used by the current thread.
+
+        `requests.Session` is not documented as thread-safe, so each thread gets its own session
+        (and connection pool), which makes one client safe to share across worker threads.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._new_session()
+        return session
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update({
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "Accept": "application/json"
         })
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        return session
 
-    def _make_request(self, method: str, endpoint: str, data: Dict[str, Any] = None, params: Dict[str, Any] = None, verbose: bool = False) -> Dict[str, Any]:
+    @contextmanager
+    def bypass_cache(self):
         """
-        Make a request to the SmartScout API.
+        Skip cache lookups for requests made by the current thread inside this block.
+
+        Fresh responses are still written back, so this also refreshes the cached entries.
+        """
+        previous = getattr(self._local, "bypass_cache", False)
+        self._local.bypass_cache = True
+        try:
+            yield self
+        finally:
+            self._local.bypass_cache = previous
+
+    @contextmanager
+    def _traced(self, method: str, endpoint: str, request: BaseRequest):
+        """
+        Collect a `Trace` for the call made inside this block and pass its event to the hooks.
+
+        Yields None when no hooks are registered.
+        """
+        if not self.hooks:
+            yield None
+            return
+        marketplace = getattr(request, "marketplace", None)
+        trace = self._local.trace = Trace(method, endpoint, getattr(marketplace, "value", marketplace))
+        try:
+            yield trace
+        except BaseException as e:
+            trace.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self._local.trace = None
+            event = trace.event()
+            for hook in list(self.hooks):
+                try:
+                    hook(event)
+                except Exception as e:
+                    warnings.warn(f"Request hook {hook!r} failed: {e!r}", RuntimeWarning)
+
+    def _flyweight_table(self) -> Optional[Flyweights]:
+        """The table to decode one response through, or None when values are not shared."""
+        if self.flyweights is True:
+            return Flyweights()
+        return self.flyweights if isinstance(self.flyweights, Flyweights) else None
+
+    def _make_request(self, method: str, endpoint: str, data: Dict[str, Any] = None, params: Dict[str, Any] = None, verbose: bool = False, route: Optional[str] = None) -> Dict[str, Any]:
         """
-        url = f"{self.BASE_URL}{endpoint}"
-        
+        Make a request to the SmartScout API.
+
+        `route` is the endpoint's path template when `endpoint` has path parameters filled in;
+        cache TTLs are looked up by it.
+        """
+        trace = getattr(self._local, "trace", None)
+        # Encoded once: the same canonical bytes are the request body and the cache key.
+        body = dumps(data) if data is not None else None
+        key = None
+        ttl = None
+        if self.cache is not None:
+            ttl = self.cache.ttl_for(route or endpoint)
+            if ttl != 0:
+                key = cache_key(method, endpoint, params=params, body=body)
+                if getattr(self._local, "bypass_cache", False):
+                    if trace is not None:
+                        trace.cache = "bypass"
+                else:
+                    cached = self.cache.get(key)
+                    if trace is not None:
+                        trace.cache = "miss" if cached is None else "hit"
+                    if cached is not None:
+                        return cached
+
+        def fetch() -> Dict[str, Any]:
+            if trace is not None:
+                trace.coalesced = False
+            response_data = self._send_request(method, endpoint, data=data, params=params, verbose=verbose, body=body)
+            if key is not None:
+                self.cache.set(key, response_data, ttl=ttl)
+            return response_data
+
+        if self._single_flight is None:
+            return fetch()
+        if trace is not None:
+            # Reset by fetch() when this thread ends up making the call itself.
+            trace.coalesced = True
+        return self._single_flight.do(key or cache_key(method, endpoint, params=params, body=body), fetch)
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Dict[str, Any] = None,
+        params: Dict[str, Any] = None,
+        verbose: bool = False,
+        stream: bool = False,
+        body: Optional[bytes] = None,
+    ) -> Any:
+        """
+        Send a request over the network, applying rate limiting and retries.
+
+        `data` is sent as its canonical JSON encoding, or as `body` when the caller already
+        encoded it. Returns the decoded JSON body, or with `stream=True` the open
+        `requests.Response` whose body has not been read yet; the caller is responsible for closing it.
+        """
+        url = request_url(self.base_url, endpoint)
+        if body is None and data is not None:
+            body = dumps(data)
+        trace = getattr(self._local, "trace", None)
+
         if verbose:
-            curl_command = f"curl -X {method.upper()} '{url}'"
-            for header, value in self.session.headers.items():
-                curl_command += f" -H '{header}: {value}'"
-            if data:
-                curl_command += f" -d '{json.dumps(data)}'"
-            if params:
-                curl_command += f" -G {' '.join([f'-d {k}={shlex.quote(str(v))}' for k, v in params.items()])}"
-            print(f"CURL command:\n{curl_command}")
+            print(f"CURL command:\n{redacted_curl(method, url, self.session.headers, data, params)}")
 
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = self.session.request(method, url, data=body, params=params, stream=stream, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not self.retry_policy.should_retry_error(attempt):
+                    raise SmartScoutAPIError(f"An error occurred: {e}")
+                time.sleep(self.retry_policy.backoff(attempt))
+                attempt += 1
+                continue
+            except requests.exceptions.RequestException as e:
+                raise SmartScoutAPIError(f"An error occurred: {e}")
+            if not self.retry_policy.should_retry_status(response.status_code, attempt):
+                break
+            delay = self.retry_policy.backoff(attempt, parse_retry_after(response.headers.get("Retry-After")))
+            if response.status_code == 429 and self.rate_limiter is not None:
+                self.rate_limiter.penalize(delay)
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+        if trace is not None:
+            trace.retries = attempt
+            trace.status = response.status_code
+            trace.ttfb = response.elapsed.total_seconds()
+            body = response.request.body
+            trace.request_bytes = len(body) if body else 0
         try:
-            response = self.session.request(method, url, json=data, params=params)
             response.raise_for_status()
-            return response.json()
+            if stream:
+                return response
+            if trace is None:
+                return response.json()
+            start = time.perf_counter()
+            response_data = response.json()
+            trace.parse += time.perf_counter() - start
+            trace.response_bytes = _bytes_read(response)
+            return response_data
         except requests.exceptions.HTTPError as e:
+            response.close()
             if e.response.status_code == 429:
-                raise RateLimitError("Rate limit exceeded")
+                raise RateLimitError("Rate limit exceeded", retry_after=parse_retry_after(e.response.headers.get("Retry-After")))
             elif e.response.status_code == 401:
                 raise AuthenticationError("Invalid API key")
             else:
@@ -88,24 +333,87 @@ class SmartScoutAPIClient:
         except requests.exceptions.RequestException as e:
             raise SmartScoutAPIError(f"An error occurred: {e}")
 
-    def _paged_request(self, endpoint: str, request: BaseRequest, response_model: Type[T], verbose: bool = False) -> PagedResponse[T]:
+    def _paged_request(
+        self,
+        endpoint: str,
+        request: BaseRequest,
+        response_model: Type[T],
+        verbose: bool = False,
+        output: str = "models",
+        method: str = "POST",
+        data: Optional[Dict[str, Any]] = _REQUEST_BODY,
+        params: Optional[Dict[str, Any]] = None,
+        route: Optional[str] = None,
+    ) -> PagedResponse[T]:
         """
         Make a paged request to the SmartScout API.
-        """
-        data = request.dict(exclude_none=True)
-        response_data = self._make_request("POST", endpoint, data=data, verbose=verbose)
-        return PagedResponse[response_model](**response_data)
 
-    def search_brands(self, request: SearchBrandsRequest, verbose: bool = False) -> PagedResponse[Brand]:
+        With `output="models"` (the default) the page is a `PagedResponse` of models. `"records"`,
+        `"arrow"` and `"pandas"` skip model construction and return a `ColumnarPage` whose `data` is
+        a list of dicts, a `pyarrow.Table` or a `pandas.DataFrame` decoded straight from the payload.
+        `"stream"` returns a `StreamedPage` that parses rows from the socket as they arrive; it
+        always goes to the network, bypassing the response cache.
+
+        By default the request model is sent as the JSON body of a POST; generated operations
+        pass their own `method`, serialized `data`/`params` and path template (`route`), and a
+        `data` of None sends no body at all.
+        """
+        if data is _REQUEST_BODY:
+            data = to_wire(request) if method == "POST" else None
+        with self._traced(method, route or endpoint, request) as trace:
+            if output == "stream":
+                response = self._send_request(method, endpoint, data=data, params=params, verbose=verbose, stream=True)
+                if self.validate_responses:
+                    return StreamedPage(response, response_model.parse_obj)
+                return StreamedPage(response, get_decoder(response_model, self._flyweight_table()).decode)
+            # Only generated operations carry a query string and a path template.
+            extra = {} if route is None else {"params": params, "route": route}
+            response_data = self._make_request(method, endpoint, data=data, verbose=verbose, **extra)
+            start = time.perf_counter()
+            if output != "models":
+                page = convert_page(response_data, response_model, output)
+            elif not self.validate_responses:
+                page = decode_paged(response_data, response_model, self._flyweight_table())
+            else:
+                page = paged_model(response_model)(**response_data)
+            if trace is not None:
+                trace.parse += time.perf_counter() - start
+                trace.rows = len(response_data.get("data") or ())
+            return page
+
+    def _operation_request(self, operation: Operation, request: BaseRequest, verbose: bool = False, output: str = "models") -> Any:
+        """
+        Send one generated operation of the API spec (see `smartscout.endpoints`).
+
+        Paged operations return pages exactly like the hand-written methods (so they work with
+        `iter_pages` and every `output` format); the others return a single response model.
+        """
+        path, params, data = operation.serialize(request)
+        if operation.paged:
+            return self._paged_request(path, request, operation.response_model, verbose=verbose, output=output, method=operation.method, data=data, params=params, route=operation.path)
+        with self._traced(operation.method, operation.path, request) as trace:
+            response_data = self._make_request(operation.method, path, data=data, params=params, verbose=verbose, route=operation.path)
+            start = time.perf_counter()
+            if self.validate_responses:
+                result = operation.response_model.parse_obj(response_data)
+            else:
+                result = get_decoder(operation.response_model, self._flyweight_table()).decode(response_data)
+            if trace is not None:
+                trace.parse += time.perf_counter() - start
+                trace.rows = 1
+            return result
+
+    def search_brands(self, request: SearchBrandsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Brand]:
         """
         Search for brands based on the given criteria.
         """
-        return self._paged_request("/brands/search", request, Brand, verbose=verbose)
+        return self._paged_request("/brands/search", request, models.Brand, verbose=verbose, output=output)
 
     def search_products(
         self, 
         request: SearchProductsRequest, 
-        verbose: bool = False
+        verbose: bool = False,
+        output: str = "models"
     ) -> PagedResponse[Product]:
         """
         Search for products based on specified criteria.
@@ -122,6 +430,11 @@ class SmartScoutAPIClient:
                 If set to `True`, the method will output detailed information about the API request being made, including the 
                 constructed CURL command for debugging purposes. Defaults to `False`.
 
+            output (str, optional):
+                `"models"` (default) returns `Product` models. `"records"`, `"arrow"` or `"pandas"` return a `ColumnarPage`
+                whose `data` is a list of dicts, a typed `pyarrow.Table` or a `pandas.DataFrame`, decoded without building
+                a model per row.
+
         Returns:
             PagedResponse[Product]: 
                 A `PagedResponse` object containing a list of `Product` instances that match the search criteria. It also includes 
@@ -132,7 +445,7 @@ class SmartScoutAPIClient:
                 Raised when an unexpected error occurs during the API request that is not related to rate limiting or authentication.
             
             RateLimitError:
-                Raised when the API rate limit has been exceeded. Users should implement retry logic with exponential backoff in this case.
+                Raised when the API rate limit is still exceeded after the client's `retry_policy` has been exhausted.
             
             AuthenticationError:
                 Raised when the provided API key is invalid or has insufficient permissions to perform the search operation.
@@ -170,90 +483,445 @@ class SmartScoutAPIClient:
 
         Notes:
             - Ensure that the `SearchProductsRequest` is populated with all necessary fields to obtain accurate and relevant search results.
-            - When `verbose` is enabled, sensitive information such as API keys will appear in the output. Use this feature primarily for debugging purposes in a secure environment.
+            - When `verbose` is enabled, the request is printed as a curl command with the API key masked.
         """
-        return self._paged_request("/products/search", request, Product, verbose=verbose)
+        return self._paged_request("/products/search", request, models.Product, verbose=verbose, output=output)
 
-    def search_search_terms(self, request: SearchSearchTermsRequest, verbose: bool = False) -> PagedResponse[SearchTerm]:
+    def search_search_terms(self, request: SearchSearchTermsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SearchTerm]:
         """
         Search for search terms based on the given criteria.
         """
-        return self._paged_request("/search-terms/search", request, SearchTerm, verbose=verbose)
+        return self._paged_request("/search-terms/search", request, models.SearchTerm, verbose=verbose, output=output)
 
-    def search_sellers(self, request: SearchSellersRequest, verbose: bool = False) -> PagedResponse[Seller]:
+    def search_sellers(self, request: SearchSellersRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Seller]:
         """
         Search for sellers based on the given criteria.
         """
-        return self._paged_request("/sellers/search", request, Seller, verbose=verbose)
+        return self._paged_request("/sellers/search", request, models.Seller, verbose=verbose, output=output)
 
-    def get_organic_ranks(self, request: GetOrganicRanksRequest, verbose: bool = False) -> PagedResponse[Product]:
+    def get_organic_ranks(self, request: GetOrganicRanksRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Product]:
         """
         Get organic ranks for products based on the given criteria.
         """
-        return self._paged_request("/products/organic-ranks", request, Product, verbose=verbose)
+        return self._paged_request("/products/organic-ranks", request, models.Product, verbose=verbose, output=output)
 
-    def get_product_history_scope(self, request: GetProductHistoryScopeRequest, verbose: bool = False) -> PagedResponse[ProductSalesHistory]:
+    def get_product_history_scope(self, request: GetProductHistoryScopeRequest, verbose: bool = False, output: str = "models") -> PagedResponse[ProductSalesHistory]:
         """
         Get product history scope based on the given criteria.
         """
-        return self._paged_request("/products/history/scope", request, ProductSalesHistory, verbose=verbose)
+        return self._paged_request("/products/history/scope", request, models.ProductSalesHistory, verbose=verbose, output=output)
 
-    def get_relevant_products(self, request: GetRelevantProductsRequest, verbose: bool = False) -> PagedResponse[Product]:
+    def get_relevant_products(self, request: GetRelevantProductsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Product]:
         """
         Get relevant products based on the given criteria.
         """
-        return self._paged_request("/products/relevant", request, Product, verbose=verbose)
+        return self._paged_request("/products/relevant", request, models.Product, verbose=verbose, output=output)
 
-    def get_subcategory_brands(self, request: GetSubcategoryBrandsRequest, verbose: bool = False) -> PagedResponse[Brand]:
+    def get_subcategory_brands(self, request: GetSubcategoryBrandsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Brand]:
         """
         Get brands in a subcategory based on the given criteria.
         """
-        return self._paged_request("/subcategories/brands", request, Brand, verbose=verbose)
+        return self._paged_request("/subcategories/brands", request, models.Brand, verbose=verbose, output=output)
 
-    def get_brand_sales_history(self, request: GetBrandSalesHistoryRequest, verbose: bool = False) -> PagedResponse[BrandSalesHistory]:
+    def get_brand_sales_history(self, request: GetBrandSalesHistoryRequest, verbose: bool = False, output: str = "models") -> PagedResponse[BrandSalesHistory]:
         """
         Get brand sales history based on the given criteria.
         """
-        return self._paged_request("/brands/history/sales", request, BrandSalesHistory, verbose=verbose)
+        return self._paged_request("/brands/history/sales", request, models.BrandSalesHistory, verbose=verbose, output=output)
 
-    def get_brand_sales_history_by_subcategories(self, request: GetBrandSalesHistoryBySubcategoriesRequest, verbose: bool = False) -> PagedResponse[BrandSalesHistory]:
+    def get_brand_sales_history_by_subcategories(self, request: GetBrandSalesHistoryBySubcategoriesRequest, verbose: bool = False, output: str = "models") -> PagedResponse[BrandSalesHistory]:
         """
         Get brand sales history by subcategories based on the given criteria.
         """
-        return self._paged_request("/brands/history/sales-by-subcategories", request, BrandSalesHistory, verbose=verbose)
+        return self._paged_request("/brands/history/sales-by-subcategories", request, models.BrandSalesHistory, verbose=verbose, output=output)
 
-    def get_brand_scope(self, request: GetBrandScopeRequest, verbose: bool = False) -> PagedResponse[Brand]:
+    def get_brand_scope(self, request: GetBrandScopeRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Brand]:
         """
         Get brand scope based on the given criteria.
         """
-        return self._paged_request("/brands/scope", request, Brand, verbose=verbose)
+        return self._paged_request("/brands/scope", request, models.Brand, verbose=verbose, output=output)
 
-    def get_brand_scope_top_products(self, request: GetBrandScopeTopProductsRequest, verbose: bool = False) -> PagedResponse[Product]:
+    def get_brand_scope_top_products(self, request: GetBrandScopeTopProductsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Product]:
         """
         Get top products in a brand scope based on the given criteria.
         """
-        return self._paged_request("/brands/scope/top-products", request, Product, verbose=verbose)
+        return self._paged_request("/brands/scope/top-products", request, models.Product, verbose=verbose, output=output)
 
-    def get_relevant_search_terms(self, request: GetRelevantSearchTermsRequest, verbose: bool = False) -> PagedResponse[SearchTerm]:
+    def get_relevant_search_terms(self, request: GetRelevantSearchTermsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SearchTerm]:
         """
         Get relevant search terms based on the given criteria.
         """
-        return self._paged_request("/search-terms/relevant", request, SearchTerm, verbose=verbose)
+        return self._paged_request("/search-terms/relevant", request, models.SearchTerm, verbose=verbose, output=output)
 
-    def get_search_term_history(self, request: GetSearchTermHistoryRequest, verbose: bool = False) -> PagedResponse[SearchTerm]:
+    def get_search_term_history(self, request: GetSearchTermHistoryRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SearchTerm]:
         """
         Get search term history based on the given criteria.
         """
-        return self._paged_request("/search-terms/history", request, SearchTerm, verbose=verbose)
+        return self._paged_request("/search-terms/history", request, models.SearchTerm, verbose=verbose, output=output)
+
+    def iter_pages(
+        self,
+        method: Callable[..., PagedResponse[T]],
+        request: BaseRequest,
+        page_size: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        verbose: bool = False,
+        output: str = "models",
+        prefetch: int = 0,
+    ) -> Iterator[PagedResponse[T]]:
+        """
+        Yield successive pages of a paged endpoint, following `Paging.next_page_id`.
+
+        `method` is any paged client method, e.g. `client.search_products`. The given request
+        is not modified; a copy is re-issued with `page.id` set to each next-page cursor until
+        the API reports no more records or `max_pages` pages have been fetched. Pass
+        `output="arrow"` (or `"pandas"`, `"records"`) to receive each page as a `ColumnarPage`,
+        or `output="stream"` to receive `StreamedPage`s whose rows are decoded as they arrive.
+
+        With `prefetch=n`, up to `n` pages are fetched and decoded ahead of the consumer on a
+        background thread (see `PrefetchingPager`), so work done on each page overlaps with
+        downloading the next. Not available with `output="stream"`, whose cursor is only known
+        once the consumer has read the page.
+        """
+        if prefetch and output == "stream":
+            raise InvalidRequestError("prefetch is not supported with output='stream'")
+        pages = self._iter_pages(method, request, page_size, max_pages, verbose, output)
+        if not prefetch:
+            yield from pages
+            return
+        with PrefetchingPager(pages, depth=prefetch) as pager:
+            yield from pager
+
+    def _iter_pages(
+        self,
+        method: Callable[..., PagedResponse[T]],
+        request: BaseRequest,
+        page_size: Optional[int],
+        max_pages: Optional[int],
+        verbose: bool,
+        output: str,
+    ) -> Iterator[PagedResponse[T]]:
+        request = request.copy(deep=True)
+        if request.page is None:
+            request.page = PageOptions()
+        if page_size is not None:
+            request.page.size = page_size
+
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            response = method(request, verbose=verbose, output=output)
+            pages += 1
+            yield response
+            # Paging is read after the consumer is done with the page: a streamed page only knows
+            # its cursor once its rows have been read (reading it drains any rows left over).
+            paging = response.paging
+            next_page_id = paging.next_page_id
+            has_more = paging.has_more_records
+            # Drop our reference before fetching the next page so only one page is alive at a time.
+            del response
+            if not has_more or not next_page_id:
+                return
+            request.page.id = next_page_id
+
+    def iter_items(
+        self,
+        method: Callable[..., PagedResponse[T]],
+        request: BaseRequest,
+        page_size: Optional[int] = None,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        verbose: bool = False,
+        stream: bool = False,
+        prefetch: int = 0,
+    ) -> Iterator[T]:
+        """
+        Yield the items of a paged endpoint one at a time across all pages.
+
+        Memory use is bounded by a single page regardless of how many rows the search returns,
+        or by a single row with `stream=True` (requires `ijson`), or by `prefetch + 1` pages when
+        pages are prefetched (see `iter_pages`).
+        Iteration stops after `max_items` items or `max_pages` pages, whichever comes first.
+        """
+        if max_items is not None and max_items <= 0:
+            return
+        count = 0
+        output = "stream" if stream else "models"
+        for page in self.iter_pages(method, request, page_size=page_size, max_pages=max_pages, verbose=verbose, output=output, prefetch=prefetch):
+            try:
+                for item in page.data or []:
+                    yield item
+                    count += 1
+                    if max_items is not None and count >= max_items:
+                        return
+            finally:
+                if stream:
+                    page.close()
+
+    def iter_brands(self, request: SearchBrandsRequest, page_size: Optional[int] = None, max_items: Optional[int] = None, max_pages: Optional[int] = None, verbose: bool = False, stream: bool = False) -> Iterator[Brand]:
+        """
+        Iterate over every brand matching the given criteria, across all pages.
+        """
+        return self.iter_items(self.search_brands, request, page_size=page_size, max_items=max_items, max_pages=max_pages, verbose=verbose, stream=stream)
+
+    def iter_products(self, request: SearchProductsRequest, page_size: Optional[int] = None, max_items: Optional[int] = None, max_pages: Optional[int] = None, verbose: bool = False, stream: bool = False) -> Iterator[Product]:
+        """
+        Iterate over every product matching the given criteria, across all pages.
+        """
+        return self.iter_items(self.search_products, request, page_size=page_size, max_items=max_items, max_pages=max_pages, verbose=verbose, stream=stream)
+
+    def iter_search_terms(self, request: SearchSearchTermsRequest, page_size: Optional[int] = None, max_items: Optional[int] = None, max_pages: Optional[int] = None, verbose: bool = False, stream: bool = False) -> Iterator[SearchTerm]:
+        """
+        Iterate over every search term matching the given criteria, across all pages.
+        """
+        return self.iter_items(self.search_search_terms, request, page_size=page_size, max_items=max_items, max_pages=max_pages, verbose=verbose, stream=stream)
+
+    def iter_sellers(self, request: SearchSellersRequest, page_size: Optional[int] = None, max_items: Optional[int] = None, max_pages: Optional[int] = None, verbose: bool = False, stream: bool = False) -> Iterator[Seller]:
+        """
+        Iterate over every seller matching the given criteria, across all pages.
+        """
+        return self.iter_items(self.search_sellers, request, page_size=page_size, max_items=max_items, max_pages=max_pages, verbose=verbose, stream=stream)
+
+    def map(
+        self,
+        method: Union[str, Callable[..., Any]],
+        requests: Iterable[BaseRequest],
+        max_workers: int = 8,
+        ordered: bool = True,
+        verbose: bool = False,
+    ) -> Iterator[BatchResult]:
+        """
+        Run one client method over many independent requests concurrently.
+
+        Args:
+            method: A client method such as `client.get_brand_sales_history`, or its name.
+            requests: Request models to send. Consumed lazily, so a generator of 10k+ requests is fine.
+            max_workers: Number of worker threads. Each thread uses its own session.
+            ordered: Yield results in input order (default) or as soon as each one completes.
+
+        Returns:
+            An iterator of `BatchResult(index, request, response, error)`. A failed item carries
+            its exception in `error` instead of aborting the batch.
+
+        Example:
+            ```python
+            for result in client.map(client.get_brand_sales_history, history_requests, max_workers=16):
+                if result.ok:
+                    store(result.response)
+                else:
+                    log.warning("request %d failed: %s", result.index, result.error)
+            ```
+        """
+        if isinstance(method, str):
+            method = getattr(self, method)
+        return run_batch(lambda request: method(request, verbose=verbose), requests, max_workers=max_workers, ordered=ordered)
+
+    def fan_out(
+        self,
+        method: Union[str, Callable[..., Any]],
+        request: BaseRequest,
+        marketplaces: Optional[Iterable[Union[MarketplaceId, str]]] = None,
+        max_workers: Optional[int] = None,
+        verbose: bool = False,
+        **kwargs: Any,
+    ) -> Dict[str, BatchResult]:
+        """
+        Run the same request against several marketplaces concurrently.
+
+        The request is cloned once per marketplace (every `MarketplaceId` except `NOT_SET` by
+        default) and the clones run in parallel, so the wall-clock time is close to that of the
+        slowest marketplace. Requests still draw from the client's `rate_limiter`, which acts as
+        the global budget. Extra keyword arguments (e.g. `output="arrow"`) are passed to `method`.
+
+        Returns:
+            A dict mapping each marketplace code to its `BatchResult`; a failed marketplace
+            carries its exception in `error` instead of aborting the others.
+        """
+        if isinstance(method, str):
+            method = getattr(self, method)
+        codes = _marketplace_codes(marketplaces)
+        clones = [request.copy(update={"marketplace": code}) for code in codes]
+        results = run_batch(lambda clone: method(clone, verbose=verbose, **kwargs), clones, max_workers=max_workers or len(codes) or 1)
+        return {codes[result.index]: result for result in results}
+
+    def iter_fan_out(
+        self,
+        method: Union[str, Callable[..., Any]],
+        request: BaseRequest,
+        marketplaces: Optional[Iterable[Union[MarketplaceId, str]]] = None,
+        page_size: Optional[int] = None,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        verbose: bool = False,
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Page through the same request in several marketplaces at once, yielding `(marketplace, item)`.
+
+        Each marketplace is paged on its own thread; items are yielded as they arrive, tagged with
+        the marketplace code they came from. `max_items` and `max_pages` apply per marketplace.
+        """
+        if isinstance(method, str):
+            method = getattr(self, method)
+        sources = {
+            code: self.iter_items(method, request.copy(update={"marketplace": code}), page_size=page_size, max_items=max_items, max_pages=max_pages, verbose=verbose)
+            for code in _marketplace_codes(marketplaces)
+        }
+        return merge_iterators(sources, max_workers=max_workers)
+
+    def iter_sharded(
+        self,
+        method: Union[str, Callable[..., Any]],
+        request: BaseRequest,
+        field: str,
+        bounds: Optional[Tuple[Number, Number]] = None,
+        shards: Union[int, Sequence[Number]] = 8,
+        max_shard_rows: int = 10_000,
+        max_workers: int = 8,
+        page_size: Optional[int] = None,
+        key: Optional[Callable[[Any], Hashable]] = None,
+        verbose: bool = False,
+    ) -> ShardedScan:
+        """
+        Page through one large search as concurrent shards split on the numeric range filter `field`.
+
+        The request is partitioned into non-overlapping `[min, max]` ranges of `field` (e.g.
+        `"rank"` for `search_products`, `"estimate_sales"` for `search_sellers`), the shards are
+        paged on `max_workers` threads, and shards reporting more than `max_shard_rows` rows are
+        halved until they fit. Rows are yielded once each, in arrival order. See `ShardedScan`.
+
+        Example:
+            ```python
+            request = SearchProductsRequest(marketplace="US", subcategory_id=1234)
+            for product in client.iter_sharded(client.search_products, request, "rank", bounds=(1, 2_000_000), page_size=1000):
+                store(product)
+            ```
+        """
+        return ShardedScan(
+            self,
+            method,
+            request,
+            field,
+            bounds=bounds,
+            shards=shards,
+            max_shard_rows=max_shard_rows,
+            max_workers=max_workers,
+            page_size=page_size,
+            key=key,
+            verbose=verbose,
+        )
+
+    def get_products_by_asins(
+        self,
+        asins: Iterable[str],
+        marketplace: Union[MarketplaceId, str] = MarketplaceId.US,
+        batch_size: int = 100,
+        max_workers: int = 8,
+        verbose: bool = False,
+    ) -> LookupResult[Product]:
+        """
+        Look up many products by ASIN with as few requests as possible.
+
+        The ASINs are de-duplicated and packed `batch_size` at a time into the `asins` list filter
+        of `search_products`, and the batches run concurrently. Returns a `LookupResult`: a dict
+        with an entry for every requested ASIN, in input order, where ASINs the API did not return
+        map to None. A failed batch does not abort the lookup; its ASINs are left out of the dict
+        and listed in `errors` with the exception instead.
+        """
+        return self._lookup(self.search_products, models.SearchProductsRequest, "asins", "asin", asins, marketplace, batch_size, max_workers, verbose, normalize=str.upper)
+
+    def get_brands_by_names(
+        self,
+        brand_names: Iterable[str],
+        marketplace: Union[MarketplaceId, str] = MarketplaceId.US,
+        batch_size: int = 100,
+        max_workers: int = 8,
+        verbose: bool = False,
+    ) -> LookupResult[Brand]:
+        """
+        Look up many brands by name in batches, like `get_products_by_asins`. Names match case-insensitively.
+        """
+        return self._lookup(self.search_brands, models.SearchBrandsRequest, "brand_names", "brand_name", brand_names, marketplace, batch_size, max_workers, verbose, normalize=str.casefold)
+
+    def get_sellers_by_ids(
+        self,
+        seller_ids: Iterable[str],
+        marketplace: Union[MarketplaceId, str] = MarketplaceId.US,
+        batch_size: int = 100,
+        max_workers: int = 8,
+        verbose: bool = False,
+    ) -> LookupResult[Seller]:
+        """
+        Look up many sellers by Amazon seller id in batches, like `get_products_by_asins`.
+        """
+        return self._lookup(self.search_sellers, models.SearchSellersRequest, "amazon_seller_ids", "seller_id", seller_ids, marketplace, batch_size, max_workers, verbose)
+
+    def _lookup(
+        self,
+        method: Callable[..., PagedResponse[T]],
+        request_model: Type[BaseRequest],
+        filter_field: str,
+        key_field: str,
+        keys: Iterable[str],
+        marketplace: Union[MarketplaceId, str],
+        batch_size: int,
+        max_workers: int,
+        verbose: bool,
+        normalize: Callable[[str], str] = str,
+    ) -> LookupResult[T]:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        results: LookupResult[T] = LookupResult.fromkeys(key.strip() for key in keys if key and key.strip())
+        wanted: Dict[str, List[str]] = {}
+        for key in results:
+            wanted.setdefault(normalize(key), []).append(key)
+        unique = [spellings[0] for spellings in wanted.values()]
+        alias = request_model.__fields__[filter_field].alias
+        code = _marketplace_codes([marketplace])[0]
+        batches = (
+            request_model(**{"marketplace": code, alias: ListFilter(filter=unique[i:i + batch_size])})
+            for i in range(0, len(unique), batch_size)
+        )
+
+        def fetch(request: BaseRequest) -> List[T]:
+            return list(self.iter_items(method, request, page_size=batch_size, verbose=verbose))
+
+        for batch in run_batch(fetch, batches, max_workers=max_workers, ordered=False):
+            if not batch.ok:
+                for name in getattr(batch.request, filter_field).filter:
+                    for key in wanted[normalize(name)]:
+                        results.errors[key] = batch.error
+                continue
+            for item in batch.response:
+                value = getattr(item, key_field)
+                if value is None:
+                    continue
+                for key in wanted.get(normalize(value), ()):
+                    if results[key] is None:
+                        results[key] = item
+        for key in results.errors:
+            del results[key]
+        return results
 
     # Add more methods for other API endpoints as needed
 
+def _marketplace_codes(marketplaces: Optional[Iterable[Union[MarketplaceId, str]]] = None) -> List[str]:
+    if marketplaces is None:
+        return [mp.value for mp in MarketplaceId if mp is not MarketplaceId.NOT_SET]
+    return [mp.value if isinstance(mp, MarketplaceId) else mp for mp in marketplaces]
+
+def _bytes_read(response: requests.Response) -> int:
+    """Bytes received for the body of a consumed response, before content decoding."""
+    try:
+        return int(response.raw.tell())
+    except (AttributeError, TypeError, ValueError):
+        return len(response.content)
+
 # Example usage
 if __name__ == "__main__":
     client = SmartScoutAPIClient(api_key="your_api_key_here")
     
     # Search for brands with verbose output
-    brand_request = SearchBrandsRequest(marketplace=MarketplaceId.US, brand_name="Example Brand")
+    brand_request = models.SearchBrandsRequest(marketplace=MarketplaceId.US, brand_name="Example Brand")
     brand_response = client.search_brands(brand_request, verbose=True)
     brand_response = client.search_brands(brand_request, verbose=True)
     
@@ -261,17 +929,17 @@ if __name__ == "__main__":
         print(f"Brand: {brand.brand_name}, Monthly Revenue: ${brand.monthly_revenue}")
     
     # Search for brands
-    brand_request = SearchBrandsRequest(marketplace=MarketplaceId.US, brand_name="Example Brand")
+    brand_request = models.SearchBrandsRequest(marketplace=MarketplaceId.US, brand_name="Example Brand")
     brand_response = client.search_brands(brand_request)
     
     for brand in brand_response.data:
         print(f"Brand: {brand.brand_name}, Monthly Revenue: ${brand.monthly_revenue}")
 
     # Search for products
-    product_request = SearchProductsRequest(marketplace=MarketplaceId.US, brand_name="Example Brand")
+    product_request = models.SearchProductsRequest(marketplace=MarketplaceId.US, brand_name="Example Brand")
     product_response = client.search_products(product_request)
     
     for product in product_response.data:
         print(f"Product: {product.asin}, Title: {product.title}")
 
-    # Add more examples for other API endpoints as needed
\ No newline at end of file
+    # Add more examples for other API endpoints as needed
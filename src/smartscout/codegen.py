@@ -0,0 +1,405 @@
+# src/smartscout/codegen.py
+
+"""
+Generate typed models and client methods for every operation in the OpenAPI spec.
+
+    python -m smartscout.codegen [--spec swagger.json] [--check]
+
+Writes `smartscout/models/generated.py` (response models, plus one request model per operation)
+and `smartscout/endpoints.py` (an `Operation` table with a generated serializer per operation,
+and the `EndpointsMixin`/`AsyncEndpointsMixin` methods that `SmartScoutAPIClient` and
+`AsyncSmartScoutAPIClient` inherit). `--check` exits with status 1 if the files on disk are out
+of date with the spec instead of writing them.
+"""
+
+import argparse
+import json
+import keyword
+import os
+import re
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional, Set
+
+from pydantic import BaseModel
+
+HEADER = "# Generated by `python -m smartscout.codegen` from swagger.json; do not edit by hand."
+
+# Spec schemas that map onto hand-written models in `models.base`.
+BASE_SCHEMAS = {
+    "Bb.Core.ListFilter": "ListFilter",
+    "Bb.Core.RangeDecimal": "RangeDecimal",
+    "Bb.Core.RangeFilter": "RangeFilter",
+    "Bb.Core.RangeInt": "RangeInt",
+    "Bb.Core.TextFilter": "TextFilter",
+    "Bb.Pub.App.Paging": "Paging",
+}
+
+# Parameters every operation takes; they live on `BaseSearchRequest` and are sent by `paging_query`.
+COMMON_PARAMETERS = {"X-Api-Key", "marketplace", "page[id]", "page[size]", "sort[by]", "sort[order]"}
+
+# Spellings that a plain camelCase split would mangle, matched to the names used in `models.requests`.
+WORD_FIXES = {"moM": "mom", "ASINs": "Asins"}
+
+# JSON-native types whose values are sent as they are; strings may hold enums and need `scalar`.
+PLAIN_TYPES = {"integer", "number", "boolean"}
+
+RESERVED = set(dir(BaseModel)) | {"marketplace", "page", "sort"}
+
+class FieldSpec(NamedTuple):
+    name: str
+    wire: str
+    annotation: str
+    required: bool
+    kind: str  # "plain", "scalar", "list", "plain_list", or the serializer name of a nested schema
+
+class Endpoint(NamedTuple):
+    name: str
+    method: str
+    path: str
+    tag: str
+    deprecated: bool
+    path_fields: List[FieldSpec]
+    query_fields: List[FieldSpec]
+    body_fields: Optional[List[FieldSpec]]
+    response_model: str
+    paged: bool
+
+def snake_case(name: str) -> str:
+    for wrong, right in WORD_FIXES.items():
+        name = name.replace(wrong, right)
+    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
+    name = re.sub(r"([a-z])([A-Z])", r"\1_\2", name)
+    name = re.sub(r"([A-Za-z])(\d)", r"\1_\2", name)
+    name = re.sub(r"(\d)([A-Za-z])", r"\1_\2", name)
+    return name.replace("-", "_").lower()
+
+def pascal_case(name: str) -> str:
+    return "".join(part[:1].upper() + part[1:] for part in name.split("_"))
+
+class Generator:
+    def __init__(self, spec: Dict[str, Any]):
+        self.spec = spec
+        self.schemas: Dict[str, Dict[str, Any]] = spec.get("components", {}).get("schemas", {})
+        self.models: Dict[str, str] = {}        # schema key -> class name, for emitted response models
+        self.serializers: Set[str] = set()      # schema keys with an emitted body serializer
+        self.endpoints = self._endpoints()
+
+    # -- spec walking -----------------------------------------------------------------------
+
+    def _ref(self, schema: Dict[str, Any]) -> Optional[str]:
+        ref = schema.get("$ref")
+        return ref.split("/")[-1] if ref else None
+
+    def _base_name(self, key: str) -> Optional[str]:
+        for prefix, name in BASE_SCHEMAS.items():
+            if key == prefix or key.startswith(prefix + "`"):
+                return name
+        return None
+
+    def _class_name(self, key: str) -> str:
+        return self.schemas[key].get("title") or key.split(".")[-1]
+
+    def _annotation(self, schema: Dict[str, Any], register: bool) -> str:
+        key = self._ref(schema)
+        if key is not None:
+            base = self._base_name(key)
+            if base is not None:
+                return base
+            if "enum" in self.schemas[key] and key.endswith("MarketplaceId"):
+                return "MarketplaceId"
+            if register:
+                self._register_model(key)
+            return self._class_name(key)
+        kind = schema.get("type")
+        if kind == "array":
+            return f"List[{self._annotation(schema.get('items', {}), register)}]"
+        if kind == "string" and schema.get("format") == "date-time":
+            return "datetime"
+        return {"integer": "int", "number": "float", "boolean": "bool", "string": "str"}.get(kind, "Any")
+
+    def _register_model(self, key: str) -> None:
+        if key not in self.models:
+            self.models[key] = self._class_name(key)
+            for prop in self.schemas[key].get("properties", {}).values():
+                self._annotation(prop, register=True)
+
+    def _field(self, wire: str, schema: Dict[str, Any], required: bool = False, register: bool = False) -> FieldSpec:
+        name = snake_case(wire)
+        if keyword.iskeyword(name) or name in RESERVED:
+            name += "_"
+        key = self._ref(schema)
+        if key is not None and self._base_name(key) is not None:
+            kind = "_" + snake_case(self._base_name(key))
+        elif schema.get("type") == "array":
+            kind = "plain_list" if schema.get("items", {}).get("type") in PLAIN_TYPES else "list"
+        else:
+            kind = "plain" if schema.get("type") in PLAIN_TYPES else "scalar"
+        return FieldSpec(name, wire, self._annotation(schema, register), required, kind)
+
+    def _endpoints(self) -> List[Endpoint]:
+        endpoints = []
+        names: Set[str] = set()
+        for path, operations in self.spec.get("paths", {}).items():
+            version = re.match(r"^/api/(v\d+)", path)
+            words = [part for part in re.sub(r"^/api/v\d+", "", path).split("/") if part and not part.startswith("{")]
+            base_name = "_".join(snake_case(word) for word in words)
+            if version and version.group(1) != "v1":
+                base_name += f"_{version.group(1)}"
+            # GET keeps the plain name when a path has several operations.
+            for method in sorted(operations, key=lambda m: (m != "get", m)):
+                operation = operations[method]
+                name = base_name if base_name not in names else f"{base_name}_{method}"
+                names.add(name)
+                endpoints.append(self._endpoint(name, method.upper(), path, operation))
+        return endpoints
+
+    def _endpoint(self, name: str, method: str, path: str, operation: Dict[str, Any]) -> Endpoint:
+        path_fields, query_fields = [], []
+        for parameter in operation.get("parameters", []):
+            if parameter["name"] in COMMON_PARAMETERS:
+                continue
+            field = self._field(parameter["name"], parameter.get("schema", {}), required=parameter.get("required", False))
+            (path_fields if parameter["in"] == "path" else query_fields).append(field)
+
+        body_fields = None
+        content = operation.get("requestBody", {}).get("content", {})
+        if content:
+            schema = (content.get("application/json") or next(iter(content.values()))).get("schema", {})
+            key = self._ref(schema)
+            body = self.schemas[key] if key else schema
+            body_fields = []
+            for wire, prop in body.get("properties", {}).items():
+                body_fields.append(self._field(wire, prop))
+                if self._ref(prop) is not None:
+                    self.serializers.add(self._ref(prop))
+
+        taken: Set[str] = set()
+        for field in path_fields + query_fields + (body_fields or []):
+            if field.name in taken:
+                raise ValueError(f"{method} {path}: parameter {field.wire!r} clashes with another field named {field.name!r}")
+            taken.add(field.name)
+
+        responses = operation.get("responses", {}).get("200", {}).get("content", {})
+        schema = (responses.get("application/json") or next(iter(responses.values()))).get("schema", {})
+        response = self.schemas[self._ref(schema)]
+        properties = response.get("properties", {})
+        paged = "paging" in properties and "data" in properties
+        item = properties["data"].get("items", {}) if paged else schema
+        return Endpoint(
+            name=name,
+            method=method,
+            path=path,
+            tag=(operation.get("tags") or [""])[0],
+            deprecated=bool(operation.get("deprecated")),
+            path_fields=path_fields,
+            query_fields=query_fields,
+            body_fields=body_fields,
+            response_model=self._annotation(item, register=True),
+            paged=paged,
+        )
+
+    # -- models/generated.py ----------------------------------------------------------------
+
+    def _ordered_models(self) -> List[str]:
+        ordered: List[str] = []
+
+        def visit(key: str) -> None:
+            if key in ordered:
+                return
+            for prop in self.schemas[key].get("properties", {}).values():
+                for ref in re.findall(r"#/components/schemas/([^\"']+)", json.dumps(prop)):
+                    if ref in self.models:
+                        visit(ref)
+            ordered.append(key)
+
+        for key in sorted(self.models, key=lambda k: self.models[k]):
+            visit(key)
+        return ordered
+
+    def _field_line(self, field: FieldSpec) -> str:
+        if field.required:
+            if field.name == field.wire:
+                return f"    {field.name}: {field.annotation}"
+            return f"    {field.name}: {field.annotation} = Field(..., alias={json.dumps(field.wire)})"
+        if field.name == field.wire:
+            return f"    {field.name}: Optional[{field.annotation}] = None"
+        return f"    {field.name}: Optional[{field.annotation}] = Field(None, alias={json.dumps(field.wire)})"
+
+    def models_module(self) -> str:
+        lines = [
+            "# src/smartscout/models/generated.py",
+            HEADER,
+            "",
+            "from datetime import datetime",
+            "from typing import Any, List, Optional",
+            "from pydantic import Field",
+            "from .base import ListFilter, OperationRequest, RangeDecimal, RangeFilter, RangeInt, SpecModel, TextFilter",
+            "",
+        ]
+        for key in self._ordered_models():
+            lines.append(f"class {self.models[key]}(SpecModel):")
+            properties = self.schemas[key].get("properties", {})
+            for wire, prop in properties.items():
+                lines.append(self._field_line(self._field(wire, prop)))
+            if not properties:
+                lines.append("    pass")
+            lines.append("")
+        for endpoint in self.endpoints:
+            lines.append(f"class {request_class(endpoint)}(OperationRequest):")
+            lines.append(f'    """Request for `{endpoint.method} {endpoint.path}`."""')
+            for field in endpoint.path_fields + endpoint.query_fields + (endpoint.body_fields or []):
+                lines.append(self._field_line(field))
+            lines.append("")
+        lines.append("__all__ = [")
+        for name in sorted(self.models.values()) + [request_class(endpoint) for endpoint in self.endpoints]:
+            lines.append(f"    {json.dumps(name)},")
+        lines.append("]")
+        return "\n".join(lines) + "\n"
+
+    # -- endpoints.py -----------------------------------------------------------------------
+
+    def _value(self, field: FieldSpec, expression: str) -> str:
+        if field.kind == "plain":
+            return expression
+        if field.kind == "scalar":
+            return f"scalar({expression})"
+        if field.kind == "plain_list":
+            return f"list({expression})"
+        if field.kind == "list":
+            return f"[scalar(item) for item in {expression}]"
+        return f"{field.kind}({expression})"
+
+    def _serializer(self, endpoint: Endpoint) -> List[str]:
+        path = endpoint.path
+        for field in endpoint.path_fields:
+            path = path.replace("{" + field.wire + "}", "{segment(request." + field.name + ")}")
+        lines = [f"def _serialize_{endpoint.name}(request: {request_class(endpoint)}) -> Serialized:", "    query = paging_query(request)"]
+        for field in endpoint.query_fields:
+            lines.append(f"    if request.{field.name} is not None:")
+            lines.append(f"        query[{json.dumps(field.wire)}] = {self._value(field, 'request.' + field.name)}")
+        if endpoint.body_fields is None:
+            lines.append("    body = None")
+        else:
+            lines.append("    body = {}")
+            for field in endpoint.body_fields:
+                lines.append(f"    if request.{field.name} is not None:")
+                lines.append(f"        body[{json.dumps(field.wire)}] = {self._value(field, 'request.' + field.name)}")
+        prefix = "f" if endpoint.path_fields else ""
+        lines.append(f"    return {prefix}{json.dumps(path)}, query, body")
+        return lines
+
+    def _nested_serializer(self, key: str) -> List[str]:
+        name = self._base_name(key)
+        lines = [f"def _{snake_case(name)}(value: {name}) -> Dict[str, Any]:", "    body = {}"]
+        for wire, prop in self.schemas[key].get("properties", {}).items():
+            field = self._field(wire, prop)
+            lines.append(f"    if value.{field.name} is not None:")
+            lines.append(f"        body[{json.dumps(field.wire)}] = {self._value(field, 'value.' + field.name)}")
+        lines.append("    return body")
+        return lines
+
+    def _method(self, endpoint: Endpoint, is_async: bool) -> List[str]:
+        returns = f"PagedResponse[{endpoint.response_model}]" if endpoint.paged else endpoint.response_model
+        params = "self, request: " + request_class(endpoint) + ", verbose: bool = False"
+        if endpoint.paged:
+            params += ', output: str = "models"'
+        call = f'self._operation_request(OPERATIONS["{endpoint.name}"], request, verbose=verbose'
+        call += ", output=output)" if endpoint.paged else ")"
+        summary = f"{endpoint.tag}: `{endpoint.method} {endpoint.path}`."
+        if endpoint.deprecated:
+            summary += " Deprecated by the API."
+        return [
+            f"    {'async ' if is_async else ''}def {endpoint.name}({params}) -> {returns}:",
+            '        """',
+            f"        {summary}",
+            '        """',
+            f"        return {'await ' if is_async else ''}{call}",
+            "",
+        ]
+
+    def endpoints_module(self) -> str:
+        imported = sorted({e.response_model for e in self.endpoints} | {request_class(e) for e in self.endpoints})
+        nested = sorted(self.serializers, key=lambda k: self._base_name(k))
+        lines = [
+            "# src/smartscout/endpoints.py",
+            HEADER,
+            "",
+            "from __future__ import annotations",
+            "",
+            "from typing import TYPE_CHECKING, Any, Dict",
+            "from .operations import OperationTable, Serialized, paging_query, scalar, segment",
+            "",
+            "# Models appear in annotations only: OPERATIONS imports `.models.generated` on first lookup,",
+            "# so importing the clients does not build every generated model class.",
+            "if TYPE_CHECKING:",
+            "    from .models.base import PagedResponse, " + ", ".join(sorted(self._base_name(k) for k in nested)),
+            "    from .models.generated import (",
+        ]
+        lines += [f"        {name}," for name in imported]
+        lines += [
+            "    )",
+            "",
+        ]
+        for key in nested:
+            lines += self._nested_serializer(key) + [""]
+        for endpoint in self.endpoints:
+            lines += self._serializer(endpoint) + [""]
+        lines.append('OPERATIONS = OperationTable(".models.generated", __package__, {')
+        for e in self.endpoints:
+            lines.append(
+                f'    "{e.name}": ("{e.method}", "{e.path}", "{request_class(e)}", '
+                f'"{e.response_model}", {e.paged}, _serialize_{e.name}),'
+            )
+        lines += ["})", ""]
+        for is_async in (False, True):
+            lines.append(f"class {'Async' if is_async else ''}EndpointsMixin:")
+            lines.append('    """')
+            lines.append(f"    One {'coroutine ' if is_async else ''}method per operation in the API spec, generated by `smartscout.codegen`.")
+            lines.append('    """')
+            lines.append("")
+            for endpoint in self.endpoints:
+                lines += self._method(endpoint, is_async)
+        return "\n".join(lines).rstrip("\n") + "\n"
+
+def request_class(endpoint: Endpoint) -> str:
+    return pascal_case(endpoint.name) + "Request"
+
+def generate(spec: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Render the generated modules for `spec`, keyed by path relative to the package directory.
+    """
+    generator = Generator(spec)
+    endpoints = generator.endpoints_module()
+    return {
+        os.path.join("models", "generated.py"): generator.models_module(),
+        "endpoints.py": endpoints,
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m smartscout.codegen", description="Generate models and client methods from the OpenAPI spec")
+    parser.add_argument("--spec", default="swagger.json", help="OpenAPI spec (default: ./swagger.json)")
+    parser.add_argument("--output", default=os.path.dirname(os.path.abspath(__file__)), help="Package directory to write into")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if the generated files are out of date")
+    args = parser.parse_args(argv)
+
+    with open(args.spec, "r", encoding="utf-8") as f:
+        files = generate(json.load(f))
+    stale = []
+    for relative, content in files.items():
+        path = os.path.join(args.output, relative)
+        current = open(path, "r", encoding="utf-8").read() if os.path.exists(path) else None
+        if current == content:
+            continue
+        stale.append(relative)
+        if not args.check:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+    if args.check and stale:
+        print(f"out of date: {', '.join(stale)}; run `python -m smartscout.codegen`", file=sys.stderr)
+        return 1
+    for relative in stale:
+        print(f"wrote {relative}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
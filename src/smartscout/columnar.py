@@ -0,0 +1,198 @@
+# src/smartscout/columnar.py
+
+from datetime import date, datetime, timezone
+from enum import Enum
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type
+
+from pydantic import BaseModel
+from pydantic.datetime_parse import parse_datetime
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
+
+from .models.base import Paging
+from .exceptions import InvalidRequestError
+
+OUTPUT_FORMATS = ("models", "records", "arrow", "pandas")
+
+class ColumnarPage(NamedTuple):
+    """
+    A page of results returned with `output="records"`, `"arrow"` or `"pandas"`.
+
+    Has the same `data_count`/`paging`/`data` attributes as `PagedResponse`, but `data` is a
+    list of dicts, a `pyarrow.Table` or a `pandas.DataFrame` instead of a list of models.
+    """
+    data_count: int
+    paging: Paging
+    data: Any
+
+class _Column(NamedTuple):
+    name: str
+    alias: str
+    kind: str  # float, int, bool, str, datetime, date, enum, model, list, object
+    item: Any = None  # nested model class for "model"/"list" of models, scalar kind for "list"
+
+_schemas: Dict[type, Tuple[_Column, ...]] = {}
+
+def column_schema(model: Type[BaseModel]) -> Tuple[_Column, ...]:
+    """
+    Derive (and cache) the column layout of a response model from its pydantic field definitions.
+    """
+    schema = _schemas.get(model)
+    if schema is None:
+        schema = _schemas[model] = tuple(
+            _Column(name, field.alias, *_kind(field.type_, field.shape)) for name, field in model.__fields__.items()
+        )
+    return schema
+
+def _scalar_kind(type_: Any) -> Tuple[str, Any]:
+    if isinstance(type_, type):
+        if issubclass(type_, BaseModel):
+            return "model", type_
+        if issubclass(type_, Enum):
+            return "enum", type_
+        if issubclass(type_, bool):
+            return "bool", None
+        if issubclass(type_, int):
+            return "int", None
+        if issubclass(type_, float):
+            return "float", None
+        if issubclass(type_, str):
+            return "str", None
+        if issubclass(type_, datetime):
+            return "datetime", None
+        if issubclass(type_, date):
+            return "date", None
+    return "object", None
+
+def _kind(type_: Any, shape: int) -> Tuple[str, Any]:
+    if shape == SHAPE_SINGLETON:
+        return _scalar_kind(type_)
+    if shape == SHAPE_LIST:
+        kind, item = _scalar_kind(type_)
+        return "list", item if kind == "model" else kind
+    return "object", None
+
+def to_records(rows: List[Dict[str, Any]], model: Type[BaseModel]) -> List[Dict[str, Any]]:
+    """
+    Rename payload keys to model field names, leaving values as decoded from JSON.
+    """
+    renames = [(column.alias, column.name) for column in column_schema(model)]
+    return [{name: row.get(alias) for alias, name in renames} for row in rows]
+
+def to_arrow(rows: List[Dict[str, Any]], model: Type[BaseModel]):
+    """
+    Decode payload rows straight into a typed `pyarrow.Table`.
+
+    Floats become float64, ints int64, datetimes UTC timestamps, enums dictionary-encoded strings
+    and nested models struct columns.
+    """
+    pa = _import("pyarrow", "arrow")
+    names, arrays = _arrow_arrays(pa, rows, model)
+    return pa.Table.from_arrays(arrays, names=names)
+
+def _arrow_arrays(pa, rows: List[Dict[str, Any]], model: Type[BaseModel]):
+    names, arrays = [], []
+    for column in column_schema(model):
+        values = [row.get(column.alias) for row in rows]
+        names.append(column.name)
+        arrays.append(_arrow_array(pa, values, column.kind, column.item))
+    return names, arrays
+
+_ARROW_SCALARS = {
+    "float": "float64",
+    "int": "int64",
+    "bool": "bool_",
+    "str": "string",
+}
+
+def _arrow_array(pa, values: List[Any], kind: str, item: Any = None):
+    if kind in _ARROW_SCALARS:
+        return pa.array(values, type=getattr(pa, _ARROW_SCALARS[kind])())
+    if kind == "enum":
+        return pa.array(values, type=pa.string()).dictionary_encode()
+    if kind == "datetime":
+        return _arrow_timestamps(pa, values)
+    if kind == "date":
+        return pa.array(values, type=pa.string()).cast(pa.date32())
+    if kind == "model":
+        mask = pa.array([value is None for value in values], type=pa.bool_())
+        names, children = _arrow_arrays(pa, [value or {} for value in values], item)
+        return pa.StructArray.from_arrays(children, names=names, mask=mask)
+    if kind == "list" and isinstance(item, str) and item in _ARROW_SCALARS:
+        return pa.array(values, type=pa.list_(getattr(pa, _ARROW_SCALARS[item])()))
+    return pa.array(values)
+
+def _arrow_timestamps(pa, values: List[Any]):
+    timestamp = pa.timestamp("us", tz="UTC")
+    try:
+        return pa.array(values, type=pa.string()).cast(timestamp)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed or zone-less values: parse one by one and treat naive timestamps as UTC.
+        return pa.array([_utc(value) for value in values], type=timestamp)
+
+def _utc(value: Any) -> Optional[datetime]:
+    if value is None:
+        return None
+    parsed = parse_datetime(value)
+    return parsed.replace(tzinfo=timezone.utc) if parsed.tzinfo is None else parsed.astimezone(timezone.utc)
+
+def to_pandas(rows: List[Dict[str, Any]], model: Type[BaseModel]):
+    """
+    Decode payload rows into a NumPy-backed `pandas.DataFrame`.
+
+    Nested models are flattened into dotted columns (e.g. `category.name`). Ints with missing
+    values use pandas' nullable `Int64`, enums become categoricals and datetimes UTC `datetime64`.
+    """
+    pd = _import("pandas", "pandas")
+    columns: Dict[str, Any] = {}
+    _pandas_columns(pd, rows, model, "", columns)
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(rows)))
+
+def _pandas_columns(pd, rows: List[Dict[str, Any]], model: Type[BaseModel], prefix: str, out: Dict[str, Any]) -> None:
+    for column in column_schema(model):
+        values = [row.get(column.alias) if row is not None else None for row in rows]
+        name = prefix + column.name
+        kind = column.kind
+        if kind == "model":
+            _pandas_columns(pd, values, column.item, name + ".", out)
+        elif kind == "float":
+            out[name] = pd.Series(values, dtype="float64")
+        elif kind == "int":
+            out[name] = pd.Series(values, dtype="int64" if None not in values else "Int64")
+        elif kind == "bool":
+            out[name] = pd.Series(values, dtype="bool" if None not in values else "boolean")
+        elif kind == "enum":
+            out[name] = pd.Series(values, dtype="category")
+        elif kind == "datetime":
+            out[name] = _pandas_timestamps(pd, values)
+        else:
+            out[name] = pd.Series(values, dtype="object")
+
+def _pandas_timestamps(pd, values: List[Any]):
+    try:
+        return pd.Series(pd.to_datetime(values, utc=True, format="ISO8601"))
+    except (TypeError, ValueError):
+        # pandas < 2.0 has no "ISO8601" format; parse value by value instead.
+        return pd.Series([_utc(value) for value in values], dtype="datetime64[ns, UTC]")
+
+def convert_page(response_data: Dict[str, Any], response_model: Type[BaseModel], output: str) -> ColumnarPage:
+    """
+    Build a `ColumnarPage` in the requested output format from a raw paged response body.
+    """
+    rows = response_data.get("data") or []
+    if output == "records":
+        data = to_records(rows, response_model)
+    elif output == "arrow":
+        data = to_arrow(rows, response_model)
+    elif output == "pandas":
+        data = to_pandas(rows, response_model)
+    else:
+        raise InvalidRequestError(f"Unknown output format {output!r}; expected one of {', '.join(OUTPUT_FORMATS)}")
+    paging = Paging(**response_data["paging"])
+    data_count = response_data.get("dataCount", response_data.get("data_count", len(rows)))
+    return ColumnarPage(data_count, paging, data)
+
+def _import(module: str, extra: str):
+    try:
+        return __import__(module)
+    except ImportError:
+        raise ImportError(f"output={extra!r} requires {module}; install it with `pip install smartscout-api[{extra}]`") from None
@@ -0,0 +1,253 @@
+# src/smartscout/decoding.py
+
+import threading
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+from pydantic.datetime_parse import parse_date, parse_datetime
+from pydantic.fields import ModelField, SHAPE_LIST, SHAPE_SINGLETON
+
+from .models.base import CategoryInfo, PagedResponse
+
+M = TypeVar('M', bound=BaseModel)
+
+_MISSING = object()
+
+class ModelDecoder:
+    """
+    Builds instances of one pydantic model from trusted payload dicts, skipping validation.
+
+    The field table (wire alias, attribute name, default and per-field converter) is computed once
+    per model class, so decoding a row is a single pass over the fields. Nested models, lists of
+    models, enums and datetimes are still converted to their declared types; every other value is
+    taken from the payload as-is. Use this only for payloads from the SmartScout API itself.
+    """
+
+    def __init__(self, model: Type[M], flyweights: Optional["Flyweights"] = None):
+        self.model = model
+        self._fields: List[Tuple[str, str, Optional[Callable[[], Any]], Optional[Callable[[Any], Any]]]] = []
+        for name, field in model.__fields__.items():
+            self._fields.append((field.alias, name, _default_factory(field), _converter(field, flyweights)))
+        self._has_private = bool(getattr(model, "__private_attributes__", None))
+        self._flyweights = flyweights
+
+    def decode(self, payload: Dict[str, Any]) -> M:
+        values: Dict[str, Any] = {}
+        fields_set = set()
+        get = payload.get
+        for alias, name, default, convert in self._fields:
+            value = get(alias, _MISSING)
+            if value is _MISSING and alias != name:
+                value = get(name, _MISSING)
+            if value is _MISSING:
+                values[name] = default() if default is not None else None
+                continue
+            fields_set.add(name)
+            values[name] = convert(value) if convert is not None and value is not None else value
+        if self._flyweights is not None:
+            fields_set = self._flyweights.fields_set(fields_set)
+        instance = self.model.__new__(self.model)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__fields_set__", fields_set)
+        if self._has_private:
+            instance._init_private_attributes()
+        return instance
+
+    def decode_many(self, payloads: List[Dict[str, Any]]) -> List[M]:
+        decode = self.decode
+        return [decode(payload) for payload in payloads]
+
+_FROZEN: Dict[type, type] = {}
+_FROZEN_LOCK = threading.Lock()
+
+def _frozen(model: Type[M]) -> Type[M]:
+    """
+    An immutable subclass of `model`, created once per class.
+
+    pydantic rejects assignments to it before anything is written, so values shared between rows
+    cannot be changed through any one of them.
+    """
+    frozen = _FROZEN.get(model)
+    if frozen is None:
+        with _FROZEN_LOCK:
+            frozen = _FROZEN.get(model)
+            if frozen is None:
+                config = type("Config", (), {"allow_mutation": False})
+                namespace = {"__module__": model.__module__, "__qualname__": model.__qualname__, "Config": config}
+                frozen = _FROZEN[model] = type(model)(model.__name__, (model,), namespace)
+    return frozen
+
+class Flyweights:
+    """
+    A table of values shared between decoded rows, to cut the memory held by large result sets.
+
+    Strings up to `max_length` characters are interned, so the currency, brand, category and
+    availability strings of every row point at one object each, and rows whose nested payloads
+    of a `shared` model are equal (by default `CategoryInfo`) get the same instance. Enum members
+    are singletons already, and each model's `__fields_set__` is shared too. Rows are decoded as
+    immutable subclasses of their models: assigning to a field raises `TypeError` and leaves
+    every row unchanged.
+
+    Use a new table per response, or keep one for a whole session so pages share values with
+    each other. At most `max_entries` strings and `max_entries` instances are kept; values past
+    that are decoded unshared.
+
+    Example:
+        ```python
+        flyweights = Flyweights(shared=(CategoryInfo, Money))
+        page = decode_paged(response_data, Product, flyweights=flyweights)
+        ```
+    """
+
+    def __init__(self, shared: Iterable[Type[BaseModel]] = (CategoryInfo,), max_length: int = 64, max_entries: int = 100_000):
+        self.shared = frozenset(shared)
+        self.max_length = max_length
+        self.max_entries = max_entries
+        self._strings: Dict[str, str] = {}
+        self._instances: Dict[Any, BaseModel] = {}
+        self._field_sets: Dict[FrozenSet[str], FrozenSet[str]] = {}
+        self._decoders: Dict[type, ModelDecoder] = {}
+
+    def string(self, value: Any) -> Any:
+        """The table's copy of `value` if it is a short string, else `value` itself."""
+        if type(value) is not str or len(value) > self.max_length:
+            return value
+        found = self._strings.get(value)
+        if found is not None:
+            return found
+        if len(self._strings) < self.max_entries:
+            return self._strings.setdefault(value, value)
+        return value
+
+    def fields_set(self, names: Set[str]) -> FrozenSet[str]:
+        """The table's copy of a decoded instance's `__fields_set__`."""
+        key = frozenset(names)
+        found = self._field_sets.get(key)
+        if found is not None:
+            return found
+        if len(self._field_sets) < self.max_entries:
+            return self._field_sets.setdefault(key, key)
+        return key
+
+    def decoder(self, model: Type[M]) -> ModelDecoder:
+        """The `ModelDecoder` for `model` that shares values through this table."""
+        decoder = self._decoders.get(model)
+        if decoder is None:
+            decoder = self._decoders.setdefault(model, ModelDecoder(_frozen(model), self))
+        return decoder
+
+    def _sharing(self, model: Type[M], decode: Callable[[Dict[str, Any]], M]) -> Callable[[Dict[str, Any]], M]:
+        instances = self._instances
+
+        def share(payload: Dict[str, Any]) -> M:
+            key = (model, _freeze(payload))
+            instance = instances.get(key)
+            if instance is None:
+                instance = decode(payload)
+                if len(instances) < self.max_entries:
+                    instance = instances.setdefault(key, instance)
+            return instance
+
+        return share
+
+def _freeze(value: Any) -> Any:
+    # A hashable key for a JSON value; payloads of one model list their keys in the same order.
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+_decoders: Dict[type, ModelDecoder] = {}
+
+def get_decoder(model: Type[M], flyweights: Optional[Flyweights] = None) -> ModelDecoder:
+    """
+    Return the cached `ModelDecoder` for `model`, compiling it on first use.
+
+    With `flyweights`, the decoder cached on that table is returned instead.
+    """
+    if flyweights is not None:
+        return flyweights.decoder(model)
+    decoder = _decoders.get(model)
+    if decoder is None:
+        decoder = _decoders[model] = ModelDecoder(model)
+    return decoder
+
+def decode_paged(response_data: Dict[str, Any], response_model: Type[M], flyweights: Optional[Flyweights] = None) -> PagedResponse[M]:
+    """
+    Build a `PagedResponse[response_model]` from a trusted response body without validation.
+
+    Pass a `Flyweights` table to share repeated strings and nested values between the rows.
+    """
+    return get_decoder(paged_model(response_model), flyweights).decode(response_data)
+
+_PAGED_MODELS: Dict[type, type] = {}
+_PAGED_LOCK = threading.Lock()
+
+def paged_model(response_model: Type[M]) -> Type[PagedResponse[M]]:
+    """
+    `PagedResponse[response_model]`, created once under a lock.
+
+    pydantic caches a parametrized generic before preparing its fields, so threads creating the
+    same one concurrently could otherwise validate against a half-built class.
+    """
+    paged = _PAGED_MODELS.get(response_model)
+    if paged is None:
+        with _PAGED_LOCK:
+            paged = _PAGED_MODELS.get(response_model)
+            if paged is None:
+                paged = _PAGED_MODELS[response_model] = PagedResponse[response_model]
+    return paged
+
+def _default_factory(field: ModelField) -> Optional[Callable[[], Any]]:
+    """
+    Return a callable producing the field's default, or None when the default is None.
+    """
+    if field.required:
+        return None
+    if field.default_factory is not None:
+        return field.default_factory
+    if field.default is None:
+        return None
+    return field.get_default
+
+def _converter(field: ModelField, flyweights: Optional[Flyweights] = None) -> Optional[Callable[[Any], Any]]:
+    item = _item_converter(field.type_, flyweights)
+    if item is None:
+        return None
+    if field.shape == SHAPE_SINGLETON:
+        return item
+    if field.shape == SHAPE_LIST:
+        return lambda values: [item(value) if value is not None else None for value in values]
+    return None
+
+def _item_converter(type_: Any, flyweights: Optional[Flyweights] = None) -> Optional[Callable[[Any], Any]]:
+    if isinstance(type_, type):
+        if issubclass(type_, BaseModel):
+            return _model_converter(type_, flyweights)
+        if issubclass(type_, Enum):
+            members = type_._value2member_map_
+            return lambda value: members.get(value) or type_(value)
+        if issubclass(type_, datetime):
+            return parse_datetime
+        if issubclass(type_, date):
+            return parse_date
+        if flyweights is not None and issubclass(type_, str):
+            return flyweights.string
+    return None
+
+def _model_converter(model: Type[M], flyweights: Optional[Flyweights] = None) -> Callable[[Dict[str, Any]], M]:
+    # The nested decoder is resolved on first use so self-referencing models don't recurse while compiling.
+    decode = None
+
+    def convert(value: Dict[str, Any]) -> M:
+        nonlocal decode
+        if decode is None:
+            decode = get_decoder(model, flyweights).decode
+            if flyweights is not None and model in flyweights.shared:
+                decode = flyweights._sharing(model, decode)
+        return decode(value)
+
+    return convert
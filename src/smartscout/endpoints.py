@@ -0,0 +1,1431 @@
+# src/smartscout/endpoints.py
+# Generated by `python -m smartscout.codegen` from swagger.json; do not edit by hand.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict
+from .operations import OperationTable, Serialized, paging_query, scalar, segment
+
+# Models appear in annotations only: OPERATIONS imports `.models.generated` on first lookup,
+# so importing the clients does not build every generated model class.
+if TYPE_CHECKING:
+    from .models.base import PagedResponse, ListFilter, RangeDecimal, RangeFilter, RangeInt, TextFilter
+    from .models.generated import (
+        AdSpyBrandsRequest,
+        AdSpySearchRequest,
+        AdSpySponsoredProductsRequest,
+        Brand,
+        BrandCoverage,
+        BrandSalesHistory,
+        BrandScope,
+        BrandScopeBySubcategory,
+        BrandSearchTerm,
+        BrandsAdSpyRequest,
+        BrandsAdSpyV2Request,
+        BrandsHistorySalesBySubcategoriesRequest,
+        BrandsHistorySalesBySubcategoriesV2Request,
+        BrandsHistorySalesRequest,
+        BrandsHistorySalesV2Request,
+        BrandsHistoryScopeBySubcategoriesV2Request,
+        BrandsHistoryScopeTopProductsV2Request,
+        BrandsHistoryScopeV2Request,
+        BrandsHistoryTopProductsSalesRankRequest,
+        BrandsHistoryTopProductsSalesRankV2Request,
+        BrandsHistoryTopProductsSalesRequest,
+        BrandsHistoryTopProductsSalesV2Request,
+        BrandsMarketShareRequest,
+        BrandsMarketShareV2Request,
+        BrandsSearchRequest,
+        BrandsSearchV2Request,
+        BrandsSellersRequest,
+        BrandsSellersV2Request,
+        EstimatedUnitSalesHistory,
+        Product,
+        ProductHistory,
+        ProductOffer,
+        ProductSalesHistory,
+        ProductSalesRankHistory,
+        ProductsHistoryRequest,
+        ProductsHistoryScopeRequest,
+        ProductsOffersRequest,
+        ProductsSearchRequest,
+        RelevantProduct,
+        RelevantSearchTerm,
+        SalesEstimate,
+        SalesEstimateRequest,
+        ScopeHistory,
+        SearchTerm,
+        SearchTermBrand,
+        SearchTermHistory,
+        SearchTermProductRank,
+        SearchTermsHistoryRequest,
+        SearchTermsOrganicRanksRequest,
+        SearchTermsRelevantProductsRequest,
+        SearchTermsRelevantSearchTermsRequest,
+        SearchTermsSearchRequest,
+        Seller,
+        SellerHistory,
+        SellerOffer,
+        SellersBrandsRequest,
+        SellersHistoryRequest,
+        SellersOffersRequest,
+        SellersSearchRequest,
+        SubcategoriesBrandsRequest,
+        SubcategoriesHierarchyPostRequest,
+        SubcategoriesHierarchyRequest,
+        SubcategoriesHistorySalesByBrandsRequest,
+        SubcategoriesHistorySalesRequest,
+        SubcategoriesHistoryScopeByBrandsRequest,
+        SubcategoriesHistoryScopeRequest,
+        SubcategoriesHistoryScopeTopProductsRequest,
+        SubcategoriesHistoryTopProductsSalesRankRequest,
+        SubcategoriesHistoryTopProductsSalesRequest,
+        SubcategoriesSearchRequest,
+        Subcategory,
+        SubcategoryBrand,
+        SubcategorySalesHistory,
+        SubcategoryScope,
+        SubcategoryScopeByBrand,
+        TopProductScope,
+    )
+
+def _list_filter(value: ListFilter) -> Dict[str, Any]:
+    body = {}
+    if value.filter is not None:
+        body["filter"] = [scalar(item) for item in value.filter]
+    return body
+
+def _range_decimal(value: RangeDecimal) -> Dict[str, Any]:
+    body = {}
+    if value.min is not None:
+        body["min"] = value.min
+    if value.max is not None:
+        body["max"] = value.max
+    return body
+
+def _range_filter(value: RangeFilter) -> Dict[str, Any]:
+    body = {}
+    if value.min is not None:
+        body["min"] = value.min
+    if value.max is not None:
+        body["max"] = value.max
+    return body
+
+def _range_int(value: RangeInt) -> Dict[str, Any]:
+    body = {}
+    if value.min is not None:
+        body["min"] = value.min
+    if value.max is not None:
+        body["max"] = value.max
+    return body
+
+def _text_filter(value: TextFilter) -> Dict[str, Any]:
+    body = {}
+    if value.type is not None:
+        body["type"] = scalar(value.type)
+    if value.filter is not None:
+        body["filter"] = scalar(value.filter)
+    return body
+
+def _serialize_ad_spy_search(request: AdSpySearchRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.search_term_value is not None:
+        body["searchTermValue"] = _text_filter(request.search_term_value)
+    if request.estimate_searches is not None:
+        body["estimateSearches"] = _range_int(request.estimate_searches)
+    if request.brands is not None:
+        body["brands"] = _range_int(request.brands)
+    if request.products is not None:
+        body["products"] = _range_int(request.products)
+    if request.estimated_cpc is not None:
+        body["estimatedCpc"] = _range_filter(request.estimated_cpc)
+    if request.super_charge is not None:
+        body["superCharge"] = request.super_charge
+    return "/api/v1/ad-spy/search", query, body
+
+def _serialize_ad_spy_brands(request: AdSpyBrandsRequest) -> Serialized:
+    query = paging_query(request)
+    body = None
+    return f"/api/v1/ad-spy/{segment(request.search_term_value)}/brands", query, body
+
+def _serialize_ad_spy_sponsored_products(request: AdSpySponsoredProductsRequest) -> Serialized:
+    query = paging_query(request)
+    if request.search_term_value is not None:
+        query["searchTermValue"] = scalar(request.search_term_value)
+    if request.brand_name is not None:
+        query["brandName"] = scalar(request.brand_name)
+    body = None
+    return "/api/v1/ad-spy/sponsored-products", query, body
+
+def _serialize_brands_search(request: BrandsSearchRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.brand_names is not None:
+        body["brandNames"] = _list_filter(request.brand_names)
+    if request.brand_name is not None:
+        body["brandName"] = _text_filter(request.brand_name)
+    if request.amazon_isr is not None:
+        body["amazonIsr"] = _range_filter(request.amazon_isr)
+    if request.avg_sellers is not None:
+        body["avgSellers"] = _range_filter(request.avg_sellers)
+    if request.avg_price is not None:
+        body["avgPrice"] = _range_filter(request.avg_price)
+    if request.avg_volume is not None:
+        body["avgVolume"] = _range_filter(request.avg_volume)
+    if request.review_rating is not None:
+        body["reviewRating"] = _range_filter(request.review_rating)
+    if request.total_reviews is not None:
+        body["totalReviews"] = _range_int(request.total_reviews)
+    if request.total_products is not None:
+        body["totalProducts"] = _range_int(request.total_products)
+    if request.avg_fba_sellers is not None:
+        body["avgFbaSellers"] = _range_filter(request.avg_fba_sellers)
+    if request.brand_score is not None:
+        body["brandScore"] = _range_filter(request.brand_score)
+    if request.monthly_revenue is not None:
+        body["monthlyRevenue"] = _range_filter(request.monthly_revenue)
+    if request.note is not None:
+        body["note"] = _text_filter(request.note)
+    if request.category is not None:
+        body["category"] = _text_filter(request.category)
+    if request.category_name is not None:
+        body["categoryName"] = _text_filter(request.category_name)
+    if request.subcategory_name is not None:
+        body["subcategoryName"] = _text_filter(request.subcategory_name)
+    if request.has_storefront is not None:
+        body["hasStorefront"] = request.has_storefront
+    if request.search_terms is not None:
+        body["searchTerms"] = _range_int(request.search_terms)
+    if request.sponsored_products is not None:
+        body["sponsoredProducts"] = _range_int(request.sponsored_products)
+    if request.sponsored_brand_win_rate is not None:
+        body["sponsoredBrandWinRate"] = _range_decimal(request.sponsored_brand_win_rate)
+    if request.sponsored_video_win_rate is not None:
+        body["sponsoredVideoWinRate"] = _range_decimal(request.sponsored_video_win_rate)
+    if request.top_spot_win_rate is not None:
+        body["topSpotWinRate"] = _range_decimal(request.top_spot_win_rate)
+    if request.top_group_win_rate is not None:
+        body["topGroupWinRate"] = _range_decimal(request.top_group_win_rate)
+    if request.month_growth is not None:
+        body["monthGrowth"] = _range_decimal(request.month_growth)
+    if request.month_growth_12 is not None:
+        body["monthGrowth12"] = _range_decimal(request.month_growth_12)
+    if request.trailing_12_months is not None:
+        body["trailing12Months"] = _range_decimal(request.trailing_12_months)
+    return "/api/v1/brands/search", query, body
+
+def _serialize_brands_market_share(request: BrandsMarketShareRequest) -> Serialized:
+    query = paging_query(request)
+    body = None
+    return f"/api/v1/brands/{segment(request.brand_name)}/market-share", query, body
+
+def _serialize_brands_sellers(request: BrandsSellersRequest) -> Serialized:
+    query = paging_query(request)
+    body = None
+    return f"/api/v1/brands/{segment(request.brand_name)}/sellers", query, body
+
+def _serialize_brands_ad_spy(request: BrandsAdSpyRequest) -> Serialized:
+    query = paging_query(request)
+    body = None
+    return f"/api/v1/brands/{segment(request.brand_name)}/ad-spy", query, body
+
+def _serialize_brands_history_sales(request: BrandsHistorySalesRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.subcategory_id is not None:
+        body["subcategoryId"] = request.subcategory_id
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return f"/api/v1/brands/{segment(request.brand_name)}/history/sales", query, body
+
+def _serialize_brands_history_sales_by_subcategories(request: BrandsHistorySalesBySubcategoriesRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.subcategory_id is not None:
+        body["subcategoryId"] = request.subcategory_id
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return f"/api/v1/brands/{segment(request.brand_name)}/history/sales-by-subcategories", query, body
+
+def _serialize_brands_history_top_products_sales(request: BrandsHistoryTopProductsSalesRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return f"/api/v1/brands/{segment(request.brand_name)}/history/top-products/sales", query, body
+
+def _serialize_brands_history_top_products_sales_rank(request: BrandsHistoryTopProductsSalesRankRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return f"/api/v1/brands/{segment(request.brand_name)}/history/top-products/sales-rank", query, body
+
+def _serialize_brands_search_v2(request: BrandsSearchV2Request) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.brand_names is not None:
+        body["brandNames"] = _list_filter(request.brand_names)
+    if request.brand_name is not None:
+        body["brandName"] = _text_filter(request.brand_name)
+    if request.amazon_isr is not None:
+        body["amazonIsr"] = _range_filter(request.amazon_isr)
+    if request.avg_sellers is not None:
+        body["avgSellers"] = _range_filter(request.avg_sellers)
+    if request.avg_price is not None:
+        body["avgPrice"] = _range_filter(request.avg_price)
+    if request.avg_volume is not None:
+        body["avgVolume"] = _range_filter(request.avg_volume)
+    if request.review_rating is not None:
+        body["reviewRating"] = _range_filter(request.review_rating)
+    if request.total_reviews is not None:
+        body["totalReviews"] = _range_int(request.total_reviews)
+    if request.total_products is not None:
+        body["totalProducts"] = _range_int(request.total_products)
+    if request.avg_fba_sellers is not None:
+        body["avgFbaSellers"] = _range_filter(request.avg_fba_sellers)
+    if request.brand_score is not None:
+        body["brandScore"] = _range_filter(request.brand_score)
+    if request.monthly_revenue is not None:
+        body["monthlyRevenue"] = _range_filter(request.monthly_revenue)
+    if request.note is not None:
+        body["note"] = _text_filter(request.note)
+    if request.category is not None:
+        body["category"] = _text_filter(request.category)
+    if request.category_name is not None:
+        body["categoryName"] = _text_filter(request.category_name)
+    if request.subcategory_name is not None:
+        body["subcategoryName"] = _text_filter(request.subcategory_name)
+    if request.has_storefront is not None:
+        body["hasStorefront"] = request.has_storefront
+    if request.search_terms is not None:
+        body["searchTerms"] = _range_int(request.search_terms)
+    if request.sponsored_products is not None:
+        body["sponsoredProducts"] = _range_int(request.sponsored_products)
+    if request.sponsored_brand_win_rate is not None:
+        body["sponsoredBrandWinRate"] = _range_decimal(request.sponsored_brand_win_rate)
+    if request.sponsored_video_win_rate is not None:
+        body["sponsoredVideoWinRate"] = _range_decimal(request.sponsored_video_win_rate)
+    if request.top_spot_win_rate is not None:
+        body["topSpotWinRate"] = _range_decimal(request.top_spot_win_rate)
+    if request.top_group_win_rate is not None:
+        body["topGroupWinRate"] = _range_decimal(request.top_group_win_rate)
+    if request.month_growth is not None:
+        body["monthGrowth"] = _range_decimal(request.month_growth)
+    if request.month_growth_12 is not None:
+        body["monthGrowth12"] = _range_decimal(request.month_growth_12)
+    if request.trailing_12_months is not None:
+        body["trailing12Months"] = _range_decimal(request.trailing_12_months)
+    return "/api/v2/brands/search", query, body
+
+def _serialize_brands_market_share_v2(request: BrandsMarketShareV2Request) -> Serialized:
+    query = paging_query(request)
+    if request.brand_name is not None:
+        query["brandName"] = scalar(request.brand_name)
+    body = None
+    return "/api/v2/brands/market-share", query, body
+
+def _serialize_brands_sellers_v2(request: BrandsSellersV2Request) -> Serialized:
+    query = paging_query(request)
+    if request.brand_name is not None:
+        query["brandName"] = scalar(request.brand_name)
+    body = None
+    return "/api/v2/brands/sellers", query, body
+
+def _serialize_brands_ad_spy_v2(request: BrandsAdSpyV2Request) -> Serialized:
+    query = paging_query(request)
+    if request.brand_name is not None:
+        query["brandName"] = scalar(request.brand_name)
+    body = None
+    return "/api/v2/brands/ad-spy", query, body
+
+def _serialize_brands_history_sales_v2(request: BrandsHistorySalesV2Request) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.brand_name is not None:
+        body["brandName"] = scalar(request.brand_name)
+    if request.subcategory_id is not None:
+        body["subcategoryId"] = request.subcategory_id
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return "/api/v2/brands/history/sales", query, body
+
+def _serialize_brands_history_sales_by_subcategories_v2(request: BrandsHistorySalesBySubcategoriesV2Request) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.brand_name is not None:
+        body["brandName"] = scalar(request.brand_name)
+    if request.subcategory_id is not None:
+        body["subcategoryId"] = request.subcategory_id
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return "/api/v2/brands/history/sales-by-subcategories", query, body
+
+def _serialize_brands_history_top_products_sales_v2(request: BrandsHistoryTopProductsSalesV2Request) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.brand_name is not None:
+        body["brandName"] = scalar(request.brand_name)
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return "/api/v2/brands/history/top-products/sales", query, body
+
+def _serialize_brands_history_top_products_sales_rank_v2(request: BrandsHistoryTopProductsSalesRankV2Request) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.brand_name is not None:
+        body["brandName"] = scalar(request.brand_name)
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return "/api/v2/brands/history/top-products/sales-rank", query, body
+
+def _serialize_brands_history_scope_v2(request: BrandsHistoryScopeV2Request) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.brand_name is not None:
+        body["brandName"] = scalar(request.brand_name)
+    if request.subcategory_id is not None:
+        body["subcategoryId"] = request.subcategory_id
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return "/api/v2/brands/history/scope", query, body
+
+def _serialize_brands_history_scope_by_subcategories_v2(request: BrandsHistoryScopeBySubcategoriesV2Request) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.brand_name is not None:
+        body["brandName"] = scalar(request.brand_name)
+    if request.subcategory_id is not None:
+        body["subcategoryId"] = request.subcategory_id
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return "/api/v2/brands/history/scope/by-subcategories", query, body
+
+def _serialize_brands_history_scope_top_products_v2(request: BrandsHistoryScopeTopProductsV2Request) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.brand_name is not None:
+        body["brandName"] = scalar(request.brand_name)
+    if request.top_by is not None:
+        body["topBy"] = scalar(request.top_by)
+    if request.top is not None:
+        body["top"] = request.top
+    if request.subcategory_id is not None:
+        body["subcategoryId"] = request.subcategory_id
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return "/api/v2/brands/history/scope/top-products", query, body
+
+def _serialize_products_search(request: ProductsSearchRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.subcategory_id is not None:
+        body["subcategoryId"] = request.subcategory_id
+    if request.brand_name is not None:
+        body["brandName"] = _text_filter(request.brand_name)
+    if request.category_name is not None:
+        body["categoryName"] = _text_filter(request.category_name)
+    if request.subcategory_name is not None:
+        body["subcategoryName"] = _text_filter(request.subcategory_name)
+    if request.rank is not None:
+        body["rank"] = _range_int(request.rank)
+    if request.monthly_revenue_estimate is not None:
+        body["monthlyRevenueEstimate"] = _range_filter(request.monthly_revenue_estimate)
+    if request.amazon_isr is not None:
+        body["amazonIsr"] = _range_filter(request.amazon_isr)
+    if request.number_of_sellers is not None:
+        body["numberOfSellers"] = _range_int(request.number_of_sellers)
+    if request.number_fba_sellers is not None:
+        body["numberFbaSellers"] = _range_int(request.number_fba_sellers)
+    if request.review_count is not None:
+        body["reviewCount"] = _range_int(request.review_count)
+    if request.review_rating is not None:
+        body["reviewRating"] = _range_filter(request.review_rating)
+    if request.buy_box_price is not None:
+        body["buyBoxPrice"] = _range_filter(request.buy_box_price)
+    if request.product_page_score is not None:
+        body["productPageScore"] = _range_filter(request.product_page_score)
+    if request.out_of_stock_now is not None:
+        body["outOfStockNow"] = request.out_of_stock_now
+    if request.is_variation is not None:
+        body["isVariation"] = request.is_variation
+    if request.asins is not None:
+        body["asins"] = _list_filter(request.asins)
+    if request.asin is not None:
+        body["asin"] = _text_filter(request.asin)
+    if request.parent_asin is not None:
+        body["parentAsin"] = _text_filter(request.parent_asin)
+    if request.title is not None:
+        body["title"] = _text_filter(request.title)
+    if request.note is not None:
+        body["note"] = _text_filter(request.note)
+    if request.buy_box_equity is not None:
+        body["buyBoxEquity"] = _range_filter(request.buy_box_equity)
+    if request.number_of_items is not None:
+        body["numberOfItems"] = _range_int(request.number_of_items)
+    if request.total_ratings is not None:
+        body["totalRatings"] = _range_int(request.total_ratings)
+    return "/api/v1/products/search", query, body
+
+def _serialize_products_history(request: ProductsHistoryRequest) -> Serialized:
+    query = paging_query(request)
+    body = None
+    return f"/api/v1/products/{segment(request.asin)}/history", query, body
+
+def _serialize_products_history_scope(request: ProductsHistoryScopeRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return f"/api/v1/products/{segment(request.asin)}/history/scope", query, body
+
+def _serialize_products_offers(request: ProductsOffersRequest) -> Serialized:
+    query = paging_query(request)
+    body = None
+    return f"/api/v1/products/{segment(request.asin)}/offers", query, body
+
+def _serialize_sales_estimate(request: SalesEstimateRequest) -> Serialized:
+    query = paging_query(request)
+    if request.category_node is not None:
+        query["categoryNode"] = request.category_node
+    if request.sales_rank is not None:
+        query["salesRank"] = request.sales_rank
+    body = None
+    return "/api/v1/sales/estimate", query, body
+
+def _serialize_search_terms_search(request: SearchTermsSearchRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.search_term_value is not None:
+        body["searchTermValue"] = _text_filter(request.search_term_value)
+    if request.estimate_searches is not None:
+        body["estimateSearches"] = _range_int(request.estimate_searches)
+    if request.brands is not None:
+        body["brands"] = _range_int(request.brands)
+    if request.products is not None:
+        body["products"] = _range_int(request.products)
+    if request.estimated_cpc is not None:
+        body["estimatedCpc"] = _range_filter(request.estimated_cpc)
+    if request.super_charge is not None:
+        body["superCharge"] = request.super_charge
+    return "/api/v1/search-terms/search", query, body
+
+def _serialize_search_terms_organic_ranks(request: SearchTermsOrganicRanksRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.asin is not None:
+        body["asin"] = scalar(request.asin)
+    if request.exclude_variants is not None:
+        body["excludeVariants"] = request.exclude_variants
+    if request.include_rank_history is not None:
+        body["includeRankHistory"] = request.include_rank_history
+    if request.intent is not None:
+        body["intent"] = scalar(request.intent)
+    if request.search_term is not None:
+        body["searchTerm"] = _text_filter(request.search_term)
+    if request.avg_rank is not None:
+        body["avgRank"] = _range_decimal(request.avg_rank)
+    if request.latest_rank is not None:
+        body["latestRank"] = _range_int(request.latest_rank)
+    if request.rank_score is not None:
+        body["rankScore"] = _range_int(request.rank_score)
+    if request.smart_score is not None:
+        body["smartScore"] = _range_int(request.smart_score)
+    if request.estimate_searches is not None:
+        body["estimateSearches"] = _range_int(request.estimate_searches)
+    return "/api/v1/search-terms/organic-ranks", query, body
+
+def _serialize_search_terms_relevant_products(request: SearchTermsRelevantProductsRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.parent_asin is not None:
+        body["parentAsin"] = scalar(request.parent_asin)
+    if request.relevancy_score is not None:
+        body["relevancyScore"] = _range_decimal(request.relevancy_score)
+    if request.common_search_terms is not None:
+        body["commonSearchTerms"] = _range_int(request.common_search_terms)
+    return f"/api/v1/search-terms/relevant-products/{segment(request.asin)}", query, body
+
+def _serialize_search_terms_relevant_search_terms(request: SearchTermsRelevantSearchTermsRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.parent_asin is not None:
+        body["parentAsin"] = scalar(request.parent_asin)
+    if request.search_term is not None:
+        body["searchTerm"] = _text_filter(request.search_term)
+    if request.intent is not None:
+        body["intent"] = _text_filter(request.intent)
+    if request.relevancy is not None:
+        body["relevancy"] = _range_decimal(request.relevancy)
+    if request.estimated_searches is not None:
+        body["estimatedSearches"] = _range_int(request.estimated_searches)
+    return f"/api/v1/search-terms/relevant-search-terms/{segment(request.asin)}", query, body
+
+def _serialize_search_terms_history(request: SearchTermsHistoryRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.search_term is not None:
+        body["searchTerm"] = scalar(request.search_term)
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return "/api/v1/search-terms/history", query, body
+
+def _serialize_sellers_search(request: SellersSearchRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.category_name is not None:
+        body["categoryName"] = _text_filter(request.category_name)
+    if request.subcategory_name is not None:
+        body["subcategoryName"] = _text_filter(request.subcategory_name)
+    if request.amazon_seller_id is not None:
+        body["amazonSellerId"] = _text_filter(request.amazon_seller_id)
+    if request.amazon_seller_ids is not None:
+        body["amazonSellerIds"] = _list_filter(request.amazon_seller_ids)
+    if request.seller_names is not None:
+        body["sellerNames"] = _list_filter(request.seller_names)
+    if request.business_names is not None:
+        body["businessNames"] = _list_filter(request.business_names)
+    if request.include_products is not None:
+        body["includeProducts"] = request.include_products
+    if request.estimate_sales is not None:
+        body["estimateSales"] = _range_filter(request.estimate_sales)
+    if request.seller_name is not None:
+        body["sellerName"] = _text_filter(request.seller_name)
+    if request.percent_fba is not None:
+        body["percentFba"] = _range_filter(request.percent_fba)
+    if request.number_winning_brands is not None:
+        body["numberWinningBrands"] = _range_int(request.number_winning_brands)
+    if request.number_asins is not None:
+        body["numberAsins"] = _range_int(request.number_asins)
+    if request.number_top_asins is not None:
+        body["numberTopAsins"] = _range_int(request.number_top_asins)
+    if request.num_brands_1000 is not None:
+        body["numBrands1000"] = _range_int(request.num_brands_1000)
+    if request.mom_growth is not None:
+        body["moMGrowth"] = _range_filter(request.mom_growth)
+    if request.three_month_growth is not None:
+        body["threeMonthGrowth"] = _range_filter(request.three_month_growth)
+    if request.six_month_growth is not None:
+        body["sixMonthGrowth"] = _range_filter(request.six_month_growth)
+    if request.year_growth is not None:
+        body["yearGrowth"] = _range_filter(request.year_growth)
+    if request.mom_growth_count is not None:
+        body["moMGrowthCount"] = _range_int(request.mom_growth_count)
+    if request.six_month_growth_count is not None:
+        body["sixMonthGrowthCount"] = _range_int(request.six_month_growth_count)
+    if request.street is not None:
+        body["street"] = _text_filter(request.street)
+    if request.city is not None:
+        body["city"] = _text_filter(request.city)
+    if request.state is not None:
+        body["state"] = _text_filter(request.state)
+    if request.country is not None:
+        body["country"] = _text_filter(request.country)
+    if request.zip_code is not None:
+        body["zipCode"] = _text_filter(request.zip_code)
+    if request.business_name is not None:
+        body["businessName"] = _text_filter(request.business_name)
+    if request.number_reviews_lifetime is not None:
+        body["numberReviewsLifetime"] = _range_int(request.number_reviews_lifetime)
+    if request.number_reviews_30_days is not None:
+        body["numberReviews30Days"] = _range_int(request.number_reviews_30_days)
+    if request.is_suspended is not None:
+        body["isSuspended"] = request.is_suspended
+    if request.last_suspended_date is not None:
+        body["lastSuspendedDate"] = scalar(request.last_suspended_date)
+    return "/api/v1/sellers/search", query, body
+
+def _serialize_sellers_offers(request: SellersOffersRequest) -> Serialized:
+    query = paging_query(request)
+    body = None
+    return f"/api/v1/sellers/{segment(request.amazon_seller_id)}/offers", query, body
+
+def _serialize_sellers_brands(request: SellersBrandsRequest) -> Serialized:
+    query = paging_query(request)
+    body = None
+    return f"/api/v1/sellers/{segment(request.amazon_seller_id)}/brands", query, body
+
+def _serialize_sellers_history(request: SellersHistoryRequest) -> Serialized:
+    query = paging_query(request)
+    body = None
+    return f"/api/v1/sellers/{segment(request.amazon_seller_id)}/history", query, body
+
+def _serialize_subcategories_search(request: SubcategoriesSearchRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.id is not None:
+        body["id"] = request.id
+    if request.ids is not None:
+        body["ids"] = list(request.ids)
+    if request.parent_id is not None:
+        body["parentId"] = request.parent_id
+    if request.total_monthly_revenue is not None:
+        body["totalMonthlyRevenue"] = _range_decimal(request.total_monthly_revenue)
+    if request.total_brands is not None:
+        body["totalBrands"] = _range_int(request.total_brands)
+    if request.total_asins is not None:
+        body["totalAsins"] = _range_int(request.total_asins)
+    if request.avg_price is not None:
+        body["avgPrice"] = _range_decimal(request.avg_price)
+    if request.avg_reviews is not None:
+        body["avgReviews"] = _range_decimal(request.avg_reviews)
+    if request.avg_rating is not None:
+        body["avgRating"] = _range_decimal(request.avg_rating)
+    if request.az_revenue_pct is not None:
+        body["azRevenuePct"] = _range_decimal(request.az_revenue_pct)
+    if request.seller_revenue_pct is not None:
+        body["sellerRevenuePct"] = _range_decimal(request.seller_revenue_pct)
+    if request.avg_number_sellers is not None:
+        body["avgNumberSellers"] = _range_decimal(request.avg_number_sellers)
+    if request.avg_page_score is not None:
+        body["avgPageScore"] = _range_decimal(request.avg_page_score)
+    if request.avg_volume is not None:
+        body["avgVolume"] = _range_decimal(request.avg_volume)
+    if request.total_number_units_sold is not None:
+        body["totalNumberUnitsSold"] = _range_int(request.total_number_units_sold)
+    if request.total_reviews is not None:
+        body["totalReviews"] = _range_int(request.total_reviews)
+    if request.subcategory_context_name is not None:
+        body["subcategoryContextName"] = _text_filter(request.subcategory_context_name)
+    if request.subcategory_name is not None:
+        body["subcategoryName"] = _text_filter(request.subcategory_name)
+    return "/api/v1/subcategories/search", query, body
+
+def _serialize_subcategories_brands(request: SubcategoriesBrandsRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.brand_name is not None:
+        body["brandName"] = scalar(request.brand_name)
+    return f"/api/v1/subcategories/{segment(request.subcategory_id)}/brands", query, body
+
+def _serialize_subcategories_history_sales(request: SubcategoriesHistorySalesRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.brand_name is not None:
+        body["brandName"] = scalar(request.brand_name)
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return f"/api/v1/subcategories/{segment(request.subcategory_id)}/history/sales", query, body
+
+def _serialize_subcategories_history_sales_by_brands(request: SubcategoriesHistorySalesByBrandsRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.brand_name is not None:
+        body["brandName"] = scalar(request.brand_name)
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return f"/api/v1/subcategories/{segment(request.subcategory_id)}/history/sales-by-brands", query, body
+
+def _serialize_subcategories_history_top_products_sales(request: SubcategoriesHistoryTopProductsSalesRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return f"/api/v1/subcategories/{segment(request.subcategory_id)}/history/top-products/sales", query, body
+
+def _serialize_subcategories_history_top_products_sales_rank(request: SubcategoriesHistoryTopProductsSalesRankRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return f"/api/v1/subcategories/{segment(request.subcategory_id)}/history/top-products/sales-rank", query, body
+
+def _serialize_subcategories_history_scope(request: SubcategoriesHistoryScopeRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return f"/api/v1/subcategories/{segment(request.subcategory_id)}/history/scope", query, body
+
+def _serialize_subcategories_history_scope_by_brands(request: SubcategoriesHistoryScopeByBrandsRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return f"/api/v1/subcategories/{segment(request.subcategory_id)}/history/scope/by-brands", query, body
+
+def _serialize_subcategories_history_scope_top_products(request: SubcategoriesHistoryScopeTopProductsRequest) -> Serialized:
+    query = paging_query(request)
+    body = {}
+    if request.top_by is not None:
+        body["topBy"] = scalar(request.top_by)
+    if request.top is not None:
+        body["top"] = request.top
+    if request.start_date is not None:
+        body["startDate"] = scalar(request.start_date)
+    if request.end_date is not None:
+        body["endDate"] = scalar(request.end_date)
+    return f"/api/v1/subcategories/{segment(request.subcategory_id)}/history/scope/top-products", query, body
+
+def _serialize_subcategories_hierarchy(request: SubcategoriesHierarchyRequest) -> Serialized:
+    query = paging_query(request)
+    body = None
+    return f"/api/v1/subcategories/{segment(request.subcategory_id)}/hierarchy", query, body
+
+def _serialize_subcategories_hierarchy_post(request: SubcategoriesHierarchyPostRequest) -> Serialized:
+    query = paging_query(request)
+    body = None
+    return f"/api/v1/subcategories/{segment(request.subcategory_id)}/hierarchy", query, body
+
+OPERATIONS = OperationTable(".models.generated", __package__, {
+    "ad_spy_search": ("POST", "/api/v1/ad-spy/search", "AdSpySearchRequest", "SearchTerm", True, _serialize_ad_spy_search),
+    "ad_spy_brands": ("GET", "/api/v1/ad-spy/{SearchTermValue}/brands", "AdSpyBrandsRequest", "SearchTermBrand", True, _serialize_ad_spy_brands),
+    "ad_spy_sponsored_products": ("GET", "/api/v1/ad-spy/sponsored-products", "AdSpySponsoredProductsRequest", "BrandSearchTerm", True, _serialize_ad_spy_sponsored_products),
+    "brands_search": ("POST", "/api/v1/brands/search", "BrandsSearchRequest", "Brand", True, _serialize_brands_search),
+    "brands_market_share": ("GET", "/api/v1/brands/{BrandName}/market-share", "BrandsMarketShareRequest", "SubcategoryBrand", True, _serialize_brands_market_share),
+    "brands_sellers": ("GET", "/api/v1/brands/{BrandName}/sellers", "BrandsSellersRequest", "BrandCoverage", True, _serialize_brands_sellers),
+    "brands_ad_spy": ("GET", "/api/v1/brands/{BrandName}/ad-spy", "BrandsAdSpyRequest", "BrandSearchTerm", True, _serialize_brands_ad_spy),
+    "brands_history_sales": ("POST", "/api/v1/brands/{BrandName}/history/sales", "BrandsHistorySalesRequest", "EstimatedUnitSalesHistory", True, _serialize_brands_history_sales),
+    "brands_history_sales_by_subcategories": ("POST", "/api/v1/brands/{BrandName}/history/sales-by-subcategories", "BrandsHistorySalesBySubcategoriesRequest", "SubcategorySalesHistory", True, _serialize_brands_history_sales_by_subcategories),
+    "brands_history_top_products_sales": ("POST", "/api/v1/brands/{BrandName}/history/top-products/sales", "BrandsHistoryTopProductsSalesRequest", "ProductSalesHistory", True, _serialize_brands_history_top_products_sales),
+    "brands_history_top_products_sales_rank": ("POST", "/api/v1/brands/{BrandName}/history/top-products/sales-rank", "BrandsHistoryTopProductsSalesRankRequest", "ProductSalesRankHistory", True, _serialize_brands_history_top_products_sales_rank),
+    "brands_search_v2": ("POST", "/api/v2/brands/search", "BrandsSearchV2Request", "Brand", True, _serialize_brands_search_v2),
+    "brands_market_share_v2": ("GET", "/api/v2/brands/market-share", "BrandsMarketShareV2Request", "SubcategoryBrand", True, _serialize_brands_market_share_v2),
+    "brands_sellers_v2": ("GET", "/api/v2/brands/sellers", "BrandsSellersV2Request", "BrandCoverage", True, _serialize_brands_sellers_v2),
+    "brands_ad_spy_v2": ("GET", "/api/v2/brands/ad-spy", "BrandsAdSpyV2Request", "BrandSearchTerm", True, _serialize_brands_ad_spy_v2),
+    "brands_history_sales_v2": ("POST", "/api/v2/brands/history/sales", "BrandsHistorySalesV2Request", "EstimatedUnitSalesHistory", True, _serialize_brands_history_sales_v2),
+    "brands_history_sales_by_subcategories_v2": ("POST", "/api/v2/brands/history/sales-by-subcategories", "BrandsHistorySalesBySubcategoriesV2Request", "SubcategorySalesHistory", True, _serialize_brands_history_sales_by_subcategories_v2),
+    "brands_history_top_products_sales_v2": ("POST", "/api/v2/brands/history/top-products/sales", "BrandsHistoryTopProductsSalesV2Request", "ProductSalesHistory", True, _serialize_brands_history_top_products_sales_v2),
+    "brands_history_top_products_sales_rank_v2": ("POST", "/api/v2/brands/history/top-products/sales-rank", "BrandsHistoryTopProductsSalesRankV2Request", "ProductSalesRankHistory", True, _serialize_brands_history_top_products_sales_rank_v2),
+    "brands_history_scope_v2": ("POST", "/api/v2/brands/history/scope", "BrandsHistoryScopeV2Request", "BrandScope", True, _serialize_brands_history_scope_v2),
+    "brands_history_scope_by_subcategories_v2": ("POST", "/api/v2/brands/history/scope/by-subcategories", "BrandsHistoryScopeBySubcategoriesV2Request", "BrandScopeBySubcategory", True, _serialize_brands_history_scope_by_subcategories_v2),
+    "brands_history_scope_top_products_v2": ("POST", "/api/v2/brands/history/scope/top-products", "BrandsHistoryScopeTopProductsV2Request", "TopProductScope", True, _serialize_brands_history_scope_top_products_v2),
+    "products_search": ("POST", "/api/v1/products/search", "ProductsSearchRequest", "Product", True, _serialize_products_search),
+    "products_history": ("GET", "/api/v1/products/{Asin}/history", "ProductsHistoryRequest", "ProductHistory", True, _serialize_products_history),
+    "products_history_scope": ("POST", "/api/v1/products/{Asin}/history/scope", "ProductsHistoryScopeRequest", "ScopeHistory", True, _serialize_products_history_scope),
+    "products_offers": ("GET", "/api/v1/products/{Asin}/offers", "ProductsOffersRequest", "ProductOffer", True, _serialize_products_offers),
+    "sales_estimate": ("GET", "/api/v1/sales/estimate", "SalesEstimateRequest", "SalesEstimate", False, _serialize_sales_estimate),
+    "search_terms_search": ("POST", "/api/v1/search-terms/search", "SearchTermsSearchRequest", "SearchTerm", True, _serialize_search_terms_search),
+    "search_terms_organic_ranks": ("POST", "/api/v1/search-terms/organic-ranks", "SearchTermsOrganicRanksRequest", "SearchTermProductRank", True, _serialize_search_terms_organic_ranks),
+    "search_terms_relevant_products": ("POST", "/api/v1/search-terms/relevant-products/{Asin}", "SearchTermsRelevantProductsRequest", "RelevantProduct", True, _serialize_search_terms_relevant_products),
+    "search_terms_relevant_search_terms": ("POST", "/api/v1/search-terms/relevant-search-terms/{Asin}", "SearchTermsRelevantSearchTermsRequest", "RelevantSearchTerm", True, _serialize_search_terms_relevant_search_terms),
+    "search_terms_history": ("POST", "/api/v1/search-terms/history", "SearchTermsHistoryRequest", "SearchTermHistory", True, _serialize_search_terms_history),
+    "sellers_search": ("POST", "/api/v1/sellers/search", "SellersSearchRequest", "Seller", True, _serialize_sellers_search),
+    "sellers_offers": ("GET", "/api/v1/sellers/{AmazonSellerId}/offers", "SellersOffersRequest", "SellerOffer", True, _serialize_sellers_offers),
+    "sellers_brands": ("GET", "/api/v1/sellers/{AmazonSellerId}/brands", "SellersBrandsRequest", "BrandCoverage", True, _serialize_sellers_brands),
+    "sellers_history": ("GET", "/api/v1/sellers/{AmazonSellerId}/history", "SellersHistoryRequest", "SellerHistory", True, _serialize_sellers_history),
+    "subcategories_search": ("POST", "/api/v1/subcategories/search", "SubcategoriesSearchRequest", "Subcategory", True, _serialize_subcategories_search),
+    "subcategories_brands": ("POST", "/api/v1/subcategories/{SubcategoryId}/brands", "SubcategoriesBrandsRequest", "SubcategoryBrand", True, _serialize_subcategories_brands),
+    "subcategories_history_sales": ("POST", "/api/v1/subcategories/{SubcategoryId}/history/sales", "SubcategoriesHistorySalesRequest", "EstimatedUnitSalesHistory", True, _serialize_subcategories_history_sales),
+    "subcategories_history_sales_by_brands": ("POST", "/api/v1/subcategories/{SubcategoryId}/history/sales-by-brands", "SubcategoriesHistorySalesByBrandsRequest", "BrandSalesHistory", True, _serialize_subcategories_history_sales_by_brands),
+    "subcategories_history_top_products_sales": ("POST", "/api/v1/subcategories/{SubcategoryId}/history/top-products/sales", "SubcategoriesHistoryTopProductsSalesRequest", "ProductSalesHistory", True, _serialize_subcategories_history_top_products_sales),
+    "subcategories_history_top_products_sales_rank": ("POST", "/api/v1/subcategories/{SubcategoryId}/history/top-products/sales-rank", "SubcategoriesHistoryTopProductsSalesRankRequest", "ProductSalesRankHistory", True, _serialize_subcategories_history_top_products_sales_rank),
+    "subcategories_history_scope": ("POST", "/api/v1/subcategories/{SubcategoryId}/history/scope", "SubcategoriesHistoryScopeRequest", "SubcategoryScope", True, _serialize_subcategories_history_scope),
+    "subcategories_history_scope_by_brands": ("POST", "/api/v1/subcategories/{SubcategoryId}/history/scope/by-brands", "SubcategoriesHistoryScopeByBrandsRequest", "SubcategoryScopeByBrand", True, _serialize_subcategories_history_scope_by_brands),
+    "subcategories_history_scope_top_products": ("POST", "/api/v1/subcategories/{SubcategoryId}/history/scope/top-products", "SubcategoriesHistoryScopeTopProductsRequest", "TopProductScope", True, _serialize_subcategories_history_scope_top_products),
+    "subcategories_hierarchy": ("GET", "/api/v1/subcategories/{SubcategoryId}/hierarchy", "SubcategoriesHierarchyRequest", "Subcategory", True, _serialize_subcategories_hierarchy),
+    "subcategories_hierarchy_post": ("POST", "/api/v1/subcategories/{SubcategoryId}/hierarchy", "SubcategoriesHierarchyPostRequest", "Subcategory", True, _serialize_subcategories_hierarchy_post),
+})
+
+class EndpointsMixin:
+    """
+    One method per operation in the API spec, generated by `smartscout.codegen`.
+    """
+
+    def ad_spy_search(self, request: AdSpySearchRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SearchTerm]:
+        """
+        AdSpy: `POST /api/v1/ad-spy/search`.
+        """
+        return self._operation_request(OPERATIONS["ad_spy_search"], request, verbose=verbose, output=output)
+
+    def ad_spy_brands(self, request: AdSpyBrandsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SearchTermBrand]:
+        """
+        AdSpy: `GET /api/v1/ad-spy/{SearchTermValue}/brands`.
+        """
+        return self._operation_request(OPERATIONS["ad_spy_brands"], request, verbose=verbose, output=output)
+
+    def ad_spy_sponsored_products(self, request: AdSpySponsoredProductsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[BrandSearchTerm]:
+        """
+        AdSpy: `GET /api/v1/ad-spy/sponsored-products`.
+        """
+        return self._operation_request(OPERATIONS["ad_spy_sponsored_products"], request, verbose=verbose, output=output)
+
+    def brands_search(self, request: BrandsSearchRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Brand]:
+        """
+        Brands: `POST /api/v1/brands/search`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["brands_search"], request, verbose=verbose, output=output)
+
+    def brands_market_share(self, request: BrandsMarketShareRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SubcategoryBrand]:
+        """
+        Brands: `GET /api/v1/brands/{BrandName}/market-share`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["brands_market_share"], request, verbose=verbose, output=output)
+
+    def brands_sellers(self, request: BrandsSellersRequest, verbose: bool = False, output: str = "models") -> PagedResponse[BrandCoverage]:
+        """
+        Brands: `GET /api/v1/brands/{BrandName}/sellers`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["brands_sellers"], request, verbose=verbose, output=output)
+
+    def brands_ad_spy(self, request: BrandsAdSpyRequest, verbose: bool = False, output: str = "models") -> PagedResponse[BrandSearchTerm]:
+        """
+        Brands: `GET /api/v1/brands/{BrandName}/ad-spy`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["brands_ad_spy"], request, verbose=verbose, output=output)
+
+    def brands_history_sales(self, request: BrandsHistorySalesRequest, verbose: bool = False, output: str = "models") -> PagedResponse[EstimatedUnitSalesHistory]:
+        """
+        Brands: `POST /api/v1/brands/{BrandName}/history/sales`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["brands_history_sales"], request, verbose=verbose, output=output)
+
+    def brands_history_sales_by_subcategories(self, request: BrandsHistorySalesBySubcategoriesRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SubcategorySalesHistory]:
+        """
+        Brands: `POST /api/v1/brands/{BrandName}/history/sales-by-subcategories`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["brands_history_sales_by_subcategories"], request, verbose=verbose, output=output)
+
+    def brands_history_top_products_sales(self, request: BrandsHistoryTopProductsSalesRequest, verbose: bool = False, output: str = "models") -> PagedResponse[ProductSalesHistory]:
+        """
+        Brands: `POST /api/v1/brands/{BrandName}/history/top-products/sales`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["brands_history_top_products_sales"], request, verbose=verbose, output=output)
+
+    def brands_history_top_products_sales_rank(self, request: BrandsHistoryTopProductsSalesRankRequest, verbose: bool = False, output: str = "models") -> PagedResponse[ProductSalesRankHistory]:
+        """
+        Brands: `POST /api/v1/brands/{BrandName}/history/top-products/sales-rank`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["brands_history_top_products_sales_rank"], request, verbose=verbose, output=output)
+
+    def brands_search_v2(self, request: BrandsSearchV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[Brand]:
+        """
+        BrandsV2: `POST /api/v2/brands/search`.
+        """
+        return self._operation_request(OPERATIONS["brands_search_v2"], request, verbose=verbose, output=output)
+
+    def brands_market_share_v2(self, request: BrandsMarketShareV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[SubcategoryBrand]:
+        """
+        BrandsV2: `GET /api/v2/brands/market-share`.
+        """
+        return self._operation_request(OPERATIONS["brands_market_share_v2"], request, verbose=verbose, output=output)
+
+    def brands_sellers_v2(self, request: BrandsSellersV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[BrandCoverage]:
+        """
+        BrandsV2: `GET /api/v2/brands/sellers`.
+        """
+        return self._operation_request(OPERATIONS["brands_sellers_v2"], request, verbose=verbose, output=output)
+
+    def brands_ad_spy_v2(self, request: BrandsAdSpyV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[BrandSearchTerm]:
+        """
+        BrandsV2: `GET /api/v2/brands/ad-spy`.
+        """
+        return self._operation_request(OPERATIONS["brands_ad_spy_v2"], request, verbose=verbose, output=output)
+
+    def brands_history_sales_v2(self, request: BrandsHistorySalesV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[EstimatedUnitSalesHistory]:
+        """
+        BrandsV2: `POST /api/v2/brands/history/sales`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["brands_history_sales_v2"], request, verbose=verbose, output=output)
+
+    def brands_history_sales_by_subcategories_v2(self, request: BrandsHistorySalesBySubcategoriesV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[SubcategorySalesHistory]:
+        """
+        BrandsV2: `POST /api/v2/brands/history/sales-by-subcategories`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["brands_history_sales_by_subcategories_v2"], request, verbose=verbose, output=output)
+
+    def brands_history_top_products_sales_v2(self, request: BrandsHistoryTopProductsSalesV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[ProductSalesHistory]:
+        """
+        BrandsV2: `POST /api/v2/brands/history/top-products/sales`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["brands_history_top_products_sales_v2"], request, verbose=verbose, output=output)
+
+    def brands_history_top_products_sales_rank_v2(self, request: BrandsHistoryTopProductsSalesRankV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[ProductSalesRankHistory]:
+        """
+        BrandsV2: `POST /api/v2/brands/history/top-products/sales-rank`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["brands_history_top_products_sales_rank_v2"], request, verbose=verbose, output=output)
+
+    def brands_history_scope_v2(self, request: BrandsHistoryScopeV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[BrandScope]:
+        """
+        BrandsV2: `POST /api/v2/brands/history/scope`.
+        """
+        return self._operation_request(OPERATIONS["brands_history_scope_v2"], request, verbose=verbose, output=output)
+
+    def brands_history_scope_by_subcategories_v2(self, request: BrandsHistoryScopeBySubcategoriesV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[BrandScopeBySubcategory]:
+        """
+        BrandsV2: `POST /api/v2/brands/history/scope/by-subcategories`.
+        """
+        return self._operation_request(OPERATIONS["brands_history_scope_by_subcategories_v2"], request, verbose=verbose, output=output)
+
+    def brands_history_scope_top_products_v2(self, request: BrandsHistoryScopeTopProductsV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[TopProductScope]:
+        """
+        BrandsV2: `POST /api/v2/brands/history/scope/top-products`.
+        """
+        return self._operation_request(OPERATIONS["brands_history_scope_top_products_v2"], request, verbose=verbose, output=output)
+
+    def products_search(self, request: ProductsSearchRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Product]:
+        """
+        Products: `POST /api/v1/products/search`.
+        """
+        return self._operation_request(OPERATIONS["products_search"], request, verbose=verbose, output=output)
+
+    def products_history(self, request: ProductsHistoryRequest, verbose: bool = False, output: str = "models") -> PagedResponse[ProductHistory]:
+        """
+        Products: `GET /api/v1/products/{Asin}/history`.
+        """
+        return self._operation_request(OPERATIONS["products_history"], request, verbose=verbose, output=output)
+
+    def products_history_scope(self, request: ProductsHistoryScopeRequest, verbose: bool = False, output: str = "models") -> PagedResponse[ScopeHistory]:
+        """
+        Products: `POST /api/v1/products/{Asin}/history/scope`.
+        """
+        return self._operation_request(OPERATIONS["products_history_scope"], request, verbose=verbose, output=output)
+
+    def products_offers(self, request: ProductsOffersRequest, verbose: bool = False, output: str = "models") -> PagedResponse[ProductOffer]:
+        """
+        Products: `GET /api/v1/products/{Asin}/offers`.
+        """
+        return self._operation_request(OPERATIONS["products_offers"], request, verbose=verbose, output=output)
+
+    def sales_estimate(self, request: SalesEstimateRequest, verbose: bool = False) -> SalesEstimate:
+        """
+        Sales: `GET /api/v1/sales/estimate`.
+        """
+        return self._operation_request(OPERATIONS["sales_estimate"], request, verbose=verbose)
+
+    def search_terms_search(self, request: SearchTermsSearchRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SearchTerm]:
+        """
+        SearchTerms: `POST /api/v1/search-terms/search`.
+        """
+        return self._operation_request(OPERATIONS["search_terms_search"], request, verbose=verbose, output=output)
+
+    def search_terms_organic_ranks(self, request: SearchTermsOrganicRanksRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SearchTermProductRank]:
+        """
+        SearchTerms: `POST /api/v1/search-terms/organic-ranks`.
+        """
+        return self._operation_request(OPERATIONS["search_terms_organic_ranks"], request, verbose=verbose, output=output)
+
+    def search_terms_relevant_products(self, request: SearchTermsRelevantProductsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[RelevantProduct]:
+        """
+        SearchTerms: `POST /api/v1/search-terms/relevant-products/{Asin}`.
+        """
+        return self._operation_request(OPERATIONS["search_terms_relevant_products"], request, verbose=verbose, output=output)
+
+    def search_terms_relevant_search_terms(self, request: SearchTermsRelevantSearchTermsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[RelevantSearchTerm]:
+        """
+        SearchTerms: `POST /api/v1/search-terms/relevant-search-terms/{Asin}`.
+        """
+        return self._operation_request(OPERATIONS["search_terms_relevant_search_terms"], request, verbose=verbose, output=output)
+
+    def search_terms_history(self, request: SearchTermsHistoryRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SearchTermHistory]:
+        """
+        SearchTerms: `POST /api/v1/search-terms/history`.
+        """
+        return self._operation_request(OPERATIONS["search_terms_history"], request, verbose=verbose, output=output)
+
+    def sellers_search(self, request: SellersSearchRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Seller]:
+        """
+        Sellers: `POST /api/v1/sellers/search`.
+        """
+        return self._operation_request(OPERATIONS["sellers_search"], request, verbose=verbose, output=output)
+
+    def sellers_offers(self, request: SellersOffersRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SellerOffer]:
+        """
+        Sellers: `GET /api/v1/sellers/{AmazonSellerId}/offers`.
+        """
+        return self._operation_request(OPERATIONS["sellers_offers"], request, verbose=verbose, output=output)
+
+    def sellers_brands(self, request: SellersBrandsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[BrandCoverage]:
+        """
+        Sellers: `GET /api/v1/sellers/{AmazonSellerId}/brands`.
+        """
+        return self._operation_request(OPERATIONS["sellers_brands"], request, verbose=verbose, output=output)
+
+    def sellers_history(self, request: SellersHistoryRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SellerHistory]:
+        """
+        Sellers: `GET /api/v1/sellers/{AmazonSellerId}/history`.
+        """
+        return self._operation_request(OPERATIONS["sellers_history"], request, verbose=verbose, output=output)
+
+    def subcategories_search(self, request: SubcategoriesSearchRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Subcategory]:
+        """
+        Subcategories: `POST /api/v1/subcategories/search`.
+        """
+        return self._operation_request(OPERATIONS["subcategories_search"], request, verbose=verbose, output=output)
+
+    def subcategories_brands(self, request: SubcategoriesBrandsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SubcategoryBrand]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/brands`.
+        """
+        return self._operation_request(OPERATIONS["subcategories_brands"], request, verbose=verbose, output=output)
+
+    def subcategories_history_sales(self, request: SubcategoriesHistorySalesRequest, verbose: bool = False, output: str = "models") -> PagedResponse[EstimatedUnitSalesHistory]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/history/sales`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["subcategories_history_sales"], request, verbose=verbose, output=output)
+
+    def subcategories_history_sales_by_brands(self, request: SubcategoriesHistorySalesByBrandsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[BrandSalesHistory]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/history/sales-by-brands`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["subcategories_history_sales_by_brands"], request, verbose=verbose, output=output)
+
+    def subcategories_history_top_products_sales(self, request: SubcategoriesHistoryTopProductsSalesRequest, verbose: bool = False, output: str = "models") -> PagedResponse[ProductSalesHistory]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/history/top-products/sales`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["subcategories_history_top_products_sales"], request, verbose=verbose, output=output)
+
+    def subcategories_history_top_products_sales_rank(self, request: SubcategoriesHistoryTopProductsSalesRankRequest, verbose: bool = False, output: str = "models") -> PagedResponse[ProductSalesRankHistory]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/history/top-products/sales-rank`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["subcategories_history_top_products_sales_rank"], request, verbose=verbose, output=output)
+
+    def subcategories_history_scope(self, request: SubcategoriesHistoryScopeRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SubcategoryScope]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/history/scope`.
+        """
+        return self._operation_request(OPERATIONS["subcategories_history_scope"], request, verbose=verbose, output=output)
+
+    def subcategories_history_scope_by_brands(self, request: SubcategoriesHistoryScopeByBrandsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SubcategoryScopeByBrand]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/history/scope/by-brands`.
+        """
+        return self._operation_request(OPERATIONS["subcategories_history_scope_by_brands"], request, verbose=verbose, output=output)
+
+    def subcategories_history_scope_top_products(self, request: SubcategoriesHistoryScopeTopProductsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[TopProductScope]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/history/scope/top-products`.
+        """
+        return self._operation_request(OPERATIONS["subcategories_history_scope_top_products"], request, verbose=verbose, output=output)
+
+    def subcategories_hierarchy(self, request: SubcategoriesHierarchyRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Subcategory]:
+        """
+        Subcategories: `GET /api/v1/subcategories/{SubcategoryId}/hierarchy`.
+        """
+        return self._operation_request(OPERATIONS["subcategories_hierarchy"], request, verbose=verbose, output=output)
+
+    def subcategories_hierarchy_post(self, request: SubcategoriesHierarchyPostRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Subcategory]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/hierarchy`. Deprecated by the API.
+        """
+        return self._operation_request(OPERATIONS["subcategories_hierarchy_post"], request, verbose=verbose, output=output)
+
+class AsyncEndpointsMixin:
+    """
+    One coroutine method per operation in the API spec, generated by `smartscout.codegen`.
+    """
+
+    async def ad_spy_search(self, request: AdSpySearchRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SearchTerm]:
+        """
+        AdSpy: `POST /api/v1/ad-spy/search`.
+        """
+        return await self._operation_request(OPERATIONS["ad_spy_search"], request, verbose=verbose, output=output)
+
+    async def ad_spy_brands(self, request: AdSpyBrandsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SearchTermBrand]:
+        """
+        AdSpy: `GET /api/v1/ad-spy/{SearchTermValue}/brands`.
+        """
+        return await self._operation_request(OPERATIONS["ad_spy_brands"], request, verbose=verbose, output=output)
+
+    async def ad_spy_sponsored_products(self, request: AdSpySponsoredProductsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[BrandSearchTerm]:
+        """
+        AdSpy: `GET /api/v1/ad-spy/sponsored-products`.
+        """
+        return await self._operation_request(OPERATIONS["ad_spy_sponsored_products"], request, verbose=verbose, output=output)
+
+    async def brands_search(self, request: BrandsSearchRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Brand]:
+        """
+        Brands: `POST /api/v1/brands/search`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["brands_search"], request, verbose=verbose, output=output)
+
+    async def brands_market_share(self, request: BrandsMarketShareRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SubcategoryBrand]:
+        """
+        Brands: `GET /api/v1/brands/{BrandName}/market-share`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["brands_market_share"], request, verbose=verbose, output=output)
+
+    async def brands_sellers(self, request: BrandsSellersRequest, verbose: bool = False, output: str = "models") -> PagedResponse[BrandCoverage]:
+        """
+        Brands: `GET /api/v1/brands/{BrandName}/sellers`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["brands_sellers"], request, verbose=verbose, output=output)
+
+    async def brands_ad_spy(self, request: BrandsAdSpyRequest, verbose: bool = False, output: str = "models") -> PagedResponse[BrandSearchTerm]:
+        """
+        Brands: `GET /api/v1/brands/{BrandName}/ad-spy`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["brands_ad_spy"], request, verbose=verbose, output=output)
+
+    async def brands_history_sales(self, request: BrandsHistorySalesRequest, verbose: bool = False, output: str = "models") -> PagedResponse[EstimatedUnitSalesHistory]:
+        """
+        Brands: `POST /api/v1/brands/{BrandName}/history/sales`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["brands_history_sales"], request, verbose=verbose, output=output)
+
+    async def brands_history_sales_by_subcategories(self, request: BrandsHistorySalesBySubcategoriesRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SubcategorySalesHistory]:
+        """
+        Brands: `POST /api/v1/brands/{BrandName}/history/sales-by-subcategories`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["brands_history_sales_by_subcategories"], request, verbose=verbose, output=output)
+
+    async def brands_history_top_products_sales(self, request: BrandsHistoryTopProductsSalesRequest, verbose: bool = False, output: str = "models") -> PagedResponse[ProductSalesHistory]:
+        """
+        Brands: `POST /api/v1/brands/{BrandName}/history/top-products/sales`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["brands_history_top_products_sales"], request, verbose=verbose, output=output)
+
+    async def brands_history_top_products_sales_rank(self, request: BrandsHistoryTopProductsSalesRankRequest, verbose: bool = False, output: str = "models") -> PagedResponse[ProductSalesRankHistory]:
+        """
+        Brands: `POST /api/v1/brands/{BrandName}/history/top-products/sales-rank`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["brands_history_top_products_sales_rank"], request, verbose=verbose, output=output)
+
+    async def brands_search_v2(self, request: BrandsSearchV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[Brand]:
+        """
+        BrandsV2: `POST /api/v2/brands/search`.
+        """
+        return await self._operation_request(OPERATIONS["brands_search_v2"], request, verbose=verbose, output=output)
+
+    async def brands_market_share_v2(self, request: BrandsMarketShareV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[SubcategoryBrand]:
+        """
+        BrandsV2: `GET /api/v2/brands/market-share`.
+        """
+        return await self._operation_request(OPERATIONS["brands_market_share_v2"], request, verbose=verbose, output=output)
+
+    async def brands_sellers_v2(self, request: BrandsSellersV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[BrandCoverage]:
+        """
+        BrandsV2: `GET /api/v2/brands/sellers`.
+        """
+        return await self._operation_request(OPERATIONS["brands_sellers_v2"], request, verbose=verbose, output=output)
+
+    async def brands_ad_spy_v2(self, request: BrandsAdSpyV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[BrandSearchTerm]:
+        """
+        BrandsV2: `GET /api/v2/brands/ad-spy`.
+        """
+        return await self._operation_request(OPERATIONS["brands_ad_spy_v2"], request, verbose=verbose, output=output)
+
+    async def brands_history_sales_v2(self, request: BrandsHistorySalesV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[EstimatedUnitSalesHistory]:
+        """
+        BrandsV2: `POST /api/v2/brands/history/sales`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["brands_history_sales_v2"], request, verbose=verbose, output=output)
+
+    async def brands_history_sales_by_subcategories_v2(self, request: BrandsHistorySalesBySubcategoriesV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[SubcategorySalesHistory]:
+        """
+        BrandsV2: `POST /api/v2/brands/history/sales-by-subcategories`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["brands_history_sales_by_subcategories_v2"], request, verbose=verbose, output=output)
+
+    async def brands_history_top_products_sales_v2(self, request: BrandsHistoryTopProductsSalesV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[ProductSalesHistory]:
+        """
+        BrandsV2: `POST /api/v2/brands/history/top-products/sales`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["brands_history_top_products_sales_v2"], request, verbose=verbose, output=output)
+
+    async def brands_history_top_products_sales_rank_v2(self, request: BrandsHistoryTopProductsSalesRankV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[ProductSalesRankHistory]:
+        """
+        BrandsV2: `POST /api/v2/brands/history/top-products/sales-rank`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["brands_history_top_products_sales_rank_v2"], request, verbose=verbose, output=output)
+
+    async def brands_history_scope_v2(self, request: BrandsHistoryScopeV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[BrandScope]:
+        """
+        BrandsV2: `POST /api/v2/brands/history/scope`.
+        """
+        return await self._operation_request(OPERATIONS["brands_history_scope_v2"], request, verbose=verbose, output=output)
+
+    async def brands_history_scope_by_subcategories_v2(self, request: BrandsHistoryScopeBySubcategoriesV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[BrandScopeBySubcategory]:
+        """
+        BrandsV2: `POST /api/v2/brands/history/scope/by-subcategories`.
+        """
+        return await self._operation_request(OPERATIONS["brands_history_scope_by_subcategories_v2"], request, verbose=verbose, output=output)
+
+    async def brands_history_scope_top_products_v2(self, request: BrandsHistoryScopeTopProductsV2Request, verbose: bool = False, output: str = "models") -> PagedResponse[TopProductScope]:
+        """
+        BrandsV2: `POST /api/v2/brands/history/scope/top-products`.
+        """
+        return await self._operation_request(OPERATIONS["brands_history_scope_top_products_v2"], request, verbose=verbose, output=output)
+
+    async def products_search(self, request: ProductsSearchRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Product]:
+        """
+        Products: `POST /api/v1/products/search`.
+        """
+        return await self._operation_request(OPERATIONS["products_search"], request, verbose=verbose, output=output)
+
+    async def products_history(self, request: ProductsHistoryRequest, verbose: bool = False, output: str = "models") -> PagedResponse[ProductHistory]:
+        """
+        Products: `GET /api/v1/products/{Asin}/history`.
+        """
+        return await self._operation_request(OPERATIONS["products_history"], request, verbose=verbose, output=output)
+
+    async def products_history_scope(self, request: ProductsHistoryScopeRequest, verbose: bool = False, output: str = "models") -> PagedResponse[ScopeHistory]:
+        """
+        Products: `POST /api/v1/products/{Asin}/history/scope`.
+        """
+        return await self._operation_request(OPERATIONS["products_history_scope"], request, verbose=verbose, output=output)
+
+    async def products_offers(self, request: ProductsOffersRequest, verbose: bool = False, output: str = "models") -> PagedResponse[ProductOffer]:
+        """
+        Products: `GET /api/v1/products/{Asin}/offers`.
+        """
+        return await self._operation_request(OPERATIONS["products_offers"], request, verbose=verbose, output=output)
+
+    async def sales_estimate(self, request: SalesEstimateRequest, verbose: bool = False) -> SalesEstimate:
+        """
+        Sales: `GET /api/v1/sales/estimate`.
+        """
+        return await self._operation_request(OPERATIONS["sales_estimate"], request, verbose=verbose)
+
+    async def search_terms_search(self, request: SearchTermsSearchRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SearchTerm]:
+        """
+        SearchTerms: `POST /api/v1/search-terms/search`.
+        """
+        return await self._operation_request(OPERATIONS["search_terms_search"], request, verbose=verbose, output=output)
+
+    async def search_terms_organic_ranks(self, request: SearchTermsOrganicRanksRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SearchTermProductRank]:
+        """
+        SearchTerms: `POST /api/v1/search-terms/organic-ranks`.
+        """
+        return await self._operation_request(OPERATIONS["search_terms_organic_ranks"], request, verbose=verbose, output=output)
+
+    async def search_terms_relevant_products(self, request: SearchTermsRelevantProductsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[RelevantProduct]:
+        """
+        SearchTerms: `POST /api/v1/search-terms/relevant-products/{Asin}`.
+        """
+        return await self._operation_request(OPERATIONS["search_terms_relevant_products"], request, verbose=verbose, output=output)
+
+    async def search_terms_relevant_search_terms(self, request: SearchTermsRelevantSearchTermsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[RelevantSearchTerm]:
+        """
+        SearchTerms: `POST /api/v1/search-terms/relevant-search-terms/{Asin}`.
+        """
+        return await self._operation_request(OPERATIONS["search_terms_relevant_search_terms"], request, verbose=verbose, output=output)
+
+    async def search_terms_history(self, request: SearchTermsHistoryRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SearchTermHistory]:
+        """
+        SearchTerms: `POST /api/v1/search-terms/history`.
+        """
+        return await self._operation_request(OPERATIONS["search_terms_history"], request, verbose=verbose, output=output)
+
+    async def sellers_search(self, request: SellersSearchRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Seller]:
+        """
+        Sellers: `POST /api/v1/sellers/search`.
+        """
+        return await self._operation_request(OPERATIONS["sellers_search"], request, verbose=verbose, output=output)
+
+    async def sellers_offers(self, request: SellersOffersRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SellerOffer]:
+        """
+        Sellers: `GET /api/v1/sellers/{AmazonSellerId}/offers`.
+        """
+        return await self._operation_request(OPERATIONS["sellers_offers"], request, verbose=verbose, output=output)
+
+    async def sellers_brands(self, request: SellersBrandsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[BrandCoverage]:
+        """
+        Sellers: `GET /api/v1/sellers/{AmazonSellerId}/brands`.
+        """
+        return await self._operation_request(OPERATIONS["sellers_brands"], request, verbose=verbose, output=output)
+
+    async def sellers_history(self, request: SellersHistoryRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SellerHistory]:
+        """
+        Sellers: `GET /api/v1/sellers/{AmazonSellerId}/history`.
+        """
+        return await self._operation_request(OPERATIONS["sellers_history"], request, verbose=verbose, output=output)
+
+    async def subcategories_search(self, request: SubcategoriesSearchRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Subcategory]:
+        """
+        Subcategories: `POST /api/v1/subcategories/search`.
+        """
+        return await self._operation_request(OPERATIONS["subcategories_search"], request, verbose=verbose, output=output)
+
+    async def subcategories_brands(self, request: SubcategoriesBrandsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SubcategoryBrand]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/brands`.
+        """
+        return await self._operation_request(OPERATIONS["subcategories_brands"], request, verbose=verbose, output=output)
+
+    async def subcategories_history_sales(self, request: SubcategoriesHistorySalesRequest, verbose: bool = False, output: str = "models") -> PagedResponse[EstimatedUnitSalesHistory]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/history/sales`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["subcategories_history_sales"], request, verbose=verbose, output=output)
+
+    async def subcategories_history_sales_by_brands(self, request: SubcategoriesHistorySalesByBrandsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[BrandSalesHistory]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/history/sales-by-brands`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["subcategories_history_sales_by_brands"], request, verbose=verbose, output=output)
+
+    async def subcategories_history_top_products_sales(self, request: SubcategoriesHistoryTopProductsSalesRequest, verbose: bool = False, output: str = "models") -> PagedResponse[ProductSalesHistory]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/history/top-products/sales`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["subcategories_history_top_products_sales"], request, verbose=verbose, output=output)
+
+    async def subcategories_history_top_products_sales_rank(self, request: SubcategoriesHistoryTopProductsSalesRankRequest, verbose: bool = False, output: str = "models") -> PagedResponse[ProductSalesRankHistory]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/history/top-products/sales-rank`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["subcategories_history_top_products_sales_rank"], request, verbose=verbose, output=output)
+
+    async def subcategories_history_scope(self, request: SubcategoriesHistoryScopeRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SubcategoryScope]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/history/scope`.
+        """
+        return await self._operation_request(OPERATIONS["subcategories_history_scope"], request, verbose=verbose, output=output)
+
+    async def subcategories_history_scope_by_brands(self, request: SubcategoriesHistoryScopeByBrandsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[SubcategoryScopeByBrand]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/history/scope/by-brands`.
+        """
+        return await self._operation_request(OPERATIONS["subcategories_history_scope_by_brands"], request, verbose=verbose, output=output)
+
+    async def subcategories_history_scope_top_products(self, request: SubcategoriesHistoryScopeTopProductsRequest, verbose: bool = False, output: str = "models") -> PagedResponse[TopProductScope]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/history/scope/top-products`.
+        """
+        return await self._operation_request(OPERATIONS["subcategories_history_scope_top_products"], request, verbose=verbose, output=output)
+
+    async def subcategories_hierarchy(self, request: SubcategoriesHierarchyRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Subcategory]:
+        """
+        Subcategories: `GET /api/v1/subcategories/{SubcategoryId}/hierarchy`.
+        """
+        return await self._operation_request(OPERATIONS["subcategories_hierarchy"], request, verbose=verbose, output=output)
+
+    async def subcategories_hierarchy_post(self, request: SubcategoriesHierarchyPostRequest, verbose: bool = False, output: str = "models") -> PagedResponse[Subcategory]:
+        """
+        Subcategories: `POST /api/v1/subcategories/{SubcategoryId}/hierarchy`. Deprecated by the API.
+        """
+        return await self._operation_request(OPERATIONS["subcategories_hierarchy_post"], request, verbose=verbose, output=output)
@@ -20,7 +20,8 @@ class AuthenticationError(SmartScoutException):
 
 class RateLimitError(SmartScoutException):
     """Exception raised when API rate limit is exceeded."""
-    def __init__(self, message: str = "Rate limit exceeded"):
+    def __init__(self, message: str = "Rate limit exceeded", retry_after: float = None):
+        self.retry_after = retry_after
         super().__init__(f"Rate Limit Error: {message}")
 
 class ValidationError(SmartScoutException):
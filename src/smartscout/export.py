@@ -0,0 +1,268 @@
+# src/smartscout/export.py
+
+import csv
+import io
+import json
+import os
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Union
+
+from .models.base import BaseRequest, PageOptions
+from .columnar import _import
+from .cache import cache_key
+from .serialization import to_wire
+from .exceptions import InvalidRequestError
+
+EXPORT_FORMATS = ("jsonl", "csv", "parquet")
+
+class ExportResult(NamedTuple):
+    """
+    Summary of an export run. `pages` and `rows` include those written by earlier, resumed runs.
+    """
+    path: str
+    format: str
+    pages: int
+    rows: int
+    completed: bool
+
+class Checkpoint:
+    """
+    Progress of an export, persisted as a small JSON file next to the output.
+
+    `position` is where the sink's durable output ends: a byte offset for JSONL/CSV files and
+    the number of part files for Parquet. It is only advanced after the corresponding rows have
+    been flushed to disk, together with the cursor of the next page to fetch, so a resumed run
+    discards any partial write and continues from exactly the next unwritten page.
+    """
+
+    def __init__(self, path: str, fingerprint: str):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.next_page_id: Optional[str] = None
+        self.position = 0
+        self.pages = 0
+        self.rows = 0
+        self.completed = False
+
+    @classmethod
+    def load(cls, path: str, fingerprint: str) -> "Checkpoint":
+        checkpoint = cls(path, fingerprint)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("fingerprint") != fingerprint:
+                raise InvalidRequestError(
+                    f"Checkpoint {path} belongs to a different export; delete it or pass resume=False to start over"
+                )
+            checkpoint.next_page_id = state.get("next_page_id")
+            checkpoint.position = state.get("position", 0)
+            checkpoint.pages = state.get("pages", 0)
+            checkpoint.rows = state.get("rows", 0)
+            checkpoint.completed = state.get("completed", False)
+        return checkpoint
+
+    def save(self) -> None:
+        state = {
+            "fingerprint": self.fingerprint,
+            "next_page_id": self.next_page_id,
+            "position": self.position,
+            "pages": self.pages,
+            "rows": self.rows,
+            "completed": self.completed,
+        }
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+class _FileSink:
+    """
+    Base for sinks that append to a single file. Resuming truncates the file to the last
+    checkpointed byte offset, dropping rows that were written but never checkpointed.
+    """
+
+    output = "records"
+
+    def __init__(self, path: str, position: int):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "r+b" if os.path.exists(path) else "w+b")
+        self._file.truncate(position)
+        self._file.seek(position)
+        self._buffer: List[Dict[str, Any]] = []
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        self._buffer.extend(rows)
+
+    def flush(self) -> int:
+        if self._buffer:
+            self._file.write(self._encode(self._buffer))
+            self._buffer = []
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _encode(self, rows: List[Dict[str, Any]]) -> bytes:
+        raise NotImplementedError
+
+class JSONLSink(_FileSink):
+    """One JSON object per line, keyed by model field name."""
+
+    def _encode(self, rows: List[Dict[str, Any]]) -> bytes:
+        return "".join(json.dumps(row, separators=(",", ":")) + "\n" for row in rows).encode("utf-8")
+
+class CSVSink(_FileSink):
+    """CSV with a header row. Nested objects and lists are written as JSON strings."""
+
+    def _encode(self, rows: List[Dict[str, Any]]) -> bytes:
+        out = io.StringIO()
+        writer = csv.writer(out)
+        if self._file.tell() == 0:
+            writer.writerow(list(rows[0]))
+        for row in rows:
+            writer.writerow([json.dumps(value) if isinstance(value, (dict, list)) else value for value in row.values()])
+        return out.getvalue().encode("utf-8")
+
+class ParquetSink:
+    """
+    A directory of `part-NNNNN.parquet` files.
+
+    Pages are buffered as Arrow tables and written out as one part file per flush, in row groups
+    of at most `row_group_size` rows. Parts are written to a temporary name and renamed into
+    place, so a part either exists completely or not at all.
+    """
+
+    output = "arrow"
+
+    def __init__(self, path: str, position: int, row_group_size: int = 50_000):
+        self._pa = _import("pyarrow", "arrow")
+        import pyarrow.parquet
+        self._pq = pyarrow.parquet
+        self.path = path
+        self.row_group_size = row_group_size
+        os.makedirs(path, exist_ok=True)
+        for name in os.listdir(path):
+            # Drop parts (and temporary files) written after the last checkpoint.
+            if name.startswith("part-") and not (name.endswith(".parquet") and int(name[5:10]) < position):
+                os.remove(os.path.join(path, name))
+        self._parts = position
+        self._buffer: List[Any] = []
+
+    def write(self, table: Any) -> None:
+        self._buffer.append(table)
+
+    def flush(self) -> int:
+        if self._buffer:
+            try:
+                table = self._pa.concat_tables(self._buffer, promote_options="default")
+            except TypeError:  # pyarrow < 14
+                table = self._pa.concat_tables(self._buffer, promote=True)
+            final = os.path.join(self.path, f"part-{self._parts:05d}.parquet")
+            tmp = f"{final}.tmp"
+            self._pq.write_table(table, tmp, row_group_size=self.row_group_size)
+            os.replace(tmp, final)
+            self._parts += 1
+            self._buffer = []
+        return self._parts
+
+    def close(self) -> None:
+        self._buffer = []
+
+def open_sink(format: str, path: str, position: int = 0, row_group_size: int = 50_000):
+    """
+    Open a sink for `format`, discarding anything written beyond `position`.
+    """
+    if format == "jsonl":
+        return JSONLSink(path, position)
+    if format == "csv":
+        return CSVSink(path, position)
+    if format == "parquet":
+        return ParquetSink(path, position, row_group_size=row_group_size)
+    raise InvalidRequestError(f"Unknown export format {format!r}; expected one of {', '.join(EXPORT_FORMATS)}")
+
+def infer_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lstrip(".").lower()
+    if extension in ("jsonl", "ndjson"):
+        return "jsonl"
+    if extension in ("csv", "parquet"):
+        return extension
+    raise InvalidRequestError(f"Cannot infer export format from {path!r}; pass format= one of {', '.join(EXPORT_FORMATS)}")
+
+def export(
+    client: Any,
+    method: Union[str, Callable[..., Any]],
+    request: BaseRequest,
+    path: str,
+    format: Optional[str] = None,
+    page_size: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    flush_rows: int = 50_000,
+    checkpoint_path: Optional[str] = None,
+    resume: bool = True,
+    prefetch: int = 2,
+    verbose: bool = False,
+) -> ExportResult:
+    """
+    Page through a paged endpoint and write every row to a JSONL, CSV or Parquet sink.
+
+    Args:
+        client: A `SmartScoutAPIClient`.
+        method: A paged client method such as `client.search_products`, or its name.
+        request: The search request. It is not modified.
+        path: Output file (JSONL/CSV) or directory of part files (Parquet).
+        format: "jsonl", "csv" or "parquet"; inferred from the extension of `path` if omitted.
+        page_size: Page size to request.
+        max_pages: Stop after this many pages (including pages written by earlier runs).
+        flush_rows: Rows buffered before they are flushed to disk and the checkpoint advances.
+            For Parquet this is also the row group size.
+        checkpoint_path: Where progress is recorded. Defaults to `<path>.checkpoint.json`.
+        resume: Continue from an existing checkpoint (default). With False, start over.
+        prefetch: Number of pages fetched ahead of the writer on a background thread; 0 fetches
+            each page only after the previous one is written.
+
+    Returns:
+        An `ExportResult`. `completed` is False if the run stopped at `max_pages` before the end.
+    """
+    if isinstance(method, str):
+        method = getattr(client, method)
+    format = format or infer_format(path)
+    checkpoint_path = checkpoint_path or f"{path.rstrip(os.sep)}.checkpoint.json"
+    fingerprint = cache_key(format, method.__name__, to_wire(request))
+    if resume:
+        checkpoint = Checkpoint.load(checkpoint_path, fingerprint)
+    else:
+        checkpoint = Checkpoint(checkpoint_path, fingerprint)
+    if checkpoint.completed or (max_pages is not None and checkpoint.pages >= max_pages):
+        return ExportResult(path, format, checkpoint.pages, checkpoint.rows, checkpoint.completed)
+
+    request = request.copy(deep=True)
+    if request.page is None:
+        request.page = PageOptions()
+    request.page.id = checkpoint.next_page_id
+
+    sink = open_sink(format, path, checkpoint.position, row_group_size=flush_rows)
+    remaining = None if max_pages is None else max_pages - checkpoint.pages
+    pages = client.iter_pages(method, request, page_size=page_size, max_pages=remaining, verbose=verbose, output=sink.output, prefetch=prefetch)
+    pending_rows = 0
+    try:
+        for page in pages:
+            sink.write(page.data)
+            pending_rows += len(page.data)
+            checkpoint.pages += 1
+            checkpoint.next_page_id = page.paging.next_page_id
+            checkpoint.completed = not page.paging.has_more_records or not page.paging.next_page_id
+            if pending_rows >= flush_rows or checkpoint.completed:
+                checkpoint.position = sink.flush()
+                checkpoint.rows += pending_rows
+                pending_rows = 0
+                checkpoint.save()
+        checkpoint.position = sink.flush()
+        checkpoint.rows += pending_rows
+        checkpoint.save()
+    finally:
+        sink.close()
+    return ExportResult(path, format, checkpoint.pages, checkpoint.rows, checkpoint.completed)
@@ -0,0 +1,483 @@
+# src/smartscout/history.py
+
+import json
+import os
+import sqlite3
+import threading
+import time as _time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from pydantic.datetime_parse import parse_date, parse_datetime
+
+from .models.base import BaseHistoryRequest, DateRangeFilter
+from .bulk import BatchResult, run_batch
+
+class HistoryStore:
+    """
+    Local time-series store for history endpoints, kept in a single SQLite file.
+
+    Rows are stored as JSON keyed by `(dataset, entity, day, key)`: `dataset` is the client
+    method, `entity` identifies one series (e.g. a brand or search term), `day` is the row's
+    date and `key` tells apart several rows of the same series on the same day. Writing a row
+    that already exists replaces it, so re-fetched days are merged in place.
+
+    Separately, the store records the range of days that has been completely fetched for each
+    series (`coverage`), which `HistorySync` extends once a sync has finished.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS history ("
+            " dataset TEXT NOT NULL,"
+            " entity TEXT NOT NULL,"
+            " day TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " row TEXT NOT NULL,"
+            " PRIMARY KEY (dataset, entity, day, key))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS coverage ("
+            " dataset TEXT NOT NULL,"
+            " entity TEXT NOT NULL,"
+            " first_day TEXT,"
+            " last_day TEXT NOT NULL,"
+            " PRIMARY KEY (dataset, entity))"
+        )
+
+    def latest_date(self, dataset: str, entity: str) -> Optional[date]:
+        """
+        The most recent day stored for a series, or None if nothing is stored yet.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(day) FROM history WHERE dataset = ? AND entity = ?", (dataset, entity)
+            ).fetchone()
+        return date.fromisoformat(row[0]) if row[0] is not None else None
+
+    def coverage(self, dataset: str, entity: str) -> Optional[Tuple[Optional[date], date]]:
+        """
+        The `(first, last)` days fully fetched for a series, or None if no sync has completed.
+
+        `first` is None when the series was fetched from its very beginning.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT first_day, last_day FROM coverage WHERE dataset = ? AND entity = ?", (dataset, entity)
+            ).fetchone()
+        if row is None:
+            return None
+        return (date.fromisoformat(row[0]) if row[0] is not None else None), date.fromisoformat(row[1])
+
+    def extend_coverage(self, dataset: str, entity: str, first: Optional[date], last: date) -> Tuple[Optional[date], date]:
+        """
+        Merge `[first, last]` into the covered range of a series and return the new range.
+
+        The caller must have fetched everything between the two ranges, so the result stays one
+        contiguous span. A `first` of None means "from the beginning".
+        """
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                row = self._conn.execute(
+                    "SELECT first_day, last_day FROM coverage WHERE dataset = ? AND entity = ?", (dataset, entity)
+                ).fetchone()
+                if row is not None:
+                    known_first = date.fromisoformat(row[0]) if row[0] is not None else None
+                    first = None if first is None or known_first is None else min(first, known_first)
+                    last = max(last, date.fromisoformat(row[1]))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO coverage (dataset, entity, first_day, last_day) VALUES (?, ?, ?, ?)",
+                    (dataset, entity, first.isoformat() if first is not None else None, last.isoformat()),
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return first, last
+
+    def upsert(self, dataset: str, entity: str, rows: Iterable[Dict[str, Any]], date_field: str = "date", key_fields: Sequence[str] = ()) -> int:
+        """
+        Insert or replace rows of one series in a single transaction. Returns the number of rows written.
+        """
+        entries = [
+            (dataset, entity, _day(row[date_field]).isoformat(), _row_key(row, key_fields), json.dumps(row, separators=(",", ":"), default=str))
+            for row in rows
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO history (dataset, entity, day, key, row) VALUES (?, ?, ?, ?, ?)", entries
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return len(entries)
+
+    def read(self, dataset: str, entity: str, start: Optional[date] = None, end: Optional[date] = None) -> List[Dict[str, Any]]:
+        """
+        Rows of one series in date order, optionally limited to `start <= day <= end`.
+        """
+        query = "SELECT row FROM history WHERE dataset = ? AND entity = ?"
+        args: List[Any] = [dataset, entity]
+        if start is not None:
+            query += " AND day >= ?"
+            args.append(start.isoformat())
+        if end is not None:
+            query += " AND day <= ?"
+            args.append(end.isoformat())
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY day, key", args).fetchall()
+        return [json.loads(row) for row, in rows]
+
+    def entities(self, dataset: str) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT entity FROM history WHERE dataset = ? ORDER BY entity", (dataset,)).fetchall()
+        return [entity for entity, in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+class SyncResult(NamedTuple):
+    """
+    What one sync fetched: `windows` are the date ranges requested, oldest first, and `start` and
+    `end` bound them. `windows` is empty (and `start` None) when the series was already up to date.
+    """
+    dataset: str
+    entity: str
+    start: Optional[datetime]
+    end: datetime
+    rows: int
+    windows: Tuple[DateRangeFilter, ...] = ()
+
+class HistorySync:
+    """
+    Keeps a `HistoryStore` up to date by fetching only the days it does not have yet.
+
+    For each series the store's covered range is looked up, and only the parts of the request's
+    `date_range` outside it are fetched: the days before the first covered day, if the request
+    starts earlier, and the days from the last covered day (fetched again, as the newest day may
+    have been incomplete) to the requested end date, or now. A window reaches the covered range
+    even when the request does not, so the covered range stays one contiguous span. It is only
+    extended after every window has been fetched, so a sync that fails partway is simply
+    repeated next time.
+
+    Example:
+        ```python
+        sync = HistorySync(client, HistoryStore("history.db"))
+        request = GetSearchTermHistoryRequest(marketplace="US", searchTerm="yoga mat",
+                                              date_range={"start_date": "2020-01-01T00:00:00"})
+        sync.sync(client.get_search_term_history, request)       # first run: full history
+        sync.sync(client.get_search_term_history, request)       # later runs: newest days only
+        rows = sync.store.read("get_search_term_history", sync.entity_for(request))
+        ```
+    """
+
+    def __init__(self, client: Any, store: HistoryStore, date_field: str = "date", page_size: Optional[int] = None):
+        self.client = client
+        self.store = store
+        self.date_field = date_field
+        self.page_size = page_size
+
+    @staticmethod
+    def entity_for(request: BaseHistoryRequest) -> str:
+        """
+        Default series id: the request's filters, without the date range, paging and sort.
+        """
+        scope = request.dict(exclude={"date_range", "page", "sort"}, exclude_none=True)
+        return json.dumps(scope, sort_keys=True, separators=(",", ":"), default=str)
+
+    def missing_windows(self, dataset: str, entity: str, request: BaseHistoryRequest) -> List[DateRangeFilter]:
+        """
+        The date ranges of `request.date_range` the store does not cover, oldest first; empty if
+        there is nothing to fetch.
+        """
+        requested = request.date_range
+        end = requested.end_date or datetime.now(timezone.utc)
+        start = requested.start_date
+        covered = self.store.coverage(dataset, entity)
+        if covered is None:
+            if start is not None and _aware_like(start, end) > end:
+                return []
+            return [DateRangeFilter(start_date=start, end_date=end)]
+        first, last = covered
+        windows = []
+        if first is not None and (start is None or _aware_like(start, end).date() < first):
+            windows.append(DateRangeFilter(start_date=start, end_date=datetime.combine(first, time.min, tzinfo=end.tzinfo)))
+        resume = datetime.combine(last, time.min, tzinfo=end.tzinfo)
+        if end >= resume:
+            windows.append(DateRangeFilter(start_date=resume, end_date=end))
+        return windows
+
+    def sync(
+        self,
+        method: Union[str, Callable[..., Any]],
+        request: BaseHistoryRequest,
+        entity: Optional[str] = None,
+        key_fields: Sequence[str] = (),
+        verbose: bool = False,
+    ) -> SyncResult:
+        """
+        Fetch and store the days of one series that are missing locally.
+
+        Args:
+            method: A history method such as `client.get_brand_sales_history`, or its name.
+            request: The history request; its `date_range` bounds what is kept in sync.
+            entity: Series id. Defaults to `entity_for(request)`.
+            key_fields: Row fields that distinguish rows sharing a date (e.g. `("brand",)`).
+        """
+        if isinstance(method, str):
+            method = getattr(self.client, method)
+        dataset = method.__name__
+        entity = entity or self.entity_for(request)
+        windows = self.missing_windows(dataset, entity, request)
+        if not windows:
+            return SyncResult(dataset, entity, None, request.date_range.end_date, 0)
+
+        written = 0
+        for window in windows:
+            window_request = request.copy(deep=True)
+            window_request.date_range = window
+            for page in self.client.iter_pages(method, window_request, page_size=self.page_size, verbose=verbose, output="records"):
+                written += self.store.upsert(dataset, entity, page.data, date_field=self.date_field, key_fields=key_fields)
+        # Only now is the whole requested range, and any gap to the old coverage, in the store.
+        start, end = request.date_range.start_date, windows[-1].end_date
+        first = _aware_like(start, end).date() if start is not None else None
+        self.store.extend_coverage(dataset, entity, first, end.date())
+        return SyncResult(dataset, entity, windows[0].start_date, end, written, tuple(windows))
+
+    def sync_many(
+        self,
+        method: Union[str, Callable[..., Any]],
+        requests: Iterable[BaseHistoryRequest],
+        key_fields: Sequence[str] = (),
+        max_workers: int = 8,
+        verbose: bool = False,
+    ) -> Iterator[BatchResult]:
+        """
+        Sync many series concurrently, yielding a `BatchResult` whose `response` is a `SyncResult`.
+        """
+        if isinstance(method, str):
+            method = getattr(self.client, method)
+        return run_batch(
+            lambda request: self.sync(method, request, key_fields=key_fields, verbose=verbose),
+            requests,
+            max_workers=max_workers,
+        )
+
+def plan_date_chunks(start: datetime, end: datetime, unit: Union[str, timedelta] = "month") -> List[DateRangeFilter]:
+    """
+    Split `[start, end]` into consecutive date ranges.
+
+    `unit` is `"month"` or `"quarter"` (chunks aligned to calendar boundaries) or a `timedelta`.
+    Neighbouring chunks share their boundary instant, so rows dated exactly on a boundary are
+    returned by both; `fetch_history` removes those duplicates.
+    """
+    if unit not in ("month", "quarter") and not isinstance(unit, timedelta):
+        raise ValueError(f"unit must be 'month', 'quarter' or a timedelta, not {unit!r}")
+    chunks = []
+    chunk_start = start
+    while chunk_start < end:
+        if isinstance(unit, timedelta):
+            boundary = chunk_start + unit
+        else:
+            boundary = _next_period(chunk_start, 3 if unit == "quarter" else 1)
+        chunk_end = min(boundary, end)
+        chunks.append(DateRangeFilter(start_date=chunk_start, end_date=chunk_end))
+        chunk_start = chunk_end
+    return chunks or [DateRangeFilter(start_date=start, end_date=end)]
+
+def _next_period(value: datetime, months: int) -> datetime:
+    # First instant of the next calendar month (or quarter) after `value`.
+    month0 = value.month - 1
+    if months == 3:
+        month0 -= month0 % 3
+    month0 += months
+    return value.replace(year=value.year + month0 // 12, month=month0 % 12 + 1, day=1, hour=0, minute=0, second=0, microsecond=0)
+
+class AdaptiveChunker:
+    """
+    Hands out consecutive date ranges whose length follows the observed fetch speed.
+
+    Starts with `initial` spans and, after each completed chunk, re-estimates seconds-per-day
+    (exponentially weighted) to size the next chunks so each takes about `target_seconds`,
+    bounded by `min_span` and `max_span`. Not thread-safe; call from the scheduling thread.
+    """
+
+    def __init__(
+        self,
+        start: datetime,
+        end: datetime,
+        initial: timedelta = timedelta(days=31),
+        target_seconds: float = 5.0,
+        min_span: timedelta = timedelta(days=7),
+        max_span: timedelta = timedelta(days=366),
+        smoothing: float = 0.5,
+    ):
+        self.position = start
+        self.end = end
+        self.span = initial
+        self.target_seconds = target_seconds
+        self.min_span = min_span
+        self.max_span = max_span
+        self.smoothing = smoothing
+        self._seconds_per_day: Optional[float] = None
+
+    def next_chunk(self) -> Optional[DateRangeFilter]:
+        if self.position >= self.end:
+            return None
+        chunk_end = min(self.position + self.span, self.end)
+        chunk = DateRangeFilter(start_date=self.position, end_date=chunk_end)
+        self.position = chunk_end
+        return chunk
+
+    def record(self, chunk: DateRangeFilter, seconds: float) -> None:
+        days = max((chunk.end_date - chunk.start_date).total_seconds() / 86400, 1.0)
+        observed = seconds / days
+        if self._seconds_per_day is None:
+            self._seconds_per_day = observed
+        else:
+            self._seconds_per_day += self.smoothing * (observed - self._seconds_per_day)
+        if self._seconds_per_day > 0:
+            span = timedelta(days=self.target_seconds / self._seconds_per_day)
+            self.span = max(self.min_span, min(self.max_span, span))
+        else:
+            self.span = self.max_span
+
+def fetch_history(
+    client: Any,
+    method: Union[str, Callable[..., Any]],
+    request: BaseHistoryRequest,
+    chunk: Union[str, timedelta, None] = None,
+    max_workers: int = 4,
+    key_fields: Optional[Sequence[str]] = None,
+    date_field: str = "date",
+    target_seconds: float = 5.0,
+    page_size: Optional[int] = None,
+    output: str = "models",
+    verbose: bool = False,
+) -> List[Any]:
+    """
+    Fetch a long history window as several date-range chunks fetched concurrently.
+
+    Args:
+        method: A history method such as `client.get_search_term_history`, or its name.
+        request: The history request. Its `date_range.start_date` is required; a missing
+            `end_date` means now.
+        chunk: `"month"`, `"quarter"` or a `timedelta` for fixed chunks. By default chunks start
+            at a month and adapt to how long earlier chunks took (see `AdaptiveChunker`).
+        max_workers: Number of chunks fetched at once.
+        key_fields: Fields identifying a row within a day (e.g. `("brand",)`); rows with the same
+            date and key are kept once. By default only exact duplicate rows are dropped.
+        output: `"models"` (default) or `"records"`.
+
+    Returns:
+        All rows across all pages of all chunks, in date order, without boundary duplicates.
+    """
+    if isinstance(method, str):
+        method = getattr(client, method)
+    requested = request.date_range
+    if requested.start_date is None:
+        raise ValueError("fetch_history needs a date_range.start_date to split")
+    end = requested.end_date or datetime.now(requested.start_date.tzinfo)
+    if chunk is None:
+        chunker = AdaptiveChunker(requested.start_date, end, target_seconds=target_seconds)
+        next_chunk = chunker.next_chunk
+    else:
+        planned = iter(plan_date_chunks(requested.start_date, end, chunk))
+        chunker = None
+        next_chunk = lambda: next(planned, None)
+
+    def fetch(window: DateRangeFilter) -> Tuple[List[Any], float]:
+        started = _time.monotonic()
+        chunk_request = request.copy(deep=True)
+        chunk_request.date_range = window
+        rows: List[Any] = []
+        for page in client.iter_pages(method, chunk_request, page_size=page_size, verbose=verbose, output=output):
+            rows.extend(page.data or [])
+        return rows, _time.monotonic() - started
+
+    results: List[Tuple[datetime, List[Any]]] = []
+    pending: Dict[Any, DateRangeFilter] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            while True:
+                while len(pending) < max_workers:
+                    window = next_chunk()
+                    if window is None:
+                        break
+                    pending[executor.submit(fetch, window)] = window
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    window = pending.pop(future)
+                    rows, seconds = future.result()
+                    if chunker is not None:
+                        chunker.record(window, seconds)
+                    results.append((window.start_date, rows))
+        finally:
+            for future in pending:
+                future.cancel()
+
+    results.sort(key=lambda result: result[0])
+    return _dedupe(
+        (row for _, rows in results for row in rows),
+        date_field,
+        key_fields,
+    )
+
+def _field(row: Any, name: str) -> Any:
+    return row.get(name) if isinstance(row, dict) else getattr(row, name)
+
+def _dedupe(rows: Iterable[Any], date_field: str, key_fields: Optional[Sequence[str]]) -> List[Any]:
+    seen = set()
+    unique = []
+    for row in rows:
+        if key_fields is not None:
+            key = (str(_field(row, date_field)),) + tuple(str(_field(row, field)) for field in key_fields)
+        elif isinstance(row, dict):
+            key = json.dumps(row, sort_keys=True, default=str)
+        else:
+            key = row.json(sort_keys=True)
+        if key not in seen:
+            seen.add(key)
+            unique.append(row)
+    # Stable sort: rows of the same instant keep the API's order.
+    unique.sort(key=lambda row: _moment(_field(row, date_field)))
+    return unique
+
+def _moment(value: Any) -> datetime:
+    moment = value if isinstance(value, datetime) else parse_datetime(value)
+    # Order naive and aware values together by treating naive ones as UTC.
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=timezone.utc)
+
+def _day(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str) and len(value) == 10:
+        return parse_date(value)
+    return parse_datetime(value).date()
+
+def _row_key(row: Dict[str, Any], key_fields: Sequence[str]) -> str:
+    return "\x1f".join(str(row.get(field)) for field in key_fields)
+
+def _aware_like(value: datetime, reference: datetime) -> datetime:
+    # Compare naive and aware datetimes by treating naive ones as being in the reference's zone.
+    if (value.tzinfo is None) == (reference.tzinfo is None):
+        return value
+    if value.tzinfo is None:
+        return value.replace(tzinfo=reference.tzinfo)
+    return value.replace(tzinfo=None)
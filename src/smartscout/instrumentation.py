@@ -0,0 +1,281 @@
+# src/smartscout/instrumentation.py
+
+import json
+import shlex
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+class RequestEvent(NamedTuple):
+    """
+    What happened during one client call, passed to every registered hook.
+
+    Timings are in seconds. `connect` covers DNS resolution, the TCP handshake and TLS for
+    connections opened during the call (0.0 when a pooled connection was reused, None when the
+    transport cannot measure it). `ttfb` is the time from sending the last attempt to receiving
+    its response headers; `parse` is JSON decoding plus model construction. `retries` counts
+    attempts after the first. `cache` is "hit", "miss", "bypass" or None without a cache, and
+    `coalesced` is True when the result was shared from an identical in-flight call.
+    `response_bytes` counts bytes read off the wire (compressed, if the response was).
+
+    With `output="stream"` the event is emitted as soon as the response headers arrive, so
+    `rows`, `parse` and `response_bytes` are None.
+    """
+    method: str
+    endpoint: str
+    marketplace: Optional[str]
+    status: Optional[int]
+    started_at: float
+    total: float
+    connect: Optional[float] = None
+    ttfb: Optional[float] = None
+    parse: Optional[float] = None
+    retries: int = 0
+    request_bytes: Optional[int] = None
+    response_bytes: Optional[int] = None
+    rows: Optional[int] = None
+    cache: Optional[str] = None
+    coalesced: bool = False
+    error: Optional[str] = None
+
+RequestHook = Callable[[RequestEvent], None]
+
+class Trace:
+    """
+    Mutable collector for one call; the client fills it in as the request progresses.
+    """
+
+    def __init__(self, method: str, endpoint: str, marketplace: Optional[str]):
+        self.method = method
+        self.endpoint = endpoint
+        self.marketplace = marketplace
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.status: Optional[int] = None
+        self.ttfb: Optional[float] = None
+        self.parse = 0.0
+        self.retries = 0
+        self.request_bytes: Optional[int] = None
+        self.response_bytes: Optional[int] = None
+        self.rows: Optional[int] = None
+        self.cache: Optional[str] = None
+        self.coalesced = False
+        self.error: Optional[str] = None
+        self._connect_before = _connect_timer.total()
+        self._sends_before = _connect_timer.sends
+
+    def event(self) -> RequestEvent:
+        connect = _connect_timer.total() - self._connect_before if _connect_timer.sends != self._sends_before else None
+        return RequestEvent(
+            method=self.method,
+            endpoint=self.endpoint,
+            marketplace=self.marketplace,
+            status=self.status,
+            started_at=self.started_at,
+            total=time.perf_counter() - self._start,
+            connect=connect,
+            ttfb=self.ttfb,
+            parse=self.parse if self.rows is not None or self.parse else None,
+            retries=self.retries,
+            request_bytes=self.request_bytes,
+            response_bytes=self.response_bytes,
+            rows=self.rows,
+            cache=self.cache,
+            coalesced=self.coalesced,
+            error=self.error,
+        )
+
+def redacted_curl(method: str, url: str, headers: Mapping[str, str], data: Any = None, params: Optional[Mapping[str, Any]] = None) -> str:
+    """
+    Render a request as a curl command for debugging, with credentials masked.
+    """
+    command = f"curl -X {method.upper()} '{url}'"
+    for header, value in headers.items():
+        if header.lower() == "authorization":
+            scheme, space, _ = str(value).partition(" ")
+            value = f"{scheme} ***" if space else "***"
+        command += f" -H '{header}: {value}'"
+    if data:
+        command += f" -d '{json.dumps(data, default=str)}'"
+    if params:
+        command += f" -G {' '.join(f'-d {k}={shlex.quote(str(v))}' for k, v in params.items())}"
+    return command
+
+class _ConnectTimer(threading.local):
+    """
+    Per-thread running total of time spent opening connections, DNS resolution included, and
+    the number of requests sent through a `TimingAdapter`.
+    """
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.sends = 0
+        self.enabled = False
+
+    def total(self) -> float:
+        return self.seconds
+
+_connect_timer = _ConnectTimer()
+
+class _TimedConnectionMixin:
+    def connect(self) -> None:
+        if not _connect_timer.enabled:
+            return super().connect()
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_timer.seconds += time.perf_counter() - start
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+class TimingAdapter(HTTPAdapter):
+    """
+    `HTTPAdapter` whose connections record how long they took to open, for `RequestEvent.connect`.
+
+    Name resolution happens inside urllib3's connect, so it is part of the measured time.
+    """
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": _TimedHTTPConnectionPool, "https": _TimedHTTPSConnectionPool}
+
+    def send(self, request, **kwargs):
+        enabled, _connect_timer.enabled = _connect_timer.enabled, True
+        _connect_timer.sends += 1
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            _connect_timer.enabled = enabled
+
+class RequestStats:
+    """
+    Hook that tallies requests, rows, bytes and time per endpoint, e.g. to report a job's quota use.
+
+    Cache hits and coalesced calls are counted separately, as they do not use API quota.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints: Dict[str, Dict[str, float]] = {}
+
+    def __call__(self, event: RequestEvent) -> None:
+        with self._lock:
+            stats = self.endpoints.setdefault(event.endpoint, {
+                "calls": 0, "api_requests": 0, "cache_hits": 0, "coalesced": 0, "errors": 0,
+                "retries": 0, "rows": 0, "response_bytes": 0, "seconds": 0.0,
+            })
+            stats["calls"] += 1
+            if event.cache == "hit":
+                stats["cache_hits"] += 1
+            elif event.coalesced:
+                stats["coalesced"] += 1
+            else:
+                stats["api_requests"] += 1 + event.retries
+            stats["errors"] += event.error is not None
+            stats["retries"] += event.retries
+            stats["rows"] += event.rows or 0
+            stats["response_bytes"] += event.response_bytes or 0
+            stats["seconds"] += event.total
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {endpoint: dict(stats) for endpoint, stats in self.endpoints.items()}
+
+class PrometheusHook:
+    """
+    Export request events as Prometheus metrics via `prometheus_client`.
+
+    Counters: `<namespace>_requests_total{endpoint,marketplace,status,cache}`,
+    `<namespace>_retries_total`, `<namespace>_rows_total` and `<namespace>_response_bytes_total`
+    (by endpoint). Histograms: `<namespace>_request_seconds`, `<namespace>_ttfb_seconds`,
+    `<namespace>_connect_seconds` and `<namespace>_parse_seconds` (by endpoint).
+    """
+
+    def __init__(self, registry: Any = None, namespace: str = "smartscout"):
+        try:
+            import prometheus_client
+        except ImportError:
+            raise ImportError("PrometheusHook requires prometheus_client; install it with `pip install smartscout-api[prometheus]`") from None
+        kwargs = {"registry": registry} if registry is not None else {}
+        self.requests = prometheus_client.Counter(
+            "requests", "SmartScout API calls", ["endpoint", "marketplace", "status", "cache"], namespace=namespace, **kwargs
+        )
+        self.retries = prometheus_client.Counter("retries", "Retried attempts", ["endpoint"], namespace=namespace, **kwargs)
+        self.rows = prometheus_client.Counter("rows", "Rows returned", ["endpoint"], namespace=namespace, **kwargs)
+        self.response_bytes = prometheus_client.Counter(
+            "response_bytes", "Response bytes read", ["endpoint"], namespace=namespace, **kwargs
+        )
+        self.seconds = {
+            name: prometheus_client.Histogram(f"{name}_seconds", help_text, ["endpoint"], namespace=namespace, **kwargs)
+            for name, help_text in (
+                ("request", "Total call duration"),
+                ("ttfb", "Time to first response byte"),
+                ("connect", "Time spent opening connections"),
+                ("parse", "JSON decoding and model construction"),
+            )
+        }
+
+    def __call__(self, event: RequestEvent) -> None:
+        endpoint = event.endpoint
+        status = str(event.status) if event.status is not None else ("error" if event.error else "none")
+        self.requests.labels(endpoint, event.marketplace or "", status, event.cache or "none").inc()
+        if event.retries:
+            self.retries.labels(endpoint).inc(event.retries)
+        if event.rows:
+            self.rows.labels(endpoint).inc(event.rows)
+        if event.response_bytes:
+            self.response_bytes.labels(endpoint).inc(event.response_bytes)
+        self.seconds["request"].labels(endpoint).observe(event.total)
+        for name in ("ttfb", "connect", "parse"):
+            value = getattr(event, name)
+            if value is not None:
+                self.seconds[name].labels(endpoint).observe(value)
+
+class OpenTelemetryHook:
+    """
+    Record each request event as an OpenTelemetry span named `smartscout <METHOD> <endpoint>`.
+
+    Spans carry the HTTP method, status code, endpoint, marketplace and the event's timings,
+    sizes, retries and cache outcome as `smartscout.*` attributes. Errors set the span status.
+    """
+
+    def __init__(self, tracer: Any = None):
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError("OpenTelemetryHook requires opentelemetry-api; install it with `pip install smartscout-api[otel]`") from None
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("smartscout")
+
+    def __call__(self, event: RequestEvent) -> None:
+        start_ns = int(event.started_at * 1e9)
+        span = self.tracer.start_span(
+            f"smartscout {event.method} {event.endpoint}",
+            kind=self._trace.SpanKind.CLIENT,
+            start_time=start_ns,
+        )
+        span.set_attribute("http.request.method", event.method)
+        if event.status is not None:
+            span.set_attribute("http.response.status_code", event.status)
+        for name in ("endpoint", "marketplace", "connect", "ttfb", "parse", "retries", "request_bytes", "response_bytes", "rows", "cache", "coalesced"):
+            value = getattr(event, name)
+            if value is not None:
+                span.set_attribute(f"smartscout.{name}", value)
+        if event.error is not None:
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, event.error))
+        span.end(end_time=start_ns + int(event.total * 1e9))
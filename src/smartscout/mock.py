@@ -0,0 +1,265 @@
+# src/smartscout/mock.py
+
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+_EPOCH = datetime(2024, 1, 1)
+
+class _Route:
+    __slots__ = ("method", "path", "pattern", "key", "schema")
+
+    def __init__(self, method: str, path: str, schema: Dict[str, Any]):
+        self.method = method
+        self.path = path
+        self.pattern = re.compile("^" + re.sub(r"\{[^}]+\}", "[^/]+", _strip_version(path)) + "$")
+        # Path without its version prefix and template segments, so that e.g. the client's
+        # "/products/history/scope" still finds "/api/v1/products/{Asin}/history/scope".
+        self.key = "/".join(part for part in _strip_version(path).split("/") if not part.startswith("{"))
+        self.schema = schema
+
+def _strip_version(path: str) -> str:
+    return re.sub(r"^(/api)?(/v\d+)?", "", path.rstrip("/")) or "/"
+
+class MockServer:
+    """
+    Local stand-in for the SmartScout API, generated from the OpenAPI spec (`swagger.json`).
+
+    Every operation in the spec is served on `http://127.0.0.1:<port>` with rows generated
+    deterministically from its response schema, so the same request always returns the same
+    data. Paged endpoints hold `total_records` rows each and honour `page[size]`/`page[id]`
+    (as query parameters or in the JSON body). Latency, server errors and 429s can be injected
+    to exercise throughput, pagination and retry behaviour without touching the real API.
+
+    Args:
+        spec: Path to `swagger.json`, or the already loaded spec.
+        latency: Seconds added to every response, or a `(min, max)` range drawn uniformly.
+        error_rate: Fraction of requests answered with a 500.
+        rate_limit_rate: Fraction of requests answered with a 429 carrying `Retry-After: retry_after`.
+        total_records: Rows available from each paged endpoint.
+        page_size: Page size when the request does not specify one; capped at `max_page_size`.
+        seed: Seed for generated data and injected faults.
+
+    Example:
+        ```python
+        with MockServer("swagger.json", latency=0.05, rate_limit_rate=0.1) as server:
+            client = SmartScoutAPIClient(api_key="test", base_url=server.url)
+            brands = list(client.iter_brands(SearchBrandsRequest(marketplace="US")))
+        ```
+    """
+
+    def __init__(
+        self,
+        spec: Union[str, Dict[str, Any]] = "swagger.json",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Union[float, Tuple[float, float]] = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 0.0,
+        total_records: int = 1000,
+        page_size: int = 100,
+        max_page_size: int = 1000,
+        seed: int = 0,
+    ):
+        if isinstance(spec, str):
+            with open(spec, "r", encoding="utf-8") as f:
+                spec = json.load(f)
+        self.spec = spec
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.total_records = total_records
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.seed = seed
+        self.routes = _routes(spec)
+        self.stats: Dict[str, int] = {}
+        self._stats_lock = threading.Lock()
+        self._faults = random.Random(seed)
+        self._httpd = ThreadingHTTPServer((host, port), _handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, name="smartscout-mock", daemon=True)
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """
+        Serve on the calling thread until interrupted.
+        """
+        self._httpd.serve_forever(poll_interval=0.05)
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def route_for(self, method: str, path: str) -> Optional[_Route]:
+        stripped = _strip_version(path)
+        candidates = [route for route in self.routes if route.method == method]
+        for route in candidates:
+            if route.pattern.match(stripped):
+                return route
+        for route in candidates:
+            if route.key == stripped:
+                return route
+        return None
+
+    def respond(self, method: str, target: str, body: bytes) -> Tuple[int, Dict[str, str], Any]:
+        """
+        Compute the (status, headers, JSON payload) for one request. Used by the HTTP handler.
+        """
+        self._count("requests")
+        delay = self.latency if not isinstance(self.latency, tuple) else self._fault_draw(*self.latency)
+        if delay:
+            time.sleep(delay)
+        if self.rate_limit_rate and self._fault_draw() < self.rate_limit_rate:
+            self._count("429")
+            return 429, {"Retry-After": _format_seconds(self.retry_after)}, {"message": "Too many requests"}
+        if self.error_rate and self._fault_draw() < self.error_rate:
+            self._count("500")
+            return 500, {}, {"message": "Injected server error"}
+
+        url = urlsplit(target)
+        route = self.route_for(method, url.path)
+        if route is None:
+            self._count("404")
+            return 404, {}, {"message": f"No operation for {method} {url.path}"}
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            self._count("400")
+            return 400, {}, {"message": "Request body is not valid JSON"}
+        self._count("200")
+        return 200, {}, self._page(route, query, payload if isinstance(payload, dict) else {})
+
+    def _page(self, route: _Route, query: Dict[str, str], body: Dict[str, Any]) -> Any:
+        schema = _resolve(self.spec, route.schema)
+        data_schema = schema.get("properties", {}).get("data")
+        if data_schema is None or "paging" not in schema.get("properties", {}):
+            return _generate(self.spec, schema, random.Random(f"{self.seed}:{route.path}"), 0)
+
+        page = body.get("page") or {}
+        size = query.get("page[size]") or page.get("size") or page.get("page[size]") or self.page_size
+        cursor = query.get("page[id]") or page.get("id") or page.get("page[id]")
+        size = max(1, min(int(size), self.max_page_size))
+        start = int(cursor) if cursor else 0
+        end = min(start + size, self.total_records)
+        item_schema = _resolve(self.spec, data_schema.get("items", {}))
+        rows = [
+            _generate(self.spec, item_schema, random.Random(f"{self.seed}:{route.path}:{index}"), index)
+            for index in range(start, end)
+        ]
+        has_more = end < self.total_records
+        return {
+            "dataCount": self.total_records,
+            "paging": {"nextPageId": str(end) if has_more else None, "hasMoreRecords": has_more},
+            "data": rows,
+        }
+
+    def _fault_draw(self, low: float = 0.0, high: float = 1.0) -> float:
+        with self._stats_lock:
+            return self._faults.uniform(low, high)
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self.stats[name] = self.stats.get(name, 0) + 1
+
+def _routes(spec: Dict[str, Any]) -> List[_Route]:
+    routes = []
+    # Later (v2) operations first, so a version-less path prefers the newest one.
+    for path, operations in sorted(spec.get("paths", {}).items(), key=lambda item: item[0], reverse=True):
+        for method, operation in operations.items():
+            content = operation.get("responses", {}).get("200", {}).get("content", {})
+            schema = (content.get("application/json") or next(iter(content.values()), {})).get("schema", {})
+            routes.append(_Route(method.upper(), path, schema))
+    return routes
+
+def _resolve(spec: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, Any]:
+    while "$ref" in schema:
+        node: Any = spec
+        for part in schema["$ref"].lstrip("#/").split("/"):
+            node = node[part]
+        schema = node
+    return schema
+
+def _generate(spec: Dict[str, Any], schema: Dict[str, Any], rng: random.Random, index: int, name: str = "", depth: int = 0) -> Any:
+    schema = _resolve(spec, schema)
+    if "enum" in schema:
+        return rng.choice(schema["enum"])
+    kind = schema.get("type")
+    if kind == "object" or "properties" in schema:
+        if depth > 4:
+            return None
+        return {
+            prop: _generate(spec, sub, rng, index, prop, depth + 1)
+            for prop, sub in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        return [_generate(spec, schema.get("items", {}), rng, index, name, depth + 1) for _ in range(rng.randint(0, 3))]
+    if kind == "integer":
+        return rng.randint(0, 100_000)
+    if kind == "number":
+        return round(rng.uniform(0, 1000), 2)
+    if kind == "boolean":
+        return rng.random() < 0.5
+    if kind == "string":
+        if schema.get("format") == "date-time":
+            return (_EPOCH + timedelta(days=index)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return f"{name or 'value'}-{index}"
+    return None
+
+def _format_seconds(seconds: float) -> str:
+    return str(int(seconds)) if float(seconds).is_integer() else str(seconds)
+
+def _handler(server: MockServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out in separate writes; without TCP_NODELAY each response
+        # stalls on the client's delayed ACK.
+        disable_nagle_algorithm = True
+
+        def _serve(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            status, headers, payload = server.respond(self.command, self.path, body)
+            encoded = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(encoded)))
+            for header, value in headers.items():
+                self.send_header(header, value)
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
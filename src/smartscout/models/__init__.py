@@ -1,124 +1,147 @@
 # src/smartscout/models/__init__.py
 
-# Import enums
-from .enums import MarketplaceId, SortOrder, TextFilterType
+# Models are imported on first access (PEP 562): pydantic builds every class of a module when
+# the module is imported, so only the modules that are actually used pay that cost.
 
-# Import base models and utilities
-from .base import ListFilter, RangeDecimal, RangeFilter, RangeInt, TextFilter, Paging
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
-# Import request models
-from .requests import (
-    SearchBrandsRequest,
-    SearchProductsRequest,
-    SearchSearchTermsRequest,
-    SearchSellersRequest,
-    GetOrganicRanksRequest,
-    GetProductHistoryScopeRequest,
-    GetRelevantProductsRequest,
-    GetSubcategoryBrandsRequest,
-    GetBrandSalesHistoryRequest,
-    GetBrandSalesHistoryBySubcategoriesRequest,
-    GetBrandScopeRequest,
-    GetBrandScopeTopProductsRequest,
-    GetRelevantSearchTermsRequest,
-    GetSearchTermHistoryRequest
-    # SearchSubcategoriesRequest  # Removed because it's not imported
-)
+if TYPE_CHECKING:
+    from .enums import MarketplaceId, SortOrder, TextFilterType
+    from .base import ListFilter, RangeDecimal, RangeFilter, RangeInt, TextFilter, Paging
+    from .requests import (
+        SearchBrandsRequest,
+        SearchProductsRequest,
+        SearchSearchTermsRequest,
+        SearchSellersRequest,
+        GetOrganicRanksRequest,
+        GetProductHistoryScopeRequest,
+        GetRelevantProductsRequest,
+        GetSubcategoryBrandsRequest,
+        GetBrandSalesHistoryRequest,
+        GetBrandSalesHistoryBySubcategoriesRequest,
+        GetBrandScopeRequest,
+        GetBrandScopeTopProductsRequest,
+        GetRelevantSearchTermsRequest,
+        GetSearchTermHistoryRequest,
+    )
+    from .responses import (
+        Brand,
+        Product,
+        SearchTerm,
+        Seller,
+        BrandSalesHistory,
+        ProductSalesHistory,
+        SellerPerformance,
+        CategoryTrend,
+        CompetitorAnalysis,
+        BrandPagedResponse,
+        ProductPagedResponse,
+        SellerPagedResponse,
+        SearchTermPagedResponse,
+    )
+    from .generated import (
+        BrandSearchTerm,
+        DailyRank,
+        EstimatedUnitSalesHistory,
+        ProductHistory,
+        ProductOffer,
+        ProductSalesRankHistory,
+        SalesEstimate,
+        ScopeHistory,
+        SearchTermBrand,
+        SearchTermProductRank,
+        SellerHistory,
+        SellerOffer,
+        SubcategoryBrand,
+        SubcategorySalesHistory,
+        SubcategoryScopeByBrand,
+        TopProductScope,
+    )
 
-# Import response models
-from .responses import (
-    Brand,
-    Product,
-    SearchTerm,
-    Seller,
-    BrandSalesHistory,
-    ProductSalesHistory,
-    SellerPerformance,
-    CategoryTrend,
-    CompetitorAnalysis,
-    # Remove BrandScopeBySubcategory if it's not defined in responses.py
-    # BrandScopeBySubcategory,
-    BrandPagedResponse,
-    ProductPagedResponse,
-    SellerPagedResponse,
-    SearchTermPagedResponse,
-    BrandSearchTerm,
-    DailyRank,
-    EstimatedUnitSalesHistory,
-    ProductHistory,
-    ProductOffer,
-    ProductSalesRankHistory,
-    SalesEstimate,
-    ScopeHistory,
-    SearchTermBrand,
-    SearchTermProductRank,
-    SellerHistory,
-    SellerOffer,
-    SubcategoryBrand,
-    SubcategorySalesHistory,
-    SubcategoryScopeByBrand,
-    TopProductScope,
-)
-
-# Define __all__ to specify what gets imported with "from smartscout.models import *"
-__all__ = [
+_EXPORTS: Dict[str, List[str]] = {
     # Enums
-    "MarketplaceId",
-    "SortOrder",
-    "TextFilterType",
-    
+    ".enums": [
+        "MarketplaceId",
+        "SortOrder",
+        "TextFilterType",
+    ],
     # Base models and utilities
-    "ListFilter",
-    "RangeDecimal",
-    "RangeFilter",
-    "RangeInt",
-    "TextFilter",
-    "Paging",
-    
+    ".base": [
+        "ListFilter",
+        "RangeDecimal",
+        "RangeFilter",
+        "RangeInt",
+        "TextFilter",
+        "Paging",
+    ],
     # Request models
-    "SearchBrandsRequest",
-    "SearchProductsRequest",
-    "SearchSearchTermsRequest",
-    "SearchSellersRequest",
-    "GetOrganicRanksRequest",
-    "GetProductHistoryScopeRequest",
-    "GetRelevantProductsRequest",
-    "GetSubcategoryBrandsRequest",
-    "GetBrandSalesHistoryRequest",
-    "GetBrandSalesHistoryBySubcategoriesRequest",
-    "GetBrandScopeRequest",
-    "GetBrandScopeTopProductsRequest",
-    "GetRelevantSearchTermsRequest",
-    "GetSearchTermHistoryRequest",
-    
+    ".requests": [
+        "SearchBrandsRequest",
+        "SearchProductsRequest",
+        "SearchSearchTermsRequest",
+        "SearchSellersRequest",
+        "GetOrganicRanksRequest",
+        "GetProductHistoryScopeRequest",
+        "GetRelevantProductsRequest",
+        "GetSubcategoryBrandsRequest",
+        "GetBrandSalesHistoryRequest",
+        "GetBrandSalesHistoryBySubcategoriesRequest",
+        "GetBrandScopeRequest",
+        "GetBrandScopeTopProductsRequest",
+        "GetRelevantSearchTermsRequest",
+        "GetSearchTermHistoryRequest",
+    ],
     # Response models
-    "Brand",
-    "BrandSalesHistory",
-    "BrandPagedResponse",
-    "Product",
-    "ProductSalesHistory",
-    "Seller",
-    "SearchTerm",
-    "SellerPerformance",
-    "CategoryTrend",
-    "CompetitorAnalysis",
-    "ProductPagedResponse",
-    "SellerPagedResponse",
-    "SearchTermPagedResponse",
-    "BrandSearchTerm",
-    "DailyRank",
-    "EstimatedUnitSalesHistory",
-    "ProductHistory",
-    "ProductOffer",
-    "ProductSalesRankHistory",
-    "SalesEstimate",
-    "ScopeHistory",
-    "SearchTermBrand",
-    "SearchTermProductRank",
-    "SellerHistory",
-    "SellerOffer",
-    "SubcategoryBrand",
-    "SubcategorySalesHistory",
-    "SubcategoryScopeByBrand",
-    "TopProductScope",
-]
\ No newline at end of file
+    ".responses": [
+        "Brand",
+        "BrandSalesHistory",
+        "BrandPagedResponse",
+        "Product",
+        "ProductSalesHistory",
+        "Seller",
+        "SearchTerm",
+        "SellerPerformance",
+        "CategoryTrend",
+        "CompetitorAnalysis",
+        "ProductPagedResponse",
+        "SellerPagedResponse",
+        "SearchTermPagedResponse",
+    ],
+    # Response models that only exist in the API spec, from the generated models
+    # (see `smartscout.codegen`). Request models for every operation live in `.generated` too.
+    ".generated": [
+        "BrandSearchTerm",
+        "DailyRank",
+        "EstimatedUnitSalesHistory",
+        "ProductHistory",
+        "ProductOffer",
+        "ProductSalesRankHistory",
+        "SalesEstimate",
+        "ScopeHistory",
+        "SearchTermBrand",
+        "SearchTermProductRank",
+        "SellerHistory",
+        "SellerOffer",
+        "SubcategoryBrand",
+        "SubcategorySalesHistory",
+        "SubcategoryScopeByBrand",
+        "TopProductScope",
+    ],
+}
+
+_MODULES: Dict[str, str] = {name: module for module, names in _EXPORTS.items() for name in names}
+
+# Define __all__ to specify what gets imported with "from smartscout.models import *"
+__all__ = list(_MODULES)
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,6 +2,7 @@
 
 from typing import List, Optional, Generic, TypeVar
 from pydantic import BaseModel, Field
+from pydantic.generics import GenericModel
 from datetime import datetime
 from .enums import SortOrder, TextFilterType
 
@@ -59,17 +60,32 @@ class BaseResponse(BaseModel):
     """Base model for all API responses."""
     pass
 
-class PagedResponse(BaseResponse, Generic[T]):
+class PagedResponse(BaseResponse, GenericModel, Generic[T]):
     """Generic model for paginated API responses."""
-    data_count: int
+    data_count: int = Field(..., alias="dataCount")
     paging: Paging
     data: Optional[List[T]] = None
 
+    class Config:
+        allow_population_by_field_name = True
+
 class BaseSearchRequest(BaseRequest):
     """Base model for search requests."""
     sort: Optional[SortOptions] = None
     page: Optional[PageOptions] = None
 
+class OperationRequest(BaseSearchRequest):
+    """Base model for the per-operation requests generated from the API spec."""
+
+    class Config:
+        allow_population_by_field_name = True
+
+class SpecModel(BaseResponse):
+    """Base model for the response models generated from the API spec."""
+
+    class Config:
+        allow_population_by_field_name = True
+
 class BaseHistoryRequest(BaseRequest):
     """Base model for history requests."""
     date_range: DateRangeFilter
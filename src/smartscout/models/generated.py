@@ -0,0 +1,787 @@
+# src/smartscout/models/generated.py
+# Generated by `python -m smartscout.codegen` from swagger.json; do not edit by hand.
+
+from datetime import datetime
+from typing import Any, List, Optional
+from pydantic import Field
+from .base import ListFilter, OperationRequest, RangeDecimal, RangeFilter, RangeInt, SpecModel, TextFilter
+
+class Brand(SpecModel):
+    amazon_isr: Optional[float] = Field(None, alias="amazonIsr")
+    avg_fba_sellers: Optional[float] = Field(None, alias="avgFbaSellers")
+    avg_sellers: Optional[float] = Field(None, alias="avgSellers")
+    avg_price: Optional[float] = Field(None, alias="avgPrice")
+    avg_volume: Optional[float] = Field(None, alias="avgVolume")
+    review_rating: Optional[float] = Field(None, alias="reviewRating")
+    total_products: Optional[int] = Field(None, alias="totalProducts")
+    total_reviews: Optional[int] = Field(None, alias="totalReviews")
+    monthly_revenue: Optional[float] = Field(None, alias="monthlyRevenue")
+    monthly_units_sold: Optional[int] = Field(None, alias="monthlyUnitsSold")
+    brand_score: Optional[float] = Field(None, alias="brandScore")
+    has_storefront: Optional[bool] = Field(None, alias="hasStorefront")
+    has_single_seller: Optional[bool] = Field(None, alias="hasSingleSeller")
+    dominant_seller_profile_id: Optional[int] = Field(None, alias="dominantSellerProfileId")
+    dominant_seller_brand_coverage: Optional[float] = Field(None, alias="dominantSellerBrandCoverage")
+    brand_name: Optional[str] = Field(None, alias="brandName")
+    category_name: Optional[str] = Field(None, alias="categoryName")
+    subcategory_name: Optional[str] = Field(None, alias="subcategoryName")
+    month_growth: Optional[float] = Field(None, alias="monthGrowth")
+    month_growth_12: Optional[float] = Field(None, alias="monthGrowth12")
+    trailing_12_months: Optional[float] = Field(None, alias="trailing12Months")
+
+class BrandCoverage(SpecModel):
+    number_offers: Optional[int] = Field(None, alias="numberOffers")
+    monthly_revenue: Optional[float] = Field(None, alias="monthlyRevenue")
+    estimate_brand_percentage: Optional[float] = Field(None, alias="estimateBrandPercentage")
+    amazon_seller_id: Optional[str] = Field(None, alias="amazonSellerId")
+    brand_name: Optional[str] = Field(None, alias="brandName")
+
+class BrandSalesHistory(SpecModel):
+    date: Optional[datetime] = None
+    brand: Optional[str] = None
+    sales: Optional[float] = None
+
+class BrandScope(SpecModel):
+    date: Optional[datetime] = None
+    revenue: Optional[float] = None
+    unit_sales: Optional[int] = Field(None, alias="unitSales")
+    selling_price: Optional[float] = Field(None, alias="sellingPrice")
+    asins: Optional[int] = None
+
+class BrandScopeBySubcategory(SpecModel):
+    date: Optional[datetime] = None
+    subcategory_id: Optional[int] = Field(None, alias="subcategoryId")
+    revenue: Optional[float] = None
+    unit_sales: Optional[int] = Field(None, alias="unitSales")
+    selling_price: Optional[float] = Field(None, alias="sellingPrice")
+    asins: Optional[int] = None
+
+class BrandSearchTerm(SpecModel):
+    sponsored_products: Optional[int] = Field(None, alias="sponsoredProducts")
+    sponsored_brand_win_rate: Optional[float] = Field(None, alias="sponsoredBrandWinRate")
+    sponsored_video_win_rate: Optional[float] = Field(None, alias="sponsoredVideoWinRate")
+    top_group_win_rate: Optional[float] = Field(None, alias="topGroupWinRate")
+    top_spot_win_rate: Optional[float] = Field(None, alias="topSpotWinRate")
+    search_term_value: Optional[str] = Field(None, alias="searchTermValue")
+    estimate_searches: Optional[int] = Field(None, alias="estimateSearches")
+
+class DailyRank(SpecModel):
+    date: Optional[datetime] = None
+    avg_rank: Optional[float] = Field(None, alias="avgRank")
+
+class EstimatedUnitSalesHistory(SpecModel):
+    date: Optional[datetime] = None
+    sales: Optional[float] = None
+    coverage: Optional[int] = None
+
+class Product(SpecModel):
+    subcategory_id: Optional[int] = Field(None, alias="subcategoryId")
+    asin: Optional[str] = None
+    rank: Optional[int] = None
+    subcategory_rank: Optional[int] = Field(None, alias="subcategoryRank")
+    number_of_sellers: Optional[int] = Field(None, alias="numberOfSellers")
+    buy_box_price: Optional[float] = Field(None, alias="buyBoxPrice")
+    average_buy_box_price: Optional[float] = Field(None, alias="averageBuyBoxPrice")
+    review_count: Optional[int] = Field(None, alias="reviewCount")
+    review_rating: Optional[float] = Field(None, alias="reviewRating")
+    number_fba_sellers: Optional[int] = Field(None, alias="numberFbaSellers")
+    amazon_isr: Optional[float] = Field(None, alias="amazonIsr")
+    monthly_revenue_estimate: Optional[float] = Field(None, alias="monthlyRevenueEstimate")
+    monthly_units_sold: Optional[int] = Field(None, alias="monthlyUnitsSold")
+    out_of_stock_now: Optional[bool] = Field(None, alias="outOfStockNow")
+    product_page_score: Optional[float] = Field(None, alias="productPageScore")
+    is_variation: Optional[bool] = Field(None, alias="isVariation")
+    parent_asin: Optional[str] = Field(None, alias="parentAsin")
+    image_url: Optional[str] = Field(None, alias="imageUrl")
+    title: Optional[str] = None
+    buy_box_equity: Optional[float] = Field(None, alias="buyBoxEquity")
+    revenue_equity: Optional[float] = Field(None, alias="revenueEquity")
+    margin_equity: Optional[float] = Field(None, alias="marginEquity")
+    part_number: Optional[str] = Field(None, alias="partNumber")
+    model: Optional[str] = None
+    upc: Optional[str] = None
+    manufacturer: Optional[str] = None
+    number_of_items: Optional[int] = Field(None, alias="numberOfItems")
+    total_ratings: Optional[int] = Field(None, alias="totalRatings")
+    package_quantity: Optional[int] = Field(None, alias="packageQuantity")
+    size: Optional[str] = None
+    color: Optional[str] = None
+    length: Optional[float] = None
+    height: Optional[float] = None
+    width: Optional[float] = None
+    weight: Optional[float] = None
+    subcategory_name: Optional[str] = Field(None, alias="subcategoryName")
+    category_name: Optional[str] = Field(None, alias="categoryName")
+    brand_name: Optional[str] = Field(None, alias="brandName")
+
+class ProductHistory(SpecModel):
+    date: Optional[datetime] = None
+    new_fbm_price: Optional[float] = Field(None, alias="newFbmPrice")
+    new_fba_price: Optional[float] = Field(None, alias="newFbaPrice")
+    sales_rank: Optional[float] = Field(None, alias="salesRank")
+    buy_box_price: Optional[float] = Field(None, alias="buyBoxPrice")
+    reviews_count: Optional[float] = Field(None, alias="reviewsCount")
+    new_offer_count: Optional[float] = Field(None, alias="newOfferCount")
+    amazon_price: Optional[float] = Field(None, alias="amazonPrice")
+    rank_score: Optional[int] = Field(None, alias="rankScore")
+
+class ProductOffer(SpecModel):
+    seller_id: Optional[str] = Field(None, alias="sellerId")
+    seller_name: Optional[str] = Field(None, alias="sellerName")
+    buy_box_percentage: Optional[float] = Field(None, alias="buyBoxPercentage")
+    price: Optional[float] = None
+    monthly_revenue: Optional[float] = Field(None, alias="monthlyRevenue")
+
+class ProductSalesHistory(SpecModel):
+    date: Optional[datetime] = None
+    asin: Optional[str] = None
+    sales: Optional[float] = None
+
+class ProductSalesRankHistory(SpecModel):
+    date: Optional[datetime] = None
+    asin: Optional[str] = None
+    sales_rank: Optional[int] = Field(None, alias="salesRank")
+
+class RelevantProduct(SpecModel):
+    asin: Optional[str] = None
+    brand: Optional[str] = None
+    common_search_terms: Optional[int] = Field(None, alias="commonSearchTerms")
+    relevancy_score: Optional[float] = Field(None, alias="relevancyScore")
+
+class RelevantSearchTerm(SpecModel):
+    search_term: Optional[str] = Field(None, alias="searchTerm")
+    estimate_searches: Optional[int] = Field(None, alias="estimateSearches")
+    relevancy: Optional[float] = None
+    intent: Optional[str] = None
+
+class SalesEstimate(SpecModel):
+    estimated_30_day_sales_velocity: Optional[int] = Field(None, alias="estimated30DaySalesVelocity")
+
+class ScopeHistory(SpecModel):
+    date: Optional[datetime] = None
+    buy_box_price: Optional[float] = Field(None, alias="buyBoxPrice")
+    sales: Optional[float] = None
+    revenue: Optional[float] = None
+    number_of_sellers: Optional[int] = Field(None, alias="numberOfSellers")
+    sales_rank: Optional[int] = Field(None, alias="salesRank")
+    rating: Optional[float] = None
+    reviews: Optional[int] = None
+
+class SearchTerm(SpecModel):
+    search_term_value: Optional[str] = Field(None, alias="searchTermValue")
+    estimate_searches: Optional[int] = Field(None, alias="estimateSearches")
+    super_charge: Optional[bool] = Field(None, alias="superCharge")
+    brands: Optional[int] = None
+    products: Optional[int] = None
+    estimated_cpc: Optional[float] = Field(None, alias="estimatedCpc")
+    ranking_products: Optional[int] = Field(None, alias="rankingProducts")
+    ranking_brands: Optional[int] = Field(None, alias="rankingBrands")
+    estimate_searches_growth_12_months: Optional[int] = Field(None, alias="estimateSearchesGrowth12Months")
+    estimate_searches_growth_6_months: Optional[int] = Field(None, alias="estimateSearchesGrowth6Months")
+    estimate_searches_growth_3_months: Optional[int] = Field(None, alias="estimateSearchesGrowth3Months")
+    estimate_searches_growth_1_month: Optional[int] = Field(None, alias="estimateSearchesGrowth1Month")
+
+class SearchTermBrand(SpecModel):
+    sponsored_products: Optional[int] = Field(None, alias="sponsoredProducts")
+    sponsored_brand_win_rate: Optional[float] = Field(None, alias="sponsoredBrandWinRate")
+    sponsored_video_win_rate: Optional[float] = Field(None, alias="sponsoredVideoWinRate")
+    top_group_win_rate: Optional[float] = Field(None, alias="topGroupWinRate")
+    top_spot_win_rate: Optional[float] = Field(None, alias="topSpotWinRate")
+    brand_name: Optional[str] = Field(None, alias="brandName")
+
+class SearchTermHistory(SpecModel):
+    date: Optional[datetime] = None
+    estimate_searches: Optional[int] = Field(None, alias="estimateSearches")
+
+class SearchTermProductRank(SpecModel):
+    avg_rank: Optional[float] = Field(None, alias="avgRank")
+    latest_rank: Optional[int] = Field(None, alias="latestRank")
+    asin: Optional[str] = None
+    search_term: Optional[str] = Field(None, alias="searchTerm")
+    estimate_searches: Optional[int] = Field(None, alias="estimateSearches")
+    intent: Optional[str] = None
+    rank_score: Optional[int] = Field(None, alias="rankScore")
+    rank_history: Optional[List[DailyRank]] = Field(None, alias="rankHistory")
+
+class Seller(SpecModel):
+    business_name: Optional[str] = Field(None, alias="businessName")
+    amazon_seller_id: Optional[str] = Field(None, alias="amazonSellerId")
+    estimate_sales: Optional[float] = Field(None, alias="estimateSales")
+    avg_price: Optional[float] = Field(None, alias="avgPrice")
+    percent_fba: Optional[float] = Field(None, alias="percentFba")
+    number_reviews_lifetime: Optional[int] = Field(None, alias="numberReviewsLifetime")
+    number_reviews_30_days: Optional[int] = Field(None, alias="numberReviews30Days")
+    number_winning_brands: Optional[int] = Field(None, alias="numberWinningBrands")
+    number_asins: Optional[int] = Field(None, alias="numberAsins")
+    number_top_asins: Optional[int] = Field(None, alias="numberTopAsins")
+    street: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    country: Optional[str] = None
+    zip_code: Optional[str] = Field(None, alias="zipCode")
+    num_brands_1000: Optional[int] = Field(None, alias="numBrands1000")
+    mom_growth: Optional[float] = Field(None, alias="moMGrowth")
+    three_month_growth: Optional[float] = Field(None, alias="threeMonthGrowth")
+    six_month_growth: Optional[float] = Field(None, alias="sixMonthGrowth")
+    year_growth: Optional[float] = Field(None, alias="yearGrowth")
+    mom_growth_count: Optional[int] = Field(None, alias="moMGrowthCount")
+    six_month_growth_count: Optional[int] = Field(None, alias="sixMonthGrowthCount")
+    is_suspended: Optional[bool] = Field(None, alias="isSuspended")
+    last_suspended_date: Optional[datetime] = Field(None, alias="lastSuspendedDate")
+    started_selling_date: Optional[datetime] = Field(None, alias="startedSellingDate")
+    seller_name: Optional[str] = Field(None, alias="sellerName")
+    category_name: Optional[str] = Field(None, alias="categoryName")
+    subcategory_name: Optional[str] = Field(None, alias="subcategoryName")
+
+class SellerHistory(SpecModel):
+    history_date: Optional[datetime] = Field(None, alias="historyDate")
+    reviews: Optional[int] = None
+    review_score: Optional[int] = Field(None, alias="reviewScore")
+
+class SellerOffer(SpecModel):
+    asin: Optional[str] = None
+    brand_name: Optional[str] = Field(None, alias="brandName")
+    monthly_revenue: Optional[float] = Field(None, alias="monthlyRevenue")
+    buy_box_percentage: Optional[float] = Field(None, alias="buyBoxPercentage")
+
+class Subcategory(SpecModel):
+    id: Optional[int] = None
+    subcategory_name: Optional[str] = Field(None, alias="subcategoryName")
+    total_monthly_revenue: Optional[float] = Field(None, alias="totalMonthlyRevenue")
+    total_brands: Optional[int] = Field(None, alias="totalBrands")
+    total_asins: Optional[int] = Field(None, alias="totalAsins")
+    avg_price: Optional[float] = Field(None, alias="avgPrice")
+    avg_reviews: Optional[float] = Field(None, alias="avgReviews")
+    avg_rating: Optional[float] = Field(None, alias="avgRating")
+    avg_number_sellers: Optional[float] = Field(None, alias="avgNumberSellers")
+    avg_page_score: Optional[float] = Field(None, alias="avgPageScore")
+    avg_volume: Optional[float] = Field(None, alias="avgVolume")
+    total_number_units_sold: Optional[int] = Field(None, alias="totalNumberUnitsSold")
+    total_reviews: Optional[int] = Field(None, alias="totalReviews")
+    subcategory_context_name: Optional[str] = Field(None, alias="subcategoryContextName")
+    seller_revenue_pct: Optional[float] = Field(None, alias="sellerRevenuePct")
+    az_revenue_pct: Optional[float] = Field(None, alias="azRevenuePct")
+    avg_listed_since_days: Optional[int] = Field(None, alias="avgListedSinceDays")
+    ttm: Optional[float] = None
+    is_parent: Optional[bool] = Field(None, alias="isParent")
+    level: Optional[int] = None
+    parent_id: Optional[int] = Field(None, alias="parentId")
+    month_growth: Optional[float] = Field(None, alias="monthGrowth")
+    month_growth_12: Optional[float] = Field(None, alias="monthGrowth12")
+
+class SubcategoryBrand(SpecModel):
+    brand_name: Optional[str] = Field(None, alias="brandName")
+    subcategory_name: Optional[str] = Field(None, alias="subcategoryName")
+    subcategory_context: Optional[str] = Field(None, alias="subcategoryContext")
+    number_asins: Optional[int] = Field(None, alias="numberASINs")
+    revenue: Optional[float] = None
+    total_reviews: Optional[int] = Field(None, alias="totalReviews")
+    review_rating: Optional[float] = Field(None, alias="reviewRating")
+    avg_price: Optional[float] = Field(None, alias="avgPrice")
+    avg_number_sellers: Optional[float] = Field(None, alias="avgNumberSellers")
+    avg_page_score: Optional[float] = Field(None, alias="avgPageScore")
+    avg_volume: Optional[float] = Field(None, alias="avgVolume")
+    avg_reviews: Optional[float] = Field(None, alias="avgReviews")
+    total_number_units_sold: Optional[int] = Field(None, alias="totalNumberUnitsSold")
+    marketshare: Optional[float] = None
+    mom_mkt_share_change: Optional[float] = Field(None, alias="moMMktShareChange")
+    mom_monthly_units_change: Optional[int] = Field(None, alias="moMMonthlyUnitsChange")
+    mom_monthly_rev_change: Optional[float] = Field(None, alias="moMMonthlyRevChange")
+
+class SubcategorySalesHistory(SpecModel):
+    date: Optional[datetime] = None
+    subcategory_id: Optional[int] = Field(None, alias="subcategoryId")
+    sales: Optional[float] = None
+
+class SubcategoryScope(SpecModel):
+    date: Optional[datetime] = None
+    revenue: Optional[float] = None
+    unit_sales: Optional[int] = Field(None, alias="unitSales")
+    selling_price: Optional[float] = Field(None, alias="sellingPrice")
+    asins: Optional[int] = None
+    brands: Optional[int] = None
+
+class SubcategoryScopeByBrand(SpecModel):
+    date: Optional[datetime] = None
+    brand_name: Optional[str] = Field(None, alias="brandName")
+    revenue: Optional[float] = None
+    unit_sales: Optional[int] = Field(None, alias="unitSales")
+    selling_price: Optional[float] = Field(None, alias="sellingPrice")
+    asins: Optional[int] = None
+
+class TopProductScope(SpecModel):
+    date: Optional[datetime] = None
+    asin: Optional[str] = None
+    revenue: Optional[float] = None
+    unit_sales: Optional[int] = Field(None, alias="unitSales")
+    selling_price: Optional[float] = Field(None, alias="sellingPrice")
+    sales_rank: Optional[int] = Field(None, alias="salesRank")
+
+class AdSpySearchRequest(OperationRequest):
+    """Request for `POST /api/v1/ad-spy/search`."""
+    search_term_value: Optional[TextFilter] = Field(None, alias="searchTermValue")
+    estimate_searches: Optional[RangeInt] = Field(None, alias="estimateSearches")
+    brands: Optional[RangeInt] = None
+    products: Optional[RangeInt] = None
+    estimated_cpc: Optional[RangeFilter] = Field(None, alias="estimatedCpc")
+    super_charge: Optional[bool] = Field(None, alias="superCharge")
+
+class AdSpyBrandsRequest(OperationRequest):
+    """Request for `GET /api/v1/ad-spy/{SearchTermValue}/brands`."""
+    search_term_value: str = Field(..., alias="SearchTermValue")
+
+class AdSpySponsoredProductsRequest(OperationRequest):
+    """Request for `GET /api/v1/ad-spy/sponsored-products`."""
+    search_term_value: Optional[str] = Field(None, alias="searchTermValue")
+    brand_name: Optional[str] = Field(None, alias="brandName")
+
+class BrandsSearchRequest(OperationRequest):
+    """Request for `POST /api/v1/brands/search`."""
+    brand_names: Optional[ListFilter] = Field(None, alias="brandNames")
+    brand_name: Optional[TextFilter] = Field(None, alias="brandName")
+    amazon_isr: Optional[RangeFilter] = Field(None, alias="amazonIsr")
+    avg_sellers: Optional[RangeFilter] = Field(None, alias="avgSellers")
+    avg_price: Optional[RangeFilter] = Field(None, alias="avgPrice")
+    avg_volume: Optional[RangeFilter] = Field(None, alias="avgVolume")
+    review_rating: Optional[RangeFilter] = Field(None, alias="reviewRating")
+    total_reviews: Optional[RangeInt] = Field(None, alias="totalReviews")
+    total_products: Optional[RangeInt] = Field(None, alias="totalProducts")
+    avg_fba_sellers: Optional[RangeFilter] = Field(None, alias="avgFbaSellers")
+    brand_score: Optional[RangeFilter] = Field(None, alias="brandScore")
+    monthly_revenue: Optional[RangeFilter] = Field(None, alias="monthlyRevenue")
+    note: Optional[TextFilter] = None
+    category: Optional[TextFilter] = None
+    category_name: Optional[TextFilter] = Field(None, alias="categoryName")
+    subcategory_name: Optional[TextFilter] = Field(None, alias="subcategoryName")
+    has_storefront: Optional[bool] = Field(None, alias="hasStorefront")
+    search_terms: Optional[RangeInt] = Field(None, alias="searchTerms")
+    sponsored_products: Optional[RangeInt] = Field(None, alias="sponsoredProducts")
+    sponsored_brand_win_rate: Optional[RangeDecimal] = Field(None, alias="sponsoredBrandWinRate")
+    sponsored_video_win_rate: Optional[RangeDecimal] = Field(None, alias="sponsoredVideoWinRate")
+    top_spot_win_rate: Optional[RangeDecimal] = Field(None, alias="topSpotWinRate")
+    top_group_win_rate: Optional[RangeDecimal] = Field(None, alias="topGroupWinRate")
+    month_growth: Optional[RangeDecimal] = Field(None, alias="monthGrowth")
+    month_growth_12: Optional[RangeDecimal] = Field(None, alias="monthGrowth12")
+    trailing_12_months: Optional[RangeDecimal] = Field(None, alias="trailing12Months")
+
+class BrandsMarketShareRequest(OperationRequest):
+    """Request for `GET /api/v1/brands/{BrandName}/market-share`."""
+    brand_name: str = Field(..., alias="BrandName")
+
+class BrandsSellersRequest(OperationRequest):
+    """Request for `GET /api/v1/brands/{BrandName}/sellers`."""
+    brand_name: str = Field(..., alias="BrandName")
+
+class BrandsAdSpyRequest(OperationRequest):
+    """Request for `GET /api/v1/brands/{BrandName}/ad-spy`."""
+    brand_name: str = Field(..., alias="BrandName")
+
+class BrandsHistorySalesRequest(OperationRequest):
+    """Request for `POST /api/v1/brands/{BrandName}/history/sales`."""
+    brand_name: str = Field(..., alias="BrandName")
+    subcategory_id: Optional[int] = Field(None, alias="subcategoryId")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class BrandsHistorySalesBySubcategoriesRequest(OperationRequest):
+    """Request for `POST /api/v1/brands/{BrandName}/history/sales-by-subcategories`."""
+    brand_name: str = Field(..., alias="BrandName")
+    subcategory_id: Optional[int] = Field(None, alias="subcategoryId")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class BrandsHistoryTopProductsSalesRequest(OperationRequest):
+    """Request for `POST /api/v1/brands/{BrandName}/history/top-products/sales`."""
+    brand_name: str = Field(..., alias="BrandName")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class BrandsHistoryTopProductsSalesRankRequest(OperationRequest):
+    """Request for `POST /api/v1/brands/{BrandName}/history/top-products/sales-rank`."""
+    brand_name: str = Field(..., alias="BrandName")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class BrandsSearchV2Request(OperationRequest):
+    """Request for `POST /api/v2/brands/search`."""
+    brand_names: Optional[ListFilter] = Field(None, alias="brandNames")
+    brand_name: Optional[TextFilter] = Field(None, alias="brandName")
+    amazon_isr: Optional[RangeFilter] = Field(None, alias="amazonIsr")
+    avg_sellers: Optional[RangeFilter] = Field(None, alias="avgSellers")
+    avg_price: Optional[RangeFilter] = Field(None, alias="avgPrice")
+    avg_volume: Optional[RangeFilter] = Field(None, alias="avgVolume")
+    review_rating: Optional[RangeFilter] = Field(None, alias="reviewRating")
+    total_reviews: Optional[RangeInt] = Field(None, alias="totalReviews")
+    total_products: Optional[RangeInt] = Field(None, alias="totalProducts")
+    avg_fba_sellers: Optional[RangeFilter] = Field(None, alias="avgFbaSellers")
+    brand_score: Optional[RangeFilter] = Field(None, alias="brandScore")
+    monthly_revenue: Optional[RangeFilter] = Field(None, alias="monthlyRevenue")
+    note: Optional[TextFilter] = None
+    category: Optional[TextFilter] = None
+    category_name: Optional[TextFilter] = Field(None, alias="categoryName")
+    subcategory_name: Optional[TextFilter] = Field(None, alias="subcategoryName")
+    has_storefront: Optional[bool] = Field(None, alias="hasStorefront")
+    search_terms: Optional[RangeInt] = Field(None, alias="searchTerms")
+    sponsored_products: Optional[RangeInt] = Field(None, alias="sponsoredProducts")
+    sponsored_brand_win_rate: Optional[RangeDecimal] = Field(None, alias="sponsoredBrandWinRate")
+    sponsored_video_win_rate: Optional[RangeDecimal] = Field(None, alias="sponsoredVideoWinRate")
+    top_spot_win_rate: Optional[RangeDecimal] = Field(None, alias="topSpotWinRate")
+    top_group_win_rate: Optional[RangeDecimal] = Field(None, alias="topGroupWinRate")
+    month_growth: Optional[RangeDecimal] = Field(None, alias="monthGrowth")
+    month_growth_12: Optional[RangeDecimal] = Field(None, alias="monthGrowth12")
+    trailing_12_months: Optional[RangeDecimal] = Field(None, alias="trailing12Months")
+
+class BrandsMarketShareV2Request(OperationRequest):
+    """Request for `GET /api/v2/brands/market-share`."""
+    brand_name: Optional[str] = Field(None, alias="brandName")
+
+class BrandsSellersV2Request(OperationRequest):
+    """Request for `GET /api/v2/brands/sellers`."""
+    brand_name: Optional[str] = Field(None, alias="brandName")
+
+class BrandsAdSpyV2Request(OperationRequest):
+    """Request for `GET /api/v2/brands/ad-spy`."""
+    brand_name: Optional[str] = Field(None, alias="brandName")
+
+class BrandsHistorySalesV2Request(OperationRequest):
+    """Request for `POST /api/v2/brands/history/sales`."""
+    brand_name: Optional[str] = Field(None, alias="brandName")
+    subcategory_id: Optional[int] = Field(None, alias="subcategoryId")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class BrandsHistorySalesBySubcategoriesV2Request(OperationRequest):
+    """Request for `POST /api/v2/brands/history/sales-by-subcategories`."""
+    brand_name: Optional[str] = Field(None, alias="brandName")
+    subcategory_id: Optional[int] = Field(None, alias="subcategoryId")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class BrandsHistoryTopProductsSalesV2Request(OperationRequest):
+    """Request for `POST /api/v2/brands/history/top-products/sales`."""
+    brand_name: Optional[str] = Field(None, alias="brandName")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class BrandsHistoryTopProductsSalesRankV2Request(OperationRequest):
+    """Request for `POST /api/v2/brands/history/top-products/sales-rank`."""
+    brand_name: Optional[str] = Field(None, alias="brandName")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class BrandsHistoryScopeV2Request(OperationRequest):
+    """Request for `POST /api/v2/brands/history/scope`."""
+    brand_name: Optional[str] = Field(None, alias="brandName")
+    subcategory_id: Optional[int] = Field(None, alias="subcategoryId")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class BrandsHistoryScopeBySubcategoriesV2Request(OperationRequest):
+    """Request for `POST /api/v2/brands/history/scope/by-subcategories`."""
+    brand_name: Optional[str] = Field(None, alias="brandName")
+    subcategory_id: Optional[int] = Field(None, alias="subcategoryId")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class BrandsHistoryScopeTopProductsV2Request(OperationRequest):
+    """Request for `POST /api/v2/brands/history/scope/top-products`."""
+    brand_name: Optional[str] = Field(None, alias="brandName")
+    top_by: Optional[str] = Field(None, alias="topBy")
+    top: Optional[int] = None
+    subcategory_id: Optional[int] = Field(None, alias="subcategoryId")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class ProductsSearchRequest(OperationRequest):
+    """Request for `POST /api/v1/products/search`."""
+    subcategory_id: Optional[int] = Field(None, alias="subcategoryId")
+    brand_name: Optional[TextFilter] = Field(None, alias="brandName")
+    category_name: Optional[TextFilter] = Field(None, alias="categoryName")
+    subcategory_name: Optional[TextFilter] = Field(None, alias="subcategoryName")
+    rank: Optional[RangeInt] = None
+    monthly_revenue_estimate: Optional[RangeFilter] = Field(None, alias="monthlyRevenueEstimate")
+    amazon_isr: Optional[RangeFilter] = Field(None, alias="amazonIsr")
+    number_of_sellers: Optional[RangeInt] = Field(None, alias="numberOfSellers")
+    number_fba_sellers: Optional[RangeInt] = Field(None, alias="numberFbaSellers")
+    review_count: Optional[RangeInt] = Field(None, alias="reviewCount")
+    review_rating: Optional[RangeFilter] = Field(None, alias="reviewRating")
+    buy_box_price: Optional[RangeFilter] = Field(None, alias="buyBoxPrice")
+    product_page_score: Optional[RangeFilter] = Field(None, alias="productPageScore")
+    out_of_stock_now: Optional[bool] = Field(None, alias="outOfStockNow")
+    is_variation: Optional[bool] = Field(None, alias="isVariation")
+    asins: Optional[ListFilter] = None
+    asin: Optional[TextFilter] = None
+    parent_asin: Optional[TextFilter] = Field(None, alias="parentAsin")
+    title: Optional[TextFilter] = None
+    note: Optional[TextFilter] = None
+    buy_box_equity: Optional[RangeFilter] = Field(None, alias="buyBoxEquity")
+    number_of_items: Optional[RangeInt] = Field(None, alias="numberOfItems")
+    total_ratings: Optional[RangeInt] = Field(None, alias="totalRatings")
+
+class ProductsHistoryRequest(OperationRequest):
+    """Request for `GET /api/v1/products/{Asin}/history`."""
+    asin: str = Field(..., alias="Asin")
+
+class ProductsHistoryScopeRequest(OperationRequest):
+    """Request for `POST /api/v1/products/{Asin}/history/scope`."""
+    asin: str = Field(..., alias="Asin")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class ProductsOffersRequest(OperationRequest):
+    """Request for `GET /api/v1/products/{Asin}/offers`."""
+    asin: str = Field(..., alias="Asin")
+
+class SalesEstimateRequest(OperationRequest):
+    """Request for `GET /api/v1/sales/estimate`."""
+    category_node: Optional[int] = Field(None, alias="categoryNode")
+    sales_rank: Optional[int] = Field(None, alias="salesRank")
+
+class SearchTermsSearchRequest(OperationRequest):
+    """Request for `POST /api/v1/search-terms/search`."""
+    search_term_value: Optional[TextFilter] = Field(None, alias="searchTermValue")
+    estimate_searches: Optional[RangeInt] = Field(None, alias="estimateSearches")
+    brands: Optional[RangeInt] = None
+    products: Optional[RangeInt] = None
+    estimated_cpc: Optional[RangeFilter] = Field(None, alias="estimatedCpc")
+    super_charge: Optional[bool] = Field(None, alias="superCharge")
+
+class SearchTermsOrganicRanksRequest(OperationRequest):
+    """Request for `POST /api/v1/search-terms/organic-ranks`."""
+    asin: Optional[str] = None
+    exclude_variants: Optional[bool] = Field(None, alias="excludeVariants")
+    include_rank_history: Optional[bool] = Field(None, alias="includeRankHistory")
+    intent: Optional[str] = None
+    search_term: Optional[TextFilter] = Field(None, alias="searchTerm")
+    avg_rank: Optional[RangeDecimal] = Field(None, alias="avgRank")
+    latest_rank: Optional[RangeInt] = Field(None, alias="latestRank")
+    rank_score: Optional[RangeInt] = Field(None, alias="rankScore")
+    smart_score: Optional[RangeInt] = Field(None, alias="smartScore")
+    estimate_searches: Optional[RangeInt] = Field(None, alias="estimateSearches")
+
+class SearchTermsRelevantProductsRequest(OperationRequest):
+    """Request for `POST /api/v1/search-terms/relevant-products/{Asin}`."""
+    asin: str = Field(..., alias="Asin")
+    parent_asin: Optional[str] = Field(None, alias="parentAsin")
+    relevancy_score: Optional[RangeDecimal] = Field(None, alias="relevancyScore")
+    common_search_terms: Optional[RangeInt] = Field(None, alias="commonSearchTerms")
+
+class SearchTermsRelevantSearchTermsRequest(OperationRequest):
+    """Request for `POST /api/v1/search-terms/relevant-search-terms/{Asin}`."""
+    asin: str = Field(..., alias="Asin")
+    parent_asin: Optional[str] = Field(None, alias="parentAsin")
+    search_term: Optional[TextFilter] = Field(None, alias="searchTerm")
+    intent: Optional[TextFilter] = None
+    relevancy: Optional[RangeDecimal] = None
+    estimated_searches: Optional[RangeInt] = Field(None, alias="estimatedSearches")
+
+class SearchTermsHistoryRequest(OperationRequest):
+    """Request for `POST /api/v1/search-terms/history`."""
+    search_term: Optional[str] = Field(None, alias="searchTerm")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class SellersSearchRequest(OperationRequest):
+    """Request for `POST /api/v1/sellers/search`."""
+    category_name: Optional[TextFilter] = Field(None, alias="categoryName")
+    subcategory_name: Optional[TextFilter] = Field(None, alias="subcategoryName")
+    amazon_seller_id: Optional[TextFilter] = Field(None, alias="amazonSellerId")
+    amazon_seller_ids: Optional[ListFilter] = Field(None, alias="amazonSellerIds")
+    seller_names: Optional[ListFilter] = Field(None, alias="sellerNames")
+    business_names: Optional[ListFilter] = Field(None, alias="businessNames")
+    include_products: Optional[bool] = Field(None, alias="includeProducts")
+    estimate_sales: Optional[RangeFilter] = Field(None, alias="estimateSales")
+    seller_name: Optional[TextFilter] = Field(None, alias="sellerName")
+    percent_fba: Optional[RangeFilter] = Field(None, alias="percentFba")
+    number_winning_brands: Optional[RangeInt] = Field(None, alias="numberWinningBrands")
+    number_asins: Optional[RangeInt] = Field(None, alias="numberAsins")
+    number_top_asins: Optional[RangeInt] = Field(None, alias="numberTopAsins")
+    num_brands_1000: Optional[RangeInt] = Field(None, alias="numBrands1000")
+    mom_growth: Optional[RangeFilter] = Field(None, alias="moMGrowth")
+    three_month_growth: Optional[RangeFilter] = Field(None, alias="threeMonthGrowth")
+    six_month_growth: Optional[RangeFilter] = Field(None, alias="sixMonthGrowth")
+    year_growth: Optional[RangeFilter] = Field(None, alias="yearGrowth")
+    mom_growth_count: Optional[RangeInt] = Field(None, alias="moMGrowthCount")
+    six_month_growth_count: Optional[RangeInt] = Field(None, alias="sixMonthGrowthCount")
+    street: Optional[TextFilter] = None
+    city: Optional[TextFilter] = None
+    state: Optional[TextFilter] = None
+    country: Optional[TextFilter] = None
+    zip_code: Optional[TextFilter] = Field(None, alias="zipCode")
+    business_name: Optional[TextFilter] = Field(None, alias="businessName")
+    number_reviews_lifetime: Optional[RangeInt] = Field(None, alias="numberReviewsLifetime")
+    number_reviews_30_days: Optional[RangeInt] = Field(None, alias="numberReviews30Days")
+    is_suspended: Optional[bool] = Field(None, alias="isSuspended")
+    last_suspended_date: Optional[datetime] = Field(None, alias="lastSuspendedDate")
+
+class SellersOffersRequest(OperationRequest):
+    """Request for `GET /api/v1/sellers/{AmazonSellerId}/offers`."""
+    amazon_seller_id: str = Field(..., alias="AmazonSellerId")
+
+class SellersBrandsRequest(OperationRequest):
+    """Request for `GET /api/v1/sellers/{AmazonSellerId}/brands`."""
+    amazon_seller_id: str = Field(..., alias="AmazonSellerId")
+
+class SellersHistoryRequest(OperationRequest):
+    """Request for `GET /api/v1/sellers/{AmazonSellerId}/history`."""
+    amazon_seller_id: str = Field(..., alias="AmazonSellerId")
+
+class SubcategoriesSearchRequest(OperationRequest):
+    """Request for `POST /api/v1/subcategories/search`."""
+    id: Optional[int] = None
+    ids: Optional[List[int]] = None
+    parent_id: Optional[int] = Field(None, alias="parentId")
+    total_monthly_revenue: Optional[RangeDecimal] = Field(None, alias="totalMonthlyRevenue")
+    total_brands: Optional[RangeInt] = Field(None, alias="totalBrands")
+    total_asins: Optional[RangeInt] = Field(None, alias="totalAsins")
+    avg_price: Optional[RangeDecimal] = Field(None, alias="avgPrice")
+    avg_reviews: Optional[RangeDecimal] = Field(None, alias="avgReviews")
+    avg_rating: Optional[RangeDecimal] = Field(None, alias="avgRating")
+    az_revenue_pct: Optional[RangeDecimal] = Field(None, alias="azRevenuePct")
+    seller_revenue_pct: Optional[RangeDecimal] = Field(None, alias="sellerRevenuePct")
+    avg_number_sellers: Optional[RangeDecimal] = Field(None, alias="avgNumberSellers")
+    avg_page_score: Optional[RangeDecimal] = Field(None, alias="avgPageScore")
+    avg_volume: Optional[RangeDecimal] = Field(None, alias="avgVolume")
+    total_number_units_sold: Optional[RangeInt] = Field(None, alias="totalNumberUnitsSold")
+    total_reviews: Optional[RangeInt] = Field(None, alias="totalReviews")
+    subcategory_context_name: Optional[TextFilter] = Field(None, alias="subcategoryContextName")
+    subcategory_name: Optional[TextFilter] = Field(None, alias="subcategoryName")
+
+class SubcategoriesBrandsRequest(OperationRequest):
+    """Request for `POST /api/v1/subcategories/{SubcategoryId}/brands`."""
+    subcategory_id: str = Field(..., alias="SubcategoryId")
+    brand_name: Optional[str] = Field(None, alias="brandName")
+
+class SubcategoriesHistorySalesRequest(OperationRequest):
+    """Request for `POST /api/v1/subcategories/{SubcategoryId}/history/sales`."""
+    subcategory_id: str = Field(..., alias="SubcategoryId")
+    brand_name: Optional[str] = Field(None, alias="brandName")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class SubcategoriesHistorySalesByBrandsRequest(OperationRequest):
+    """Request for `POST /api/v1/subcategories/{SubcategoryId}/history/sales-by-brands`."""
+    subcategory_id: str = Field(..., alias="SubcategoryId")
+    brand_name: Optional[str] = Field(None, alias="brandName")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class SubcategoriesHistoryTopProductsSalesRequest(OperationRequest):
+    """Request for `POST /api/v1/subcategories/{SubcategoryId}/history/top-products/sales`."""
+    subcategory_id: str = Field(..., alias="SubcategoryId")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class SubcategoriesHistoryTopProductsSalesRankRequest(OperationRequest):
+    """Request for `POST /api/v1/subcategories/{SubcategoryId}/history/top-products/sales-rank`."""
+    subcategory_id: str = Field(..., alias="SubcategoryId")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class SubcategoriesHistoryScopeRequest(OperationRequest):
+    """Request for `POST /api/v1/subcategories/{SubcategoryId}/history/scope`."""
+    subcategory_id: str = Field(..., alias="SubcategoryId")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class SubcategoriesHistoryScopeByBrandsRequest(OperationRequest):
+    """Request for `POST /api/v1/subcategories/{SubcategoryId}/history/scope/by-brands`."""
+    subcategory_id: str = Field(..., alias="SubcategoryId")
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class SubcategoriesHistoryScopeTopProductsRequest(OperationRequest):
+    """Request for `POST /api/v1/subcategories/{SubcategoryId}/history/scope/top-products`."""
+    subcategory_id: str = Field(..., alias="SubcategoryId")
+    top_by: Optional[str] = Field(None, alias="topBy")
+    top: Optional[int] = None
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+
+class SubcategoriesHierarchyRequest(OperationRequest):
+    """Request for `GET /api/v1/subcategories/{SubcategoryId}/hierarchy`."""
+    subcategory_id: int = Field(..., alias="SubcategoryId")
+
+class SubcategoriesHierarchyPostRequest(OperationRequest):
+    """Request for `POST /api/v1/subcategories/{SubcategoryId}/hierarchy`."""
+    subcategory_id: int = Field(..., alias="SubcategoryId")
+
+__all__ = [
+    "Brand",
+    "BrandCoverage",
+    "BrandSalesHistory",
+    "BrandScope",
+    "BrandScopeBySubcategory",
+    "BrandSearchTerm",
+    "DailyRank",
+    "EstimatedUnitSalesHistory",
+    "Product",
+    "ProductHistory",
+    "ProductOffer",
+    "ProductSalesHistory",
+    "ProductSalesRankHistory",
+    "RelevantProduct",
+    "RelevantSearchTerm",
+    "SalesEstimate",
+    "ScopeHistory",
+    "SearchTerm",
+    "SearchTermBrand",
+    "SearchTermHistory",
+    "SearchTermProductRank",
+    "Seller",
+    "SellerHistory",
+    "SellerOffer",
+    "Subcategory",
+    "SubcategoryBrand",
+    "SubcategorySalesHistory",
+    "SubcategoryScope",
+    "SubcategoryScopeByBrand",
+    "TopProductScope",
+    "AdSpySearchRequest",
+    "AdSpyBrandsRequest",
+    "AdSpySponsoredProductsRequest",
+    "BrandsSearchRequest",
+    "BrandsMarketShareRequest",
+    "BrandsSellersRequest",
+    "BrandsAdSpyRequest",
+    "BrandsHistorySalesRequest",
+    "BrandsHistorySalesBySubcategoriesRequest",
+    "BrandsHistoryTopProductsSalesRequest",
+    "BrandsHistoryTopProductsSalesRankRequest",
+    "BrandsSearchV2Request",
+    "BrandsMarketShareV2Request",
+    "BrandsSellersV2Request",
+    "BrandsAdSpyV2Request",
+    "BrandsHistorySalesV2Request",
+    "BrandsHistorySalesBySubcategoriesV2Request",
+    "BrandsHistoryTopProductsSalesV2Request",
+    "BrandsHistoryTopProductsSalesRankV2Request",
+    "BrandsHistoryScopeV2Request",
+    "BrandsHistoryScopeBySubcategoriesV2Request",
+    "BrandsHistoryScopeTopProductsV2Request",
+    "ProductsSearchRequest",
+    "ProductsHistoryRequest",
+    "ProductsHistoryScopeRequest",
+    "ProductsOffersRequest",
+    "SalesEstimateRequest",
+    "SearchTermsSearchRequest",
+    "SearchTermsOrganicRanksRequest",
+    "SearchTermsRelevantProductsRequest",
+    "SearchTermsRelevantSearchTermsRequest",
+    "SearchTermsHistoryRequest",
+    "SellersSearchRequest",
+    "SellersOffersRequest",
+    "SellersBrandsRequest",
+    "SellersHistoryRequest",
+    "SubcategoriesSearchRequest",
+    "SubcategoriesBrandsRequest",
+    "SubcategoriesHistorySalesRequest",
+    "SubcategoriesHistorySalesByBrandsRequest",
+    "SubcategoriesHistoryTopProductsSalesRequest",
+    "SubcategoriesHistoryTopProductsSalesRankRequest",
+    "SubcategoriesHistoryScopeRequest",
+    "SubcategoriesHistoryScopeByBrandsRequest",
+    "SubcategoriesHistoryScopeTopProductsRequest",
+    "SubcategoriesHierarchyRequest",
+    "SubcategoriesHierarchyPostRequest",
+]
@@ -0,0 +1,101 @@
+# src/smartscout/operations.py
+
+import importlib
+import re
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, Mapping, NamedTuple, Optional, Tuple, Type
+from urllib.parse import quote
+
+from pydantic import BaseModel
+
+from .models.base import BaseRequest
+
+Serialized = Tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]
+
+class Operation(NamedTuple):
+    """
+    One operation of the API spec, as emitted by `smartscout.codegen` into `smartscout.endpoints`.
+
+    `serialize` is the operation's generated serializer: it turns a request model into the
+    concrete path, query parameters and JSON body (or None) with every field already mapped to
+    its wire name and location, so no model introspection happens per call.
+    """
+    name: str
+    method: str
+    path: str
+    request_model: Type[BaseRequest]
+    response_model: Type[BaseModel]
+    paged: bool
+    serialize: Callable[[Any], Serialized]
+
+# (method, path, request model name, response model name, paged, serializer)
+OperationSpec = Tuple[str, str, str, str, bool, Callable[[Any], Serialized]]
+
+class OperationTable(Mapping[str, Operation]):
+    """
+    Read-only `name -> Operation` mapping whose models are resolved on first lookup.
+
+    Model classes are named rather than referenced, so the module defining them (and every
+    pydantic class in it) is only imported once an operation is actually used.
+    """
+
+    def __init__(self, module: str, package: Optional[str], specs: Dict[str, OperationSpec]):
+        self._module = module
+        self._package = package
+        self._specs = specs
+        self._operations: Dict[str, Operation] = {}
+
+    def __getitem__(self, name: str) -> Operation:
+        operation = self._operations.get(name)
+        if operation is None:
+            method, path, request_model, response_model, paged, serialize = self._specs[name]
+            models = importlib.import_module(self._module, self._package)
+            operation = self._operations[name] = Operation(
+                name, method, path, getattr(models, request_model), getattr(models, response_model), paged, serialize
+            )
+        return operation
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+def scalar(value: Any) -> Any:
+    """Wire value of a string/number field: enums become their value, dates ISO 8601 strings."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+def segment(value: Any) -> str:
+    """Percent-encode a path parameter."""
+    return quote(str(scalar(value)), safe="")
+
+def paging_query(request: Any) -> Dict[str, Any]:
+    """Query parameters shared by every operation: marketplace, `page[...]` and `sort[...]`."""
+    query = {"marketplace": scalar(request.marketplace)}
+    page = request.page
+    if page is not None:
+        if page.id is not None:
+            query["page[id]"] = page.id
+        if page.size is not None:
+            query["page[size]"] = page.size
+    sort = request.sort
+    if sort is not None:
+        if sort.by is not None:
+            query["sort[by]"] = sort.by
+        if sort.order is not None:
+            query["sort[order]"] = scalar(sort.order)
+    return query
+
+def request_url(base_url: str, endpoint: str) -> str:
+    """
+    Full URL of a request: spec paths (`/api/v1/...`, `/api/v2/...`) are resolved against the
+    host of `base_url`, anything else is appended to `base_url` as before.
+    """
+    if endpoint.startswith("/api/"):
+        return re.sub(r"(/api)?/v\d+$", "", base_url) + endpoint
+    return f"{base_url}{endpoint}"
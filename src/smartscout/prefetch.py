@@ -0,0 +1,177 @@
+# src/smartscout/prefetch.py
+
+import queue
+import threading
+import time
+from typing import Any, AsyncIterator, Generic, Iterator, Optional, TypeVar
+
+P = TypeVar("P")
+
+_DONE = object()
+
+class PrefetchingPager(Generic[P]):
+    """
+    Iterate pages on a background thread, keeping up to `depth` fetched and decoded pages ready.
+
+    Cursor pagination is serial, but the next request can go out as soon as a page's
+    `nextPageId` is known instead of after the caller is done with the page. Here the fetcher
+    runs ahead of the consumer by at most `depth` pages (plus the one in flight), so slow
+    consumer work such as database writes overlaps with the network instead of adding to it,
+    and memory stays bounded when the consumer is the bottleneck.
+
+    Exceptions raised while fetching are re-raised in the consumer at the point they occurred.
+    Closing the pager (or leaving its `with` block) stops the fetcher after its in-flight
+    request; `client.iter_pages(..., prefetch=n)` does this for you. The asyncio counterpart is
+    `AsyncPrefetchingPager`.
+
+    Args:
+        pages: The page iterator to run ahead, typically `client.iter_pages(...)`.
+        depth: Pages buffered ahead of the consumer.
+
+    Example:
+        ```python
+        with PrefetchingPager(client.iter_pages(client.search_products, request), depth=2) as pages:
+            for page in pages:
+                db.insert_many(page.data)
+        ```
+    """
+
+    def __init__(self, pages: Iterator[P], depth: int = 2):
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        self.depth = depth
+        self.waited = 0.0  # seconds the consumer spent waiting for pages
+        self._pages = pages
+        self._ready: "queue.Queue" = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(target=self._fetch, name="smartscout-prefetch", daemon=True)
+        self._thread.start()
+
+    def _put(self, item: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._ready.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fetch(self) -> None:
+        try:
+            for page in self._pages:
+                if not self._put((page, None)):
+                    return
+            self._put((_DONE, None))
+        except BaseException as e:
+            self._put((None, e))
+        finally:
+            close = getattr(self._pages, "close", None)
+            if close is not None:
+                close()
+
+    def __iter__(self) -> "PrefetchingPager[P]":
+        return self
+
+    def __next__(self) -> P:
+        if self._finished:
+            raise StopIteration
+        start = time.perf_counter()
+        page, error = self._ready.get()
+        self.waited += time.perf_counter() - start
+        if error is not None:
+            self.close()
+            raise error
+        if page is _DONE:
+            self.close()
+            raise StopIteration
+        return page
+
+    def close(self) -> None:
+        """
+        Stop fetching and wait for the background thread to exit.
+        """
+        self._finished = True
+        self._stop.set()
+        self._thread.join()
+
+    def __enter__(self) -> "PrefetchingPager[P]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class AsyncPrefetchingPager(Generic[P]):
+    """
+    asyncio counterpart of `PrefetchingPager`: a background task fetches and decodes up to
+    `depth` pages ahead of the consumer.
+
+    Must be created inside a running event loop. Use `async with` or `aclose()` to cancel the
+    fetcher when the consumer stops early; `client.iter_pages(..., prefetch=n)` does this for you.
+    """
+
+    def __init__(self, pages: AsyncIterator[P], depth: int = 2):
+        import asyncio  # already loaded by any caller; kept off the sync client's import path
+
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        self.depth = depth
+        self.waited = 0.0  # seconds the consumer spent waiting for pages
+        self._pages = pages
+        self._ready: "asyncio.Queue" = asyncio.Queue(maxsize=depth)
+        self._finished = False
+        self._task: Optional["asyncio.Task"] = asyncio.get_running_loop().create_task(self._fetch())
+
+    async def _fetch(self) -> None:
+        import asyncio
+
+        try:
+            async for page in self._pages:
+                await self._ready.put((page, None))
+            await self._ready.put((_DONE, None))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await self._ready.put((None, e))
+        finally:
+            aclose = getattr(self._pages, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def __aiter__(self) -> "AsyncPrefetchingPager[P]":
+        return self
+
+    async def __anext__(self) -> P:
+        if self._finished:
+            raise StopAsyncIteration
+        start = time.perf_counter()
+        page, error = await self._ready.get()
+        self.waited += time.perf_counter() - start
+        if error is not None:
+            await self.aclose()
+            raise error
+        if page is _DONE:
+            await self.aclose()
+            raise StopAsyncIteration
+        return page
+
+    async def aclose(self) -> None:
+        """
+        Cancel the fetcher task and wait for it to finish.
+        """
+        import asyncio
+
+        self._finished = True
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def __aenter__(self) -> "AsyncPrefetchingPager[P]":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -0,0 +1,148 @@
+# src/smartscout/ratelimit.py
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+class TokenBucket:
+    """
+    Client-side token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Each request takes one token;
+    when the bucket is empty the caller waits for its reserved slot instead of polling, so waiting
+    callers are released evenly spaced rather than all at once.
+
+    A single instance is safe to share between threads (`acquire`) and asyncio tasks
+    (`acquire_async`), and between several sync and async clients drawing on the same quota.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            rate: Sustained requests per second.
+            burst: Maximum number of requests that may be made back to back. Defaults to `rate`
+                (at least 1).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        # No token is handed out before this monotonic time; set by `penalize`.
+        self._not_before = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        # Tokens do not accumulate while a penalty is in force.
+        start = max(self._updated, self._not_before)
+        if now > start:
+            self._tokens = min(self.capacity, self._tokens + (now - start) * self.rate)
+        self._updated = max(self._updated, now)
+
+    def _reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take `tokens` from the bucket and return how many seconds the caller must wait before use.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = max(0.0, self._not_before - now)
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return wait
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Block the current thread until `tokens` are available.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """
+        Wait without blocking the event loop until `tokens` are available.
+        """
+        import asyncio  # already loaded by any caller; kept off the sync client's import path
+
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self, delay: float) -> None:
+        """
+        Hold every caller sharing this bucket until `delay` seconds from now.
+
+        Used when the server answers 429 so that all workers back off together instead of each
+        discovering the limit on its own. Penalties do not add up: workers hitting the same 429
+        together all move the same deadline, to the latest of their `Retry-After` values. Once it
+        passes, callers are released one at a time at `rate` rather than in a burst.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._not_before = max(self._not_before, now + delay)
+            self._tokens = min(self._tokens, 1.0)
+
+class RetryPolicy:
+    """
+    Retry settings for transient failures: 429, 5xx responses and connection errors.
+
+    Retries use "full jitter" exponential backoff, a random delay between 0 and
+    `backoff_factor * 2 ** attempt` capped at `max_backoff`, so workers that failed together do
+    not retry together. When the server sends `Retry-After`, that delay is honoured, plus a small
+    random spread.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        retry_on_connection_errors: bool = True,
+        respect_retry_after: bool = True,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_on_connection_errors = retry_on_connection_errors
+        self.respect_retry_after = respect_retry_after
+
+    def should_retry_status(self, status_code: int, attempt: int) -> bool:
+        return attempt < self.max_retries and status_code in self.retry_statuses
+
+    def should_retry_error(self, attempt: int) -> bool:
+        return attempt < self.max_retries and self.retry_on_connection_errors
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Seconds to wait before retry number `attempt + 1`.
+        """
+        if retry_after is not None and self.respect_retry_after:
+            return min(retry_after, self.max_backoff) + random.uniform(0, self.backoff_factor)
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a `Retry-After` header given either as delta-seconds or as an HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,522 @@
+# src/smartscout/replica.py
+
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
+from .models.base import BaseRequest, ListFilter, RangeDecimal, RangeFilter, RangeInt, SortOptions, TextFilter
+from .models.enums import SortOrder, TextFilterType
+
+# How a request filter is evaluated against a row.
+RANGE, TEXT, LIST, EQUAL = "range", "text", "list", "equal"
+
+class Column(NamedTuple):
+    """
+    A request filter that can be evaluated locally: the row attribute `path` it applies to, and
+    whether it is a range, text, list or plain equality filter.
+    """
+    path: Tuple[str, ...]
+    kind: str
+
+class Dataset(NamedTuple):
+    """
+    How rows of one search endpoint are identified (`key`) and filtered (`columns`, keyed by
+    request field name). Request filters without a column are only answered by the API.
+    """
+    key: Tuple[str, ...]
+    columns: Dict[str, Column]
+
+def _columns(**columns: Tuple[str, str]) -> Dict[str, Column]:
+    return {name: Column(tuple(path.split(".")), kind) for name, (path, kind) in columns.items()}
+
+DATASETS: Dict[str, Dataset] = {
+    "search_products": Dataset(("asin",), _columns(
+        subcategory_id=("subcategory.id", EQUAL),
+        brand_name=("brand", TEXT),
+        category_name=("category.name", TEXT),
+        subcategory_name=("subcategory.name", TEXT),
+        rank=("sales_rank", RANGE),
+        monthly_revenue_estimate=("estimated_monthly_revenue.amount", RANGE),
+        number_of_sellers=("number_of_sellers", RANGE),
+        number_fba_sellers=("number_of_fba_sellers", RANGE),
+        review_count=("reviews.total_reviews", RANGE),
+        review_rating=("rating", RANGE),
+        buy_box_price=("buy_box_price.amount", RANGE),
+        is_variation=("is_variation", EQUAL),
+        asins=("asin", LIST),
+        asin=("asin", TEXT),
+        parent_asin=("parent_asin", TEXT),
+        title=("title", TEXT),
+        total_ratings=("total_ratings", RANGE),
+    )),
+    "search_brands": Dataset(("brand_name",), _columns(
+        brand_names=("brand_name", LIST),
+        brand_name=("brand_name", TEXT),
+        amazon_isr=("amazon_isr", RANGE),
+        avg_sellers=("avg_sellers", RANGE),
+        avg_price=("avg_price", RANGE),
+        avg_volume=("avg_volume", RANGE),
+        review_rating=("review_rating", RANGE),
+        total_reviews=("total_reviews", RANGE),
+        total_products=("total_products", RANGE),
+        avg_fba_sellers=("avg_fba_sellers", RANGE),
+        brand_score=("brand_score", RANGE),
+        monthly_revenue=("monthly_revenue", RANGE),
+        category_name=("category_name", TEXT),
+        subcategory_name=("subcategory_name", TEXT),
+        has_storefront=("has_storefront", EQUAL),
+        month_growth=("month_growth", RANGE),
+        month_growth_12=("month_growth_12", RANGE),
+        trailing_12_months=("trailing_12_months", RANGE),
+    )),
+    "search_sellers": Dataset(("seller_id",), _columns(
+        amazon_seller_id=("seller_id", TEXT),
+        amazon_seller_ids=("seller_id", LIST),
+        seller_names=("seller_name", LIST),
+        business_names=("business_name", LIST),
+        seller_name=("seller_name", TEXT),
+        business_name=("business_name", TEXT),
+    )),
+    "search_search_terms": Dataset(("search_term",), _columns(
+        search_term_value=("search_term", TEXT),
+        estimate_searches=("search_volume", RANGE),
+        estimated_cpc=("cpc", RANGE),
+    )),
+}
+
+_RANGES = (RangeInt, RangeFilter, RangeDecimal)
+
+def _value(row: Any, path: Tuple[str, ...]) -> Any:
+    for name in path:
+        if row is None:
+            return None
+        row = row.get(name) if isinstance(row, dict) else getattr(row, name, None)
+    return row
+
+def _fold(value: Any) -> Any:
+    # Text and equality matching is case-insensitive; ids such as `subcategory.id` compare as text.
+    if value is None or isinstance(value, bool):
+        return value
+    return str(value).casefold()
+
+def _filters(request: BaseRequest) -> Dict[str, Any]:
+    """
+    The request's filters by field name, without paging, sorting and filters that match everything.
+    """
+    filters = {}
+    for name in type(request).__fields__:
+        if name in ("page", "sort"):
+            continue
+        value = getattr(request, name)
+        if value is None:
+            continue
+        if isinstance(value, _RANGES) and value.min is None and value.max is None:
+            continue
+        if isinstance(value, (TextFilter, ListFilter)) and not value.filter:
+            continue
+        filters[name] = value
+    return filters
+
+def _narrows(value: Any, scope: Any) -> bool:
+    """
+    Whether every row matching filter `value` also matches filter `scope`.
+    """
+    if value == scope:
+        return True
+    if isinstance(value, _RANGES) and isinstance(scope, _RANGES):
+        return (scope.min is None or (value.min is not None and value.min >= scope.min)) and (
+            scope.max is None or (value.max is not None and value.max <= scope.max)
+        )
+    if isinstance(value, ListFilter) and isinstance(scope, ListFilter):
+        return {_fold(item) for item in value.filter} <= {_fold(item) for item in scope.filter}
+    if isinstance(value, TextFilter) and isinstance(scope, TextFilter) and value.type == scope.type:
+        needle, within = _fold(value.filter), _fold(scope.filter)
+        if value.type is TextFilterType.STARTS_WITH:
+            return needle.startswith(within)
+        if value.type is TextFilterType.ENDS_WITH:
+            return needle.endswith(within)
+        if value.type is TextFilterType.CONTAINS:
+            return within in needle
+    return False
+
+def _local(value: Any) -> bool:
+    # Text filters without a type have no documented matching rule, so they are left to the API.
+    return not (isinstance(value, TextFilter) and value.type is None)
+
+def _predicate(column: Column, value: Any) -> Callable[[Any], bool]:
+    """
+    A test of one row value against a request filter, for filters not answered by an index.
+    Text, list and equality filters are tested against case-folded values (see `_Table.values`).
+    """
+    if column.kind == RANGE:
+        low, high = value.min, value.max
+        return lambda found: found is not None and (low is None or found >= low) and (high is None or found <= high)
+    if column.kind == LIST:
+        return {_fold(item) for item in value.filter}.__contains__
+    if column.kind == EQUAL:
+        target = _fold(value)
+        return lambda found: found == target
+    needle = _fold(value.filter)
+    if value.type is TextFilterType.EXACT:
+        return lambda found: found == needle
+    if value.type is TextFilterType.STARTS_WITH:
+        return lambda found: found is not None and found.startswith(needle)
+    if value.type is TextFilterType.ENDS_WITH:
+        return lambda found: found is not None and found.endswith(needle)
+    return lambda found: found is not None and needle in found
+
+class _RangeIndex:
+    """Row ids sorted by a numeric value, for `[min, max]` lookups by bisection."""
+
+    def __init__(self, values: List[Any]):
+        pairs = sorted((value, row_id) for row_id, value in enumerate(values) if value is not None)
+        self.keys = [value for value, _ in pairs]
+        self.ids = [row_id for _, row_id in pairs]
+
+    def _span(self, value: Any) -> Tuple[int, int]:
+        start = 0 if value.min is None else bisect_left(self.keys, value.min)
+        end = len(self.keys) if value.max is None else bisect_right(self.keys, value.max)
+        return start, end
+
+    def estimate(self, column: Column, value: Any) -> int:
+        start, end = self._span(value)
+        return max(end - start, 0)
+
+    def lookup(self, column: Column, value: Any) -> List[int]:
+        start, end = self._span(value)
+        return self.ids[start:end]
+
+class _TextIndex:
+    """
+    Row ids by (case-folded) value. Sorted value and reversed-value arrays (for prefix and suffix
+    lookups) and a trigram index (for substring lookups) are built on first use.
+    """
+
+    def __init__(self, values: List[Any]):
+        self.exact: Dict[Any, List[int]] = {}
+        self.size = 0
+        for row_id, value in enumerate(values):
+            if value is not None:
+                self.exact.setdefault(value, []).append(row_id)
+                self.size += 1
+        self._prefixes: Optional[List[str]] = None
+        self._suffixes: Optional[List[str]] = None
+        self._trigrams: Optional[Dict[str, Set[str]]] = None
+
+    def _sorted(self, suffix: bool) -> List[str]:
+        if self._prefixes is None:
+            self._prefixes = sorted(self.exact)
+            self._suffixes = sorted(value[::-1] for value in self.exact)
+        return self._suffixes if suffix else self._prefixes
+
+    def _trigram_index(self) -> Dict[str, Set[str]]:
+        if self._trigrams is None:
+            self._trigrams = {}
+            for value in self.exact:
+                for i in range(len(value) - 2):
+                    self._trigrams.setdefault(value[i:i + 3], set()).add(value)
+        return self._trigrams
+
+    def _values(self, column: Column, value: Any, build: bool = True) -> Optional[Iterable[str]]:
+        """The distinct indexed values matching the filter, or None when unknown without building an index."""
+        if column.kind == LIST:
+            return {_fold(item) for item in value.filter}
+        if column.kind == EQUAL:
+            return (_fold(value),)
+        needle = _fold(value.filter)
+        if value.type is TextFilterType.EXACT:
+            return (needle,)
+        if value.type in (TextFilterType.STARTS_WITH, TextFilterType.ENDS_WITH):
+            suffix = value.type is TextFilterType.ENDS_WITH
+            ordered = self._sorted(suffix)
+            prefix = needle[::-1] if suffix else needle
+            found = ordered[bisect_left(ordered, prefix):bisect_left(ordered, prefix + "\U0010ffff")]
+            return [item[::-1] for item in found] if suffix else found
+        if len(needle) < 3:
+            return [item for item in self.exact if needle in item]
+        if self._trigrams is None and not build:
+            return None
+        trigrams = self._trigram_index()
+        postings = sorted((trigrams.get(needle[i:i + 3], set()) for i in range(len(needle) - 2)), key=len)
+        return [item for item in postings[0].intersection(*postings[1:]) if needle in item]
+
+    def estimate(self, column: Column, value: Any) -> int:
+        # Substring filters only use the trigram index once it exists; until then they are
+        # assumed to match everything, so that a cheaper filter drives the lookup.
+        values = self._values(column, value, build=False)
+        if values is None:
+            return self.size
+        return sum(len(self.exact.get(item, ())) for item in values)
+
+    def lookup(self, column: Column, value: Any) -> List[int]:
+        ids: List[int] = []
+        for item in self._values(column, value):
+            ids.extend(self.exact.get(item, ()))
+        return ids
+
+class _Scope(NamedTuple):
+    """
+    One request answered in full by the API: its filters and sort, its row ids mapped to their
+    position in the API's order, and its load time.
+    """
+    filters: Dict[str, Any]
+    sort: Optional[SortOptions]
+    positions: Dict[int, int]
+    loaded_at: float
+
+class _Table:
+    def __init__(self, dataset: Dataset):
+        self.dataset = dataset
+        self.rows: List[Any] = []
+        self.ids: Dict[Any, int] = {}
+        self.scopes: List[_Scope] = []
+        self.indexes: Dict[Tuple[str, ...], Any] = {}
+
+    def upsert(self, rows: Iterable[Any]) -> Tuple[List[int], List[int]]:
+        """Store `rows`; returns the row id of each, and the ids of rows that replaced older ones."""
+        ids, replaced = [], []
+        for row in rows:
+            key = _value(row, self.dataset.key)
+            row_id = self.ids.get(key)
+            if row_id is None:
+                row_id = self.ids[key] = len(self.rows)
+                self.rows.append(row)
+            else:
+                self.rows[row_id] = row
+                replaced.append(row_id)
+            ids.append(row_id)
+        # Indexes are rebuilt on the next query that needs them.
+        self.indexes.clear()
+        return ids, replaced
+
+    def revalidate(self, scope: _Scope, filters: Dict[str, Any], replaced: List[int]) -> Optional[_Scope]:
+        """
+        `scope` after some of its rows were replaced by the result of a request with `filters`:
+        rows that no longer match the scope's own filters are dropped from it. None when that
+        cannot be decided locally (a scope filter without a column), so the scope is discarded.
+        """
+        changed = [row_id for row_id in replaced if row_id in scope.positions]
+        if not changed:
+            return scope
+        checks = []
+        for name, value in scope.filters.items():
+            if filters.get(name) == value:
+                # The new rows were returned for this very filter.
+                continue
+            column = self.dataset.columns.get(name)
+            if column is None or not _local(value):
+                return None
+            checks.append((column, _predicate(column, value)))
+        positions = scope.positions
+        for row_id in changed:
+            row = self.rows[row_id]
+            for column, check in checks:
+                found = _value(row, column.path)
+                if not check(found if column.kind == RANGE else _fold(found)):
+                    if positions is scope.positions:
+                        positions = dict(positions)
+                    del positions[row_id]
+                    break
+        return scope._replace(positions=positions)
+
+    def values(self, column: Column) -> List[Any]:
+        """The column's value for every row id; case-folded unless it is a range column."""
+        key = ("values", column.kind == RANGE) + column.path
+        values = self.indexes.get(key)
+        if values is None:
+            values = [_value(row, column.path) for row in self.rows]
+            if column.kind != RANGE:
+                values = [_fold(value) for value in values]
+            self.indexes[key] = values
+        return values
+
+    def index(self, column: Column) -> Any:
+        key = (column.kind,) + column.path
+        index = self.indexes.get(key)
+        if index is None:
+            values = self.values(column)
+            index = self.indexes[key] = _RangeIndex(values) if column.kind == RANGE else _TextIndex(values)
+        return index
+
+class Replica:
+    """
+    In-memory replica of search results, queried locally with the same request models as the API.
+
+    Every request the replica fetches (with `load`, or on a miss in `search`) is remembered as a
+    scope: the rows it returned are the complete answer to its filters as of that time. A later
+    `search` whose filters are the same as, or narrower than, a scope fresher than `max_age` is
+    answered from memory: filters that differ from the scope are evaluated on indexes built on
+    first use (sorted arrays for `RangeInt`/`RangeFilter`/`RangeDecimal`, a value map for
+    `ListFilter` and exact matches, sorted value and reversed-value arrays for `startsWith` and
+    `endsWith`, and a trigram index for `contains`), then `sort` is applied. Anything else, such
+    as a wider range, a filter with no local column (see `DATASETS`), a text filter without a
+    `type`, or a stale scope, is sent to the API and becomes a new scope.
+
+    Text and list matching is case-insensitive. `page` is ignored: `search` returns every
+    matching row.
+
+    All scopes of an endpoint share one row per key, so rows fetched later replace older copies.
+    When that happens, the older scopes' filters are checked against the new rows: rows that no
+    longer match leave those scopes, and a scope whose filters cannot be checked locally (e.g. a
+    different `marketplace`) is discarded.
+
+    Args:
+        client: A `SmartScoutAPIClient`, used to fetch missing or stale data.
+        max_age: Seconds a scope is used for before it is fetched again. None never expires.
+        page_size: Page size used when fetching from the API.
+
+    Example:
+        ```python
+        replica = Replica(client, max_age=6 * 60 * 60)
+        replica.load(client.search_products, SearchProductsRequest(marketplace="US", subcategory_id=1234))
+
+        # Answered locally, in milliseconds
+        top = replica.search(client.search_products, SearchProductsRequest(
+            marketplace="US", subcategory_id=1234, rank={"max": 5000},
+            title={"type": "contains", "filter": "yoga"}, sort={"sort[by]": "rank"}))
+        ```
+    """
+
+    def __init__(self, client: Any = None, max_age: Optional[float] = 24 * 60 * 60, page_size: Optional[int] = None, clock: Callable[[], float] = time.monotonic):
+        self.client = client
+        self.max_age = max_age
+        self.page_size = page_size
+        self.clock = clock
+        self.local_queries = 0
+        self.api_queries = 0
+        self._tables: Dict[str, _Table] = {}
+        self._lock = threading.RLock()
+
+    def _dataset(self, method: Union[str, Callable[..., Any]]) -> Tuple[str, Callable[..., Any]]:
+        name = method if isinstance(method, str) else method.__name__
+        if name not in DATASETS:
+            raise ValueError(f"{name!r} cannot be replicated; supported: {', '.join(DATASETS)}")
+        if isinstance(method, str):
+            method = getattr(self.client, name) if self.client is not None else None
+        return name, method
+
+    def _table(self, name: str) -> _Table:
+        table = self._tables.get(name)
+        if table is None:
+            table = self._tables[name] = _Table(DATASETS[name])
+        return table
+
+    def add(self, method: Union[str, Callable[..., Any]], request: BaseRequest, rows: Iterable[Any], loaded_at: Optional[float] = None) -> int:
+        """
+        Store `rows` as the complete result of `request`, e.g. rows read back from an export.
+        Returns the number of rows stored.
+        """
+        name, _ = self._dataset(method)
+        with self._lock:
+            table = self._table(name)
+            ids, replaced = table.upsert(rows)
+            positions = {row_id: position for position, row_id in enumerate(dict.fromkeys(ids))}
+            scope = _Scope(_filters(request), request.sort, positions, self.clock() if loaded_at is None else loaded_at)
+            if replaced:
+                table.scopes = [kept for kept in (table.revalidate(existing, scope.filters, replaced) for existing in table.scopes) if kept is not None]
+            table.scopes = [existing for existing in table.scopes if (existing.filters, existing.sort) != (scope.filters, scope.sort)]
+            table.scopes.append(scope)
+        return len(ids)
+
+    def load(self, method: Union[str, Callable[..., Any]], request: BaseRequest, verbose: bool = False) -> int:
+        """
+        Fetch every row matching `request` from the API and store it. Returns the number of rows.
+        """
+        name, method = self._dataset(method)
+        if self.client is None:
+            raise ValueError("the replica has no client to load from")
+        started = self.clock()
+        rows = list(self.client.iter_items(method, request, page_size=self.page_size, verbose=verbose))
+        self.api_queries += 1
+        return self.add(name, request, rows, loaded_at=started)
+
+    def _fresh(self, scope: _Scope) -> bool:
+        return self.max_age is None or self.clock() - scope.loaded_at < self.max_age
+
+    @staticmethod
+    def _sort_path(table: _Table, request: BaseRequest) -> Optional[Tuple[str, ...]]:
+        by = request.sort.by if request.sort is not None else None
+        for field in type(request).__fields__.values():
+            if by in (field.name, field.alias) and field.name in table.dataset.columns:
+                return table.dataset.columns[field.name].path
+        return None
+
+    def _plan(self, table: _Table, request: BaseRequest) -> Optional[Tuple[_Scope, List[str], Optional[Tuple[str, ...]]]]:
+        """
+        The smallest fresh scope covering `request`, the filters still to evaluate on its rows,
+        and the row attribute to sort by (None keeps the scope's order). None if no scope covers it.
+        """
+        filters = _filters(request)
+        sort_path = self._sort_path(table, request)
+        best = None
+        for scope in table.scopes:
+            if not self._fresh(scope):
+                continue
+            if sort_path is None and request.sort is not None and request.sort != scope.sort:
+                continue
+            if not all(name in filters and _narrows(filters[name], value) for name, value in scope.filters.items()):
+                continue
+            pending = [name for name, value in filters.items() if scope.filters.get(name) != value]
+            if not all(name in table.dataset.columns and _local(filters[name]) for name in pending):
+                continue
+            if best is None or len(scope.positions) < len(best[0].positions):
+                best = (scope, pending, sort_path)
+        return best
+
+    def _evaluate(self, table: _Table, request: BaseRequest) -> Optional[List[Any]]:
+        plan = self._plan(table, request)
+        if plan is None:
+            return None
+        scope, pending, sort_path = plan
+        rows = table.rows
+        if not pending:
+            ids: List[int] = list(scope.positions)
+        else:
+            # The filter with the fewest index matches picks the candidates; the others are
+            # checked on those rows only.
+            columns = [(table.dataset.columns[name], getattr(request, name)) for name in pending]
+            columns.sort(key=lambda entry: table.index(entry[0]).estimate(*entry))
+            column, value = columns[0]
+            ids = table.index(column).lookup(column, value)
+            if len(scope.positions) != len(rows):
+                ids = [row_id for row_id in ids if row_id in scope.positions]
+            for column, value in columns[1:]:
+                values, check = table.values(column), _predicate(column, value)
+                ids = [row_id for row_id in ids if check(values[row_id])]
+            ids.sort(key=scope.positions.__getitem__)
+        found = [rows[row_id] for row_id in ids]
+        if sort_path is not None:
+            # Ties keep the API's order, and rows without a value sort last in either direction.
+            keyed = [(_value(row, sort_path), row) for row in found]
+            present = sorted((entry for entry in keyed if entry[0] is not None), key=lambda entry: entry[0], reverse=request.sort.order is SortOrder.DESCENDING)
+            found = [row for _, row in present] + [row for value, row in keyed if value is None]
+        return found
+
+    def search(self, method: Union[str, Callable[..., Any]], request: BaseRequest, verbose: bool = False) -> List[Any]:
+        """
+        Rows matching `request`, answered locally when a fresh scope covers it and otherwise
+        fetched from the API (and stored as a new scope).
+        """
+        name, method = self._dataset(method)
+        with self._lock:
+            rows = self._evaluate(self._table(name), request)
+        if rows is not None:
+            self.local_queries += 1
+            return rows
+        self.load(method, request, verbose=verbose)
+        with self._lock:
+            rows = self._evaluate(self._table(name), request)
+        return rows if rows is not None else []
+
+    def covers(self, method: Union[str, Callable[..., Any]], request: BaseRequest) -> bool:
+        """
+        Whether `search(method, request)` would be answered without calling the API.
+        """
+        name, _ = self._dataset(method)
+        with self._lock:
+            return self._plan(self._table(name), request) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
@@ -0,0 +1,117 @@
+# src/smartscout/serialization.py
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Type
+
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SEQUENCE, SHAPE_SET, SHAPE_SINGLETON, SHAPE_TUPLE_ELLIPSIS, ModelField
+
+Serializer = Callable[[BaseModel], Dict[str, Any]]
+
+_SERIALIZERS: Dict[type, Serializer] = {}
+
+def _plain(value: Any) -> Any:
+    # Fallback for fields whose type is not known when the serializer is compiled.
+    if value is None or isinstance(value, (str, int, float)) and not isinstance(value, Enum):
+        return value
+    if isinstance(value, BaseModel):
+        return to_wire(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {str(key): _plain(item) for key, item in value.items() if item is not None}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_plain(item) for item in value]
+    return value
+
+def _item_expression(type_: Any, name: str) -> str:
+    if isinstance(type_, type):
+        if issubclass(type_, BaseModel):
+            return f"to_wire({name})"
+        if issubclass(type_, Enum):
+            return f"{name}.value"
+        if issubclass(type_, (datetime, date)):
+            return f"{name}.isoformat()"
+        if issubclass(type_, (str, int, float)):
+            return name
+    return f"_plain({name})"
+
+def _expression(field: ModelField) -> str:
+    if field.shape == SHAPE_SINGLETON:
+        return _item_expression(field.type_, "value")
+    if field.shape in (SHAPE_LIST, SHAPE_SEQUENCE, SHAPE_SET, SHAPE_TUPLE_ELLIPSIS):
+        item = _item_expression(field.type_, "item")
+        return "list(value)" if item == "item" else f"[{item} for item in value]"
+    return "_plain(value)"
+
+def compile_serializer(model: Type[BaseModel]) -> Serializer:
+    """
+    Build a function turning an instance of `model` into its wire dict.
+
+    The function is generated once per class: one `if value is not None` per field, keys are
+    the field aliases (`brandName`, `sort[by]`) in sorted order, and nested models, enums and
+    dates are converted by code chosen from the field's declared type, so no per-call
+    introspection happens. The result equals `model.dict(by_alias=True, exclude_none=True)`
+    with enums and dates in their JSON form.
+    """
+    lines = ["def serialize(model):", "    values = model.__dict__", "    wire = {}"]
+    for field in sorted(model.__fields__.values(), key=lambda field: field.alias):
+        lines += [
+            f"    value = values.get({field.name!r})",
+            "    if value is not None:",
+            f"        wire[{field.alias!r}] = {_expression(field)}",
+        ]
+    lines.append("    return wire")
+    namespace: Dict[str, Any] = {"to_wire": to_wire, "_plain": _plain}
+    exec(compile("\n".join(lines), f"<serializer {model.__module__}.{model.__qualname__}>", "exec"), namespace)
+    serialize = namespace["serialize"]
+    serialize.__name__ = serialize.__qualname__ = f"serialize_{model.__name__}"
+    return serialize
+
+def serializer_for(model: Type[BaseModel]) -> Serializer:
+    """The compiled serializer of `model`, built on first use and cached per class."""
+    serialize = _SERIALIZERS.get(model)
+    if serialize is None:
+        serialize = _SERIALIZERS[model] = compile_serializer(model)
+    return serialize
+
+def to_wire(model: BaseModel) -> Dict[str, Any]:
+    """
+    The JSON body of a request model, as sent to the API: aliased keys, None fields left out.
+
+    Example:
+        ```python
+        to_wire(SearchBrandsRequest(marketplace="US", brand_name={"type": "exact", "filter": "Acme"}))
+        # {"brandName": {"filter": "Acme", "type": "exact"}, "marketplace": "US"}
+        ```
+    """
+    serialize = _SERIALIZERS.get(type(model))
+    if serialize is None:
+        serialize = serializer_for(type(model))
+    return serialize(model)
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return to_wire(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+_ENCODER = json.JSONEncoder(separators=(",", ":"), sort_keys=True, ensure_ascii=False, allow_nan=False, check_circular=False, default=_default)
+
+def dumps(value: Any) -> bytes:
+    """
+    Canonical UTF-8 JSON encoding: sorted keys, no whitespace, request models via `to_wire`.
+
+    Equal values always encode to the same bytes, so the output is both the request body and a
+    stable key for caching and de-duplicating requests.
+    """
+    return _ENCODER.encode(value).encode("utf-8")
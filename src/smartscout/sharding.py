@@ -0,0 +1,278 @@
+# src/smartscout/sharding.py
+
+import math
+import queue
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .models.base import BaseRequest, PageOptions, RangeDecimal, RangeFilter, RangeInt
+
+Number = Union[int, float]
+
+# Row attributes tried, in order, to recognise the same row returned by two shards.
+KEY_FIELDS = ("asin", "seller_id", "brand_name", "search_term_value")
+
+class Shard(NamedTuple):
+    """
+    One partition of a sharded scan: the rows whose `field` lies in `[min, max]` (inclusive).
+
+    `min`/`max` of None leave that side open. `data_count` is the row count the API reported for
+    the shard, and `depth` how many times its range was halved from an initial shard.
+    """
+    field: str
+    min: Optional[Number]
+    max: Optional[Number]
+    depth: int = 0
+    data_count: Optional[int] = None
+
+def _adjacent(value: float, up: bool) -> float:
+    # math.nextafter, which needs Python 3.9.
+    if value == 0:
+        return 5e-324 if up else -5e-324
+    bits = struct.unpack("<q", struct.pack("<d", value))[0]
+    bits += 1 if (value > 0) == up else -1
+    return struct.unpack("<d", struct.pack("<q", bits))[0]
+
+def _next(value: Number, integer: bool) -> Number:
+    return value + 1 if integer else _adjacent(value, up=True)
+
+def _previous(value: Number, integer: bool) -> Number:
+    return value - 1 if integer else _adjacent(value, up=False)
+
+def split_range(low: Number, high: Number, integer: bool) -> Optional[Tuple[Tuple[Number, Number], Tuple[Number, Number]]]:
+    """
+    Halve the inclusive range `[low, high]` into two disjoint inclusive ranges, or return None
+    when it cannot be split any further.
+    """
+    middle = (low + high) // 2 if integer else low + (high - low) / 2
+    upper = _next(middle, integer)
+    if middle < low or upper > high:
+        return None
+    return (low, middle), (upper, high)
+
+def initial_ranges(low: Number, high: Number, shards: Union[int, Sequence[Number]], integer: bool) -> List[Tuple[Number, Number]]:
+    """
+    Cut `[low, high]` into disjoint inclusive ranges: `shards` equal-width pieces, or pieces ending
+    at each of the given cut points.
+    """
+    if isinstance(shards, int):
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        step = (high - low) / shards
+        cuts = [low + step * i for i in range(1, shards)]
+        cuts = [math.floor(cut) for cut in cuts] if integer else cuts
+    else:
+        cuts = list(shards)
+    ranges = []
+    start = low
+    for cut in sorted(cut for cut in cuts if low <= cut < high):
+        if cut >= start:
+            ranges.append((start, cut))
+            start = _next(cut, integer)
+    ranges.append((start, high))
+    return ranges
+
+def _row_key(row: Any) -> Hashable:
+    for name in KEY_FIELDS:
+        value = getattr(row, name, None)
+        if value is None and isinstance(row, dict):
+            value = row.get(name)
+        if value is not None:
+            return value
+    raise ValueError(f"cannot tell {type(row).__name__} rows apart; pass key= to the scan")
+
+_DONE = object()
+
+class ShardedScan:
+    """
+    Page through one search as many disjoint range shards at once, yielding every row once.
+
+    `nextPageId` is a serial cursor, so a single crawl fetches one page at a time. A sharded scan
+    instead partitions the request on a numeric range filter (e.g. `rank` of `SearchProductsRequest`
+    or `estimate_sales` of `SearchSellersRequest`) into non-overlapping `[min, max]` shards and
+    pages them concurrently. The first page of each shard reports its `data_count`; a shard
+    holding more than `max_shard_rows` rows is halved and its halves are scanned instead, so
+    skewed ranges (most products have a high rank number, most sellers low sales) are split
+    where the rows actually are. Rows seen in more than one shard, e.g. because their value
+    changed mid-scan, are yielded only once.
+
+    Rows arrive interleaved across shards, so the request's sort order is only kept within a
+    shard. The keys of rows already yielded are held in memory for de-duplication.
+
+    Args:
+        client: A `SmartScoutAPIClient`.
+        method: A paged client method such as `client.search_products`, or its name.
+        request: The search request. It is not modified; an existing `min`/`max` on `field`
+            bounds the scan.
+        field: Name (or alias) of a `RangeInt`/`RangeFilter`/`RangeDecimal` filter of the request.
+        bounds: `(low, high)` used for a side that `request` leaves open. Rows outside the
+            bounds are still returned, by an unsplit tail shard on each open side.
+        shards: Number of equal-width initial shards, or explicit cut points.
+        max_shard_rows: Split shards whose `data_count` exceeds this.
+        max_depth: Stop halving a shard after this many splits.
+        max_workers: Shards paged at once. Requests still draw from the client's `rate_limiter`.
+        page_size: Page size to request.
+        key: Function returning a row's identity; defaults to its ASIN, seller id, brand name or
+            search term.
+
+    Example:
+        ```python
+        scan = client.iter_sharded(client.search_products, request, "rank", bounds=(1, 5_000_000), max_workers=16)
+        for product in scan:
+            store(product)
+        print(len(scan.shards), scan.duplicates)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        method: Union[str, Callable[..., Any]],
+        request: BaseRequest,
+        field: str,
+        bounds: Optional[Tuple[Number, Number]] = None,
+        shards: Union[int, Sequence[Number]] = 8,
+        max_shard_rows: int = 10_000,
+        max_depth: int = 16,
+        max_workers: int = 8,
+        page_size: Optional[int] = None,
+        key: Optional[Callable[[Any], Hashable]] = None,
+        verbose: bool = False,
+        buffer: int = 1024,
+    ):
+        self.client = client
+        self.method = getattr(client, method) if isinstance(method, str) else method
+        self.request = request
+        self.field, self.range_model = self._resolve_field(request, field)
+        self.integer = self.range_model is RangeInt
+        self.max_shard_rows = max_shard_rows
+        self.max_depth = max_depth
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.key = key or _row_key
+        self.verbose = verbose
+        self.buffer = buffer
+        self.plan = self._plan(bounds, shards)
+        self.shards: List[Shard] = []  # shards scanned to the end, with their data_count
+        self.duplicates = 0
+
+    @staticmethod
+    def _resolve_field(request: BaseRequest, field: str) -> Tuple[str, type]:
+        for model_field in type(request).__fields__.values():
+            if field in (model_field.name, model_field.alias):
+                if model_field.type_ not in (RangeInt, RangeFilter, RangeDecimal):
+                    raise ValueError(f"{field!r} is not a numeric range filter of {type(request).__name__}")
+                return model_field.name, model_field.type_
+        raise ValueError(f"{type(request).__name__} has no field {field!r}")
+
+    def _plan(self, bounds: Optional[Tuple[Number, Number]], shards: Union[int, Sequence[Number]]) -> List[Shard]:
+        current = getattr(self.request, self.field)
+        low = current.min if current is not None else None
+        high = current.max if current is not None else None
+        open_low, open_high = low is None, high is None
+        if bounds is not None:
+            low = bounds[0] if open_low else low
+            high = bounds[1] if open_high else high
+        if low is None or high is None:
+            raise ValueError(f"the request does not bound {self.field!r}; pass bounds=(low, high)")
+        if low > high:
+            raise ValueError(f"empty range for {self.field!r}: {low} > {high}")
+        plan = [Shard(self.field, a, b) for a, b in initial_ranges(low, high, shards, self.integer)]
+        # Open sides stay covered by tail shards, which are never split.
+        if open_low:
+            plan.insert(0, Shard(self.field, None, _previous(low, self.integer), depth=self.max_depth))
+        if open_high:
+            plan.append(Shard(self.field, _next(high, self.integer), None, depth=self.max_depth))
+        return plan
+
+    def shard_request(self, shard: Shard) -> BaseRequest:
+        """The request restricted to `shard`."""
+        request = self.request.copy(deep=True)
+        setattr(request, self.field, self.range_model(min=shard.min, max=shard.max))
+        if request.page is None:
+            request.page = PageOptions()
+        if self.page_size is not None:
+            request.page.size = self.page_size
+        request.page.id = None
+        return request
+
+    def __iter__(self) -> Iterator[Any]:
+        ready: "queue.Queue" = queue.Queue(maxsize=self.buffer)
+        stop = threading.Event()
+        lock = threading.Lock()
+        # Shards submitted but not finished, plus one held while the initial plan is submitted.
+        outstanding = [1]
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="smartscout-shard")
+
+        def put(entry: Tuple[Any, Optional[BaseException]]) -> bool:
+            while not stop.is_set():
+                try:
+                    ready.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def submit(shard: Shard) -> None:
+            with lock:
+                outstanding[0] += 1
+            executor.submit(scan, shard)
+
+        def release() -> None:
+            with lock:
+                outstanding[0] -= 1
+                finished = outstanding[0] == 0
+            if finished:
+                put((_DONE, None))
+
+        def scan(shard: Shard) -> None:
+            try:
+                if stop.is_set():
+                    return
+                request = self.shard_request(shard)
+                first = self.method(request, verbose=self.verbose)
+                shard = shard._replace(data_count=first.data_count)
+                halves = None
+                if first.data_count is not None and first.data_count > self.max_shard_rows and shard.depth < self.max_depth:
+                    halves = split_range(shard.min, shard.max, self.integer)
+                if halves is not None:
+                    for low, high in halves:
+                        submit(Shard(self.field, low, high, shard.depth + 1))
+                    return
+                for row in first.data or ():
+                    if not put((row, None)):
+                        return
+                if first.paging.has_more_records and first.paging.next_page_id:
+                    request.page.id = first.paging.next_page_id
+                    for page in self.client.iter_pages(self.method, request, verbose=self.verbose):
+                        for row in page.data or ():
+                            if not put((row, None)):
+                                return
+                self.shards.append(shard)
+            except BaseException as e:
+                put((None, e))
+            finally:
+                release()
+
+        seen = set()
+        try:
+            for shard in self.plan:
+                submit(shard)
+            release()
+            while True:
+                row, error = ready.get()
+                if error is not None:
+                    raise error
+                if row is _DONE:
+                    return
+                identity = self.key(row)
+                if identity in seen:
+                    self.duplicates += 1
+                    continue
+                seen.add(identity)
+                yield row
+        finally:
+            stop.set()
+            executor.shutdown(wait=True)
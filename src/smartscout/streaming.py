@@ -0,0 +1,86 @@
+# src/smartscout/streaming.py
+
+from typing import Any, Callable, Dict, Iterator, Optional
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+from .models.base import Paging
+from .exceptions import UnexpectedResponseError
+
+class StreamedPage:
+    """
+    A page of results decoded incrementally from the HTTP response body.
+
+    Rows of the `data` array are parsed and yielded one at a time as bytes arrive from the socket,
+    so memory is bounded by the size of a row rather than of the page. `data` can be iterated only
+    once. `data_count` and `paging` are read from the same stream; accessing them before `data`
+    is exhausted drains (and discards) the remaining rows.
+    """
+
+    def __init__(self, response: Any, decode_row: Callable[[Dict[str, Any]], Any]):
+        if ijson is None:
+            raise ImportError("output='stream' requires ijson; install it with `pip install smartscout-api[stream]`")
+        self._response = response
+        self._decode_row = decode_row
+        self._rows = self._parse()
+        self._data_count: Optional[int] = None
+        self._paging: Dict[str, Any] = {}
+        self._done = False
+
+    @property
+    def data(self) -> Iterator[Any]:
+        return self._rows
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._rows
+
+    @property
+    def data_count(self) -> Optional[int]:
+        self._drain()
+        return self._data_count
+
+    @property
+    def paging(self) -> Paging:
+        self._drain()
+        if "hasMoreRecords" not in self._paging:
+            raise UnexpectedResponseError("Response did not include paging information")
+        return Paging(**self._paging)
+
+    def _drain(self) -> None:
+        if not self._done:
+            for _ in self._rows:
+                pass
+
+    def close(self) -> None:
+        self._rows.close()
+        self._response.close()
+
+    def _parse(self) -> Iterator[Any]:
+        raw = self._response.raw
+        raw.decode_content = True
+        builder = None
+        try:
+            for prefix, event, value in ijson.parse(raw, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == "data.item" and event in ("end_map", "end_array"):
+                        row, builder = builder.value, None
+                        yield self._decode_row(row)
+                elif prefix == "data.item":
+                    if event in ("start_map", "start_array"):
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    else:
+                        yield value
+                elif prefix in ("dataCount", "data_count") and event == "number":
+                    self._data_count = int(value)
+                elif prefix.startswith("paging.") and event in ("string", "boolean", "null"):
+                    self._paging[prefix[len("paging."):]] = value
+        except ijson.JSONError as e:
+            raise UnexpectedResponseError(f"Could not decode streamed response: {e}")
+        finally:
+            self._done = True
+            self._response.close()
@@ -0,0 +1,205 @@
+# src/smartscout/transport.py
+
+import io
+import json
+import socket
+import threading
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3 import HTTPResponse
+from urllib3.connection import HTTPConnection
+
+from .instrumentation import TimingAdapter
+
+# Any `requests` transport adapter can carry the client's requests: the `adapter=` argument of
+# `SmartScoutAPIClient` accepts a `PooledAdapter` (the default), an `HttpxTransport`, a
+# `StubTransport`, a `CassetteAdapter` or a plain `requests.adapters.HTTPAdapter`, which talks to
+# urllib3 directly.
+Transport = BaseAdapter
+
+Timeout = Union[float, Tuple[float, float]]
+
+def keepalive_socket_options(idle: int = 60, interval: int = 15, count: int = 4) -> List[Tuple[int, int, int]]:
+    """
+    urllib3 socket options enabling TCP keep-alive probes, on top of urllib3's defaults.
+
+    The idle/interval/count tuning is applied where the platform exposes it (Linux, macOS,
+    recent Windows); elsewhere only `SO_KEEPALIVE` is set.
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    idle_option = getattr(socket, "TCP_KEEPIDLE", None) or getattr(socket, "TCP_KEEPALIVE", None)
+    for option, value in ((idle_option, idle), (getattr(socket, "TCP_KEEPINTVL", None), interval), (getattr(socket, "TCP_KEEPCNT", None), count)):
+        if option is not None:
+            options.append((socket.IPPROTO_TCP, option, value))
+    return options
+
+class PooledAdapter(TimingAdapter):
+    """
+    The client's default transport: a `requests` HTTP adapter with a connection pool sized for
+    concurrent workers, TCP keep-alive and a default timeout.
+
+    One instance is shared by every thread's session, so `pool_maxsize` should be at least the
+    number of threads issuing requests at once; beyond that, extra connections are opened and
+    discarded after use (or callers wait for a free one with `pool_block=True`). Responses are
+    requested with `gzip`/`deflate` compression, plus `br` when `brotli` is installed
+    (`pip install smartscout-api[brotli]`).
+
+    Args:
+        pool_connections: Number of hosts to keep a connection pool for.
+        pool_maxsize: Connections kept open per host.
+        pool_block: Wait for a free connection instead of opening a throwaway one.
+        timeout: `(connect, read)` seconds, or one number for both, used when the caller does
+            not pass a timeout. The read timeout bounds each wait for data, not the whole response.
+        keepalive: Enable TCP keep-alive probes so dead idle connections are detected.
+
+    Example:
+        ```python
+        client = SmartScoutAPIClient(api_key, adapter=PooledAdapter(pool_maxsize=64), timeout=(3.05, 120))
+        ```
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["timeout", "socket_options"]
+
+    def __init__(
+        self,
+        pool_connections: int = 4,
+        pool_maxsize: int = 32,
+        pool_block: bool = False,
+        timeout: Optional[Timeout] = (5.0, 60.0),
+        keepalive: bool = True,
+    ):
+        self.timeout = timeout
+        self.socket_options = keepalive_socket_options() if keepalive else None
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
+        if self.socket_options is not None:
+            pool_kwargs.setdefault("socket_options", self.socket_options)
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def send(self, request: requests.PreparedRequest, timeout: Optional[Timeout] = None, **kwargs: Any) -> requests.Response:
+        return super().send(request, timeout=timeout if timeout is not None else self.timeout, **kwargs)
+
+class HttpxTransport(BaseAdapter):
+    """
+    Send the client's requests through an `httpx.Client`, e.g. to use HTTP/2.
+
+    Response bodies are read from httpx incrementally, so `output="stream"` still parses rows as
+    they arrive. Connection timing (`RequestEvent.connect`) is not available on this transport.
+
+    Args:
+        client: The `httpx.Client` to use; by default one is created from `http2` and `client_kwargs`.
+        http2: Negotiate HTTP/2. Requires `pip install smartscout-api[http2]`.
+    """
+
+    def __init__(self, client: Any = None, http2: bool = False, **client_kwargs: Any):
+        super().__init__()
+        # Imported here so that loading the default transport does not pay for httpx.
+        try:
+            import httpx
+        except ImportError:  # pragma: no cover - optional dependency
+            raise ImportError("HttpxTransport requires httpx; install it with `pip install smartscout-api[async]`") from None
+        self._httpx = httpx
+        self.client = client or httpx.Client(http2=http2, **client_kwargs)
+        self._builder = HTTPAdapter()
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, timeout: Optional[Timeout] = None, **kwargs: Any) -> requests.Response:
+        httpx = self._httpx
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        elif timeout is None:
+            timeout = httpx.USE_CLIENT_DEFAULT
+        try:
+            outgoing = self.client.build_request(request.method, request.url, headers=dict(request.headers), content=request.body, timeout=timeout)
+            incoming = self.client.send(outgoing, stream=True)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e, request=request)
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+        # httpx decodes the content encoding itself, so the body handed on is already plain.
+        headers = {k: v for k, v in incoming.headers.items() if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")}
+        raw = HTTPResponse(
+            body=_ChunkReader(incoming),
+            headers=headers,
+            status=incoming.status_code,
+            reason=incoming.reason_phrase,
+            preload_content=False,
+            decode_content=False,
+        )
+        return self._builder.build_response(request, raw)
+
+    def close(self) -> None:
+        self.client.close()
+
+class _ChunkReader(io.RawIOBase):
+    """File-like view of an httpx response body, read as it arrives."""
+
+    def __init__(self, response: Any):
+        self._response = response
+        self._chunks = response.iter_bytes()
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = chunk
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def close(self) -> None:
+        self._response.close()
+        super().close()
+
+StubResponse = Union[Tuple[int, Any], Tuple[int, Any, Mapping[str, str]]]
+
+class StubTransport(BaseAdapter):
+    """
+    In-process transport for unit tests: `handler` computes each response without any network.
+
+    `handler` receives the `requests.PreparedRequest` (with `.json` set to its decoded body) and
+    returns `(status, payload)` or `(status, payload, headers)`; the payload is sent as JSON.
+    Every request is kept in `requests` for assertions.
+
+    Example:
+        ```python
+        transport = StubTransport(lambda request: (200, {"dataCount": 0, "paging": {"hasMoreRecords": False}, "data": []}))
+        client = SmartScoutAPIClient(api_key="test", adapter=transport)
+        ```
+    """
+
+    def __init__(self, handler: Callable[[requests.PreparedRequest], StubResponse]):
+        super().__init__()
+        self.handler = handler
+        self.requests: List[requests.PreparedRequest] = []
+        self._lock = threading.Lock()
+        self._builder = HTTPAdapter()
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        body = request.body.decode("utf-8") if isinstance(request.body, bytes) else request.body
+        request.json = json.loads(body) if body else None
+        with self._lock:
+            self.requests.append(request)
+        status, payload, *rest = self.handler(request)
+        headers: Dict[str, str] = dict(rest[0]) if rest else {}
+        encoded = json.dumps(payload).encode("utf-8")
+        raw = HTTPResponse(
+            body=io.BytesIO(encoded),
+            headers={"Content-Type": "application/json", **headers, "Content-Length": str(len(encoded))},
+            status=status,
+            preload_content=False,
+            decode_content=False,
+        )
+        return self._builder.build_response(request, raw)
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,48 @@
+# tests/test_async_client.py
+import asyncio
+import pytest
+from unittest.mock import patch, AsyncMock
+from smartscout.async_client import AsyncSmartScoutAPIClient
+from smartscout.exceptions import RateLimitError
+from smartscout.ratelimit import RetryPolicy
+from smartscout.models.requests import SearchBrandsRequest
+
+httpx = pytest.importorskip("httpx")
+
+
+def _response(status_code, payload=None):
+    return httpx.Response(status_code, json=payload, request=httpx.Request("POST", "https://api.smartscout.com/v1/brands/search"))
+
+
+def _page(names, next_page_id=None):
+    return _response(200, {
+        "dataCount": len(names),
+        "paging": {"nextPageId": next_page_id, "hasMoreRecords": next_page_id is not None},
+        "data": [{"brandName": name, "hasStorefront": False, "hasSingleSeller": False} for name in names],
+    })
+
+
+def test_async_search_brands():
+    async def run():
+        async with AsyncSmartScoutAPIClient(api_key="test_key") as client:
+            with patch.object(client.session, "request", AsyncMock(return_value=_page(["a", "b"]))) as mock_request:
+                response = await client.search_brands(SearchBrandsRequest(marketplace="US"))
+                assert mock_request.call_args.kwargs["content"] == b'{"marketplace":"US"}'
+                return response
+
+    response = asyncio.run(run())
+    assert response.data_count == 2
+    assert not response.paging.has_more_records
+
+
+def test_async_iter_brands_and_rate_limit():
+    async def run():
+        async with AsyncSmartScoutAPIClient(api_key="test_key", max_connections_per_host=2, retry_policy=RetryPolicy(max_retries=0)) as client:
+            with patch.object(client.session, "request", AsyncMock(side_effect=[_page(["a"], "p2"), _page(["b"])])):
+                items = [item async for item in client.iter_brands(SearchBrandsRequest(marketplace="US"))]
+            with patch.object(client.session, "request", AsyncMock(return_value=_response(429))):
+                with pytest.raises(RateLimitError):
+                    await client.search_brands(SearchBrandsRequest(marketplace="US"))
+            return items
+
+    assert len(asyncio.run(run())) == 2
@@ -0,0 +1,179 @@
+# tests/test_bulk.py
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch, Mock
+import pytest
+from smartscout.bulk import run_batch, merge_iterators
+from smartscout.client import SmartScoutAPIClient
+from smartscout.exceptions import SmartScoutAPIError
+from smartscout.models.requests import SearchBrandsRequest
+
+
+def _slow_square(n):
+    time.sleep(0.01 * (5 - n % 5))
+    if n == 3:
+        raise ValueError("bad item")
+    return n * n
+
+
+def test_run_batch_preserves_order_and_returns_errors_as_values():
+    results = list(run_batch(_slow_square, range(10), max_workers=4))
+
+    assert [r.index for r in results] == list(range(10))
+    assert not results[3].ok and isinstance(results[3].error, ValueError)
+    assert [r.response for r in results if r.ok] == [n * n for n in range(10) if n != 3]
+
+
+def test_run_batch_unordered_yields_everything():
+    results = list(run_batch(_slow_square, range(10), max_workers=4, ordered=False))
+    assert sorted(r.index for r in results) == list(range(10))
+
+
+def test_client_session_is_per_thread():
+    client = SmartScoutAPIClient(api_key="test_key")
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(client.session))
+    worker.start()
+    worker.join()
+
+    assert client.session is client.session
+    assert seen[0] is not client.session
+    assert seen[0].headers["Authorization"] == "Bearer test_key"
+
+
+@patch('smartscout.client.requests.Session.request')
+def test_client_map_runs_each_request(mock_request):
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.json.return_value = {"dataCount": 0, "paging": {"hasMoreRecords": False}, "data": []}
+    mock_request.return_value = response
+
+    client = SmartScoutAPIClient(api_key="test_key")
+    requests = (SearchBrandsRequest(marketplace=m) for m in ["US", "UK", "DE", "CA"])
+    results = list(client.map("search_brands", requests, max_workers=2))
+
+    assert [r.request.marketplace for r in results] == ["US", "UK", "DE", "CA"]
+    assert all(r.ok for r in results)
+    assert mock_request.call_count == 4
+
+
+def test_merge_iterators_tags_items_and_propagates_errors():
+    def numbers(n):
+        for i in range(n):
+            time.sleep(0.001)
+            yield i
+
+    merged = list(merge_iterators({"a": numbers(3), "b": numbers(2), "c": []}))
+    assert sorted(merged) == [("a", 0), ("a", 1), ("a", 2), ("b", 0), ("b", 1)]
+    assert [item for key, item in merged if key == "a"] == [0, 1, 2]
+
+    def broken():
+        yield 1
+        raise ValueError("bad source")
+
+    with pytest.raises(ValueError):
+        list(merge_iterators({"ok": numbers(100), "bad": broken()}))
+
+
+def test_fan_out_runs_marketplaces_concurrently():
+    client = SmartScoutAPIClient(api_key="test_key")
+
+    def make_request(method, endpoint, data=None, params=None, verbose=False):
+        time.sleep(0.1)
+        row = {"brandName": data["marketplace"], "hasStorefront": True, "hasSingleSeller": False}
+        return {"dataCount": 1, "paging": {"hasMoreRecords": False}, "data": [row]}
+
+    with patch.object(client, "_make_request", side_effect=make_request):
+        started = time.monotonic()
+        results = client.fan_out(client.search_brands, SearchBrandsRequest(marketplace="US"))
+        elapsed = time.monotonic() - started
+        tagged = list(client.iter_fan_out("search_brands", SearchBrandsRequest(marketplace="US"), marketplaces=["US", "JP"]))
+
+    assert list(results) == ["US", "UK", "IT", "DE", "CA", "MX", "FR", "ES", "IN", "AU", "JP"]
+    assert all(r.ok and r.response.data[0].brand_name == mp for mp, r in results.items())
+    assert elapsed < 0.5
+    assert sorted((mp, brand.brand_name) for mp, brand in tagged) == [("JP", "JP"), ("US", "US")]
+
+
+def _product(asin):
+    return {
+        "asin": asin,
+        "title": "Test Product",
+        "category": {"id": "1", "name": "Electronics", "path": ["Electronics"]},
+        "subcategory": {"id": "2", "name": "Headphones", "path": ["Electronics", "Headphones"]},
+        "price": {"amount": 19.99, "currency": "USD"},
+        "currency": "USD",
+        "condition": "New",
+        "availability": "In Stock",
+        "fulfillmentChannel": "FBA",
+        "isPrime": True,
+        "isAmazonFulfilled": True,
+        "isFBA": True,
+        "reviews": {"averageRating": 4.5, "totalReviews": 100},
+        "images": {},
+        "isVariation": False,
+    }
+
+
+def test_get_products_by_asins_batches_and_reports_misses():
+    client = SmartScoutAPIClient(api_key="test_key")
+    known = {f"B{i:09d}" for i in range(0, 250, 2)}
+    batches = []
+
+    def make_request(method, endpoint, data=None, params=None, verbose=False):
+        asins = data["asins"]["filter"]
+        batches.append(asins)
+        rows = [_product(asin) for asin in asins if asin in known]
+        return {"dataCount": len(rows), "paging": {"hasMoreRecords": False}, "data": rows}
+
+    asins = [f"B{i:09d}" for i in range(250)] + ["B000000000", "b000000002", " "]
+    with patch.object(client, "_make_request", side_effect=make_request):
+        found = client.get_products_by_asins(asins, marketplace="US", batch_size=100)
+
+    assert sorted(len(batch) for batch in batches) == [50, 100, 100]
+    assert list(found)[:3] == ["B000000000", "B000000001", "B000000002"]
+    assert len(found) == 251
+    assert found["B000000002"].asin == "B000000002"
+    assert found["b000000002"] is found["B000000002"]
+    assert found["B000000001"] is None
+    assert found.errors == {}
+
+
+def test_lookup_keeps_successful_batches_when_one_fails():
+    client = SmartScoutAPIClient(api_key="test_key")
+
+    def make_request(method, endpoint, data=None, params=None, verbose=False):
+        asins = data["asins"]["filter"]
+        if "B000000150" in asins:
+            raise SmartScoutAPIError("HTTP error occurred: 503")
+        rows = [_product(asin) for asin in asins]
+        return {"dataCount": len(rows), "paging": {"hasMoreRecords": False}, "data": rows}
+
+    asins = [f"B{i:09d}" for i in range(250)] + ["b000000150"]
+    with patch.object(client, "_make_request", side_effect=make_request):
+        found = client.get_products_by_asins(asins, marketplace="US", batch_size=100)
+
+    failed = asins[100:200] + ["b000000150"]
+    assert list(found) == asins[:100] + asins[200:250]
+    assert all(product is not None for product in found.values())
+    assert sorted(found.errors) == sorted(failed)
+    assert all(isinstance(error, SmartScoutAPIError) for error in found.errors.values())
+
+
+def test_lookup_sends_original_spellings_and_skips_rows_without_a_key():
+    client = SmartScoutAPIClient(api_key="test_key")
+    sent = []
+
+    def iter_items(method, request, page_size=100, verbose=False):
+        sent.extend(request.brand_names.filter)
+        return iter([SimpleNamespace(brand_name=None), SimpleNamespace(brand_name="ACME")])
+
+    with patch.object(client, "iter_items", side_effect=iter_items):
+        found = client.get_brands_by_names(["Acme", "acme", "Zen"], marketplace="US")
+
+    assert sent == ["Acme", "Zen"]
+    assert found["Acme"].brand_name == "ACME"
+    assert found["acme"] is found["Acme"]
+    assert found["Zen"] is None
+    assert found.errors == {}
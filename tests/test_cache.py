@@ -0,0 +1,101 @@
+# tests/test_cache.py
+import os
+import threading
+import time
+from unittest.mock import patch, Mock
+from smartscout.cache import MemoryCache, SQLiteCache, cache_key
+from smartscout.client import SmartScoutAPIClient
+from smartscout.models.requests import SearchBrandsRequest
+
+PAGE = {"dataCount": 0, "paging": {"nextPageId": None, "hasMoreRecords": False}, "data": []}
+
+
+def test_cache_key_is_order_independent():
+    a = cache_key("post", "/brands/search", {"marketplace": "US", "brandName": {"filter": "x"}, "page": {"size": 10}})
+    b = cache_key("POST", "/brands/search", {"page": {"size": 10}, "brandName": {"filter": "x"}, "marketplace": "US"})
+    c = cache_key("POST", "/brands/search", {"marketplace": "UK", "brandName": {"filter": "x"}, "page": {"size": 10}})
+    assert a == b
+    assert a != c
+
+
+def test_sqlite_cache_ttl_and_lru_eviction(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), default_ttl=60)
+    cache.set("k", {"a": 1}, ttl=60)
+    assert cache.get("k") == {"a": 1}
+    with patch("smartscout.cache.time.time", return_value=10 ** 12):
+        assert cache.get("k") is None
+
+    clock = iter(range(1, 100))
+    payload = lambda: {"blob": os.urandom(400).hex()}
+    small = SQLiteCache(str(tmp_path / "small.db"), max_bytes=1000)
+    with patch("smartscout.cache.time.time", side_effect=lambda: next(clock)):
+        small.set("old", payload())
+        small.set("new", payload())
+        small.get("old")
+        small.set("newest", payload())
+        assert small.get("old") is not None
+        assert small.get("new") is None
+        assert small.get("newest") is not None
+
+
+@patch('smartscout.client.requests.Session.request')
+def test_client_serves_cache_hits_without_network(mock_request, tmp_path):
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.json.return_value = PAGE
+    mock_request.return_value = response
+
+    cache = SQLiteCache(str(tmp_path / "cache.db"), ttls={"/sellers/search": 0})
+    client = SmartScoutAPIClient(api_key="test_key", cache=cache)
+    request = SearchBrandsRequest(marketplace="US")
+
+    client.search_brands(request)
+    client.search_brands(request)
+    assert mock_request.call_count == 1
+
+    with client.bypass_cache():
+        client.search_brands(request)
+    assert mock_request.call_count == 2
+
+
+def test_memory_cache_is_bounded_lru():
+    cache = MemoryCache(max_entries=2, default_ttl=None)
+    cache.set("a", {"n": 1})
+    cache.set("b", {"n": 2})
+    cache.get("a")
+    cache.set("c", {"n": 3})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"n": 1}
+    assert len(cache) == 2
+    cache.set("d", {"n": 4}, ttl=1)
+    with patch("smartscout.cache.time.monotonic", return_value=10 ** 12):
+        assert cache.get("d") is None
+
+
+@patch('smartscout.client.requests.Session.request')
+def test_client_coalesces_identical_in_flight_requests(mock_request):
+    release = threading.Event()
+
+    def slow_request(*args, **kwargs):
+        release.wait(5)
+        response = Mock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = PAGE
+        return response
+
+    mock_request.side_effect = slow_request
+    client = SmartScoutAPIClient(api_key="test_key", coalesce_requests=True)
+    request = SearchBrandsRequest(marketplace="US")
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.search_brands(request))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    while client._single_flight.in_flight() == 0:
+        time.sleep(0.001)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert mock_request.call_count == 1
@@ -0,0 +1,124 @@
+# tests/test_codegen.py
+import asyncio
+import json
+import os
+from datetime import datetime
+import pytest
+from smartscout.client import SmartScoutAPIClient
+from smartscout.codegen import generate
+from smartscout.endpoints import OPERATIONS
+from smartscout.mock import MockServer
+from smartscout.models.base import PageOptions, RangeInt, TextFilter
+from smartscout.models.generated import BrandsHistorySalesRequest, BrandsSearchV2Request, ProductsHistoryRequest, SalesEstimate, SubcategoriesHierarchyPostRequest
+from smartscout.operations import request_url
+from smartscout.transport import StubTransport
+
+SPEC = os.path.join(os.path.dirname(__file__), os.pardir, "swagger.json")
+PACKAGE = os.path.join(os.path.dirname(__file__), os.pardir, "src", "smartscout")
+
+
+def _request(operation):
+    # Fill in every required field with a placeholder of its type.
+    values = {field.alias: 1 if field.outer_type_ is int else "US" if field.name == "marketplace" else "x"
+              for field in operation.request_model.__fields__.values() if field.required}
+    return operation.request_model(**values)
+
+
+def test_generated_files_are_up_to_date():
+    with open(SPEC, "r", encoding="utf-8") as f:
+        files = generate(json.load(f))
+
+    for relative, content in files.items():
+        with open(os.path.join(PACKAGE, relative), "r", encoding="utf-8") as f:
+            assert f.read() == content, f"{relative} is stale; run `python -m smartscout.codegen`"
+    with open(SPEC, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+    assert len(OPERATIONS) == sum(len(methods) for methods in spec["paths"].values())
+
+
+@pytest.mark.parametrize("name", sorted(OPERATIONS))
+def test_every_operation_round_trips_against_the_mock(name):
+    operation = OPERATIONS[name]
+    with MockServer(SPEC, total_records=3) as server:
+        client = SmartScoutAPIClient(api_key="test", base_url=server.url)
+        result = getattr(client, name)(_request(operation))
+
+    if operation.paged:
+        assert len(result.data) == 3
+        assert all(isinstance(row, operation.response_model) for row in result.data)
+    else:
+        assert isinstance(result, operation.response_model)
+
+
+def test_serializer_places_fields_by_location_and_wire_name():
+    request = BrandsHistorySalesRequest(
+        marketplace="US",
+        brand_name="Acme & Co",
+        start_date=datetime(2024, 1, 1),
+        page=PageOptions(**{"page[size]": 50}),
+    )
+    path, query, body = OPERATIONS["brands_history_sales"].serialize(request)
+
+    assert path == "/api/v1/brands/Acme%20%26%20Co/history/sales"
+    assert query == {"marketplace": "US", "page[size]": 50}
+    assert body == {"startDate": "2024-01-01T00:00:00"}
+
+    path, query, body = OPERATIONS["brands_search_v2"].serialize(BrandsSearchV2Request(marketplace="US", brand_name=TextFilter(filter="acme"), total_reviews=RangeInt(min=10)))
+    assert body == {"brandName": {"filter": "acme"}, "totalReviews": {"min": 10}}
+
+
+def test_bodyless_post_operations_send_no_body():
+    empty = {"dataCount": 0, "paging": {"hasMoreRecords": False}, "data": []}
+    request = SubcategoriesHierarchyPostRequest(marketplace="US", SubcategoryId=5)
+    transport = StubTransport(lambda request: (200, empty))
+    client = SmartScoutAPIClient(api_key="test", base_url="http://stub.invalid", adapter=transport)
+    client.subcategories_hierarchy_post(request)
+
+    sent = transport.requests[0]
+    assert sent.method == "POST" and sent.path_url == "/api/v1/subcategories/5/hierarchy?marketplace=US"
+    assert not sent.body
+
+    httpx = pytest.importorskip("httpx")
+    from smartscout.async_client import AsyncSmartScoutAPIClient
+    bodies = []
+
+    def handler(sent):
+        bodies.append(sent.content)
+        return httpx.Response(200, json=empty)
+
+    async def run():
+        async with AsyncSmartScoutAPIClient(api_key="test", base_url="http://stub.invalid", transport=httpx.MockTransport(handler)) as client:
+            await client.subcategories_hierarchy_post(request)
+
+    asyncio.run(run())
+    assert bodies == [b""]
+
+
+def test_spec_paths_resolve_against_the_api_host():
+    assert request_url("https://api.smartscout.com/v1", "/api/v2/brands/search") == "https://api.smartscout.com/api/v2/brands/search"
+    assert request_url("https://api.smartscout.com/v1", "/brands/search") == "https://api.smartscout.com/v1/brands/search"
+    assert request_url("http://127.0.0.1:8000", "/api/v1/sales/estimate") == "http://127.0.0.1:8000/api/v1/sales/estimate"
+
+
+def test_generated_methods_page_and_decode_without_validation():
+    with MockServer(SPEC, total_records=25, page_size=10) as server:
+        client = SmartScoutAPIClient(api_key="test", base_url=server.url, validate_responses=False)
+        rows = [row for page in client.iter_pages(client.products_history, ProductsHistoryRequest(marketplace="US", asin="B000")) for row in page.data]
+        estimate = client.sales_estimate(OPERATIONS["sales_estimate"].request_model(marketplace="US", sales_rank=10))
+
+    assert len(rows) == 25
+    assert isinstance(estimate, SalesEstimate)
+
+
+def test_async_client_exposes_generated_methods():
+    pytest.importorskip("httpx")
+    from smartscout.async_client import AsyncSmartScoutAPIClient
+
+    async def run(url):
+        async with AsyncSmartScoutAPIClient(api_key="test", base_url=url) as client:
+            return await client.brands_search_v2(BrandsSearchV2Request(marketplace="US"))
+
+    with MockServer(SPEC, total_records=4) as server:
+        page = asyncio.run(run(server.url))
+
+    assert len(page.data) == 4
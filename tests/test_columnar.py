@@ -0,0 +1,57 @@
+# tests/test_columnar.py
+from unittest.mock import patch, Mock
+import pytest
+from smartscout.client import SmartScoutAPIClient
+from smartscout.columnar import ColumnarPage, to_records
+from smartscout.models.requests import GetBrandSalesHistoryRequest
+from smartscout.models.responses import Brand, BrandSalesHistory
+
+ROWS = [
+    {"date": "2024-01-01T00:00:00Z", "brand": "Acme", "sales": 10.5, "unitsSold": 3, "averagePrice": 3.5},
+    {"date": "2024-01-02T00:00:00", "brand": "Acme", "sales": 12.0, "unitsSold": 4, "averagePrice": 3.0},
+]
+PAGE = {"dataCount": 2, "paging": {"nextPageId": None, "hasMoreRecords": False}, "data": ROWS}
+
+
+def _client(mock_request):
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.json.return_value = PAGE
+    mock_request.return_value = response
+    return SmartScoutAPIClient(api_key="test_key")
+
+
+def _request():
+    return GetBrandSalesHistoryRequest(marketplace="US", date_range={"start_date": "2024-01-01T00:00:00", "end_date": "2024-01-31T00:00:00"})
+
+
+def test_records_use_field_names():
+    records = to_records([{"brandName": "Acme", "hasStorefront": True}], Brand)
+    assert records[0]["brand_name"] == "Acme"
+    assert records[0]["has_storefront"] is True
+    assert records[0]["amazon_isr"] is None
+
+
+@patch('smartscout.client.requests.Session.request')
+def test_arrow_output_has_typed_columns(mock_request):
+    pa = pytest.importorskip("pyarrow")
+    page = _client(mock_request).get_brand_sales_history(_request(), output="arrow")
+
+    assert isinstance(page, ColumnarPage)
+    assert not page.paging.has_more_records
+    table = page.data
+    assert table.schema.field("sales").type == pa.float64()
+    assert table.schema.field("units_sold").type == pa.int64()
+    assert table.schema.field("date").type == pa.timestamp("us", tz="UTC")
+    assert table.column("units_sold").to_pylist() == [3, 4]
+
+
+@patch('smartscout.client.requests.Session.request')
+def test_pandas_output_has_numpy_dtypes(mock_request):
+    pytest.importorskip("pandas")
+    frame = _client(mock_request).get_brand_sales_history(_request(), output="pandas").data
+
+    assert str(frame["sales"].dtype) == "float64"
+    assert str(frame["units_sold"].dtype) == "int64"
+    assert str(frame["date"].dtype).startswith("datetime64")
+    assert list(frame["brand"]) == ["Acme", "Acme"]
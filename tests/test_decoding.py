@@ -0,0 +1,108 @@
+# tests/test_decoding.py
+import json
+from datetime import datetime
+from unittest.mock import patch, Mock
+import pytest
+from smartscout.client import SmartScoutAPIClient
+from smartscout.decoding import Flyweights, decode_paged, get_decoder
+from smartscout.models.base import CategoryInfo, Money, PagedResponse
+from smartscout.models.enums import FulfillmentChannel
+from smartscout.models.requests import SearchProductsRequest
+from smartscout.models.responses import BrandSalesHistory, Product
+from smartscout.transport import StubTransport
+
+PRODUCT = {
+    "asin": "B000000001",
+    "title": "Test Product",
+    "category": {"id": "1", "name": "Electronics", "path": ["Electronics"]},
+    "subcategory": {"id": "2", "name": "Headphones", "path": ["Electronics", "Headphones"]},
+    "price": {"amount": 19.99, "currency": "USD"},
+    "currency": "USD",
+    "condition": "New",
+    "availability": "In Stock",
+    "fulfillmentChannel": "FBA",
+    "isPrime": True,
+    "isAmazonFulfilled": True,
+    "isFBA": True,
+    "salesRank": 1000,
+    "reviews": {"averageRating": 4.5, "totalReviews": 100},
+    "images": {"small": "s.jpg"},
+    "isVariation": False,
+}
+PAGE = {"dataCount": 1, "paging": {"nextPageId": "p2", "hasMoreRecords": True}, "data": [PRODUCT]}
+
+
+def test_trusted_decode_matches_validated_models():
+    trusted = decode_paged(PAGE, Product)
+    validated = PagedResponse[Product](**PAGE)
+
+    assert trusted == validated
+    product = trusted.data[0]
+    assert isinstance(product, Product)
+    assert isinstance(product.category, CategoryInfo)
+    assert product.fulfillment_channel is FulfillmentChannel.FBA
+    assert product.sales_rank == 1000
+    assert product.features is None
+    assert trusted.paging.next_page_id == "p2"
+
+
+def test_decoder_is_compiled_once_per_model_and_parses_datetimes():
+    assert get_decoder(Product) is get_decoder(Product)
+    row = get_decoder(BrandSalesHistory).decode(
+        {"date": "2024-01-31T00:00:00Z", "brand": "Acme", "sales": 1.5, "unitsSold": 3, "averagePrice": 0.5}
+    )
+    assert isinstance(row.date, datetime)
+    assert row.units_sold == 3
+
+
+@patch('smartscout.client.requests.Session.request')
+def test_client_trusted_decoding(mock_request):
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.json.return_value = PAGE
+    mock_request.return_value = response
+
+    client = SmartScoutAPIClient(api_key="test_key", validate_responses=False)
+    result = client.search_products(SearchProductsRequest(marketplace="US"))
+    assert result.data[0].reviews.total_reviews == 100
+
+
+def test_flyweights_share_repeated_values_between_rows():
+    # Decode from JSON text, as the client does, so equal strings start out as distinct objects.
+    body = json.dumps({**PAGE, "data": [dict(PRODUCT, asin=f"B{i:09d}") for i in range(3)]})
+    plain = decode_paged(json.loads(body), Product)
+    shared = decode_paged(json.loads(body), Product, flyweights=Flyweights(shared=(CategoryInfo, Money)))
+
+    assert shared == plain
+    first, second = shared.data[0], shared.data[1]
+    assert first.category is second.category and first.price is second.price
+    assert first.currency is second.price.currency
+    assert first.__fields_set__ is second.__fields_set__ and first.asin is not second.asin
+    assert plain.data[0].category is not plain.data[1].category
+    assert isinstance(first, Product) and isinstance(first.category, CategoryInfo)
+    with pytest.raises(TypeError):
+        first.category.name = "Changed"
+    with pytest.raises(TypeError):
+        first.title = "Changed"
+    assert [row.category.name for row in shared.data] == ["Electronics"] * 3
+    assert [row.title for row in shared.data] == ["Test Product"] * 3
+
+    bounded = decode_paged(json.loads(body), Product, flyweights=Flyweights(max_entries=0))
+    assert bounded == plain and bounded.data[0].category is not bounded.data[1].category
+
+
+def test_client_flyweights_option():
+    with pytest.raises(ValueError):
+        SmartScoutAPIClient(api_key="test_key", flyweights=True)
+
+    table = Flyweights()
+    client = SmartScoutAPIClient(
+        api_key="test_key", base_url="http://stub.invalid", adapter=StubTransport(lambda request: (200, PAGE)),
+        validate_responses=False, flyweights=table,
+    )
+    first = client.search_products(SearchProductsRequest(marketplace="US")).data[0]
+    second = client.search_products(SearchProductsRequest(marketplace="US")).data[0]
+    assert first is not second and first.subcategory is second.subcategory
+
+    client.flyweights = True
+    assert client.search_products(SearchProductsRequest(marketplace="US")).data[0].subcategory is not first.subcategory
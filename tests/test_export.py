@@ -0,0 +1,82 @@
+# tests/test_export.py
+import json
+import pytest
+from unittest.mock import patch
+from smartscout.client import SmartScoutAPIClient
+from smartscout.exceptions import SmartScoutAPIError
+from smartscout.export import export
+from smartscout.models.requests import SearchBrandsRequest
+
+PAGES = {
+    None: (["a", "b"], "p2"),
+    "p2": (["c", "d"], "p3"),
+    "p3": (["e"], None),
+}
+
+
+def _serve(fail_on=()):
+    calls = []
+
+    def make_request(method, endpoint, data=None, params=None, verbose=False):
+        page_id = (data.get("page") or {}).get("page[id]")
+        calls.append(page_id)
+        if page_id in fail_on:
+            fail_on.remove(page_id)
+            raise SmartScoutAPIError("boom")
+        names, next_page_id = PAGES[page_id]
+        rows = [{"brandName": name, "totalProducts": 1, "hasStorefront": True, "hasSingleSeller": False} for name in names]
+        return {"dataCount": len(rows), "data": rows, "paging": {"nextPageId": next_page_id, "hasMoreRecords": next_page_id is not None}}
+
+    return make_request, calls
+
+
+def test_jsonl_export_resumes_from_checkpoint(tmp_path):
+    client = SmartScoutAPIClient(api_key="test")
+    path = str(tmp_path / "brands.jsonl")
+    request = SearchBrandsRequest(marketplace="US")
+    make_request, calls = _serve(fail_on=["p3"])
+
+    with patch.object(client, "_make_request", side_effect=make_request):
+        with pytest.raises(SmartScoutAPIError):
+            export(client, "search_brands", request, path, flush_rows=1)
+        checkpoint = json.load(open(path + ".checkpoint.json"))
+        assert checkpoint["next_page_id"] == "p3" and not checkpoint["completed"]
+
+        result = export(client, "search_brands", request, path, flush_rows=1)
+
+    assert calls == [None, "p2", "p3", "p3"]
+    assert result.completed and result.pages == 3 and result.rows == 5
+    rows = [json.loads(line) for line in open(path)]
+    assert [row["brand_name"] for row in rows] == ["a", "b", "c", "d", "e"]
+
+
+def test_csv_resume_truncates_unflushed_rows(tmp_path):
+    client = SmartScoutAPIClient(api_key="test")
+    path = str(tmp_path / "brands.csv")
+    request = SearchBrandsRequest(marketplace="US")
+    make_request, _ = _serve()
+
+    with patch.object(client, "_make_request", side_effect=make_request):
+        export(client, client.search_brands, request, path, max_pages=1)
+        with open(path, "a") as f:
+            f.write("partial,row")
+        result = export(client, client.search_brands, request, path)
+
+    lines = open(path).read().splitlines()
+    assert lines[0].split(",")[0] == "brand_name"
+    assert [line.split(",")[0] for line in lines[1:]] == ["a", "b", "c", "d", "e"]
+    assert result.completed
+
+
+def test_parquet_export_writes_part_files(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    client = SmartScoutAPIClient(api_key="test")
+    path = str(tmp_path / "brands.parquet")
+    make_request, _ = _serve()
+
+    with patch.object(client, "_make_request", side_effect=make_request):
+        result = export(client, "search_brands", SearchBrandsRequest(marketplace="US"), path, flush_rows=2)
+
+    assert result.completed and result.rows == 5
+    table = pq.read_table(path)
+    assert sorted(table.column("brand_name").to_pylist()) == ["a", "b", "c", "d", "e"]
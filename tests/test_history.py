@@ -0,0 +1,156 @@
+# tests/test_history.py
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+import pytest
+from smartscout.client import SmartScoutAPIClient
+from smartscout.exceptions import SmartScoutAPIError
+from smartscout.history import AdaptiveChunker, HistoryStore, HistorySync, fetch_history, plan_date_chunks
+from smartscout.models.requests import GetBrandSalesHistoryRequest
+
+
+def _history_server(days_available):
+    windows = []
+
+    def make_request(method, endpoint, data=None, params=None, verbose=False):
+        start, end = (datetime.fromisoformat(data["date_range"][field]) for field in ("start_date", "end_date"))
+        windows.append((start.date(), end.date()))
+        rows = [
+            {"date": f"{day.isoformat()}T00:00:00Z", "brand": brand, "sales": 1.0 * day.day, "unitsSold": day.day, "averagePrice": 1.0}
+            for day in days_available
+            if start.date() <= day <= end.date()
+            for brand in ("Acme", "Zeta")
+        ]
+        return {"dataCount": len(rows), "paging": {"hasMoreRecords": False}, "data": rows}
+
+    return make_request, windows
+
+
+def test_sync_fetches_only_missing_days_and_merges_in_place(tmp_path):
+    client = SmartScoutAPIClient(api_key="test")
+    store = HistoryStore(str(tmp_path / "history.db"))
+    sync = HistorySync(client, store)
+    days = [date(2024, 1, d) for d in range(1, 11)]
+    make_request, windows = _history_server(days)
+    request = GetBrandSalesHistoryRequest(
+        marketplace="US",
+        date_range={"start_date": datetime(2024, 1, 1), "end_date": datetime(2024, 1, 5)},
+    )
+
+    with patch.object(client, "_make_request", side_effect=make_request):
+        first = sync.sync(client.get_brand_sales_history, request, key_fields=("brand",))
+        request.date_range.end_date = datetime(2024, 1, 10)
+        second = sync.sync("get_brand_sales_history", request, key_fields=("brand",))
+
+    assert first.rows == 10
+    # The second run only asks for the newest stored day onwards (re-fetching Jan 5).
+    assert windows == [(date(2024, 1, 1), date(2024, 1, 5)), (date(2024, 1, 5), date(2024, 1, 10))]
+    assert second.rows == 12
+    entity = sync.entity_for(request)
+    rows = store.read("get_brand_sales_history", entity)
+    assert len(rows) == 20
+    assert [row["date"][:10] for row in rows[::2]] == [d.isoformat() for d in days]
+    assert store.latest_date("get_brand_sales_history", entity) == date(2024, 1, 10)
+    assert store.entities("get_brand_sales_history") == [entity]
+
+
+def test_missing_window_is_none_when_up_to_date(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.db"))
+    sync = HistorySync(None, store)
+    store.extend_coverage("ds", "e", None, date(2024, 2, 1))
+    request = GetBrandSalesHistoryRequest(marketplace="US", date_range={"end_date": datetime(2024, 1, 31)})
+
+    assert sync.missing_windows("ds", "e", request) == []
+
+
+def test_sync_fetches_days_before_the_covered_range(tmp_path):
+    client = SmartScoutAPIClient(api_key="test")
+    store = HistoryStore(str(tmp_path / "history.db"))
+    sync = HistorySync(client, store)
+    days = [date(2024, 1, d) for d in range(1, 21)]
+    make_request, windows = _history_server(days)
+    recent = GetBrandSalesHistoryRequest(marketplace="US", date_range={"start_date": datetime(2024, 1, 10), "end_date": datetime(2024, 1, 15)})
+    full = GetBrandSalesHistoryRequest(marketplace="US", date_range={"start_date": datetime(2024, 1, 1), "end_date": datetime(2024, 1, 20)})
+
+    with patch.object(client, "_make_request", side_effect=make_request):
+        sync.sync(client.get_brand_sales_history, recent, key_fields=("brand",))
+        result = sync.sync(client.get_brand_sales_history, full, key_fields=("brand",))
+        again = sync.sync(client.get_brand_sales_history, full, key_fields=("brand",))
+
+    assert windows[1:3] == [(date(2024, 1, 1), date(2024, 1, 10)), (date(2024, 1, 15), date(2024, 1, 20))]
+    assert [(w.start_date.date(), w.end_date.date()) for w in result.windows] == windows[1:3]
+    assert windows[3:] == [(date(2024, 1, 20), date(2024, 1, 20))] and again.rows == 2
+    assert store.coverage("get_brand_sales_history", sync.entity_for(full)) == (date(2024, 1, 1), date(2024, 1, 20))
+    assert [row["date"][:10] for row in store.read("get_brand_sales_history", sync.entity_for(full))[::2]] == [d.isoformat() for d in days]
+
+
+def test_failed_sync_does_not_advance_the_covered_range(tmp_path):
+    client = SmartScoutAPIClient(api_key="test")
+    store = HistoryStore(str(tmp_path / "history.db"))
+    sync = HistorySync(client, store)
+    days = [date(2024, 1, d) for d in range(1, 11)]
+    make_request, windows = _history_server(days)
+    request = GetBrandSalesHistoryRequest(marketplace="US", date_range={"start_date": datetime(2024, 1, 1), "end_date": datetime(2024, 1, 10)})
+    calls = []
+
+    def first_page_then_fail(method, endpoint, data=None, params=None, verbose=False):
+        calls.append(data.get("page"))
+        if len(calls) == 2:
+            raise SmartScoutAPIError("HTTP error occurred: 503")
+        # Newest days first, so the stored rows run ahead of what was fully fetched.
+        page = make_request(method, endpoint, data)
+        page["data"] = page["data"][::-1][:6] if len(calls) == 1 else page["data"]
+        page["paging"] = {"nextPageId": "2", "hasMoreRecords": True} if len(calls) == 1 else {"hasMoreRecords": False}
+        return page
+
+    entity = sync.entity_for(request)
+    with patch.object(client, "_make_request", side_effect=first_page_then_fail):
+        with pytest.raises(SmartScoutAPIError):
+            sync.sync(client.get_brand_sales_history, request, key_fields=("brand",))
+        assert store.latest_date("get_brand_sales_history", entity) == date(2024, 1, 10)
+        assert store.coverage("get_brand_sales_history", entity) is None
+        result = sync.sync(client.get_brand_sales_history, request, key_fields=("brand",))
+
+    assert (result.start.date(), result.end.date()) == (date(2024, 1, 1), date(2024, 1, 10))
+    assert len(store.read("get_brand_sales_history", entity)) == 20
+    assert store.coverage("get_brand_sales_history", entity) == (date(2024, 1, 1), date(2024, 1, 10))
+
+
+def test_plan_date_chunks_aligns_to_calendar_quarters():
+    chunks = plan_date_chunks(datetime(2023, 2, 15), datetime(2023, 8, 1), "quarter")
+
+    assert [(c.start_date, c.end_date) for c in chunks] == [
+        (datetime(2023, 2, 15), datetime(2023, 4, 1)),
+        (datetime(2023, 4, 1), datetime(2023, 7, 1)),
+        (datetime(2023, 7, 1), datetime(2023, 8, 1)),
+    ]
+
+
+def test_adaptive_chunker_grows_fast_chunks_and_shrinks_slow_ones():
+    chunker = AdaptiveChunker(datetime(2020, 1, 1), datetime(2024, 1, 1), target_seconds=10)
+    first = chunker.next_chunk()
+    chunker.record(first, 1.0)
+    grown = chunker.span
+    assert grown > timedelta(days=31)
+
+    chunker.record(chunker.next_chunk(), 1000.0)
+    assert timedelta(days=7) <= chunker.span < grown
+
+
+def test_fetch_history_stitches_chunks_in_order_without_boundary_duplicates():
+    client = SmartScoutAPIClient(api_key="test")
+    days = [date(2024, 1, 1) + timedelta(days=i) for i in range(90)]
+    make_request, windows = _history_server(days)
+    request = GetBrandSalesHistoryRequest(
+        marketplace="US",
+        date_range={"start_date": datetime(2024, 1, 1), "end_date": datetime(2024, 3, 30)},
+    )
+
+    with patch.object(client, "_make_request", side_effect=make_request):
+        rows = fetch_history(client, client.get_brand_sales_history, request, chunk="month", max_workers=3, key_fields=("brand",))
+        adaptive = fetch_history(client, "get_brand_sales_history", request, output="records")
+
+    assert len(windows) > 3
+    assert len(rows) == 180
+    assert [row.date.date() for row in rows[::2]] == days
+    assert [row.brand for row in rows[:2]] == ["Acme", "Zeta"]
+    assert [row["date"][:10] for row in adaptive[::2]] == [d.isoformat() for d in days]
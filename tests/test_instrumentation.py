@@ -0,0 +1,95 @@
+# tests/test_instrumentation.py
+import os
+import pytest
+from smartscout.cache import MemoryCache
+from smartscout.client import SmartScoutAPIClient
+from smartscout.instrumentation import RequestStats, redacted_curl
+from smartscout.mock import MockServer
+from smartscout.models.requests import SearchBrandsRequest
+from smartscout.ratelimit import RetryPolicy
+from smartscout.transport import StubTransport
+
+SPEC = os.path.join(os.path.dirname(__file__), os.pardir, "swagger.json")
+
+
+def test_hooks_receive_an_event_per_call():
+    events = []
+    with MockServer(SPEC, total_records=25, page_size=10) as server:
+        client = SmartScoutAPIClient(api_key="test", base_url=server.url, cache=MemoryCache(), hooks=[events.append])
+        list(client.iter_brands(SearchBrandsRequest(marketplace="US")))
+        client.search_brands(SearchBrandsRequest(marketplace="US"))
+        client.search_brands(SearchBrandsRequest(marketplace="US"))
+
+    assert [event.rows for event in events] == [10, 10, 5, 10, 10]
+    assert [event.cache for event in events] == ["miss", "miss", "miss", "miss", "hit"]
+    first = events[0]
+    assert first.endpoint == "/brands/search"
+    assert first.marketplace == "US"
+    assert first.status == 200
+    assert first.connect > 0 and first.ttfb > 0 and first.parse > 0
+    assert first.total >= first.ttfb
+    assert first.request_bytes > 0 and first.response_bytes > 0
+    assert events[1].connect == 0.0  # pooled connection reused
+    assert events[4].status is None and events[4].response_bytes is None and events[4].connect is None
+
+
+def test_connect_is_only_reported_for_requests_sent_through_a_timing_adapter():
+    events = []
+    with MockServer(SPEC, total_records=5) as server:
+        SmartScoutAPIClient(api_key="test", base_url=server.url, hooks=[events.append]).search_brands(SearchBrandsRequest(marketplace="US"))
+    stub = StubTransport(lambda request: (200, {"dataCount": 0, "paging": {"hasMoreRecords": False}, "data": []}))
+    SmartScoutAPIClient(api_key="test", base_url="http://stub.invalid", adapter=stub, hooks=[events.append]).search_brands(SearchBrandsRequest(marketplace="US"))
+
+    assert events[0].connect > 0
+    assert events[1].connect is None
+
+
+def test_request_stats_counts_retries_and_quota():
+    stats = RequestStats()
+    with MockServer(SPEC, total_records=5, rate_limit_rate=0.5, seed=1) as server:
+        client = SmartScoutAPIClient(api_key="test", base_url=server.url, hooks=[stats], retry_policy=RetryPolicy(max_retries=20, backoff_factor=0))
+        client.search_brands(SearchBrandsRequest(marketplace="US"))
+
+    brands = stats.summary()["/brands/search"]
+    assert brands["calls"] == 1
+    assert brands["rows"] == 5
+    assert brands["retries"] == server.stats["429"] > 0
+    assert brands["api_requests"] == server.stats["requests"]
+
+
+def test_errors_are_reported_and_failing_hooks_do_not_break_calls():
+    events = []
+
+    def broken(event):
+        raise RuntimeError("boom")
+
+    with MockServer(SPEC, error_rate=1.0) as server:
+        client = SmartScoutAPIClient(api_key="test", base_url=server.url, hooks=[broken, events.append], retry_policy=RetryPolicy(max_retries=0))
+        with pytest.warns(RuntimeWarning), pytest.raises(Exception):
+            client.search_brands(SearchBrandsRequest(marketplace="US"))
+
+    assert events[0].status == 500
+    assert events[0].error.startswith("SmartScoutAPIError")
+
+
+def test_prometheus_hook_exports_counters_and_histograms():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    from smartscout.instrumentation import PrometheusHook
+
+    registry = prometheus_client.CollectorRegistry()
+    with MockServer(SPEC, total_records=5) as server:
+        client = SmartScoutAPIClient(api_key="test", base_url=server.url, hooks=[PrometheusHook(registry=registry)])
+        client.search_brands(SearchBrandsRequest(marketplace="US"))
+
+    labels = {"endpoint": "/brands/search", "marketplace": "US", "status": "200", "cache": "none"}
+    assert registry.get_sample_value("smartscout_requests_total", labels) == 1
+    assert registry.get_sample_value("smartscout_rows_total", {"endpoint": "/brands/search"}) == 5
+    assert registry.get_sample_value("smartscout_ttfb_seconds_count", {"endpoint": "/brands/search"}) == 1
+
+
+def test_verbose_output_masks_the_api_key():
+    command = redacted_curl("post", "https://api/x", {"Authorization": "Bearer secret-key", "Accept": "application/json"}, {"a": 1})
+
+    assert "secret-key" not in command
+    assert "Authorization: Bearer ***" in command
+    assert "-d '{\"a\": 1}'" in command
@@ -0,0 +1,62 @@
+# tests/test_lazy_imports.py
+import json
+import os
+import subprocess
+import sys
+import pytest
+import smartscout
+import smartscout.models
+
+SRC = os.path.join(os.path.dirname(__file__), os.pardir, "src")
+
+
+def _loaded_after(statement):
+    code = f"import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([SRC] + sys.path))
+    output = subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True).stdout
+    return set(json.loads(output))
+
+
+def test_importing_the_package_loads_nothing_else():
+    loaded = _loaded_after("import smartscout")
+
+    assert {name for name in loaded if name.startswith("smartscout")} == {"smartscout"}
+    assert "requests" not in loaded and "pydantic" not in loaded
+
+
+def test_sync_client_does_not_build_unused_models():
+    loaded = _loaded_after("from smartscout import SmartScoutAPIClient")
+
+    assert "smartscout.client" in loaded
+    for module in ("smartscout.models.requests", "smartscout.models.responses", "smartscout.models.generated", "smartscout.async_client", "httpx", "asyncio"):
+        assert module not in loaded
+
+
+def test_models_load_on_first_use():
+    loaded = _loaded_after(
+        "from smartscout import SmartScoutAPIClient, SearchBrandsRequest\n"
+        "from smartscout.transport import StubTransport\n"
+        "page = {'dataCount': 0, 'paging': {'hasMoreRecords': False}, 'data': []}\n"
+        "client = SmartScoutAPIClient(api_key='test', adapter=StubTransport(lambda request: (200, page)))\n"
+        "client.search_brands(SearchBrandsRequest(marketplace='US'))"
+    )
+
+    assert "smartscout.models.responses" in loaded
+    assert "smartscout.models.generated" not in loaded
+
+
+def test_lazy_attributes_resolve_and_unknown_names_raise():
+    assert smartscout.SmartScoutAPIClient.__name__ == "SmartScoutAPIClient"
+    assert "SmartScoutAPIClient" in dir(smartscout)
+    assert smartscout.models.SalesEstimate.__module__ == "smartscout.models.generated"
+    with pytest.raises(AttributeError):
+        smartscout.NotAThing
+    with pytest.raises(ImportError):
+        from smartscout.models import NotAModel  # noqa: F401
+
+
+def test_star_import_exposes_every_public_name():
+    namespace = {}
+    exec("from smartscout.models import *", namespace)
+
+    assert set(smartscout.models.__all__) <= set(namespace)
@@ -0,0 +1,63 @@
+# tests/test_mock.py
+import json
+import os
+from unittest.mock import patch
+import pytest
+from smartscout.cassette import CassetteAdapter, CassetteMiss
+from smartscout.client import SmartScoutAPIClient
+from smartscout.exceptions import SmartScoutAPIError
+from smartscout.mock import MockServer
+from smartscout.models.requests import SearchBrandsRequest
+from smartscout.ratelimit import RetryPolicy
+
+SPEC = os.path.join(os.path.dirname(__file__), os.pardir, "swagger.json")
+
+
+def test_mock_server_pages_through_generated_rows():
+    with MockServer(SPEC, total_records=25, page_size=10) as server:
+        client = SmartScoutAPIClient(api_key="test", base_url=server.url)
+        brands = list(client.iter_brands(SearchBrandsRequest(marketplace="US")))
+        again = client.search_brands(SearchBrandsRequest(marketplace="US"))
+
+    assert len(brands) == 25
+    assert brands[0].brand_name == "brandName-0"
+    assert brands[:10] == again.data
+    assert server.stats["200"] == 4
+
+
+def test_mock_server_injects_rate_limits_that_the_client_retries():
+    with MockServer(SPEC, total_records=5, rate_limit_rate=0.5, seed=1) as server:
+        client = SmartScoutAPIClient(api_key="test", base_url=server.url, retry_policy=RetryPolicy(max_retries=20, backoff_factor=0))
+        brands = list(client.iter_brands(SearchBrandsRequest(marketplace="US")))
+
+    assert len(brands) == 5
+    assert server.stats["429"] > 0
+
+
+def test_cassette_records_then_replays_offline(tmp_path):
+    cassette = str(tmp_path / "brands.json")
+    request = SearchBrandsRequest(marketplace="US")
+    with MockServer(SPEC, total_records=15, page_size=10) as server:
+        recording = SmartScoutAPIClient(api_key="secret-key", base_url=server.url, adapter=CassetteAdapter(cassette, mode="record"))
+        recorded = list(recording.iter_brands(request))
+
+    replaying = SmartScoutAPIClient(api_key="test", base_url="http://offline.invalid", adapter=CassetteAdapter(cassette))
+    assert list(replaying.iter_brands(request)) == recorded
+    assert "secret-key" not in open(cassette).read()
+    with pytest.raises(SmartScoutAPIError):
+        replaying.search_brands(SearchBrandsRequest(marketplace="UK"))
+
+
+def test_cassette_appends_and_records_streamed_pages_as_the_caller_reads_them(tmp_path):
+    cassette = str(tmp_path / "brands.json")
+    request = SearchBrandsRequest(marketplace="US")
+    with MockServer(SPEC, total_records=25, page_size=10) as server:
+        recording = SmartScoutAPIClient(api_key="test", base_url=server.url, adapter=CassetteAdapter(cassette, mode="record"))
+        with patch("smartscout.cassette.os.replace", wraps=os.replace) as replace:
+            streamed = list(recording.iter_brands(request, stream=True))
+
+    assert len(streamed) == 25
+    assert replace.call_count == 1
+    assert len(json.load(open(cassette))["interactions"]) == 3
+    replaying = SmartScoutAPIClient(api_key="test", base_url="http://offline.invalid", adapter=CassetteAdapter(cassette))
+    assert list(replaying.iter_brands(request)) == streamed
@@ -0,0 +1,49 @@
+# tests/test_pagination.py
+import json
+from unittest.mock import patch, Mock
+from smartscout.client import SmartScoutAPIClient
+from smartscout.models.requests import SearchBrandsRequest
+
+
+def _page(names, next_page_id=None):
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.json.return_value = {
+        "dataCount": len(names),
+        "paging": {"nextPageId": next_page_id, "hasMoreRecords": next_page_id is not None},
+        "data": [{"brandName": name, "hasStorefront": False, "hasSingleSeller": False} for name in names],
+    }
+    return response
+
+
+@patch('smartscout.client.requests.Session.request')
+def test_iter_brands_follows_next_page_id(mock_request):
+    mock_request.side_effect = [_page(["a", "b"], "p2"), _page(["c"], "p3"), _page(["d"])]
+
+    client = SmartScoutAPIClient(api_key="test_key")
+    request = SearchBrandsRequest(marketplace="US")
+    items = list(client.iter_brands(request, page_size=2))
+
+    assert len(items) == 4
+    assert mock_request.call_count == 3
+    sent_pages = [json.loads(call.kwargs["data"])["page"] for call in mock_request.call_args_list]
+    assert [page.get("page[id]") for page in sent_pages] == [None, "p2", "p3"]
+    assert all(page["page[size]"] == 2 for page in sent_pages)
+    # The caller's request is left untouched.
+    assert request.page is None
+
+
+@patch('smartscout.client.requests.Session.request')
+def test_iter_items_respects_caps(mock_request):
+    mock_request.side_effect = [_page(["a", "b"], "p2"), _page(["c", "d"], "p3"), _page(["e"])]
+
+    client = SmartScoutAPIClient(api_key="test_key")
+    items = list(client.iter_brands(SearchBrandsRequest(marketplace="US"), max_items=3))
+    assert len(items) == 3
+    assert mock_request.call_count == 2
+
+    mock_request.reset_mock()
+    mock_request.side_effect = [_page(["a", "b"], "p2"), _page(["c", "d"], "p3")]
+    pages = list(client.iter_pages(client.search_brands, SearchBrandsRequest(marketplace="US"), max_pages=1))
+    assert len(pages) == 1
+    assert mock_request.call_count == 1
@@ -0,0 +1,102 @@
+# tests/test_prefetch.py
+import asyncio
+import threading
+import time
+import pytest
+from smartscout.client import SmartScoutAPIClient
+from smartscout.exceptions import InvalidRequestError, SmartScoutAPIError
+from smartscout.models.requests import SearchBrandsRequest
+from smartscout.ratelimit import RetryPolicy
+from smartscout.transport import StubTransport
+
+
+def _pages(total, fail_at=None):
+    issued = []
+
+    def handler(request):
+        cursor = int((request.json.get("page") or {}).get("page[id]") or 0)
+        issued.append((cursor, time.perf_counter()))
+        if cursor == fail_at:
+            return 500, {"error": "boom"}
+        more = cursor + 1 < total
+        paging = {"nextPageId": str(cursor + 1) if more else None, "hasMoreRecords": more}
+        return 200, {"dataCount": total, "paging": paging, "data": [{"brandName": f"b{cursor}", "hasStorefront": False, "hasSingleSeller": False}]}
+
+    transport = StubTransport(handler)
+    client = SmartScoutAPIClient(api_key="test", base_url="http://stub.invalid", adapter=transport, retry_policy=RetryPolicy(max_retries=0))
+    return client, issued
+
+
+def _prefetch_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "smartscout-prefetch"]
+
+
+def test_next_page_is_fetched_while_the_current_one_is_processed():
+    client, issued = _pages(5)
+    done = []
+    names = []
+    for page in client.iter_pages(client.search_brands, SearchBrandsRequest(marketplace="US"), prefetch=1):
+        time.sleep(0.05)  # consumer work, e.g. a database write
+        names.append(page.data[0].brand_name)
+        done.append(time.perf_counter())
+
+    assert names == ["b0", "b1", "b2", "b3", "b4"]
+    started = [at for _, at in issued]
+    assert all(started[i + 1] < done[i] for i in range(4))
+
+
+def test_buffer_is_bounded_by_the_prefetch_depth():
+    client, issued = _pages(10)
+    pages = client.iter_pages(client.search_brands, SearchBrandsRequest(marketplace="US"), prefetch=2)
+    next(pages)
+    time.sleep(0.3)
+
+    # The page handed out, two buffered, and one fetched but waiting for room.
+    assert len(issued) == 4
+    pages.close()
+    assert not _prefetch_threads()
+
+
+def test_fetch_errors_surface_in_order_and_stop_the_fetcher():
+    client, _ = _pages(5, fail_at=2)
+    names = []
+    with pytest.raises(SmartScoutAPIError):
+        for page in client.iter_pages(client.search_brands, SearchBrandsRequest(marketplace="US"), prefetch=3):
+            names.append(page.data[0].brand_name)
+
+    assert names == ["b0", "b1"]
+    assert not _prefetch_threads()
+
+
+def test_iter_items_with_prefetch_stops_early_and_rejects_streaming():
+    client, _ = _pages(10)
+    items = list(client.iter_items(client.search_brands, SearchBrandsRequest(marketplace="US"), max_items=3, prefetch=2))
+
+    assert [item.brand_name for item in items] == ["b0", "b1", "b2"]
+    assert not _prefetch_threads()
+    with pytest.raises(InvalidRequestError):
+        next(client.iter_pages(client.search_brands, SearchBrandsRequest(marketplace="US"), output="stream", prefetch=1))
+
+
+def test_async_prefetching_pager_runs_ahead_of_the_consumer():
+    from smartscout.prefetch import AsyncPrefetchingPager
+
+    fetched = []
+
+    async def source():
+        for i in range(6):
+            await asyncio.sleep(0.01)
+            fetched.append(i)
+            yield i
+
+    async def run():
+        seen = []
+        async with AsyncPrefetchingPager(source(), depth=2) as pager:
+            async for page in pager:
+                await asyncio.sleep(0.03)
+                seen.append((page, len(fetched)))
+        return seen
+
+    seen = asyncio.run(run())
+    assert [page for page, _ in seen] == list(range(6))
+    assert seen[0][1] > 1
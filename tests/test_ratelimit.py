@@ -0,0 +1,109 @@
+# tests/test_ratelimit.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, Mock
+import pytest
+from smartscout.client import SmartScoutAPIClient
+from smartscout.exceptions import RateLimitError
+from smartscout.models.requests import SearchBrandsRequest
+from smartscout.ratelimit import TokenBucket, RetryPolicy, parse_retry_after
+from smartscout.transport import StubTransport
+
+
+def _response(status_code, payload=None, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = payload
+    if status_code >= 400:
+        from requests.exceptions import HTTPError
+        response.raise_for_status.side_effect = HTTPError(response=response)
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+EMPTY_PAGE = {"dataCount": 0, "paging": {"nextPageId": None, "hasMoreRecords": False}, "data": []}
+
+
+def test_token_bucket_spaces_out_requests_beyond_burst():
+    bucket = TokenBucket(rate=10, burst=2)
+    waits = [bucket._reserve() for _ in range(4)]
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.1, abs=0.02)
+    assert waits[3] == pytest.approx(0.2, abs=0.02)
+
+
+def test_penalties_share_one_deadline_instead_of_stacking():
+    bucket = TokenBucket(rate=10, burst=5)
+    for _ in range(4):
+        bucket.penalize(1.0)
+    waits = [bucket._reserve() for _ in range(3)]
+    assert waits[0] == pytest.approx(1.0, abs=0.05)
+    assert waits[1] == pytest.approx(1.1, abs=0.05)
+    assert waits[2] == pytest.approx(1.2, abs=0.05)
+
+
+def test_concurrent_429s_stall_the_pool_for_about_one_retry_after():
+    workers = 6
+    barrier = threading.Barrier(workers)
+    throttled = set()
+    lock = threading.Lock()
+
+    def handler(request):
+        worker = threading.get_ident()
+        with lock:
+            first = worker not in throttled
+            throttled.add(worker)
+        if first:
+            barrier.wait(timeout=5)
+            return 429, {}, {"Retry-After": "0.3"}
+        return 200, EMPTY_PAGE
+
+    client = SmartScoutAPIClient(
+        api_key="test_key", base_url="http://stub.invalid", adapter=StubTransport(handler),
+        rate_limiter=TokenBucket(rate=100, burst=workers), retry_policy=RetryPolicy(backoff_factor=0.01),
+    )
+    start = time.monotonic()
+    with ThreadPoolExecutor(workers) as pool:
+        pages = list(pool.map(lambda _: client.search_brands(SearchBrandsRequest(marketplace="US")), range(workers)))
+    elapsed = time.monotonic() - start
+
+    assert len(pages) == workers and len(throttled) == workers
+    # Stacked penalties would hold the pool for about workers x Retry-After (1.8s).
+    assert 0.3 <= elapsed < 0.8
+
+
+def test_retry_policy_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0)
+    assert all(0 <= policy.backoff(10) <= 5.0 for _ in range(100))
+    assert 3.0 <= policy.backoff(0, retry_after=3.0) <= 4.0
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+
+
+@patch('smartscout.client.time.sleep')
+@patch('smartscout.client.requests.Session.request')
+def test_client_retries_429_honouring_retry_after(mock_request, mock_sleep):
+    mock_request.side_effect = [_response(429, headers={"Retry-After": "2"}), _response(503), _response(200, EMPTY_PAGE)]
+
+    client = SmartScoutAPIClient(api_key="test_key", retry_policy=RetryPolicy(backoff_factor=0.1))
+    response = client.search_brands(SearchBrandsRequest(marketplace="US"))
+
+    assert response.data_count == 0
+    assert mock_request.call_count == 3
+    assert 2.0 <= mock_sleep.call_args_list[0].args[0] <= 2.1
+
+
+@patch('smartscout.client.time.sleep')
+@patch('smartscout.client.requests.Session.request')
+def test_client_raises_after_retries_exhausted(mock_request, mock_sleep):
+    mock_request.return_value = _response(429, headers={"Retry-After": "1"})
+
+    client = SmartScoutAPIClient(api_key="test_key", retry_policy=RetryPolicy(max_retries=2))
+    with pytest.raises(RateLimitError) as excinfo:
+        client.search_brands(SearchBrandsRequest(marketplace="US"))
+
+    assert mock_request.call_count == 3
+    assert excinfo.value.retry_after == 1.0
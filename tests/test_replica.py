@@ -0,0 +1,153 @@
+# tests/test_replica.py
+import random
+import pytest
+from smartscout.client import SmartScoutAPIClient
+from smartscout.models.base import ListFilter, RangeFilter, RangeInt, SortOptions, TextFilter
+from smartscout.models.requests import SearchBrandsRequest, SearchProductsRequest
+from smartscout.ratelimit import RetryPolicy
+from smartscout.replica import Replica
+from smartscout.transport import StubTransport
+
+WORDS = ["acme", "apex", "zen", "yoga", "north", "peak", "blue", "craft"]
+
+
+def _catalog(count=400):
+    rng = random.Random(11)
+    return [
+        {
+            "brandName": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}",
+            "totalProducts": rng.randint(1, 500),
+            "monthlyRevenue": round(rng.uniform(0, 100_000), 2) if i % 10 else None,
+            "categoryName": rng.choice(["Sports", "Home", "Toys"]),
+            "hasStorefront": i % 3 == 0,
+            "hasSingleSeller": False,
+        }
+        for i in range(count)
+    ]
+
+
+def _client(rows):
+    calls = []
+
+    def handler(request):
+        calls.append(request.json)
+        return 200, {"dataCount": len(rows), "paging": {"nextPageId": None, "hasMoreRecords": False}, "data": rows}
+
+    client = SmartScoutAPIClient(api_key="test", base_url="http://stub.invalid", adapter=StubTransport(handler), retry_policy=RetryPolicy(max_retries=0))
+    return client, calls
+
+
+def _expected(rows, keep, sort=None, reverse=False):
+    matched = [row for row in rows if keep(row)]
+    if sort is not None:
+        present = sorted((row for row in matched if row[sort] is not None), key=lambda row: row[sort], reverse=reverse)
+        matched = present + [row for row in matched if row[sort] is None]
+    return [row["brandName"] for row in matched]
+
+
+def test_narrower_queries_are_answered_locally():
+    rows = _catalog()
+    client, calls = _client(rows)
+    replica = Replica(client)
+    replica.load(client.search_brands, SearchBrandsRequest(marketplace="US"))
+
+    request = SearchBrandsRequest(
+        marketplace="US",
+        totalProducts=RangeInt(min=50, max=300),
+        brandName=TextFilter(type="contains", filter="YOGA"),
+        hasStorefront=True,
+        sort=SortOptions(**{"sort[by]": "monthlyRevenue", "sort[order]": "desc"}),
+    )
+    found = [brand.brand_name for brand in replica.search(client.search_brands, request)]
+
+    assert found == _expected(
+        rows,
+        lambda row: 50 <= row["totalProducts"] <= 300 and "yoga" in row["brandName"] and row["hasStorefront"],
+        sort="monthlyRevenue",
+        reverse=True,
+    )
+    assert len(calls) == 1 and replica.local_queries == 1
+
+
+@pytest.mark.parametrize("text_filter, keep", [
+    (TextFilter(type="startsWith", filter="Zen"), lambda name: name.startswith("zen")),
+    (TextFilter(type="endsWith", filter=" 7"), lambda name: name.endswith(" 7")),
+    (TextFilter(type="exact", filter="ACME PEAK 3"), lambda name: name == "acme peak 3"),
+    (TextFilter(type="contains", filter="a"), lambda name: "a" in name),
+    (TextFilter(type="contains", filter="ZEN 1"), lambda name: "zen 1" in name),
+])
+def test_text_filters_match_case_insensitively(text_filter, keep):
+    rows = _catalog()
+    client, _ = _client(rows)
+    replica = Replica(client)
+    replica.load("search_brands", SearchBrandsRequest(marketplace="US"))
+
+    found = replica.search("search_brands", SearchBrandsRequest(marketplace="US", brandName=text_filter))
+
+    assert [brand.brand_name for brand in found] == _expected(rows, lambda row: keep(row["brandName"]))
+
+
+def test_wider_unknown_or_stale_queries_go_to_the_api():
+    rows = _catalog()
+    client, calls = _client(rows)
+    now = [0.0]
+    replica = Replica(client, max_age=60, clock=lambda: now[0])
+    scope = SearchBrandsRequest(marketplace="US", hasStorefront=True, totalProducts=RangeInt(min=10, max=400))
+    replica.load(client.search_brands, scope)
+
+    assert replica.covers(client.search_brands, SearchBrandsRequest(marketplace="US", hasStorefront=True, totalProducts=RangeInt(min=20, max=30), brandName=TextFilter(type="contains", filter="zen")))
+    assert not replica.covers(client.search_brands, SearchBrandsRequest(marketplace="US", hasStorefront=True, totalProducts=RangeInt(min=5, max=30)))
+    assert not replica.covers(client.search_brands, SearchBrandsRequest(marketplace="UK", hasStorefront=True, totalProducts=RangeInt(min=10, max=400)))
+    assert not replica.covers(client.search_brands, SearchBrandsRequest(marketplace="US", hasStorefront=True, totalProducts=RangeInt(min=10, max=400), sponsoredProducts=RangeInt(min=1)))
+    assert not replica.covers(client.search_brands, SearchBrandsRequest(marketplace="US", hasStorefront=True, totalProducts=RangeInt(min=10, max=400), brandName=TextFilter(filter="zen")))
+
+    replica.search(client.search_brands, SearchBrandsRequest(marketplace="US"))
+    assert len(calls) == 2
+    replica.search(client.search_brands, SearchBrandsRequest(marketplace="US", monthlyRevenue=RangeFilter(min=10)))
+    assert len(calls) == 2
+
+    now[0] = 120
+    assert not replica.covers(client.search_brands, scope)
+    replica.search(client.search_brands, scope)
+    assert len(calls) == 3 and replica.api_queries == 3
+
+
+def test_list_filters_and_nested_product_columns():
+    # Rows read back from an export: plain dicts with the response models' attribute names.
+    products = [
+        {"asin": f"B{i:04d}", "sales_rank": i * 10, "category": {"name": "Sports" if i % 2 else "Home"}, "estimated_monthly_revenue": {"amount": float(i)}}
+        for i in range(100)
+    ]
+    replica = Replica()
+    replica.add("search_products", SearchProductsRequest(marketplace="US"), products)
+
+    request = SearchProductsRequest(
+        marketplace="US",
+        asins=ListFilter(filter=["b0001", "B0002", "B0003", "B0050", "B9999"]),
+        categoryName=TextFilter(type="exact", filter="sports"),
+        sort=SortOptions(**{"sort[by]": "rank", "sort[order]": "desc"}),
+    )
+    assert [product["asin"] for product in replica.search("search_products", request)] == ["B0003", "B0001"]
+    revenue = SearchProductsRequest(marketplace="US", monthlyRevenueEstimate=RangeFilter(min=97.5))
+    assert [product["asin"] for product in replica.search("search_products", revenue)] == ["B0098", "B0099"]
+
+
+def test_unsupported_endpoints_are_rejected():
+    with pytest.raises(ValueError):
+        Replica().search("get_brand_sales_history", SearchBrandsRequest(marketplace="US"))
+
+
+def test_rows_replaced_by_a_later_load_are_checked_against_older_scopes():
+    replica = Replica()
+    cheap = SearchBrandsRequest(marketplace="US", avgPrice=RangeFilter(max=10))
+    replica.add("search_brands", cheap, [{"brand_name": "Acme", "avg_price": 5}, {"brand_name": "Zen", "avg_price": 8}])
+    replica.add("search_brands", SearchBrandsRequest(marketplace="US"), [{"brand_name": "Acme", "avg_price": 50}, {"brand_name": "Zen", "avg_price": 9}])
+
+    assert replica.covers("search_brands", cheap)
+    assert [brand["brand_name"] for brand in replica.search("search_brands", cheap)] == ["Zen"]
+
+    # Another marketplace's copy of a row says nothing about the US scopes it lands in.
+    replica.add("search_brands", SearchBrandsRequest(marketplace="UK"), [{"brand_name": "Zen", "avg_price": 1}])
+    assert not replica.covers("search_brands", cheap)
+    assert not replica.covers("search_brands", SearchBrandsRequest(marketplace="US"))
+    assert replica.covers("search_brands", SearchBrandsRequest(marketplace="UK"))
@@ -0,0 +1,76 @@
+# tests/test_serialization.py
+import json
+from datetime import datetime
+from enum import Enum
+from typing import get_args, get_origin
+import pytest
+from pydantic import BaseModel
+from smartscout.cache import cache_key
+from smartscout.client import SmartScoutAPIClient
+from smartscout.models import generated, requests
+from smartscout.models.base import BaseRequest
+from smartscout.models.requests import SearchBrandsRequest
+from smartscout.serialization import dumps, serializer_for, to_wire
+from smartscout.transport import StubTransport
+
+REQUEST_MODELS = sorted(
+    {model for module in (requests, generated) for model in vars(module).values() if isinstance(model, type) and issubclass(model, BaseRequest)},
+    key=lambda model: (model.__module__, model.__name__),
+)
+
+
+def _sample(type_):
+    if get_origin(type_) is not None:
+        args = [arg for arg in get_args(type_) if arg is not type(None)]
+        return [_sample(args[0])] * 2 if get_origin(type_) is list else _sample(args[0])
+    if issubclass(type_, BaseModel):
+        return {field.alias: _sample(field.outer_type_) for field in type_.__fields__.values()}
+    if issubclass(type_, Enum):
+        return list(type_)[-1]
+    if issubclass(type_, bool):
+        return True
+    if issubclass(type_, (int, float)):
+        return 3
+    if issubclass(type_, datetime):
+        return datetime(2024, 5, 1, 12, 30)
+    return "sample"
+
+
+def _wide(model):
+    return model(**{field.alias: _sample(field.outer_type_) for field in model.__fields__.values()})
+
+
+@pytest.mark.parametrize("model", REQUEST_MODELS, ids=lambda model: model.__name__)
+def test_compiled_serializer_matches_pydantic_by_alias(model):
+    request = _wide(model)
+    expected = json.loads(request.json(by_alias=True, exclude_none=True))
+
+    assert to_wire(request) == expected
+    assert dumps(to_wire(request)) == json.dumps(expected, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def test_output_is_canonical_and_usable_as_a_key():
+    a = SearchBrandsRequest(marketplace="US", brandName={"type": "exact", "filter": "Acme"}, totalProducts={"max": 10, "min": 1})
+    b = SearchBrandsRequest(totalProducts={"min": 1, "max": 10}, brandName={"filter": "Acme", "type": "exact"}, marketplace="US")
+
+    assert dumps(to_wire(a)) == dumps(to_wire(b)) == (
+        b'{"brandName":{"filter":"Acme","type":"exact"},"marketplace":"US","totalProducts":{"max":10,"min":1}}'
+    )
+    assert cache_key("POST", "/brands/search", to_wire(a)) == cache_key("post", "/brands/search", body=dumps(to_wire(b)))
+    assert serializer_for(SearchBrandsRequest) is serializer_for(SearchBrandsRequest)
+    with pytest.raises(ValueError):
+        dumps({"value": float("nan")})
+
+
+def test_client_sends_the_aliased_canonical_body():
+    bodies = []
+
+    def handler(request):
+        bodies.append(request.body)
+        return 200, {"dataCount": 0, "paging": {"hasMoreRecords": False}, "data": []}
+
+    client = SmartScoutAPIClient(api_key="test", base_url="http://stub.invalid", adapter=StubTransport(handler))
+    request = SearchBrandsRequest(marketplace="US", brandName={"type": "startsWith", "filter": "Ac"}, sort={"sort[by]": "brandName", "sort[order]": "desc"})
+    list(client.iter_pages(client.search_brands, request, page_size=5))
+
+    assert bodies == [b'{"brandName":{"filter":"Ac","type":"startsWith"},"marketplace":"US","page":{"page[size]":5},"sort":{"sort[by]":"brandName","sort[order]":"desc"}}']
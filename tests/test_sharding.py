@@ -0,0 +1,110 @@
+# tests/test_sharding.py
+import random
+import threading
+import pytest
+from smartscout.client import SmartScoutAPIClient
+from smartscout.exceptions import SmartScoutAPIError
+from smartscout.models.base import RangeInt
+from smartscout.models.requests import SearchBrandsRequest, SearchSellersRequest
+from smartscout.ratelimit import RetryPolicy
+from smartscout.sharding import ShardedScan, initial_ranges, split_range
+from smartscout.transport import StubTransport
+
+
+def _search(rows, filter_name):
+    """A paged search over `rows` of `(value, payload)`, honouring the `filter_name` range."""
+    issued = []
+
+    def handler(request):
+        body = request.json
+        bounds = body.get(filter_name) or {}
+        low, high = bounds.get("min"), bounds.get("max")
+        matched = [payload for value, payload in rows if (low is None or value >= low) and (high is None or value <= high)]
+        page = body.get("page") or {}
+        size = page.get("page[size]") or 10
+        start = int(page.get("page[id]") or 0)
+        more = start + size < len(matched)
+        issued.append((threading.current_thread().name, low, high, start))
+        paging = {"nextPageId": str(start + size) if more else None, "hasMoreRecords": more}
+        return 200, {"dataCount": len(matched), "paging": paging, "data": matched[start:start + size]}
+
+    client = SmartScoutAPIClient(api_key="test", base_url="http://stub.invalid", adapter=StubTransport(handler), retry_policy=RetryPolicy(max_retries=0))
+    return client, issued
+
+
+def _brands(count=600):
+    # Skewed like real catalogues: most brands carry a handful of products.
+    rng = random.Random(7)
+    values = [min(int(rng.paretovariate(1.2)), 5000) for _ in range(count)]
+    return [(value, {"brandName": f"brand-{i}", "totalProducts": value, "hasStorefront": False, "hasSingleSeller": False}) for i, value in enumerate(values)]
+
+
+def test_split_and_initial_ranges_are_disjoint_and_cover_the_range():
+    assert split_range(1, 10, integer=True) == ((1, 5), (6, 10))
+    assert split_range(3, 3, integer=True) is None
+    assert initial_ranges(0, 99, 4, integer=True) == [(0, 24), (25, 49), (50, 74), (75, 99)]
+    assert initial_ranges(0, 99, [10, 50, 500], integer=True) == [(0, 10), (11, 50), (51, 99)]
+    (a, b), (c, d) = split_range(0.0, 1.0, integer=False)
+    assert a == 0.0 and d == 1.0 and b < c
+
+
+def test_sharded_scan_returns_every_row_once_and_splits_dense_shards():
+    rows = _brands()
+    client, issued = _search(rows, "totalProducts")
+    request = SearchBrandsRequest(marketplace="US", totalProducts=RangeInt(min=1, max=5000))
+    scan = client.iter_sharded(client.search_brands, request, "total_products", shards=4, max_shard_rows=50, max_workers=4, page_size=20)
+
+    names = [brand.brand_name for brand in scan]
+
+    assert sorted(names) == sorted(payload["brandName"] for _, payload in rows)
+    assert scan.duplicates == 0
+    assert all(shard.data_count <= 50 or shard.min == shard.max for shard in scan.shards)
+    assert max(shard.depth for shard in scan.shards) > 0
+    assert len({name for name, *_ in issued}) > 1
+    assert request.total_products.min == 1 and request.page is None  # the caller's request is untouched
+
+
+def test_open_sides_are_covered_by_tail_shards():
+    rng = random.Random(3)
+    rows = [(round(rng.uniform(-50, 2000), 2), {"sellerId": f"s{i}", "sellerName": f"s{i}", "sellerType": "3P", "isFBA": True}) for i in range(300)]
+    client, _ = _search(rows, "estimateSales")
+    scan = client.iter_sharded(client.search_sellers, SearchSellersRequest(marketplace="US"), "estimateSales", bounds=(0, 1000), max_shard_rows=40, page_size=25)
+
+    ids = [seller.seller_id for seller in scan]
+
+    assert sorted(ids) == sorted(payload["sellerId"] for _, payload in rows)
+    assert scan.plan[0].min is None and scan.plan[-1].max is None
+    assert all(shard.depth == scan.max_depth for shard in scan.shards if None in (shard.min, shard.max))
+
+
+def test_rows_returned_by_two_shards_are_yielded_once():
+    rows = _brands(100)
+    client, _ = _search(rows, "totalProducts")
+    scan = ShardedScan(client, "search_brands", SearchBrandsRequest(marketplace="US"), "totalProducts", bounds=(1, 5000), shards=[5, 100])
+    # Overlapping shards, as when a row's value moves between shards mid-scan.
+    scan.plan = [scan.plan[1]._replace(min=1), scan.plan[2], scan.plan[3]._replace(min=1)]
+
+    names = [brand.brand_name for brand in scan]
+
+    assert len(names) == len(set(names)) == len(rows)
+    assert scan.duplicates > 0
+
+
+def test_errors_stop_the_scan():
+    def handler(request):
+        return 500, {"error": "boom"}
+
+    client = SmartScoutAPIClient(api_key="test", base_url="http://stub.invalid", adapter=StubTransport(handler), retry_policy=RetryPolicy(max_retries=0))
+    with pytest.raises(SmartScoutAPIError):
+        list(client.iter_sharded(client.search_brands, SearchBrandsRequest(marketplace="US"), "totalProducts", bounds=(1, 100)))
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("smartscout-shard")]
+
+
+def test_fields_and_bounds_are_validated():
+    client, _ = _search([], "totalProducts")
+    with pytest.raises(ValueError):
+        client.iter_sharded(client.search_brands, SearchBrandsRequest(marketplace="US"), "marketplace", bounds=(1, 2))
+    with pytest.raises(ValueError):
+        client.iter_sharded(client.search_brands, SearchBrandsRequest(marketplace="US"), "nope", bounds=(1, 2))
+    with pytest.raises(ValueError):
+        client.iter_sharded(client.search_brands, SearchBrandsRequest(marketplace="US"), "totalProducts")
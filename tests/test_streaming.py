@@ -0,0 +1,44 @@
+# tests/test_streaming.py
+import io
+import json
+from unittest.mock import patch, Mock
+from smartscout.client import SmartScoutAPIClient
+from smartscout.models.requests import SearchBrandsRequest
+from smartscout.models.responses import Brand
+from smartscout.streaming import StreamedPage
+
+
+def _brand(i):
+    return {"brandName": f"Brand {i}", "monthlyRevenue": 10.5 * i, "totalProducts": i, "hasStorefront": True, "hasSingleSeller": False}
+
+
+def _streamed_response(rows, next_page_id=None):
+    body = {"dataCount": len(rows), "data": rows, "paging": {"nextPageId": next_page_id, "hasMoreRecords": next_page_id is not None}}
+    response = Mock(status_code=200)
+    response.raw = io.BytesIO(json.dumps(body).encode("utf-8"))
+    return response
+
+
+def test_streamed_page_yields_rows_then_paging():
+    response = _streamed_response([_brand(1), _brand(2)], next_page_id="p2")
+    page = StreamedPage(response, lambda row: row["brandName"])
+
+    assert next(page.data) == "Brand 1"
+    assert not response.close.called
+    assert page.paging.next_page_id == "p2"
+    assert page.data_count == 2
+    assert list(page.data) == []
+    response.close.assert_called()
+
+
+def test_iter_items_streams_every_page():
+    client = SmartScoutAPIClient(api_key="test")
+    responses = [_streamed_response([_brand(1), _brand(2)], next_page_id="p2"), _streamed_response([_brand(3)])]
+    with patch.object(client.session, "request", side_effect=responses) as request:
+        brands = list(client.iter_brands(SearchBrandsRequest(marketplace="US"), stream=True))
+
+    assert [brand.brand_name for brand in brands] == ["Brand 1", "Brand 2", "Brand 3"]
+    assert all(isinstance(brand, Brand) for brand in brands)
+    assert request.call_count == 2
+    assert request.call_args_list[0].kwargs["stream"] is True
+    assert json.loads(request.call_args_list[1].kwargs["data"])["page"]["page[id]"] == "p2"
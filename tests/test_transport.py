@@ -0,0 +1,66 @@
+# tests/test_transport.py
+import os
+import socket
+import pytest
+from smartscout.client import SmartScoutAPIClient
+from smartscout.exceptions import SmartScoutAPIError
+from smartscout.mock import MockServer
+from smartscout.models.requests import SearchBrandsRequest
+from smartscout.ratelimit import RetryPolicy
+from smartscout.transport import HttpxTransport, PooledAdapter, StubTransport
+
+SPEC = os.path.join(os.path.dirname(__file__), os.pardir, "swagger.json")
+
+
+def _brand(name):
+    return {"brandName": name, "hasStorefront": False, "hasSingleSeller": False}
+
+
+def test_stub_transport_serves_pages_without_a_network():
+    def handler(request):
+        cursor = int(request.json.get("page", {}).get("page[id]") or 0)
+        more = cursor < 2
+        return 200, {"dataCount": 3, "paging": {"nextPageId": str(cursor + 1) if more else None, "hasMoreRecords": more}, "data": [_brand(f"b{cursor}")]}
+
+    transport = StubTransport(handler)
+    client = SmartScoutAPIClient(api_key="test", base_url="http://stub.invalid", adapter=transport)
+    brands = list(client.iter_brands(SearchBrandsRequest(marketplace="US")))
+
+    assert [brand.brand_name for brand in brands] == ["b0", "b1", "b2"]
+    assert len(transport.requests) == 3
+    assert transport.requests[0].headers["Authorization"] == "Bearer test"
+
+
+def test_pooled_adapter_is_shared_and_enables_keepalive():
+    adapter = PooledAdapter(pool_maxsize=8)
+    with MockServer(SPEC, total_records=5) as server:
+        client = SmartScoutAPIClient(api_key="test", base_url=server.url, adapter=adapter)
+        client.search_brands(SearchBrandsRequest(marketplace="US"))
+        client.search_brands(SearchBrandsRequest(marketplace="US"))
+        pools = [adapter.poolmanager.pools[key] for key in adapter.poolmanager.pools.keys()]
+
+    assert client.session.get_adapter(server.url) is adapter
+    assert len(pools) == 1 and pools[0].num_connections == 1
+    assert pools[0].pool.maxsize == 8
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in pools[0].conn_kw["socket_options"]
+
+
+def test_read_timeout_is_retried_then_raised():
+    with MockServer(SPEC, total_records=5, latency=0.5) as server:
+        client = SmartScoutAPIClient(api_key="test", base_url=server.url, timeout=(1.0, 0.05), retry_policy=RetryPolicy(max_retries=1, backoff_factor=0))
+        with pytest.raises(SmartScoutAPIError, match="timed out"):
+            client.search_brands(SearchBrandsRequest(marketplace="US"))
+
+    assert server.stats["requests"] == 2
+
+
+def test_httpx_transport_supports_paging_and_streaming():
+    pytest.importorskip("httpx")
+    pytest.importorskip("ijson")
+    with MockServer(SPEC, total_records=25, page_size=10) as server:
+        client = SmartScoutAPIClient(api_key="test", base_url=server.url, adapter=HttpxTransport())
+        brands = list(client.iter_brands(SearchBrandsRequest(marketplace="US")))
+        streamed = list(client.iter_brands(SearchBrandsRequest(marketplace="US"), stream=True))
+
+    assert len(brands) == 25
+    assert streamed == brands